@@ -1,6 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import django
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 from django.conf import settings
+from django.db import connections, transaction
 from common.decorators import settings_required
 import logging
 
@@ -17,6 +20,31 @@ from powermapui.views.sam_resource_processor import SAMResourceProcessor, SAMErr
 
 logger = logging.getLogger(__name__)
 
+# Facilities whose supply factors are written together (8760 rows each)
+STORE_BATCH_FACILITIES = 20
+
+# SAM processor of a process_facilities pool worker (see init_sam_worker)
+_worker_sam_processor = None
+
+def init_sam_worker(config, weather_dir, power_curves_dir):
+    """Process pool initializer: set up Django and the worker's SAM processor"""
+    global _worker_sam_processor
+    django.setup()
+    _worker_sam_processor = SAMResourceProcessor(
+        config_settings=config,
+        weather_data_dir=weather_dir,
+        power_curves_dir=power_curves_dir
+    )
+
+def simulate_facility_worker(job, weather_year, start_date, end_date):
+    """
+    Process pool entry point: run SAM for one facility in a worker process.
+
+    The job carries the facility, its installations and weather file paths
+    (see prepare_facility_job), so the simulation does not need the database.
+    """
+    return simulate_facility(_worker_sam_processor, job, weather_year, start_date, end_date)
+
 @login_required
 @settings_required(redirect_view='powermapui:powermapui_home')
 def generate_power(request):
@@ -221,16 +249,23 @@ def generate_power(request):
         }
         return render(request, 'generate_power.html', context)
 
-def process_facilities(config, facilities_list, weather_year, scenario, refresh_supply_factors=False, single_facility_code=None, start_date=None, end_date=None):
+def process_facilities(config, facilities_list, weather_year, scenario, refresh_supply_factors=False, single_facility_code=None, start_date=None, end_date=None, workers=None, progress_callback=None):
     """
     Process renewable facilities using SAM
 
+    Facilities are simulated in a pool of worker processes (settings.SAM_WORKERS)
+    and their supply factors are written by this process in batches. A facility
+    whose simulation fails is logged and skipped without affecting the others.
+
     Args:
         refresh_supply_factors: If True, refresh supply factors for all facilities.
                               If False, only process facilities without existing supply factors.
         single_facility_code: If provided, only process this specific facility (always refreshes)
         start_date: Optional start date (YYYY-MM-DD) to filter generation data
         end_date: Optional end date (YYYY-MM-DD) to filter generation data
+        workers: Optional number of worker processes (default settings.SAM_WORKERS)
+        progress_callback: Optional callable(completed, total, facility_code, error)
+                           called as each facility's simulation finishes
 
     Returns:
         tuple: (sam_processed_count, skipped_count)
@@ -245,10 +280,12 @@ def process_facilities(config, facilities_list, weather_year, scenario, refresh_
         power_curves_dir=power_curves_dir
     )
     sam_processed_count, skipped_count = 0, 0
-    
+
+    # Select the facilities to simulate and load what SAM needs for each
+    jobs = []
     for facility_data in facilities_list:
         try:
-            facility_obj = facilities.objects.get(
+            facility_obj = facilities.objects.select_related('idtechnologies').get(
                 facility_code=facility_data.get('facility_code')
             )
 
@@ -267,22 +304,9 @@ def process_facilities(config, facilities_list, weather_year, scenario, refresh_
                 skipped_count += 1
                 continue
 
-            # Process hybrid facilities: handle multiple renewable technologies
-            all_results = process_hybrid_facility(
-                sam_processor, facility_obj, weather_year, start_date, end_date
-            )
-
-            if all_results:
-                sam_processed_count += 1
+            jobs.append(prepare_facility_job(sam_processor, facility_obj, weather_year))
 
-                # Store combined supply factors (will overwrite existing if refresh_supply_factors=True)
-                store_simulation_results(all_results, facility_obj, weather_year, start_date, end_date)
-
-                # Always update facility summary values (capacity factor, generation)
-                facility_obj.capacityfactor = all_results.capacity_factor
-                facility_obj.save()
-
-            # If in single facility mode, stop after processing the target facility
+            # If in single facility mode, stop after the target facility
             if single_facility_code and facility_obj.facility_code == single_facility_code:
                 break
 
@@ -292,10 +316,151 @@ def process_facilities(config, facilities_list, weather_year, scenario, refresh_
         except Exception as e:
             logger.error(f"Unexpected error processing facility {facility_data.get('facility_code')}: {e}")
             continue
-    
+
+    if workers is None:
+        workers = getattr(settings, 'SAM_WORKERS', 1)
+    workers = max(1, min(workers, len(jobs)))
+    logger.info(f"Simulating {len(jobs)} facilities with {workers} worker(s), skipped {skipped_count}")
+
+    def store(batch):
+        """Store a batch of results; a failure loses only this batch"""
+        try:
+            store_simulation_results(batch, weather_year, start_date, end_date)
+        except Exception as e:
+            logger.error(
+                f"Error storing supply factors for {', '.join(f.facility_code for f, _ in batch)}: {e}"
+            )
+
+    pending = []
+    failed_count = 0
+    simulations = run_facility_simulations(
+        sam_processor, config, jobs, weather_year, start_date, end_date, workers
+    )
+    for completed, (facility_obj, results, error) in enumerate(simulations, start=1):
+        if error:
+            failed_count += 1
+        elif results:
+            sam_processed_count += 1
+            # Store combined supply factors (will overwrite existing if refresh_supply_factors=True)
+            pending.append((facility_obj, results))
+
+        logger.info(
+            f"SAM {completed}/{len(jobs)}: {facility_obj.facility_code} "
+            + (f"failed: {error}" if error else "done" if results else "no results")
+        )
+        if progress_callback:
+            progress_callback(completed, len(jobs), facility_obj.facility_code, error)
+
+        if len(pending) >= STORE_BATCH_FACILITIES:
+            store(pending)
+            pending = []
+    if pending:
+        store(pending)
+
+    if failed_count:
+        logger.warning(f"SAM simulation failed for {failed_count} of {len(jobs)} facilities")
+
     return sam_processed_count, skipped_count
 
-def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_date=None, end_date=None):
+def prepare_facility_job(sam_processor, facility_obj, weather_year):
+    """
+    Load everything SAM needs for a facility, so the simulation itself can run
+    in a worker process without database access.
+
+    Args:
+        sam_processor: SAMResourceProcessor instance (finds the weather files)
+        facility_obj: Facility model instance, with idtechnologies loaded
+        weather_year: Year string for weather data
+
+    Returns:
+        dict: the facility, its active wind and solar installations (with their
+        technologies and turbines loaded) and weather file paths by fuel type
+    """
+    from siren_web.models import FacilitySolar, FacilityWindTurbines
+
+    wind_installations = list(FacilityWindTurbines.objects.filter(
+        idfacilities=facility_obj,
+        is_active=True
+    ).select_related('idtechnologies', 'idwindturbines'))
+    solar_installations = list(FacilitySolar.objects.filter(
+        idfacilities=facility_obj,
+        is_active=True
+    ).select_related('idtechnologies'))
+
+    # Weather files for each renewable fuel type at the facility
+    fuel_types = set()
+    for technology in [i.idtechnologies for i in wind_installations + solar_installations] + [facility_obj.idtechnologies]:
+        if technology and technology.renewable and not technology.dispatchable and technology.fuel_type:
+            fuel_types.add(technology.fuel_type.lower())
+    weather_paths = {
+        fuel_type: sam_processor.get_weather_file_path(
+            facility_obj.latitude,
+            facility_obj.longitude,
+            fuel_type,
+            weather_year
+        )
+        for fuel_type in fuel_types
+    }
+
+    return {
+        'facility': facility_obj,
+        'wind_installations': wind_installations,
+        'solar_installations': solar_installations,
+        'weather_paths': weather_paths,
+    }
+
+def simulate_facility(sam_processor, job, weather_year, start_date=None, end_date=None):
+    """
+    Run SAM for one prepared facility, isolating any error.
+
+    Returns:
+        tuple: (facility_obj, SimulationResults or None, error message or None)
+    """
+    facility_obj = job['facility']
+    try:
+        results = process_hybrid_facility(
+            sam_processor, facility_obj, weather_year, start_date, end_date, job=job
+        )
+        return facility_obj, results, None
+    except Exception as e:
+        logger.error(f"Unexpected error processing facility {facility_obj.facility_code}: {e}")
+        return facility_obj, None, str(e)
+
+def run_facility_simulations(sam_processor, config, jobs, weather_year, start_date=None, end_date=None, workers=1):
+    """
+    Simulate prepared facilities, in a process pool if workers > 1.
+
+    Yields:
+        tuple: (facility_obj, SimulationResults or None, error message or None)
+        for each facility as its simulation finishes
+    """
+    if workers <= 1:
+        for job in jobs:
+            yield simulate_facility(sam_processor, job, weather_year, start_date, end_date)
+        return
+
+    # Workers must not share the parent's connection
+    connections.close_all()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_sam_worker,
+        initargs=(config, str(sam_processor.weather_data_dir), str(sam_processor.power_curves_dir))
+    ) as executor:
+        futures = {
+            executor.submit(simulate_facility_worker, job, weather_year, start_date, end_date): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker process itself failed (e.g. crashed in SAM)
+                facility_obj = futures[future]['facility']
+                logger.error(f"SAM worker failed for facility {facility_obj.facility_code}: {e}")
+                yield facility_obj, None, str(e)
+
+def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_date=None, end_date=None, job=None):
     """
     Process a facility that may have multiple renewable technologies (hybrid).
     Handles wind, solar, and combinations of both.
@@ -306,11 +471,14 @@ def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_dat
         weather_year: Year string for weather data
         start_date: Optional start date to filter results
         end_date: Optional end date to filter results
+        job: Optional prepare_facility_job() result (loaded here if not given)
 
     Returns:
         SimulationResults: Combined results for all technologies at this facility
     """
-    from siren_web.models import FacilitySolar, FacilityWindTurbines
+    if job is None:
+        job = prepare_facility_job(sam_processor, facility_obj, weather_year)
+    weather_paths = job['weather_paths']
 
     combined_hourly_generation = None
     total_annual_energy = 0
@@ -318,12 +486,7 @@ def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_dat
     technologies_processed = []
 
     # Process wind installations
-    wind_installations = FacilityWindTurbines.objects.filter(
-        idfacilities=facility_obj,
-        is_active=True
-    )
-
-    for wind_install in wind_installations:
+    for wind_install in job['wind_installations']:
         try:
             technology = wind_install.idtechnologies
             if technology and technology.renewable and not technology.dispatchable:
@@ -338,7 +501,8 @@ def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_dat
 
                 # Process this wind installation
                 results = process_wind_installation(
-                    sam_processor, facility_obj, wind_install, power_curve, weather_year, fuel_type
+                    sam_processor, facility_obj, wind_install, power_curve, weather_year,
+                    weather_paths.get(fuel_type)
                 )
 
                 if results:
@@ -358,19 +522,14 @@ def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_dat
             continue
 
     # Process solar installations
-    solar_installations = FacilitySolar.objects.filter(
-        idfacilities=facility_obj,
-        is_active=True
-    )
-
-    for solar_install in solar_installations:
+    for solar_install in job['solar_installations']:
         try:
             technology = solar_install.idtechnologies
             if technology and technology.renewable and not technology.dispatchable:
 
                 results = process_solar_installation(
-                    sam_processor, facility_obj, solar_install, weather_year,
-                    technology.fuel_type.lower()
+                    sam_processor, facility_obj, solar_install,
+                    weather_paths.get(technology.fuel_type.lower())
                 )
 
                 if results:
@@ -395,7 +554,11 @@ def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_dat
         fuel_type = technology.fuel_type.lower()
 
         if technology.renewable and not technology.dispatchable:
-            results = process_renewable_facility(sam_processor, facility_obj, fuel_type, weather_year)
+            wind_installation = job['wind_installations'][0] if job['wind_installations'] else None
+            results = process_renewable_facility(
+                sam_processor, facility_obj, fuel_type, weather_year,
+                weather_paths.get(fuel_type), wind_installation
+            )
             if results:
                 combined_hourly_generation = list(results.hourly_generation)
                 total_annual_energy = results.annual_energy
@@ -432,18 +595,11 @@ def process_hybrid_facility(sam_processor, facility_obj, weather_year, start_dat
         }
     )
 
-def process_wind_installation(sam_processor, facility_obj, wind_install, power_curve, weather_year, fuel_type):
+def process_wind_installation(sam_processor, facility_obj, wind_install, power_curve, weather_year, weather_file_path):
     """
     Process a specific wind installation within a facility.
     """
     try:
-        weather_file_path = sam_processor.get_weather_file_path(
-            facility_obj.latitude,
-            facility_obj.longitude,
-            fuel_type,
-            weather_year
-        )
-
         if not weather_file_path:
             logger.warning(f"No weather file found for wind installation at {facility_obj.facility_name}")
             return None
@@ -462,18 +618,11 @@ def process_wind_installation(sam_processor, facility_obj, wind_install, power_c
         logger.error(f"Error processing wind installation: {e}")
         return None
 
-def process_solar_installation(sam_processor, facility_obj, solar_install, weather_year, fuel_type):
+def process_solar_installation(sam_processor, facility_obj, solar_install, weather_file_path):
     """
     Process a specific solar installation within a facility.
     """
     try:
-        weather_file_path = sam_processor.get_weather_file_path(
-            facility_obj.latitude,
-            facility_obj.longitude,
-            fuel_type,
-            weather_year
-        )
-
         if not weather_file_path:
             logger.warning(f"No weather file found for solar installation at {facility_obj.facility_name}")
             return None
@@ -545,21 +694,21 @@ def filter_hourly_data_by_date(hourly_data, weather_year, start_date=None, end_d
         logger.error(f"Error filtering hourly data by date: {e}")
         return hourly_data
 
-def process_renewable_facility(sam_processor, facility_obj, fuel_type, weather_year):
+def process_renewable_facility(sam_processor, facility_obj, fuel_type, weather_year, weather_file_path, wind_installation=None):
     """
     Process renewable facilities using SAM
+
+    Args:
+        weather_file_path: Nearest weather file for the fuel type, or None
+        wind_installation: The facility's first active FacilityWindTurbines, if any
     
     Returns:
         SimulationResults: Results of the SAM simulation or None if not applicable
     """
     try:
-        weather_file_path = sam_processor.get_weather_file_path(
-            facility_obj.latitude, 
-            facility_obj.longitude, 
-            fuel_type, 
-            weather_year
-        )
-        
+        if not weather_file_path:
+            raise WeatherFileError(f"No {fuel_type} weather file found for {weather_year}")
+
         # Load weather data
         weather_data = sam_processor.load_weather_data(weather_file_path)
 
@@ -571,8 +720,6 @@ def process_renewable_facility(sam_processor, facility_obj, fuel_type, weather_y
             power_curve = {}
             
             # Get wind turbine info from related FacilityWindTurbines model
-            wind_installation = facility_obj.facilitywindturbines_set.filter(is_active=True).first()
-            
             if wind_installation:
                 turbine = wind_installation.wind_turbine
                 power_curve_path = sam_processor.get_power_curve_file_path(
@@ -600,20 +747,23 @@ def process_renewable_facility(sam_processor, facility_obj, fuel_type, weather_y
         logger.error(f"SAM simulation failed for {facility_obj.facility_name}: {e}")
         return None
 
-def store_simulation_results(results, facility_obj, weather_year, start_date=None, end_date=None):
+def store_simulation_results(facility_results, weather_year, start_date=None, end_date=None):
     """
-    Store SAM simulation results in the supplyfactors table
+    Store SAM simulation results for several facilities in the supplyfactors
+    table, and their capacity factors, in one transaction
 
     Args:
-        results: SimulationResults object
-        facility_obj: Facility model instance
+        facility_results: list of (facility_obj, SimulationResults)
         weather_year: Year being processed
         start_date: Optional start date for filtering (YYYY-MM-DD)
         end_date: Optional end date for filtering (YYYY-MM-DD)
     """
     from datetime import datetime, timedelta
 
-    # Clear existing data for this facility/year (or date range)
+    facility_ids = [facility_obj.idfacilities for facility_obj, _ in facility_results]
+    existing = supplyfactors.objects.filter(idfacilities__in=facility_ids, year=weather_year)
+
+    # Clear existing data for these facilities/year (or date range)
     if start_date or end_date:
         # Calculate hour range for deletion
         year = int(weather_year)
@@ -632,18 +782,7 @@ def store_simulation_results(results, facility_obj, weather_year, start_date=Non
             end_hour = 8759
 
         # Delete only records in the specified date range
-        supplyfactors.objects.filter(
-            idfacilities=facility_obj.idfacilities,
-            year=weather_year,
-            hour__gte=start_hour,
-            hour__lte=end_hour
-        ).delete()
-    else:
-        # Clear all data for this facility/year
-        supplyfactors.objects.filter(
-            idfacilities=facility_obj.idfacilities,
-            year=weather_year
-        ).delete()
+        existing = existing.filter(hour__gte=start_hour, hour__lte=end_hour)
 
     # Calculate the starting hour offset based on date range
     if start_date:
@@ -654,18 +793,27 @@ def store_simulation_results(results, facility_obj, weather_year, start_date=Non
     else:
         hour_offset = 0
 
-    # Create new records for each hour
-    bulk_records = []
-    for idx, generation in enumerate(results.hourly_generation):
-        actual_hour = hour_offset + idx
-        record = supplyfactors(
+    # Create new records for each facility and hour
+    bulk_records = [
+        supplyfactors(
             idfacilities=facility_obj,
             year=weather_year,
-            hour=actual_hour,
+            hour=hour_offset + idx,
             quantum=generation,
             supply=1  # Assuming supply=1 for generation
         )
-        bulk_records.append(record)
-
-    # Use bulk_create for better performance
-    supplyfactors.objects.bulk_create(bulk_records, batch_size=1000)
+        for facility_obj, results in facility_results
+        for idx, generation in enumerate(results.hourly_generation)
+    ]
+
+    # Always update facility summary values (capacity factor)
+    for facility_obj, results in facility_results:
+        facility_obj.capacityfactor = results.capacity_factor
+
+    with transaction.atomic():
+        existing.delete()
+        # Use bulk_create for better performance
+        supplyfactors.objects.bulk_create(bulk_records, batch_size=1000)
+        facilities.objects.bulk_update(
+            [facility_obj for facility_obj, _ in facility_results], ['capacityfactor']
+        )
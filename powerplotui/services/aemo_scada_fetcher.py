@@ -3,13 +3,16 @@ import requests
 import json
 import zipfile
 import io
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, timezone as dt_timezone
 from decimal import Decimal
 from collections import defaultdict
 from django.db import transaction, connection
 from django.utils import timezone
 import pytz
 from siren_web.models import FacilityScada, DailyPeakRE, facilities, Technologies
+from .scada_rollups import ScadaRollupService, stored_interval
+from .scada_storage import ScadaArchive, split_by_storage
+from .plot_surfaces import DEMAND_SURFACE, PlotSurfaceService
 import logging
 import time
 
@@ -19,6 +22,8 @@ class AEMOScadaFetcher:
     CURRENT_URL = "https://data.wa.aemo.com.au/public/market-data/wemde/facilityScada/current/"
     HISTORICAL_URL = "https://data.wa.aemo.com.au/public/market-data/wemde/facilityScada/previous/"
     AWST = pytz.timezone('Australia/Perth')
+    # Minimum unique half-hourly intervals for a trading day to count as present
+    MIN_DAILY_INTERVALS = 40
     
     def __init__(self):
         # Cache facility lookups to avoid repeated DB queries
@@ -198,6 +203,14 @@ class AEMOScadaFetcher:
         
         logger.info(f"Fetching historical SCADA for {year}-{month:02d} ({start_date} to {end_date})")
         
+        plan = self.plan_date_range(start_date, end_date)
+        coverage = plan['coverage']
+
+        # Backfill DailyPeakRE for existing days in one set-based pass
+        if plan['missing_peak_dates']:
+            backfilled = self._backfill_daily_peak_re_dates(plan['missing_peak_dates'])
+            logger.info(f"Backfilled DailyPeakRE for {backfilled} existing days")
+
         current_date = start_date
         summary = {
             'month': f"{year}-{month:02d}",
@@ -212,25 +225,11 @@ class AEMOScadaFetcher:
             summary['total_days'] += 1
             
             try:
-                # Check if data already exists
-                exists, existing_count = self.verify_data_exists(current_date)
-                
-                if exists:
+                if current_date not in plan['missing_dates']:
+                    existing_count = coverage[current_date]['records']
                     logger.info(f"✓ {current_date}: Data already exists ({existing_count:,} records), skipping")
                     summary['successful_days'] += 1
                     summary['total_records'] += existing_count
-                    # Backfill DailyPeakRE if missing
-                    if not DailyPeakRE.objects.filter(trading_date=current_date).exists():
-                        peak = self._calculate_half_hourly_peak_re(current_date)
-                        if peak:
-                            DailyPeakRE.objects.create(
-                                trading_date=current_date,
-                                peak_re_percentage=peak['percentage'],
-                                peak_re_datetime=peak['datetime'],
-                                re_generation_mw=peak['re_mw'],
-                                total_generation_mw=peak['total_mw'],
-                            )
-                            logger.info(f"  Backfilled DailyPeakRE: {peak['percentage']:.1f}%")
                 else:
                     # Fetch data
                     count = self.fetch_historical_data(current_date)
@@ -238,8 +237,8 @@ class AEMOScadaFetcher:
                     summary['total_records'] += count
                     logger.info(f"✓ {current_date}: Fetched {count:,} records")
 
-                # Small delay to be nice to the server
-                time.sleep(0.5)
+                    # Small delay to be nice to the server
+                    time.sleep(0.5)
 
             except Exception as e:
                 summary['failed_days'] += 1
@@ -269,6 +268,18 @@ class AEMOScadaFetcher:
         """
         logger.info(f"Fetching historical SCADA from {start_date} to {end_date}")
         
+        plan = self.plan_date_range(start_date, end_date)
+        coverage = plan['coverage']
+        logger.info(
+            f"Coverage plan: {len(plan['missing_dates'])} days to fetch, "
+            f"{len(plan['missing_peak_dates'])} days missing DailyPeakRE"
+        )
+
+        # Backfill DailyPeakRE for existing days in one set-based pass
+        if plan['missing_peak_dates']:
+            backfilled = self._backfill_daily_peak_re_dates(plan['missing_peak_dates'])
+            logger.info(f"Backfilled DailyPeakRE for {backfilled} existing days")
+
         current_date = start_date
         summary = {
             'start_date': str(start_date),
@@ -285,25 +296,11 @@ class AEMOScadaFetcher:
             summary['total_days'] += 1
             
             try:
-                # Check if data already exists
-                exists, existing_count = self.verify_data_exists(current_date)
-                
-                if exists:
+                if current_date not in plan['missing_dates']:
+                    existing_count = coverage[current_date]['records']
                     logger.info(f"⊘ {current_date}: Already exists ({existing_count:,} records), skipping")
                     summary['skipped_days'] += 1
                     summary['total_records'] += existing_count
-                    # Backfill DailyPeakRE if missing
-                    if not DailyPeakRE.objects.filter(trading_date=current_date).exists():
-                        peak = self._calculate_half_hourly_peak_re(current_date)
-                        if peak:
-                            DailyPeakRE.objects.create(
-                                trading_date=current_date,
-                                peak_re_percentage=peak['percentage'],
-                                peak_re_datetime=peak['datetime'],
-                                re_generation_mw=peak['re_mw'],
-                                total_generation_mw=peak['total_mw'],
-                            )
-                            logger.info(f"  Backfilled DailyPeakRE: {peak['percentage']:.1f}%")
                 else:
                     # Fetch data
                     count = self.fetch_historical_data(current_date)
@@ -311,6 +308,9 @@ class AEMOScadaFetcher:
                     summary['total_records'] += count
                     logger.info(f"✓ {current_date}: Fetched {count:,} records")
 
+                    # Small delay between requests
+                    time.sleep(0.5)
+
                 # Progress update every 7 days
                 if summary['total_days'] % 7 == 0:
                     logger.info(
@@ -318,9 +318,6 @@ class AEMOScadaFetcher:
                         f"{summary['total_records']:,} total records"
                     )
                 
-                # Small delay between requests
-                time.sleep(0.5)
-                
             except Exception as e:
                 summary['failed_days'] += 1
                 error_msg = f"{current_date}: {str(e)}"
@@ -510,22 +507,57 @@ class AEMOScadaFetcher:
         return daily_peaks
 
     def _store_daily_peak_re(self, daily_peaks):
-        """Store daily peak RE% records in DailyPeakRE table."""
-        for day, peak in daily_peaks.items():
-            DailyPeakRE.objects.update_or_create(
-                trading_date=day,
-                defaults={
-                    'peak_re_percentage': peak['percentage'],
-                    'peak_re_datetime': peak['datetime'],
-                    're_generation_mw': peak['re_mw'],
-                    'total_generation_mw': peak['total_mw'],
-                }
-            )
+        """
+        Store daily peak RE% records in DailyPeakRE table.
+
+        All days are written with a single bulk upsert keyed on trading_date.
+        The raw SQL bypasses Django's time zone handling (mysqlclient drops
+        tzinfo), so datetimes are written as naive UTC, as the ORM stores them.
+
+        Returns:
+            int: number of records written
+        """
+        if not daily_peaks:
+            return 0
+
+        def utc(dt):
+            if timezone.is_naive(dt):
+                return dt
+            return timezone.make_naive(dt.astimezone(dt_timezone.utc), dt_timezone.utc)
+
+        sql = """
+            INSERT INTO daily_peak_re
+                (trading_date, peak_re_percentage, peak_re_datetime,
+                 re_generation_mw, total_generation_mw, created_at, updated_at)
+            VALUES
+                (%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                peak_re_percentage = VALUES(peak_re_percentage),
+                peak_re_datetime = VALUES(peak_re_datetime),
+                re_generation_mw = VALUES(re_generation_mw),
+                total_generation_mw = VALUES(total_generation_mw),
+                updated_at = VALUES(updated_at)
+        """
+
+        now = utc(timezone.now())
+        values = [
+            (day, peak['percentage'], utc(peak['datetime']), peak['re_mw'], peak['total_mw'], now, now)
+            for day, peak in sorted(daily_peaks.items())
+        ]
+
+        batch_size = 1000
+        with connection.cursor() as cursor:
+            for i in range(0, len(values), batch_size):
+                cursor.executemany(sql, values[i:i + batch_size])
+
+        for day, peak in sorted(daily_peaks.items()):
             logger.info(
                 f"Daily peak RE% for {day}: {peak['percentage']:.1f}% "
                 f"at {peak['datetime']}"
             )
 
+        return len(values)
+
     def _calculate_half_hourly_peak_re(self, trading_date):
         """
         Calculate peak half-hourly RE% from existing FacilityScada records.
@@ -537,51 +569,118 @@ class AEMOScadaFetcher:
         Returns:
             dict with percentage, datetime, re_mw, total_mw or None
         """
-        from django.db.models import Sum, Case, When, Value, DecimalField, F, Q
+        return self._calculate_half_hourly_peak_re_range(
+            trading_date, trading_date
+        ).get(trading_date)
 
-        start_dt = self.AWST.localize(datetime.combine(trading_date, datetime.min.time()))
-        end_dt = start_dt + timedelta(days=1)
+    def _calculate_half_hourly_peak_re_range(self, start_date, end_date):
+        """
+        Calculate peak half-hourly RE% for every trading date in a range.
 
-        scada_qs = FacilityScada.objects.filter(
-            dispatch_interval__gte=start_dt,
-            dispatch_interval__lt=end_dt,
-            quantity__gt=0,
-        )
+        Runs one grouped aggregation (RE vs total generation per dispatch
+        interval) over the range and picks each day's maximum in memory.
+        Archived months are aggregated from the SCADA archive instead.
+
+        facility_scada holds the AWST wall-clock time of each interval, read
+        back tagged as UTC (see scada_rollups.stored_interval), so the window
+        and the day buckets use the stored value directly.
+
+        Args:
+            start_date: datetime.date
+            end_date: datetime.date (inclusive)
+
+        Returns:
+            dict keyed by date with percentage, datetime, re_mw, total_mw.
+            Days without positive generation are omitted.
+        """
+        from django.db.models import Sum, Case, When, Value, DecimalField, F, Q
 
-        if not scada_qs.exists():
-            return None
+        start_dt = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=dt_timezone.utc)
+        end_dt = datetime.combine(
+            end_date + timedelta(days=1), datetime.min.time()
+        ).replace(tzinfo=dt_timezone.utc)
 
         re_condition = (
             Q(facility__idtechnologies__fuel_type__in=['WIND', 'SOLAR', 'BIOMASS', 'HYDRO']) |
             Q(facility__idtechnologies__category__iexact='storage')
         )
 
-        interval_stats = scada_qs.values('dispatch_interval').annotate(
-            re_gen=Sum(
-                Case(
-                    When(re_condition, then=F('quantity')),
-                    default=Value(0),
-                    output_field=DecimalField(),
+        archive = ScadaArchive()
+        archived, db_ranges = split_by_storage(start_dt, end_dt, archive)
+
+        interval_stats = []
+        if archived:
+            re_facility_ids = set(
+                facilities.objects.filter(
+                    Q(idtechnologies__fuel_type__in=['WIND', 'SOLAR', 'BIOMASS', 'HYDRO']) |
+                    Q(idtechnologies__category__iexact='storage')
+                ).values_list('idfacilities', flat=True)
+            )
+            for year, month in archived:
+                interval_stats.extend(
+                    (dispatch_interval, re_gen, total_gen)
+                    for dispatch_interval, _, total_gen, re_gen in archive.interval_summary(
+                        year, month, start_dt, end_dt, re_facility_ids
+                    )
                 )
-            ),
-            total_gen=Sum('quantity'),
-        )
 
-        best = None
-        for interval in interval_stats:
-            total = float(interval['total_gen'] or 0)
-            re = float(interval['re_gen'] or 0)
-            if total > 0:
-                pct = (re / total) * 100
-                if best is None or pct > best['percentage']:
-                    best = {
-                        'percentage': pct,
-                        'datetime': interval['dispatch_interval'],
-                        're_mw': re,
-                        'total_mw': total,
-                    }
-
-        return best
+        for range_start, range_end in db_ranges:
+            interval_stats.extend(FacilityScada.objects.filter(
+                dispatch_interval__gte=range_start,
+                dispatch_interval__lt=range_end,
+                quantity__gt=0,
+            ).order_by().values('dispatch_interval').annotate(
+                re_gen=Sum(
+                    Case(
+                        When(re_condition, then=F('quantity')),
+                        default=Value(0),
+                        output_field=DecimalField(),
+                    )
+                ),
+                total_gen=Sum('quantity'),
+            ).values_list('dispatch_interval', 're_gen', 'total_gen'))
+
+        daily_peaks = {}
+        for dispatch_interval, re_gen, total_gen in interval_stats:
+            total = float(total_gen or 0)
+            re = float(re_gen or 0)
+            if total <= 0:
+                continue
+            pct = (re / total) * 100
+            interval = stored_interval(dispatch_interval)
+            day = interval.date()
+            if day not in daily_peaks or pct > daily_peaks[day]['percentage']:
+                daily_peaks[day] = {
+                    'percentage': pct,
+                    # Store the instant, as the 5-minute ingest path does
+                    'datetime': self.AWST.localize(interval),
+                    're_mw': re,
+                    'total_mw': total,
+                }
+
+        return daily_peaks
+
+    def _backfill_daily_peak_re_dates(self, trading_dates):
+        """
+        Backfill DailyPeakRE for a set of trading dates from half-hourly SCADA.
+
+        Args:
+            trading_dates: iterable of datetime.date
+
+        Returns:
+            int: number of DailyPeakRE records written
+        """
+        trading_dates = set(trading_dates)
+        if not trading_dates:
+            return 0
+
+        daily_peaks = self._calculate_half_hourly_peak_re_range(
+            min(trading_dates), max(trading_dates)
+        )
+        daily_peaks = {
+            day: peak for day, peak in daily_peaks.items() if day in trading_dates
+        }
+        return self._store_daily_peak_re(daily_peaks)
 
     def backfill_daily_peak_re(self, start_date, end_date):
         """
@@ -595,34 +694,24 @@ class AEMOScadaFetcher:
         Returns:
             dict with backfilled and skipped counts
         """
-        current_date = start_date
-        backfilled = 0
-        skipped = 0
+        existing_dates = set(
+            DailyPeakRE.objects.filter(
+                trading_date__gte=start_date,
+                trading_date__lte=end_date
+            ).values_list('trading_date', flat=True)
+        )
 
+        missing_dates = set()
+        current_date = start_date
         while current_date <= end_date:
-            if not DailyPeakRE.objects.filter(trading_date=current_date).exists():
-                peak = self._calculate_half_hourly_peak_re(current_date)
-                if peak:
-                    DailyPeakRE.objects.create(
-                        trading_date=current_date,
-                        peak_re_percentage=peak['percentage'],
-                        peak_re_datetime=peak['datetime'],
-                        re_generation_mw=peak['re_mw'],
-                        total_generation_mw=peak['total_mw'],
-                    )
-                    logger.info(
-                        f"Backfilled DailyPeakRE for {current_date}: "
-                        f"{peak['percentage']:.1f}%"
-                    )
-                    backfilled += 1
-                else:
-                    skipped += 1
-            else:
-                skipped += 1
-
+            if current_date not in existing_dates:
+                missing_dates.add(current_date)
             current_date += timedelta(days=1)
 
-        return {'backfilled': backfilled, 'skipped': skipped}
+        backfilled = self._backfill_daily_peak_re_dates(missing_dates)
+        total_days = (end_date - start_date).days + 1
+
+        return {'backfilled': backfilled, 'skipped': total_days - backfilled}
 
     @transaction.atomic
     def _save_data(self, records):
@@ -650,6 +739,10 @@ class AEMOScadaFetcher:
 
         if not hourly_records:
             return 0
+
+        # Snapshot stored values so the rollups can be adjusted by the change
+        rollups = ScadaRollupService()
+        previous = rollups.get_stored_quantities(hourly_records)
         
         sql = """
             INSERT INTO facility_scada 
@@ -673,10 +766,107 @@ class AEMOScadaFetcher:
                 batch = values[i:i + batch_size]
                 cursor.executemany(sql, batch)
                 total_saved += len(batch)
+
+        # Keep the hourly/daily/monthly rollups in step with facility_scada
+        rollups.apply_changes(hourly_records, previous)
+        PlotSurfaceService().refresh_for_dates(
+            DEMAND_SURFACE, [r['dispatch_interval'] for r in hourly_records]
+        )
         
         logger.debug(f"Saved {total_saved} half-hourly records")
         return total_saved
     
+    def get_coverage_index(self, start_date, end_date):
+        """
+        Build a per-trading-date completeness index for a date range.
+
+        Runs a single grouped query (one row per half-hourly dispatch interval)
+        and buckets the intervals into AWST trading dates, so a multi-year range
+        costs one round trip instead of several queries per day. Archived
+        months are counted from the SCADA archive, so archived days are not
+        reported missing (and fetched back into facility_scada).
+
+        Args:
+            start_date: datetime.date
+            end_date: datetime.date (inclusive)
+
+        Returns:
+            dict keyed by date with 'records' (row count) and 'intervals'
+            (distinct half-hourly intervals). Dates without data are omitted.
+        """
+        from django.db.models import Count
+
+        start_dt = self.AWST.localize(datetime.combine(start_date, datetime.min.time()))
+        end_dt = self.AWST.localize(
+            datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+        )
+
+        archive = ScadaArchive()
+        archived, db_ranges = split_by_storage(start_dt, end_dt, archive)
+
+        interval_counts = []
+        for year, month in archived:
+            interval_counts.extend(
+                (dispatch_interval, records)
+                for dispatch_interval, records, _, _ in archive.interval_summary(
+                    year, month, start_dt, end_dt
+                )
+            )
+        for range_start, range_end in db_ranges:
+            interval_counts.extend(FacilityScada.objects.filter(
+                dispatch_interval__gte=range_start,
+                dispatch_interval__lt=range_end
+            ).order_by().values('dispatch_interval').annotate(
+                record_count=Count('id')
+            ).values_list('dispatch_interval', 'record_count'))
+
+        coverage = defaultdict(lambda: {'records': 0, 'intervals': 0})
+        for dispatch_interval, record_count in interval_counts:
+            day = dispatch_interval.astimezone(self.AWST).date()
+            coverage[day]['records'] += record_count
+            coverage[day]['intervals'] += 1
+
+        return dict(coverage)
+
+    def plan_date_range(self, start_date, end_date):
+        """
+        Work out up front which days of a range need fetching or peak RE backfill.
+
+        Args:
+            start_date: datetime.date
+            end_date: datetime.date (inclusive)
+
+        Returns:
+            dict with 'coverage' (see get_coverage_index), 'missing_dates'
+            (days without complete SCADA) and 'missing_peak_dates' (days with
+            complete SCADA but no DailyPeakRE record)
+        """
+        coverage = self.get_coverage_index(start_date, end_date)
+        peak_dates = set(
+            DailyPeakRE.objects.filter(
+                trading_date__gte=start_date,
+                trading_date__lte=end_date
+            ).values_list('trading_date', flat=True)
+        )
+
+        missing_dates = set()
+        missing_peak_dates = set()
+        current_date = start_date
+        while current_date <= end_date:
+            day = coverage.get(current_date)
+            if day and day['intervals'] >= self.MIN_DAILY_INTERVALS:
+                if current_date not in peak_dates:
+                    missing_peak_dates.add(current_date)
+            else:
+                missing_dates.add(current_date)
+            current_date += timedelta(days=1)
+
+        return {
+            'coverage': coverage,
+            'missing_dates': missing_dates,
+            'missing_peak_dates': missing_peak_dates,
+        }
+
     def verify_data_exists(self, trading_date):
         """
         Check if half-hourly data exists for a given trading date.
@@ -691,28 +881,12 @@ class AEMOScadaFetcher:
         Returns:
             Tuple of (exists: bool, count: int)
         """
-        start_datetime = datetime.combine(trading_date, datetime.min.time())
-        # Make timezone aware
-        start_datetime = self.AWST.localize(start_datetime)
-        end_datetime = start_datetime + timedelta(days=1)
-
-        # Get total count of records
-        count = FacilityScada.objects.filter(
-            dispatch_interval__gte=start_datetime,
-            dispatch_interval__lt=end_datetime
-        ).count()
-
-        # Count unique half-hourly intervals
-        from django.db.models import Count
-        unique_intervals = FacilityScada.objects.filter(
-            dispatch_interval__gte=start_datetime,
-            dispatch_interval__lt=end_datetime
-        ).values('dispatch_interval').annotate(
-            interval_count=Count('dispatch_interval')
-        ).count()
+        day = self.get_coverage_index(trading_date, trading_date).get(
+            trading_date, {'records': 0, 'intervals': 0}
+        )
 
         # Data exists if we have at least 40 unique half-hourly intervals
         # (allowing for some missing data at day boundaries)
-        exists = unique_intervals >= 40
+        exists = day['intervals'] >= self.MIN_DAILY_INTERVALS
 
-        return exists, count
\ No newline at end of file
+        return exists, day['records']
@@ -6,11 +6,20 @@ capacity factor distributions by technology for use in Monte Carlo simulations.
 
 Capacity factors represent how much energy a facility actually produces compared
 to its theoretical maximum, and vary year-to-year due to weather conditions.
+
+Calculated distributions are cached in the capacity_factor_distributions table,
+keyed by technology, analysis period and a data version token, so consumers
+read them with get_technology_distributions() and they are only recalculated
+when new MonthlyREPerformance months (or commissioned capacity) land.
+update_ret_dashboard refreshes the cache after ingestion (refresh_cache);
+rebuild with ``python manage.py rebuild_capacity_factors``.
 """
 
+import hashlib
 import logging
 import numpy as np
 import pandas as pd
+from django.db import transaction
 from django.db.models import Sum, Avg, Count, Q
 from datetime import datetime, date
 
@@ -102,6 +111,136 @@ class CapacityFactorAnalyzer:
 
         return distributions
 
+    # ------------------------------------------------------------------
+    # Cached distributions
+    # ------------------------------------------------------------------
+
+    def data_version(self):
+        """
+        Token of the data the distributions are calculated from.
+
+        Combines the MonthlyREPerformance months in the period (row count,
+        last id and last update) with the commissioned capacity that
+        generation is divided by (row count and total MW), so status and
+        capacity changes are picked up as well as new months.
+
+        Returns:
+            str, 40 character hex digest
+        """
+        from siren_web.models import MonthlyREPerformance, NewCapacityCommissioned
+        from .data_versions import table_state
+
+        performance, _ = table_state(
+            MonthlyREPerformance.objects.filter(year__gte=self.start_year, year__lte=self.end_year),
+            'updated_at'
+        )
+        capacity = NewCapacityCommissioned.objects.filter(
+            status='commissioned',
+            commissioned_date__lte=date(self.end_year, 12, 31)
+        ).order_by().aggregate(rows=Count('pk'), total=Sum('capacity_mw'))
+
+        parts = (performance, capacity['rows'], capacity['total'])
+        return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+    def get_technology_distributions(self):
+        """
+        Capacity factor distributions by technology, from the cache.
+
+        Reads the cached rows for the period and the current data version,
+        calculating and caching them first if there are none.
+
+        Returns:
+            dict: as calculate_technology_distributions()
+        """
+        version = self.data_version()
+        distributions = self._read_cache(version)
+        if distributions:
+            logger.info(f"Using cached capacity factor distributions for {self.start_year}-{self.end_year}")
+            return distributions
+        return self.refresh_distributions(version)
+
+    def _read_cache(self, version):
+        """Cached distributions for the period and data version, or {}"""
+        from siren_web.models import CapacityFactorDistribution
+
+        return {
+            row.technology: {
+                'mean': row.cf_mean,
+                'std': row.cf_std,
+                'min': row.cf_min,
+                'max': row.cf_max,
+                'n_months': row.n_months,
+            }
+            for row in CapacityFactorDistribution.objects.filter(
+                start_year=self.start_year,
+                end_year=self.end_year,
+                data_version=version,
+            )
+        }
+
+    def refresh_distributions(self, version=None):
+        """
+        Calculate the distributions and replace the period's cached rows.
+
+        Args:
+            version: data version token, if already known
+
+        Returns:
+            dict: the distributions calculated
+        """
+        from siren_web.models import CapacityFactorDistribution
+
+        version = version or self.data_version()
+        distributions = self.calculate_technology_distributions()
+
+        with transaction.atomic():
+            CapacityFactorDistribution.objects.filter(
+                start_year=self.start_year, end_year=self.end_year
+            ).delete()
+            # A concurrent refresh may have stored the same version
+            CapacityFactorDistribution.objects.bulk_create([
+                CapacityFactorDistribution(
+                    technology=technology,
+                    start_year=self.start_year,
+                    end_year=self.end_year,
+                    data_version=version,
+                    cf_mean=dist['mean'],
+                    cf_std=dist['std'],
+                    cf_min=dist['min'],
+                    cf_max=dist['max'],
+                    n_months=dist['n_months'],
+                )
+                for technology, dist in distributions.items()
+            ], ignore_conflicts=True)
+
+        logger.info(f"Cached capacity factor distributions for {self.start_year}-{self.end_year} "
+                    f"({len(distributions)} technologies)")
+        return distributions
+
+    def refresh_cache(self):
+        """
+        Recalculate the cached distributions if the data has changed, after ingestion.
+
+        Failures are logged rather than raised so they never fail an import;
+        the cache can be rebuilt later with rebuild_capacity_factors.
+
+        Returns:
+            bool, True if the distributions were recalculated
+        """
+        try:
+            version = self.data_version()
+            if self._read_cache(version):
+                return False
+            self.refresh_distributions(version)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not refresh capacity factor distributions: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Calculation
+    # ------------------------------------------------------------------
+
     def _calculate_tech_distribution(self, df, technology):
         """
         Calculate capacity factor distribution for a specific technology.
@@ -0,0 +1,126 @@
+# powerplot/services/chart_payload.py
+"""
+Compact encoding of chart data responses.
+
+Chart endpoints return their series column-wise (one list per field). With
+``?format=f32`` every numeric list of at least PACK_MIN_LENGTH values is sent
+as base64-encoded little-endian typed array bytes instead of a JSON number
+list:
+
+    {"dtype": "i32", "b64": "..."}   lists of integers (periods, hours)
+    {"dtype": "f32", "b64": "..."}   any other numbers (None -> NaN)
+
+powerplotui/static/js/chart_payload.js (fetchChartData / decodeChartPayload)
+requests and decodes the format in the browser. Without the parameter the
+response is the plain JSON it has always been. Decorate chart views with
+@chart_view so an unsupported format is rejected before the view runs.
+"""
+from functools import wraps
+import base64
+import logging
+
+import numpy as np
+from django.http import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+CHART_FORMATS = ('json', 'f32')
+
+# Shorter lists stay as JSON; the marker object would not save anything
+PACK_MIN_LENGTH = 32
+
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def _numeric_array(values):
+    """values as an int64/float64 array, or None if they are not all numbers"""
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return None
+    if array.ndim != 1:
+        return None
+    if array.dtype.kind == 'O':
+        # None mixed with numbers; numpy reads None as NaN for float arrays
+        if any(isinstance(v, (bool, str)) for v in values):
+            return None
+        try:
+            array = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        return None if np.isnan(array).all() else array
+    if array.dtype.kind in 'iuf':
+        return array
+    return None
+
+
+def encode_typed_array(array):
+    """
+    Encode a numeric array as a base64 little-endian typed array.
+
+    Integers that fit in int32 are sent as i32, everything else as f32.
+
+    Returns:
+        {'dtype': 'i32' | 'f32', 'b64': str}
+    """
+    array = np.asarray(array)
+    if array.dtype.kind in 'iu' and INT32_MIN <= array.min() and array.max() <= INT32_MAX:
+        dtype, array = 'i32', array.astype('<i4')
+    else:
+        dtype, array = 'f32', array.astype('<f4')
+    return {'dtype': dtype, 'b64': base64.b64encode(array.tobytes()).decode('ascii')}
+
+
+def pack_chart_data(data, min_length=PACK_MIN_LENGTH):
+    """
+    Replace every numeric list in a response structure with a typed array.
+
+    Lists of numbers (None allowed) with at least min_length entries are
+    encoded; dicts and other lists are walked recursively, everything else is
+    returned unchanged.
+    """
+    if isinstance(data, dict):
+        return {key: pack_chart_data(value, min_length) for key, value in data.items()}
+    if isinstance(data, (list, tuple, np.ndarray)):
+        if len(data) >= min_length:
+            array = _numeric_array(data)
+            if array is not None:
+                return encode_typed_array(array)
+        return [pack_chart_data(value, min_length) for value in data]
+    return data
+
+
+def chart_format_error(request):
+    """400 JsonResponse if ?format= is not a supported chart format, else None"""
+    chart_format = request.GET.get('format', 'json')
+    if chart_format not in CHART_FORMATS:
+        return JsonResponse({'error': f'Invalid format: {chart_format}'}, status=400)
+    return None
+
+
+def chart_view(view_func):
+    """Reject an unsupported ?format= with 400 before the view does any work"""
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        error = chart_format_error(request)
+        if error is not None:
+            return error
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+def chart_response(request, data, **kwargs):
+    """
+    JsonResponse for chart data in the format requested by ?format=.
+
+    Args:
+        request: HttpRequest; format=json (default) or format=f32
+        data: response dict with column-wise series
+        **kwargs: passed through to JsonResponse
+    """
+    error = chart_format_error(request)
+    if error is not None:
+        return error
+    if request.GET.get('format') == 'f32':
+        data = pack_chart_data(data)
+    return JsonResponse(data, **kwargs)
@@ -0,0 +1,178 @@
+# powerplot/services/data_versions.py
+"""
+Data version tokens for @versioned_view (see response_cache.py).
+
+Each function returns a DataVersion whose token changes whenever the data a
+view reads changes, using cheap aggregates rather than the data itself:
+
+- SCADA months: the facility_scada_monthly rollup (max updated_at and total
+  interval count), which ingest updates for every changed value; months
+  without rollup rows fall back to facility_scada (max created_at and row
+  count), and archived months add the archive file's modification time
+- supply years: supplyfactors row count and max id (rows are replaced, not
+  edited, when a year is regenerated)
+- other tables: row count, max id and max updated_at/created_at
+
+Tables without a timestamp (facilities, Scenarios) only register rows being
+added or removed; edits to those are picked up when cache entries expire.
+"""
+from datetime import datetime, timezone as dt_timezone
+import hashlib
+import logging
+
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+
+from siren_web.models import (
+    FacilityScada, FacilityScadaMonthly, MonthlyREPerformance,
+    NewCapacityCommissioned, PlotSurface, ReportComment, RiskCategory,
+    RiskEvent, Scenarios, TargetScenario, facilities, supplyfactors,
+)
+from .response_cache import DataVersion
+from .scada_storage import ScadaArchive, month_start, next_month
+
+logger = logging.getLogger(__name__)
+
+
+def _combine(parts, timestamps=()):
+    """DataVersion from token parts and candidate last-modified datetimes"""
+    token = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+    timestamps = [ts for ts in timestamps if ts is not None]
+    return DataVersion(token, max(timestamps) if timestamps else None)
+
+
+def table_state(queryset, timestamp_field=None):
+    """
+    (row count, max pk, max timestamp) for a queryset.
+
+    Returns:
+        Tuple of (parts tuple, last timestamp or None)
+    """
+    aggregates = {'rows': Count('pk'), 'last_pk': Max('pk')}
+    if timestamp_field:
+        aggregates['changed'] = Max(timestamp_field)
+    state = queryset.order_by().aggregate(**aggregates)
+    return (
+        (state['rows'], state['last_pk'], str(state.get('changed'))),
+        state.get('changed'),
+    )
+
+
+def scada_state(year, month=None):
+    """Version parts and last change for the SCADA data of a year or month"""
+    months = [month] if month else range(1, 13)
+    rollup = FacilityScadaMonthly.objects.filter(year=year, month__in=months).aggregate(
+        changed=Max('updated_at'), intervals=Sum('interval_count')
+    )
+    parts = [year, month, str(rollup['changed']), rollup['intervals']]
+    changed = rollup['changed']
+
+    if not rollup['intervals']:
+        start = month_start(year, month or 1)
+        end = month_start(*next_month(year, month)) if month else month_start(year + 1, 1)
+        raw, changed = table_state(
+            FacilityScada.objects.filter(dispatch_interval__gte=start, dispatch_interval__lt=end),
+            'created_at'
+        )
+        parts.append(raw)
+
+    archive = ScadaArchive()
+    for m in months:
+        if archive.is_archived(year, m):
+            mtime = archive.month_path(year, m).stat().st_mtime
+            parts.append((m, mtime))
+            archived = datetime.fromtimestamp(mtime, tz=dt_timezone.utc)
+            changed = max(changed, archived) if changed else archived
+
+    return tuple(parts), changed
+
+
+def supply_version(year):
+    """DataVersion of the supplyfactors rows for a year"""
+    parts, _ = table_state(supplyfactors.objects.filter(year=year))
+    return _combine((year, parts))
+
+
+def _request_year(request):
+    try:
+        return int(request.GET.get('year'))
+    except (TypeError, ValueError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# Version functions for @versioned_view: (request, *args, **kwargs)
+# ----------------------------------------------------------------------
+
+def supply_data_version(request):
+    """Supply chart endpoints: the supplyfactors rows for ?year="""
+    year = _request_year(request)
+    return supply_version(year) if year else None
+
+
+def scada_data_version(request):
+    """SCADA chart endpoints: the SCADA data for ?year="""
+    year = _request_year(request)
+    if not year:
+        return None
+    parts, changed = scada_state(year)
+    return _combine(parts, [changed])
+
+
+def scada_vs_supply_version(request):
+    """SCADA vs supply endpoints: SCADA and supplyfactors data for ?year="""
+    year = _request_year(request)
+    if not year:
+        return None
+    scada_parts, changed = scada_state(year)
+    supply_parts, _ = table_state(supplyfactors.objects.filter(year=year))
+    return _combine((scada_parts, supply_parts), [changed])
+
+
+def ret_dashboard_version(request, year=None, month=None):
+    """
+    RET dashboard inputs.
+
+    Includes today's date, as the default month and the recent quarter
+    links depend on it.
+    """
+    states = [
+        table_state(MonthlyREPerformance.objects.all(), 'updated_at'),
+        table_state(ReportComment.objects.all(), 'updated_at'),
+        table_state(NewCapacityCommissioned.objects.all(), 'created_at'),
+        table_state(TargetScenario.objects.all(), 'updated_at'),
+    ]
+    parts = (timezone.now().date(), [p for p, _ in states])
+    return _combine(parts, [changed for _, changed in states])
+
+
+def scada_report_version(request, year=None, month=None):
+    """Monthly SCADA analysis report inputs, including the year's SCADA data"""
+    if year is None or month is None:
+        latest = MonthlyREPerformance.objects.first()
+        year = latest.year if latest else None
+
+    states = [
+        table_state(MonthlyREPerformance.objects.all(), 'updated_at'),
+        table_state(facilities.objects.all()),
+    ]
+    if year:
+        states.append(scada_state(int(year)))
+    parts = (timezone.now().year, [p for p, _ in states])
+    return _combine(parts, [changed for _, changed in states])
+
+
+def risk_dashboard_version(request):
+    """Risk dashboard inputs"""
+    states = [
+        table_state(RiskEvent.objects.all(), 'updated_at'),
+        table_state(RiskCategory.objects.all(), 'updated_at'),
+        table_state(Scenarios.objects.all()),
+    ]
+    return _combine([p for p, _ in states], [changed for _, changed in states])
+
+
+def plot_surface_version(request):
+    """3D history charts: the precomputed plot_surface rows"""
+    parts, changed = table_state(PlotSurface.objects.all(), 'updated_at')
+    return _combine(parts, [changed])
@@ -0,0 +1,158 @@
+# powerplot/services/downsampling.py
+"""
+Shape-preserving downsampling of chart series.
+
+Hourly comparison charts carry 8760+ points per series. Before they are sent
+to the browser the series can be reduced to a target point count with either:
+
+- lttb: Largest-Triangle-Three-Buckets, one point per bucket chosen to
+  maximise the triangle area with its neighbours, which keeps the visual shape
+- minmax: the minimum and maximum point of each bucket, which keeps every
+  local extreme
+
+Series that share an x axis are reduced to a common set of x positions: the
+union of the points each series selects from an equal share of the budget,
+plus the peak (maximum) and minimum of every series, so the highest hour is
+never dropped from the chart. Metrics should always be calculated on the full
+series before downsampling.
+"""
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DOWNSAMPLE_METHODS = ('lttb', 'minmax')
+
+# Smallest useful per-series budget (LTTB always keeps the first and last point)
+MIN_SERIES_POINTS = 3
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: array-like of x values (ascending)
+        y: array-like of y values
+        n_out: number of points to keep
+
+    Returns:
+        int64 array of ascending indices into x/y
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < MIN_SERIES_POINTS:
+        return np.arange(n)
+
+    # n_out - 2 buckets spanning the interior points; the ends are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = edges[bucket + 2]
+            next_x = x[end:next_end].mean()
+            next_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """
+    Indices of the minimum and maximum point in each of n_out / 2 buckets.
+
+    Args:
+        y: array-like of y values
+        n_out: number of points to keep (at most)
+
+    Returns:
+        int64 array of ascending indices into y
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    selected = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            bucket = y[start:end]
+            selected.extend((start + int(np.argmin(bucket)), start + int(np.argmax(bucket))))
+    return np.unique(selected)
+
+
+def downsample_indices(periods, series, max_points, method='lttb'):
+    """
+    Common indices to keep for several series sharing the same periods.
+
+    Args:
+        periods: array-like of x values (ascending)
+        series: dict of name -> array-like of y values aligned with periods
+        max_points: target number of points
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        int64 array of ascending indices, or None if no reduction is needed
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Invalid downsample method: {method}")
+
+    n = len(periods)
+    if not max_points or n <= max_points or not series:
+        return None
+
+    # Leave room for each series' peak and minimum within the target
+    budget = max(max_points // len(series) - 2, MIN_SERIES_POINTS)
+    keep = [np.array([0, n - 1], dtype=np.int64)]
+    for values in series.values():
+        y = np.asarray(values, dtype=np.float64)
+        if method == 'lttb':
+            keep.append(lttb_indices(periods, y, budget))
+        else:
+            keep.append(minmax_indices(y, budget))
+        keep.append(np.array([np.argmax(y), np.argmin(y)], dtype=np.int64))
+
+    return np.unique(np.concatenate(keep))
+
+
+def downsample_series(periods, series, max_points, method='lttb'):
+    """
+    Reduce periods and aligned value lists to about max_points points.
+
+    Args:
+        periods: list of x values (ascending)
+        series: dict of name -> list of y values aligned with periods
+        max_points: target number of points (None or 0 for no reduction)
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        Tuple of (periods, series) as lists, unchanged when no reduction
+        is needed
+    """
+    index = downsample_indices(periods, series, max_points, method)
+    if index is None:
+        return periods, series
+
+    logger.debug(f"Downsampled {len(periods)} points to {len(index)} ({method})")
+    periods = np.asarray(periods)[index].tolist()
+    series = {
+        name: np.asarray(values, dtype=np.float64)[index].tolist()
+        for name, values in series.items()
+    }
+    return periods, series
@@ -8,6 +8,7 @@ from django.db import transaction, connection
 from django.utils import timezone
 import pytz
 from siren_web.models import DPVGeneration
+from .plot_surfaces import DEMAND_SURFACE, PlotSurfaceService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -234,6 +235,9 @@ class DPVDataFetcher:
                     continue
         
         logger.info(f"MariaDB bulk upsert completed: {total_saved} records processed")
+        PlotSurfaceService().refresh_for_dates(
+            DEMAND_SURFACE, [r['trading_date'] for r in records]
+        )
         return total_saved
     
     def fetch_date_range(self, start_date, end_date):
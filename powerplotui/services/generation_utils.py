@@ -9,6 +9,8 @@ import math
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 
 def get_hour_range_from_months(start_month: int, end_month: int) -> tuple[int, int]:
     """Convert month numbers to hour ranges (1-based months and hours).
@@ -40,6 +42,20 @@ def get_hour_of_year(dt: datetime) -> int:
     return int(delta.total_seconds() / 3600) + 1
 
 
+def get_hours_of_year(timestamps) -> np.ndarray:
+    """Vectorized get_hour_of_year for an array of UTC epoch seconds.
+
+    Args:
+        timestamps: Array-like of epoch seconds (int64)
+
+    Returns:
+        int64 array of hour of year (1-based), each relative to its own year
+    """
+    stamps = np.asarray(timestamps, dtype=np.int64).astype('datetime64[s]')
+    year_starts = stamps.astype('datetime64[Y]').astype('datetime64[s]')
+    return (stamps - year_starts).astype(np.int64) // 3600 + 1
+
+
 def get_month_from_hour(hour: int) -> int:
     """Determine which month a given hour of year belongs to.
 
@@ -72,6 +88,84 @@ def get_week_from_hour(hour: int) -> int:
     return ((hour - 1) // 168) + 1
 
 
+# Highest hour of year (leap year); the lookup tables are indexed by hour 0..MAX_HOUR_OF_YEAR
+MAX_HOUR_OF_YEAR = 8784
+
+# Precomputed hour of year -> day/week/month, matching the scalar functions above
+HOUR_TO_DAY = (np.arange(MAX_HOUR_OF_YEAR + 1) - 1) // 24 + 1
+HOUR_TO_WEEK = np.array([get_week_from_hour(h) for h in range(MAX_HOUR_OF_YEAR + 1)])
+HOUR_TO_MONTH = np.array([get_month_from_hour(h) for h in range(MAX_HOUR_OF_YEAR + 1)])
+
+PERIOD_LOOKUPS = {
+    'day': HOUR_TO_DAY,
+    'week': HOUR_TO_WEEK,
+    'month': HOUR_TO_MONTH,
+}
+
+
+def get_periods_from_hours(hours, period: str) -> np.ndarray:
+    """Vectorized hour of year -> period number via the lookup tables.
+
+    Args:
+        hours: Array-like of hours of year (1-based)
+        period: 'hour', 'day', 'week', or 'month'
+
+    Returns:
+        int64 array of period numbers ('hour' returns the hours unchanged)
+
+    Raises:
+        ValueError: If period is not recognised
+    """
+    hours = np.asarray(hours, dtype=np.int64)
+    if period == 'hour':
+        return hours
+    if period not in PERIOD_LOOKUPS:
+        raise ValueError(f"Invalid period: {period}")
+    return PERIOD_LOOKUPS[period][np.clip(hours, 0, MAX_HOUR_OF_YEAR)]
+
+
+def aggregate_arrays_by_period(hours, period: str, values: dict) -> dict:
+    """Average one or more value arrays by period in a single grouping pass.
+
+    Rows are grouped on the period of each hour and every field is reduced with
+    a weighted bincount over the same group index, so all fields come out of
+    one pass. 'hour' averages any duplicate hours.
+
+    Args:
+        hours: Array-like of hours of year (1-based)
+        period: 'hour', 'day', 'week', or 'month'
+        values: Dict of field name -> array-like of values aligned with hours
+
+    Returns:
+        Dict with 'periods' (sorted int64 array) and a float64 array of
+        period means for each field
+    """
+    periods, index = np.unique(get_periods_from_hours(hours, period), return_inverse=True)
+    index = index.ravel()
+    counts = np.bincount(index, minlength=len(periods))
+
+    result = {'periods': periods}
+    for field, field_values in values.items():
+        sums = np.bincount(
+            index, weights=np.asarray(field_values, dtype=np.float64), minlength=len(periods)
+        )
+        result[field] = sums / counts if len(periods) else sums
+    return result
+
+
+def _hour_data_arrays(hour_data: list[dict], value_fields: list[str]) -> tuple:
+    """Columns of a list of hour dicts as arrays (missing/None values -> 0)"""
+    hours = np.fromiter((entry['hour'] for entry in hour_data), dtype=np.int64, count=len(hour_data))
+    values = {
+        field: np.fromiter(
+            (entry.get(field, 0) or 0 for entry in hour_data),
+            dtype=np.float64, count=len(hour_data)
+        )
+        for field in value_fields
+    }
+    return hours, values
+
+
 def aggregate_by_hour(hour_data: list[dict], value_field: str = 'quantity') -> dict:
     """Aggregate data by hour (handles duplicates by averaging).
 
@@ -82,21 +176,7 @@ def aggregate_by_hour(hour_data: list[dict], value_field: str = 'quantity') -> d
     Returns:
         Dict with 'periods' and value field lists
     """
-    hour_dict = {}
-    for entry in hour_data:
-        hour = entry['hour']
-        value = entry.get(value_field, 0) or 0
-        if hour not in hour_dict:
-            hour_dict[hour] = []
-        hour_dict[hour].append(value)
-
-    hours = sorted(hour_dict.keys())
-    values = [sum(hour_dict[h]) / len(hour_dict[h]) for h in hours]
-
-    return {
-        'periods': hours,
-        value_field: values
-    }
+    return aggregate_multiple_fields(hour_data, 'hour', [value_field])
 
 
 def aggregate_by_week(hour_data: list[dict], value_field: str = 'quantity') -> dict:
@@ -109,24 +189,7 @@ def aggregate_by_week(hour_data: list[dict], value_field: str = 'quantity') -> d
     Returns:
         Dict with 'periods' (week numbers) and averaged values
     """
-    week_dict = {}
-
-    for entry in hour_data:
-        hour = entry['hour']
-        value = entry.get(value_field, 0) or 0
-        week = get_week_from_hour(hour)
-
-        if week not in week_dict:
-            week_dict[week] = []
-        week_dict[week].append(value)
-
-    weeks = sorted(week_dict.keys())
-    values = [sum(week_dict[w]) / len(week_dict[w]) for w in weeks]
-
-    return {
-        'periods': weeks,
-        value_field: values
-    }
+    return aggregate_multiple_fields(hour_data, 'week', [value_field])
 
 
 def aggregate_by_month(hour_data: list[dict], value_field: str = 'quantity') -> dict:
@@ -139,24 +202,7 @@ def aggregate_by_month(hour_data: list[dict], value_field: str = 'quantity') ->
     Returns:
         Dict with 'periods' (month numbers 1-12) and averaged values
     """
-    month_dict = {}
-
-    for entry in hour_data:
-        hour = entry['hour']
-        value = entry.get(value_field, 0) or 0
-        month = get_month_from_hour(hour)
-
-        if month not in month_dict:
-            month_dict[month] = []
-        month_dict[month].append(value)
-
-    months = sorted(month_dict.keys())
-    values = [sum(month_dict[m]) / len(month_dict[m]) for m in months]
-
-    return {
-        'periods': months,
-        value_field: values
-    }
+    return aggregate_multiple_fields(hour_data, 'month', [value_field])
 
 
 def aggregate_by_period(hour_data: list[dict], period: str, value_field: str = 'quantity') -> dict:
@@ -173,19 +219,16 @@ def aggregate_by_period(hour_data: list[dict], period: str, value_field: str = '
     Raises:
         ValueError: If period is not 'hour', 'week', or 'month'
     """
-    if period == 'hour':
-        return aggregate_by_hour(hour_data, value_field)
-    elif period == 'week':
-        return aggregate_by_week(hour_data, value_field)
-    elif period == 'month':
-        return aggregate_by_month(hour_data, value_field)
-    else:
+    if period not in ('hour', 'week', 'month'):
         raise ValueError(f"Invalid period: {period}. Must be 'hour', 'week', or 'month'")
+    return aggregate_multiple_fields(hour_data, period, [value_field])
 
 
 def aggregate_multiple_fields(hour_data: list[dict], period: str, value_fields: list[str]) -> dict:
     """Aggregate multiple value fields by period.
 
+    List-of-dicts wrapper around aggregate_arrays_by_period().
+
     Args:
         hour_data: List of dicts with 'hour' and value field(s)
         period: 'hour', 'week', or 'month'
@@ -194,39 +237,12 @@ def aggregate_multiple_fields(hour_data: list[dict], period: str, value_fields:
     Returns:
         Dict with 'periods' and aggregated values for each field
     """
-    if period == 'hour':
-        get_period = lambda h: h
-    elif period == 'week':
-        get_period = get_week_from_hour
-    elif period == 'month':
-        get_period = get_month_from_hour
-    else:
+    if period not in ('hour', 'week', 'month'):
         raise ValueError(f"Invalid period: {period}")
 
-    # Initialize period dictionaries for each field
-    period_data = {}
-
-    for entry in hour_data:
-        hour = entry['hour']
-        p = get_period(hour)
-
-        if p not in period_data:
-            period_data[p] = {field: [] for field in value_fields}
-
-        for field in value_fields:
-            value = entry.get(field, 0) or 0
-            period_data[p][field].append(value)
-
-    periods = sorted(period_data.keys())
-    result = {'periods': periods}
-
-    for field in value_fields:
-        result[field] = [
-            sum(period_data[p][field]) / len(period_data[p][field])
-            for p in periods
-        ]
-
-    return result
+    hours, values = _hour_data_arrays(hour_data, value_fields)
+    aggregated = aggregate_arrays_by_period(hours, period, values)
+    return {field: array.tolist() for field, array in aggregated.items()}
 
 
 def calculate_correlation_metrics(data1: list, data2: list,
@@ -431,13 +447,14 @@ def get_x_label(aggregation: str) -> str:
     """Get the appropriate x-axis label for an aggregation level.
 
     Args:
-        aggregation: 'hour', 'week', or 'month'
+        aggregation: 'hour', 'day', 'week', or 'month'
 
     Returns:
         Human-readable x-axis label
     """
     labels = {
         'hour': 'Hour of Year',
+        'day': 'Day of Year',
         'week': 'Week of Year',
         'month': 'Month of Year'
     }
@@ -1,7 +1,11 @@
 # powerplot/services/load_analyzer.py
-from django.db.models import Avg, F, Q
-from datetime import datetime
+from collections import defaultdict
+from decimal import Decimal
+from django.db.models import Avg, Count, F, Q, Sum
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 from siren_web.models import FacilityScada, DPVGeneration
+from .scada_rollups import ScadaRollupService
+from .scada_storage import ScadaArchive, split_by_storage
 from django.db.models.functions import ExtractHour, ExtractMinute
 import logging
 
@@ -46,22 +50,16 @@ class LoadAnalyzer:
         from django.db.models import F, FloatField
         from django.db.models.functions import Cast
         
-        # Aggregate SCADA data by time of day
-        scada_aggregated = FacilityScada.objects.filter(
-            dispatch_interval__gte=start_date,
-            dispatch_interval__lt=end_date
-        ).annotate(
-            hour=ExtractHour('dispatch_interval'),
-            minute=ExtractMinute('dispatch_interval')
-        ).values('hour', 'minute').annotate(
-            avg_quantity=Avg('quantity')
-        ).order_by('hour', 'minute')
-        
-        # Convert to dict keyed by time_of_day
+        # Whole-month ranges can be served from the monthly rollup
         operational_profile = {}
-        for item in scada_aggregated:
-            time_of_day = item['hour'] + item['minute'] / 60.0
-            operational_profile[time_of_day] = float(item['avg_quantity'] or 0)
+        if self._is_month_boundary(start_date) and self._is_month_boundary(end_date):
+            last_month = end_date - timedelta(days=1)
+            operational_profile = ScadaRollupService().get_diurnal_averages(
+                start_date.year, start_date.month, last_month.year, last_month.month
+            )
+
+        if not operational_profile:
+            operational_profile = self._scada_time_of_day_averages(start_date, end_date)
 
         # Aggregate DPV data by time of day
         dpv_aggregated = DPVGeneration.objects.filter(
@@ -96,4 +94,52 @@ class LoadAnalyzer:
                 'underlying_demand': float(underlying)
             })
         
-        return result
\ No newline at end of file
+        return result
+
+    @staticmethod
+    def _scada_time_of_day_averages(start_date, end_date):
+        """
+        Average SCADA quantity by time of day over [start_date, end_date),
+        read from facility_scada and, for archived months, the SCADA archive.
+        """
+        start_utc = start_date.replace(tzinfo=dt_timezone.utc)
+        end_utc = end_date.replace(tzinfo=dt_timezone.utc)
+        archive = ScadaArchive()
+        archived, db_ranges = split_by_storage(start_utc, end_utc, archive)
+
+        totals = defaultdict(Decimal)
+        counts = defaultdict(int)
+        for range_start, range_end in db_ranges:
+            # Aggregate SCADA data by time of day
+            scada_aggregated = FacilityScada.objects.filter(
+                dispatch_interval__gte=range_start,
+                dispatch_interval__lt=range_end
+            ).annotate(
+                hour=ExtractHour('dispatch_interval'),
+                minute=ExtractMinute('dispatch_interval')
+            ).values('hour', 'minute').annotate(
+                total_quantity=Sum('quantity'),
+                record_count=Count('quantity')
+            ).order_by('hour', 'minute')
+
+            for item in scada_aggregated:
+                time_of_day = item['hour'] + item['minute'] / 60.0
+                totals[time_of_day] += item['total_quantity'] or 0
+                counts[time_of_day] += item['record_count']
+
+        for year, month in archived:
+            for dispatch_interval, _, quantity in archive.iter_month(year, month, start_utc, end_utc):
+                time_of_day = dispatch_interval.hour + dispatch_interval.minute / 60.0
+                totals[time_of_day] += quantity
+                counts[time_of_day] += 1
+
+        # Convert to dict keyed by time_of_day
+        return {
+            time_of_day: float(totals[time_of_day] / counts[time_of_day]) if counts[time_of_day] else 0.0
+            for time_of_day in sorted(counts)
+        }
+
+    @staticmethod
+    def _is_month_boundary(value):
+        """True if value is midnight on the first day of a month"""
+        return value.day == 1 and value.time() == time.min
\ No newline at end of file
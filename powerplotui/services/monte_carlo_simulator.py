@@ -11,20 +11,95 @@ The simulation models four key uncertainties:
 4. Demand growth uncertainty (future electricity demand)
 
 Uses vectorized NumPy operations to run 100,000+ iterations efficiently.
+
+Random numbers come from numpy.random.SeedSequence: every batch draws from its
+own child stream spawned from the simulation seed, so a run is reproducible
+from its seed and batch size alone. Batches can be spread over a process pool
+(workers > 1) for 10M+ iteration runs; the results are bit-identical whatever
+the number of workers.
+
+Results are summarised batch by batch in a StreamingStatistics accumulator
+(see monte_carlo_statistics.py), so memory does not grow with the number of
+iterations. In adaptive mode (a ConvergenceMonitor) num_iterations is the
+maximum: the run stops after the first batch at which the target
+probabilities and percentiles are known to within the requested tolerances.
+
+The uniforms behind the four uncertainties can be drawn with variance
+reduction (sampling='sobol', 'lhs' or 'antithetic'; see UncertaintySampler)
+for the same accuracy from fewer iterations; benchmark_sampling compares the
+methods.
+
+In chronological mode (chronological=True) the capacity factor uncertainty is
+replaced by a sampled weather year, and each iteration's build-out is
+dispatched hour by hour against that year's supplyfactors profiles, with
+storage and curtailment (see hourly_dispatch.py), instead of the annual
+capacity x capacity factor estimate.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import logging
 import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
+from django.db import connections
 from django.db.models import Sum, Q
 import time
 
 from .uncertainty_sampler import UncertaintySampler
+from .monte_carlo_statistics import (
+    DEFAULT_PERCENTILES, ConvergenceMonitor, StreamingStatistics,
+)
 from .capacity_factor_analyzer import CapacityFactorAnalyzer
+from .hourly_dispatch import ChronologicalDispatcher, HourlyProfiles, load_hourly_profiles
 
 logger = logging.getLogger(__name__)
 
+# Simulator holding the shared inputs in a pool worker (see _init_worker)
+_worker_simulator = None
+
+
+def _init_worker(inputs):
+    """
+    Process pool initializer: build a simulator from the shared inputs.
+
+    The pipeline, capacity factor and demand inputs are sent once per worker
+    rather than with every batch, and are only read from then on.
+    """
+    global _worker_simulator
+    _worker_simulator = MonteCarloSimulator.from_inputs(inputs)
+
+
+def _run_batch_worker(batch_size, seed_sequence):
+    """
+    Process pool entry point: one batch drawn from its own child stream.
+
+    Returns:
+        StreamingStatistics of the batch, for merging in the parent
+    """
+    return StreamingStatistics().update(
+        _worker_simulator._calculate_iteration_batch(batch_size, np.random.default_rng(seed_sequence))
+    )
+
+
+@dataclass(frozen=True)
+class SimulationInputs:
+    """
+    Snapshot of the database inputs a simulation reads.
+
+    Loaded once with MonteCarloSimulator.load_shared_inputs() and passed to
+    each simulator (inputs=...), e.g. for every TargetScenario in a run-all,
+    instead of each one running the same MySQL queries again. The
+    snapshot is frozen and shared, so its contents must be treated as
+    read-only.
+    """
+    target_year: int
+    cf_distributions: dict
+    pipeline_df: pd.DataFrame
+    base_demand_2040: float
+    hourly_profiles: HourlyProfiles = None  # chronological mode only
+
 
 class MonteCarloSimulator:
     """
@@ -39,7 +114,9 @@ class MonteCarloSimulator:
     """
 
     def __init__(self, target_scenario, num_iterations=100000,
-                 probability_profile='optimistic', target_year=2040):
+                 probability_profile='optimistic', target_year=2040,
+                 seed=None, workers=1, convergence=None, sampling='random', inputs=None,
+                 chronological=False):
         """
         Initialize simulator with scenario and parameters.
 
@@ -48,23 +125,87 @@ class MonteCarloSimulator:
             num_iterations: int, number of Monte Carlo iterations
             probability_profile: str, 'optimistic', 'balanced', or 'conservative'
             target_year: int, year to project to (default 2040)
+            seed: int, random seed (default: fresh entropy, recorded with the run)
+            workers: int, worker processes for the iterations (default 1, in process)
+            convergence: ConvergenceMonitor for adaptive mode, stopping once its
+                tolerances are met (default None, run all num_iterations)
+            sampling: str, how uniforms are drawn: 'random', 'sobol', 'lhs' or
+                'antithetic' (see UncertaintySampler.SAMPLING_METHODS)
+            inputs: SimulationInputs snapshot to use instead of loading from
+                the database (default None, load when run)
+            chronological: bool, dispatch each iteration hourly against a
+                sampled weather year instead of the annual estimate
         """
+        if sampling not in UncertaintySampler.SAMPLING_METHODS:
+            raise ValueError(f"Invalid sampling method '{sampling}'")
+        if inputs is not None and inputs.target_year != target_year:
+            raise ValueError(f"Inputs were loaded for {inputs.target_year}, not {target_year}")
+
         self.target_scenario = target_scenario
         self.num_iterations = num_iterations
         self.probability_profile = probability_profile
         self.target_year = target_year
+        self.seed = np.random.SeedSequence().entropy if seed is None else seed
+        self.workers = max(1, workers)
+        self.convergence = convergence
+        self.converged = None
+        self.sampling = sampling
+        self.inputs = inputs
+        self.chronological = chronological
+        self.storage_mwh = None  # chronological mode (default: the scenario's storage)
 
         # Batch size for processing iterations
         # Process in chunks to manage memory
-        self.batch_size = 10000
+        # (a power of 2 for Sobol' points, which are balanced at 2^k points)
+        self.batch_size = 8192 if sampling == 'sobol' else 10000
 
         # Data containers (loaded lazily)
         self.cf_distributions = None
         self.pipeline_df = None
         self.base_demand_2040 = None
+        self.hourly_profiles = None
+        self._arrays = None  # see _facility_arrays
+        self._dispatcher = None  # see _chronological_dispatcher
 
         logger.info(f"Initialized MonteCarloSimulator: {num_iterations} iterations, {probability_profile} profile")
 
+    def shared_inputs(self):
+        """Loaded inputs a batch reads, as handed to pool workers"""
+        return {
+            'probability_profile': self.probability_profile,
+            'target_year': self.target_year,
+            'cf_distributions': self.cf_distributions,
+            'pipeline_df': self.pipeline_df,
+            'base_demand_2040': self.base_demand_2040,
+            'sampling': self.sampling,
+            'chronological': self.chronological,
+            'hourly_profiles': self.hourly_profiles,
+            'storage_mwh': self._storage_mwh(),
+        }
+
+    @classmethod
+    def from_inputs(cls, inputs):
+        """Simulator for running batches from shared_inputs(), without a scenario"""
+        simulator = cls(
+            None,
+            probability_profile=inputs['probability_profile'],
+            target_year=inputs['target_year'],
+            sampling=inputs['sampling'],
+            chronological=inputs.get('chronological', False),
+        )
+        simulator.cf_distributions = inputs['cf_distributions']
+        simulator.pipeline_df = inputs['pipeline_df']
+        simulator.base_demand_2040 = inputs['base_demand_2040']
+        simulator.hourly_profiles = inputs.get('hourly_profiles')
+        simulator.storage_mwh = inputs.get('storage_mwh', 0.0)
+        return simulator
+
+    def _storage_mwh(self):
+        """Storage dispatched in chronological mode: the scenario's storage (MWh)"""
+        if self.storage_mwh is not None:
+            return self.storage_mwh
+        return (self.target_scenario.storage or 0.0) if self.target_scenario else 0.0
+
     def run_simulation(self, simulation_record):
         """
         Main entry point - runs full simulation and updates database.
@@ -85,46 +226,54 @@ class MonteCarloSimulator:
             simulation_record.status = 'running'
             simulation_record.save(update_fields=['status'])
 
-            # Step 1: Load data
-            logger.info("Step 1: Loading capacity factor distributions...")
-            self.cf_distributions = self._load_capacity_factor_distributions()
-            self._store_parameters(simulation_record, 'capacity_factor', self.cf_distributions,
-                                 "Capacity factor distributions by technology")
-
-            logger.info("Step 2: Loading pipeline facilities...")
-            self.pipeline_df = self._load_pipeline_facilities()
-            logger.info(f"  Loaded {len(self.pipeline_df)} pipeline facilities")
-
-            logger.info("Step 3: Calculating base demand projection...")
-            self.base_demand_2040 = self._calculate_base_demand()
-            self._store_parameters(simulation_record, 'demand_growth',
-                                 {'base_demand_2040_gwh': self.base_demand_2040},
-                                 "Base 2040 demand projection")
+            # Steps 1-3: Load data (or take it from the shared snapshot)
+            self.load_inputs()
+            parameters = self._parameter_rows(simulation_record, 'capacity_factor', self.cf_distributions,
+                                              "Capacity factor distributions by technology")
+            parameters += self._parameter_rows(simulation_record, 'demand_growth',
+                                               {'base_demand_2040_gwh': self.base_demand_2040},
+                                               "Base 2040 demand projection")
 
             # Step 4: Store commissioning probabilities
             commissioning_probs = {
                 status: UncertaintySampler.get_probability_for_status(status, self.probability_profile)
                 for status in ['commissioned', 'under_construction', 'planned', 'probable', 'possible']
             }
-            self._store_parameters(simulation_record, 'commissioning_probability', commissioning_probs,
-                                 f"{self.probability_profile.capitalize()} commissioning probability profile")
+            parameters += self._parameter_rows(simulation_record, 'commissioning_probability', commissioning_probs,
+                                               f"{self.probability_profile.capitalize()} commissioning probability profile")
 
             # Step 5: Store delay distribution
-            self._store_parameters(simulation_record, 'delay_distribution',
-                                 {'min_months': 0, 'max_months': 24, 'distribution': 'uniform'},
-                                 "Commissioning delay distribution")
+            parameters += self._parameter_rows(simulation_record, 'delay_distribution',
+                                               {'min_months': 0, 'max_months': 24, 'distribution': 'uniform'},
+                                               "Commissioning delay distribution")
+
+            # Seed and batch size together determine every random stream
+            parameters += self._parameter_rows(simulation_record, 'general',
+                                               {'random_seed': str(self.seed), 'batch_size': self.batch_size,
+                                                'sampling_method': self.sampling},
+                                               "Random seed, batch size and sampling method (results do not depend on workers)")
+            if self.convergence:
+                parameters += self._parameter_rows(simulation_record, 'general', self.convergence.settings(),
+                                                   "Adaptive mode stopping tolerances (pp)")
+            if self.chronological:
+                parameters += self._parameter_rows(simulation_record, 'general', self._dispatch_settings(),
+                                                   "Chronological mode: weather years and storage dispatched hourly")
+
+            # All parameters in one insert
+            MonteCarloParameter.objects.bulk_create(parameters)
+            logger.debug(f"Stored {len(parameters)} parameters")
 
             # Step 6: Run Monte Carlo iterations
             logger.info(f"Step 4: Running {self.num_iterations} Monte Carlo iterations...")
-            re_percentage_results = self._run_iterations()
+            results = self._run_iterations()
 
             # Step 7: Calculate statistics
             logger.info("Step 5: Calculating statistics...")
-            stats = self._calculate_statistics(re_percentage_results)
+            stats = self._calculate_statistics(results)
 
             # Step 8: Store results
             logger.info("Step 6: Storing results...")
-            self._store_results(simulation_record, re_percentage_results, stats)
+            self._store_results(simulation_record, results, stats)
 
             # Update execution time
             execution_time = time.time() - start_time
@@ -146,15 +295,66 @@ class MonteCarloSimulator:
             simulation_record.save()
             raise
 
+    @classmethod
+    def load_shared_inputs(cls, target_year=2040, chronological=False):
+        """
+        Load the database inputs once, for sharing between simulators.
+
+        Args:
+            target_year: int, year to project to
+            chronological: bool, also load the hourly weather year profiles
+
+        Returns:
+            SimulationInputs
+        """
+        loader = cls(None, target_year=target_year, chronological=chronological)
+        loader.load_inputs()
+        return SimulationInputs(
+            target_year=target_year,
+            cf_distributions=loader.cf_distributions,
+            pipeline_df=loader.pipeline_df,
+            base_demand_2040=loader.base_demand_2040,
+            hourly_profiles=loader.hourly_profiles,
+        )
+
+    def load_inputs(self):
+        """Load the capacity factor distributions, pipeline facilities and base demand"""
+        self._arrays = None
+        self._dispatcher = None
+        if self.inputs is not None:
+            logger.info("Steps 1-3: Using shared input snapshot")
+            self.cf_distributions = self.inputs.cf_distributions
+            self.pipeline_df = self.inputs.pipeline_df
+            self.base_demand_2040 = self.inputs.base_demand_2040
+            self.hourly_profiles = self.inputs.hourly_profiles
+            if self.chronological and self.hourly_profiles is None:
+                self.hourly_profiles = load_hourly_profiles()
+            return
+
+        logger.info("Step 1: Loading capacity factor distributions...")
+        self.cf_distributions = self._load_capacity_factor_distributions()
+
+        logger.info("Step 2: Loading pipeline facilities...")
+        self.pipeline_df = self._load_pipeline_facilities()
+        logger.info(f"  Loaded {len(self.pipeline_df)} pipeline facilities")
+
+        logger.info("Step 3: Calculating base demand projection...")
+        self.base_demand_2040 = self._calculate_base_demand()
+
+        if self.chronological:
+            logger.info("Loading hourly weather year profiles...")
+            self.hourly_profiles = load_hourly_profiles()
+
     def _load_capacity_factor_distributions(self):
         """
-        Calculate mean and std dev for each technology from MonthlyREPerformance.
+        Mean and std dev for each technology from MonthlyREPerformance, read
+        from the cached distributions when the data has not changed.
 
         Returns:
             dict: {technology: {'mean': X, 'std': Y, 'min': A, 'max': B}}
         """
         analyzer = CapacityFactorAnalyzer()
-        distributions = analyzer.calculate_technology_distributions()
+        distributions = analyzer.get_technology_distributions()
         analyzer.validate_distributions(distributions)
         return distributions
 
@@ -247,35 +447,177 @@ class MonteCarloSimulator:
         logger.warning(f"Using fallback demand: {fallback_demand} GWh")
         return fallback_demand
 
+    def _batches(self):
+        """
+        Batch sizes and their random streams.
+
+        Each batch gets its own child of the seed's SeedSequence, so a batch
+        draws the same numbers whichever process runs it.
+
+        Returns:
+            list of (batch_size, SeedSequence) tuples
+        """
+        sizes = [
+            min(self.batch_size, self.num_iterations - batch_start)
+            for batch_start in range(0, self.num_iterations, self.batch_size)
+        ]
+        streams = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        return list(zip(sizes, streams))
+
     def _run_iterations(self):
         """
-        Run all Monte Carlo iterations in batches.
+        Run Monte Carlo iterations in batches, until all have run or (in
+        adaptive mode) the results have converged.
 
         Returns:
-            numpy array of shape (num_iterations,) with RE% results
+            StreamingStatistics summarising the RE% results of the iterations run
         """
-        n_batches = (self.num_iterations + self.batch_size - 1) // self.batch_size
-        all_results = []
+        batches = self._batches()
+        n_batches = len(batches)
+        if self.convergence:
+            self.converged = False
 
-        for batch_idx in range(n_batches):
-            batch_start = batch_idx * self.batch_size
-            batch_end = min((batch_idx + 1) * self.batch_size, self.num_iterations)
-            batch_size_actual = batch_end - batch_start
+        if self.workers > 1 and n_batches > 1:
+            return self._run_batches_parallel(batches)
 
+        results = StreamingStatistics()
+        for batch_idx, (batch_size_actual, stream) in enumerate(batches):
             logger.info(f"Processing batch {batch_idx + 1}/{n_batches} ({batch_size_actual} iterations)")
 
-            batch_results = self._calculate_iteration_batch(batch_size_actual)
-            all_results.append(batch_results)
+            batch_results = self._calculate_iteration_batch(
+                batch_size_actual, np.random.default_rng(stream)
+            )
+            results.update(batch_results)
+            if self._has_converged(results):
+                break
+
+        return results
+
+    def _has_converged(self, results):
+        """Adaptive mode: check the stopping rule after a batch"""
+        if not self.convergence or not self.convergence.is_converged(results):
+            return False
+        self.converged = True
+        logger.info(f"Converged after {results.count} of {self.num_iterations} iterations")
+        return True
+
+    def _run_batches_parallel(self, batches):
+        """
+        Run batches in a process pool, merging their statistics in batch order.
+
+        A few batches per worker are queued ahead; the stopping rule is checked
+        as each batch is merged, in order, so an adaptive run stops at the same
+        batch whatever the number of workers.
+
+        Args:
+            batches: list of (batch_size, SeedSequence) from _batches()
+
+        Returns:
+            StreamingStatistics of all batches
+        """
+        n_batches = len(batches)
+        workers = min(self.workers, n_batches)
+        logger.info(f"Running {n_batches} batches with {workers} workers")
+
+        # Workers must not share the parent's connection
+        connections.close_all()
+
+        results = StreamingStatistics()
+        queued = deque()
+        next_batch = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.shared_inputs(),)) as executor:
+            for batch_idx in range(n_batches):
+                while next_batch < n_batches and len(queued) < 2 * workers:
+                    queued.append(executor.submit(_run_batch_worker, *batches[next_batch]))
+                    next_batch += 1
+
+                results.merge(queued.popleft().result())
+                if (batch_idx + 1) % workers == 0 or batch_idx + 1 == n_batches:
+                    logger.info(f"Completed batch {batch_idx + 1}/{n_batches}")
+
+                if self._has_converged(results):
+                    for future in queued:
+                        future.cancel()
+                    break
+
+        return results
+
+    def _facility_arrays(self):
+        """
+        Per-facility arrays read by every batch, built once per run.
+
+        Capacity factor means and standard deviations are looked up through a
+        technology index (one distribution per technology, gathered per
+        facility), and expected commissioning dates become the delay each
+        facility can absorb and still commission by the end of target_year.
+
+        Returns:
+            dict of 1D arrays (n_facilities,): 'status', 'tech_index', and
+            float32 'capacity_mw', 'cf_mean', 'cf_std' and 'delay_allowance'
+            (months); and 'technologies', the names tech_index refers to
+        """
+        if self._arrays is not None:
+            return self._arrays
+
+        default = {'mean': 0.30, 'std': 0.10}
+        tech_index, technologies = pd.factorize(self.pipeline_df['technology_normalized'])
+        tech_dists = [self.cf_distributions.get(tech, default) for tech in technologies]
+        tech_mean = np.array([dist['mean'] for dist in tech_dists], dtype=np.float32)
+        tech_std = np.array([dist['std'] for dist in tech_dists], dtype=np.float32)
+
+        # Delays are applied as 30-day months, truncated to whole days: a
+        # facility commissions by the target date while int(delay * 30) <= slack
+        # days, i.e. while delay < (slack + 1) / 30
+        expected = pd.to_datetime(self.pipeline_df['expected_date']).values.astype('datetime64[D]')
+        slack_days = (np.datetime64(f'{self.target_year}-12-31') - expected).astype(np.int64)
+
+        self._arrays = {
+            'status': self.pipeline_df['status'].values,
+            'tech_index': tech_index,
+            'technologies': list(technologies),
+            'capacity_mw': self.pipeline_df['capacity_mw'].to_numpy(dtype=np.float32),
+            'cf_mean': tech_mean[tech_index],
+            'cf_std': tech_std[tech_index],
+            'delay_allowance': ((slack_days + 1) / 30).astype(np.float32),
+        }
+        return self._arrays
 
-        # Concatenate all batches
-        return np.concatenate(all_results)
+    def uniform_dimensions(self):
+        """Uniforms per iteration: one for demand and three per facility"""
+        return 3 * len(self.pipeline_df) + 1
 
-    def _calculate_iteration_batch(self, batch_size):
+    def split_uniforms(self, block):
+        """
+        Split a (batch_size, uniform_dimensions()) block of uniforms between
+        the uncertainties; demand takes the first (best stratified) column.
+
+        Returns:
+            dict of 'demand' (batch_size,) and float32 'commissioning',
+            'delay' and 'cf' (batch_size, n_facilities) uniforms
+        """
+        n_facilities = len(self.pipeline_df)
+        return {
+            'demand': block[:, 0],
+            'commissioning': block[:, 1:n_facilities + 1].astype(np.float32),
+            'delay': block[:, n_facilities + 1:2 * n_facilities + 1].astype(np.float32),
+            'cf': block[:, 2 * n_facilities + 1:].astype(np.float32),
+        }
+
+    def _calculate_iteration_batch(self, batch_size, rng=None, uniforms=None):
         """
         Calculate a batch of iterations using vectorized NumPy operations.
 
+        The (iterations x facilities) matrices are float32 or bool and are
+        combined in place where possible, so a batch holds about three of them
+        at once.
+
         Args:
             batch_size: int, number of iterations in this batch
+            rng: numpy.random.Generator for this batch (default: global NumPy random state)
+            uniforms: optional dict of uniforms per uncertainty (see
+                split_uniforms), which are only read; uncertainties without
+                uniforms are drawn with the sampling method
 
         Returns:
             numpy array of shape (batch_size,) with RE% results
@@ -286,78 +628,98 @@ class MonteCarloSimulator:
             return np.zeros(batch_size)
 
         n_facilities = len(self.pipeline_df)
+        arrays = self._facility_arrays()
+
+        if uniforms is None:
+            uniforms = {}
+            if self.sampling != 'random':
+                # One block of uniforms for the batch, split between the uncertainties
+                uniforms = self.split_uniforms(UncertaintySampler.sample_uniform_block(
+                    batch_size, self.uniform_dimensions(), self.sampling, rng
+                ))
 
         # Sample uncertainties
         # 1. Commissioning: will facility be built? (n_iterations x n_facilities) boolean
         commissioned = UncertaintySampler.sample_commissioning(
-            self.pipeline_df['status'].values,
+            arrays['status'],
             self.probability_profile,
-            batch_size
+            batch_size,
+            rng=rng,
+            uniforms=uniforms.get('commissioning'),
+            dtype=np.float32
         )
 
-        # 2. Delays: how many months delayed? (n_iterations x n_facilities) float
+        # 2. Delays: how many months delayed? (n_iterations x n_facilities) float32
         delays_months = UncertaintySampler.sample_uniform_delay(
             n_facilities,
             batch_size,
             min_months=0,
-            max_months=24
+            max_months=24,
+            rng=rng,
+            uniforms=uniforms.get('delay'),
+            dtype=np.float32
         )
 
-        # 3. Capacity factors: annual generation variation (n_iterations x n_facilities) float
-        cf_samples = self._sample_capacity_factors(batch_size)
+        # Effective commissioning = commissioned AND commissioned by target year after delays
+        commissioned &= self._apply_delays(delays_months)
+        del delays_months
+
+        if self.chronological:
+            # 3. Weather year: hourly profiles of one sampled year (n_iterations,) int
+            cf_uniforms = uniforms.get('cf')
+            weather_years = UncertaintySampler.sample_weather_year(
+                len(self.hourly_profiles.years),
+                batch_size,
+                rng=rng,
+                uniforms=None if cf_uniforms is None else cf_uniforms[:, 0]
+            )
+        else:
+            # 3. Capacity factors: annual generation variation (n_iterations x n_facilities) float32
+            cf_samples = self._sample_capacity_factors(batch_size, rng, uniforms.get('cf'))
 
         # 4. Demand: total demand uncertainty (n_iterations,) float
         demand_samples = UncertaintySampler.sample_demand_uncertainty(
             self.base_demand_2040,
             uncertainty_pct=0.20,
-            n_iterations=batch_size
+            n_iterations=batch_size,
+            rng=rng,
+            uniforms=uniforms.get('demand')
         )
 
-        # Calculate which facilities are commissioned by target year after delays
-        commissioned_by_target = self._apply_delays(delays_months)
-
-        # Effective commissioning = commissioned AND commissioned_by_target
-        effective_commissioned = commissioned & commissioned_by_target
-
         # Calculate 2040 RE%
+        if self.chronological:
+            return self._dispatch_re_percentage(commissioned, weather_years, demand_samples)
+
         re_percentage = self._calculate_re_percentage(
-            effective_commissioned,
+            commissioned,
             cf_samples,
             demand_samples
         )
 
         return re_percentage
 
-    def _sample_capacity_factors(self, batch_size):
+    def _sample_capacity_factors(self, batch_size, rng=None, uniforms=None):
         """
         Sample capacity factors for all facilities.
 
         Args:
             batch_size: int, number of iterations
+            rng: numpy.random.Generator (default: global NumPy random state)
+            uniforms: optional (batch_size, n_facilities) uniforms to transform
 
         Returns:
-            numpy array of shape (batch_size, n_facilities) with CF values
+            numpy array of shape (batch_size, n_facilities) with float32 CF values
         """
-        n_facilities = len(self.pipeline_df)
-
-        # Get mean and std dev for each facility based on its technology
-        mean_cfs = []
-        std_cfs = []
-
-        for _, facility in self.pipeline_df.iterrows():
-            tech = facility['technology_normalized']
-            dist = self.cf_distributions.get(tech, {'mean': 0.30, 'std': 0.10})
-            mean_cfs.append(dist['mean'])
-            std_cfs.append(dist['std'])
-
-        mean_array = np.array(mean_cfs)
-        std_array = np.array(std_cfs)
+        arrays = self._facility_arrays()
 
         # Sample capacity factors
         cf_samples = UncertaintySampler.sample_normal_cf(
-            mean_array,
-            std_array,
-            n_iterations=batch_size
+            arrays['cf_mean'],
+            arrays['cf_std'],
+            n_iterations=batch_size,
+            rng=rng,
+            uniforms=uniforms,
+            dtype=np.float32
         )
 
         return cf_samples
@@ -366,32 +728,17 @@ class MonteCarloSimulator:
         """
         Check if facilities are still commissioned by target year after delays.
 
+        Compares each delay with its facility's delay allowance, broadcast
+        across the iterations, instead of building a matrix of dates.
+
         Args:
             delays_months: numpy array (n_iterations, n_facilities) of delay values
 
         Returns:
             numpy array (n_iterations, n_facilities) of boolean values
         """
-        n_iterations, n_facilities = delays_months.shape
-
-        # Get expected commissioning dates
-        expected_dates = pd.to_datetime(self.pipeline_df['expected_date'].values)
-
-        # Convert to numpy datetime64
-        expected_dates_np = expected_dates.values
-
-        # Broadcast to all iterations: (1, n_facilities) -> (n_iterations, n_facilities)
-        expected_dates_broadcast = np.tile(expected_dates_np, (n_iterations, 1))
-
-        # Add delays (convert months to days, approximately)
-        delays_days = delays_months * 30  # Rough conversion
-        delayed_dates = expected_dates_broadcast + delays_days.astype('timedelta64[D]')
-
-        # Check if commissioned by target year
-        target_date = np.datetime64(f'{self.target_year}-12-31')
-        commissioned_by_target = delayed_dates <= target_date
-
-        return commissioned_by_target
+        allowance = self._facility_arrays()['delay_allowance']
+        return delays_months < allowance[np.newaxis, :]
 
     def _calculate_re_percentage(self, commissioned, cf_array, demand_array):
         """
@@ -399,24 +746,24 @@ class MonteCarloSimulator:
 
         Args:
             commissioned: numpy array (n_iterations, n_facilities) boolean
-            cf_array: numpy array (n_iterations, n_facilities) float
+            cf_array: numpy array (n_iterations, n_facilities) float32,
+                overwritten with the commissioned capacity factors
             demand_array: numpy array (n_iterations,) float
 
         Returns:
             numpy array (n_iterations,) with RE% values
         """
         # Get capacity for each facility
-        capacity_mw = self.pipeline_df['capacity_mw'].values  # (n_facilities,)
+        capacity_mw = self._facility_arrays()['capacity_mw']  # (n_facilities,)
 
-        # Calculate annual generation for each facility
-        # Generation (GWh) = Capacity (MW) × CF × 8760 hours / 1000
-        # Shape: (n_iterations, n_facilities)
-        commissioned_capacity = commissioned * capacity_mw  # Broadcast capacity
-        annual_generation_gwh = (commissioned_capacity * cf_array * 8760) / 1000
+        # Zero the capacity factors of facilities not commissioned, then
+        # commissioned capacity × CF summed across facilities in one product
+        # Shape: (n_iterations,), average MW
+        cf_array *= commissioned
+        average_re_mw = (cf_array @ capacity_mw).astype(np.float64)
 
-        # Sum across facilities to get total RE generation
-        # Shape: (n_iterations,)
-        total_re_generation = np.sum(annual_generation_gwh, axis=1)
+        # Generation (GWh) = Capacity (MW) × CF × 8760 hours / 1000
+        total_re_generation = average_re_mw * 8760 / 1000
 
         # Calculate RE percentage
         re_percentage = (total_re_generation / demand_array) * 100
@@ -426,44 +773,122 @@ class MonteCarloSimulator:
 
         return re_percentage
 
-    def _calculate_statistics(self, re_percentage_results):
+    def _chronological_dispatcher(self):
         """
-        Calculate summary statistics from results array.
+        Dispatcher for the pipeline technologies, built once per run.
+
+        Technologies without a supplyfactors profile in a weather year (e.g.
+        DPV, biomass) generate flat at their mean capacity factor.
+
+        Returns:
+            ChronologicalDispatcher
+        """
+        if self._dispatcher is not None:
+            return self._dispatcher
+
+        profiles = self.hourly_profiles
+        technologies = self._facility_arrays()['technologies']
+        default = {'mean': 0.30, 'std': 0.10}
+        generation = np.empty((len(profiles.years), len(technologies), profiles.load_shape.shape[1]),
+                              dtype=np.float32)
+        for y, year in enumerate(profiles.years):
+            for t, technology in enumerate(technologies):
+                profile = profiles.profile(y, technology)
+                if profile is None:
+                    logger.debug(f"No {technology} profile for {year} - using its mean capacity factor")
+                    generation[y, t] = self.cf_distributions.get(technology, default)['mean']
+                else:
+                    generation[y, t] = profile
+
+        self._dispatcher = ChronologicalDispatcher(
+            generation,
+            profiles.load_shape,
+            demand_range=(self.base_demand_2040 * 0.8, self.base_demand_2040 * 1.2),
+            storage_mwh=self._storage_mwh(),
+        )
+        return self._dispatcher
+
+    def _dispatch_re_percentage(self, commissioned, weather_years, demand_array):
+        """
+        Calculate RE% for each iteration by hourly dispatch.
+
+        Each iteration's build-out becomes installed MW per technology (the
+        multipliers of that technology's per-MW hourly profile) and is
+        dispatched against its weather year; see ChronologicalDispatcher.
 
         Args:
-            re_percentage_results: numpy array of RE% values
+            commissioned: numpy array (n_iterations, n_facilities) boolean
+            weather_years: numpy array (n_iterations,) of weather year indices
+            demand_array: numpy array (n_iterations,) float, demand in GWh
+
+        Returns:
+            numpy array (n_iterations,) with RE% values
+        """
+        arrays = self._facility_arrays()
+
+        # Commissioned MW by technology: (n_iterations, n_technologies)
+        technology_mw = np.zeros((len(arrays['capacity_mw']), len(arrays['technologies'])), dtype=np.float32)
+        technology_mw[np.arange(len(arrays['capacity_mw'])), arrays['tech_index']] = arrays['capacity_mw']
+        capacities = commissioned.astype(np.float32) @ technology_mw
+
+        return self._chronological_dispatcher().re_percentage(capacities, weather_years, demand_array)
+
+    def _dispatch_settings(self):
+        """Chronological mode settings recorded with the simulation"""
+        from .hourly_dispatch import DEMAND_LEVELS, ROUND_TRIP_EFFICIENCY, STORAGE_HOURS
+
+        return {
+            'weather_years': list(self.hourly_profiles.years),
+            'storage_mwh': self._storage_mwh(),
+            'storage_hours': STORAGE_HOURS,
+            'round_trip_efficiency': ROUND_TRIP_EFFICIENCY,
+            'demand_levels': DEMAND_LEVELS,
+        }
+
+    def _calculate_statistics(self, results):
+        """
+        Calculate summary statistics from the streamed results.
+
+        Percentiles come from the quantile sketch and are accurate to its
+        resolution (0.01 percentage points); everything else is exact.
+        'precision' holds the confidence interval half-widths reached, using
+        the adaptive mode's confidence level (default 95%).
+
+        Args:
+            results: StreamingStatistics of all iterations
 
         Returns:
             dict with statistics
         """
         # Percentiles
-        percentiles = [1, 5, 10, 25, 50, 75, 90, 95, 99]
-        percentile_values = np.percentile(re_percentage_results, percentiles)
+        percentiles = DEFAULT_PERCENTILES
+        percentile_values = results.percentiles(percentiles)
 
         # Target probabilities
-        prob_75 = (re_percentage_results >= 75).sum() / len(re_percentage_results) * 100
-        prob_85 = (re_percentage_results >= 85).sum() / len(re_percentage_results) * 100
+        prob_75 = results.probability(75)
+        prob_85 = results.probability(85)
 
         stats = {
-            'mean_re_percentage': float(np.mean(re_percentage_results)),
-            'median_re_percentage': float(np.median(re_percentage_results)),
-            'p10_re_percentage': float(percentile_values[2]),  # 10th percentile
-            'p90_re_percentage': float(percentile_values[6]),  # 90th percentile
-            'std_dev_re_percentage': float(np.std(re_percentage_results)),
+            'mean_re_percentage': float(results.mean),
+            'median_re_percentage': float(percentile_values[percentiles.index(50)]),
+            'p10_re_percentage': float(percentile_values[percentiles.index(10)]),
+            'p90_re_percentage': float(percentile_values[percentiles.index(90)]),
+            'std_dev_re_percentage': results.std,
             'probability_75_percent': float(prob_75),
             'probability_85_percent': float(prob_85),
             'percentiles': {f'p{p}': float(percentile_values[i]) for i, p in enumerate(percentiles)},
+            'precision': (self.convergence or ConvergenceMonitor()).precision(results),
         }
 
         return stats
 
-    def _store_results(self, simulation_record, re_percentage_results, stats):
+    def _store_results(self, simulation_record, results, stats):
         """
         Store results in MonteCarloSimulation and MonteCarloResult models.
 
         Args:
             simulation_record: MonteCarloSimulation instance
-            re_percentage_results: numpy array of results
+            results: StreamingStatistics of all iterations
             stats: dict of statistics
         """
         from siren_web.models import MonteCarloResult
@@ -476,6 +901,9 @@ class MonteCarloSimulator:
         simulation_record.std_dev_re_percentage = stats['std_dev_re_percentage']
         simulation_record.probability_75_percent = stats['probability_75_percent']
         simulation_record.probability_85_percent = stats['probability_85_percent']
+        simulation_record.iterations_completed = results.count
+        simulation_record.converged = self.converged
+        simulation_record.achieved_precision = stats['precision']
         simulation_record.status = 'completed'
         simulation_record.save()
 
@@ -483,42 +911,39 @@ class MonteCarloSimulator:
         self.target_scenario.probability_percentage = stats['probability_85_percent']
         self.target_scenario.save(update_fields=['probability_percentage'])
 
-        # Create histogram
-        hist, bin_edges = np.histogram(re_percentage_results, bins=50)
-        histogram_data = {
-            'bins': bin_edges.tolist(),
-            'counts': hist.tolist(),
-        }
-
         # Store detailed results
         MonteCarloResult.objects.create(
             simulation=simulation_record,
-            re_percentage_distribution=histogram_data,
+            re_percentage_distribution=results.histogram(bins=50),
             percentiles=stats['percentiles'],
-            sample_iterations=re_percentage_results[:1000].tolist(),  # First 1000 for debugging
+            sample_iterations=results.samples.tolist(),  # First 1000 for debugging
         )
 
         logger.info("Results stored successfully")
 
-    def _store_parameters(self, simulation_record, category, value, description):
+    def _parameter_rows(self, simulation_record, category, value, description):
         """
-        Store simulation parameters for auditing.
+        Unsaved MonteCarloParameter rows recording simulation parameters for
+        auditing, for writing together with bulk_create.
 
         Args:
             simulation_record: MonteCarloSimulation instance
             category: str, parameter category
             value: dict, parameter values
             description: str, parameter description
+
+        Returns:
+            list of MonteCarloParameter, one per key of value
         """
         from siren_web.models import MonteCarloParameter
 
-        for key, val in value.items():
-            MonteCarloParameter.objects.create(
+        return [
+            MonteCarloParameter(
                 simulation=simulation_record,
                 parameter_category=category,
                 parameter_name=key,
                 parameter_value=val,
                 description=description
             )
-
-        logger.debug(f"Stored {len(value)} parameters for category '{category}'")
\ No newline at end of file
+            for key, val in value.items()
+        ]
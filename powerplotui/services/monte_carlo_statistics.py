@@ -0,0 +1,389 @@
+"""
+Streaming Statistics for Monte Carlo Simulations
+
+Summarises RE% results batch by batch in constant memory, so a simulation
+never has to hold every iteration's result:
+
+- count, mean and variance (Welford, with Chan's formula to combine batches)
+- minimum and maximum
+- target exceedance counters (e.g. RE% >= 75, RE% >= 85)
+- a quantile sketch: counts in fixed-width bins over the RE% range, from
+  which percentiles and the stored histogram are read
+
+Accumulators from different batches or worker processes are combined with
+merge(). Counts merge exactly; merging in batch order makes the floating
+point mean and variance reproducible as well.
+
+ConvergenceMonitor decides when a run in adaptive mode can stop: once the
+confidence intervals of the target probabilities and key percentiles are
+narrower than the requested tolerances.
+"""
+
+import logging
+from statistics import NormalDist
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Percentiles stored with each simulation
+DEFAULT_PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+# RE% targets whose probability is reported
+DEFAULT_TARGETS = (75, 85)
+
+# Iteration results kept for debugging (MonteCarloResult.sample_iterations)
+DEFAULT_SAMPLE_SIZE = 1000
+
+# Percentiles whose precision is tracked in adaptive mode, by stored field
+CONVERGENCE_PERCENTILES = {
+    'p10_re_percentage': 10,
+    'median_re_percentage': 50,
+    'p90_re_percentage': 90,
+}
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch over a bounded range.
+
+    Values are counted in fixed-width bins between low and high, so memory is
+    constant and sketches merge by adding counts. Quantiles are interpolated
+    within a bin and are accurate to the bin width (resolution). Values
+    outside the range are counted as below/above.
+    """
+
+    def __init__(self, low=0.0, high=200.0, resolution=0.01):
+        """
+        Args:
+            low: float, lower bound of the binned range
+            high: float, upper bound of the binned range
+            resolution: float, bin width
+        """
+        if high <= low or resolution <= 0:
+            raise ValueError("QuantileSketch needs low < high and resolution > 0")
+
+        self.low = float(low)
+        self.high = float(high)
+        self.resolution = float(resolution)
+        self.n_bins = int(round((self.high - self.low) / self.resolution))
+        self.counts = np.zeros(self.n_bins, dtype=np.int64)
+        self.below = 0
+        self.above = 0
+
+    @property
+    def count(self):
+        return int(self.counts.sum()) + self.below + self.above
+
+    def __getstate__(self):
+        # Pickle only the occupied bins: batch sketches sent back from pool
+        # workers usually cover a small part of the range
+        state = self.__dict__.copy()
+        occupied = np.flatnonzero(self.counts)
+        first = int(occupied[0]) if len(occupied) else 0
+        last = int(occupied[-1]) + 1 if len(occupied) else 0
+        state['counts'] = (first, self.counts[first:last])
+        return state
+
+    def __setstate__(self, state):
+        first, occupied = state['counts']
+        state['counts'] = np.zeros(state['n_bins'], dtype=np.int64)
+        state['counts'][first:first + len(occupied)] = occupied
+        self.__dict__.update(state)
+
+    def update(self, values):
+        """Add a 1D array of values"""
+        bin_index = np.floor((values - self.low) / self.resolution).astype(np.int64)
+        # The upper bound belongs to the last bin
+        bin_index[values == self.high] = self.n_bins - 1
+
+        below = bin_index < 0
+        above = bin_index >= self.n_bins
+        self.below += int(below.sum())
+        self.above += int(above.sum())
+        self.counts += np.bincount(bin_index[~(below | above)], minlength=self.n_bins)
+
+    def merge(self, other):
+        """Add another sketch's counts (it must use the same bins)"""
+        if (self.low, self.high, self.resolution) != (other.low, other.high, other.resolution):
+            raise ValueError("Cannot merge quantile sketches with different bins")
+        self.counts += other.counts
+        self.below += other.below
+        self.above += other.above
+
+    def bin_edge(self, index):
+        return self.low + index * self.resolution
+
+    def quantiles(self, percentiles, minimum=None, maximum=None):
+        """
+        Estimate percentiles, using the same ranks as np.percentile.
+
+        Args:
+            percentiles: sequence of percentiles (0-100)
+            minimum, maximum: observed extremes, used to place values outside
+                the binned range and to clamp the estimates
+
+        Returns:
+            numpy array of estimates, one per percentile
+        """
+        n = self.count
+        if n == 0:
+            return np.full(len(percentiles), np.nan)
+
+        minimum = self.low if minimum is None else minimum
+        maximum = self.high if maximum is None else maximum
+        cumulative = self.below + np.cumsum(self.counts)
+
+        estimates = []
+        for percentile in percentiles:
+            rank = percentile / 100 * (n - 1)
+            if rank < self.below:
+                estimates.append(minimum)
+                continue
+            if rank >= cumulative[-1]:
+                estimates.append(maximum)
+                continue
+
+            bin_index = int(np.searchsorted(cumulative, rank, side='right'))
+            before = cumulative[bin_index - 1] if bin_index else self.below
+            within = (rank - before + 0.5) / self.counts[bin_index]
+            estimate = self.bin_edge(bin_index) + within * self.resolution
+            estimates.append(min(max(estimate, minimum), maximum))
+
+        return np.array(estimates, dtype=np.float64)
+
+    def histogram(self, bins=50):
+        """
+        Histogram of the occupied range, in at most `bins` bins.
+
+        Adjacent sketch bins are grouped, so the edges fall on sketch bin
+        edges. Values outside the binned range go to the end bins.
+
+        Returns:
+            dict {'bins': edges, 'counts': counts} as stored on MonteCarloResult
+        """
+        occupied = np.flatnonzero(self.counts)
+        if not len(occupied):
+            return {'bins': [], 'counts': []}
+
+        first, last = int(occupied[0]), int(occupied[-1]) + 1
+        group = -(-(last - first) // bins)  # ceiling division
+        starts = np.arange(first, last, group)
+        counts = np.add.reduceat(self.counts[first:last], starts - first)
+        counts[0] += self.below
+        counts[-1] += self.above
+
+        edges = [self.bin_edge(i) for i in starts] + [self.bin_edge(min(starts[-1] + group, self.n_bins))]
+        return {
+            'bins': [round(edge, 10) for edge in edges],
+            'counts': counts.tolist(),
+        }
+
+
+class StreamingStatistics:
+    """
+    Constant-memory summary of Monte Carlo results, updated per batch.
+
+    Usage:
+        stats = StreamingStatistics()
+        for batch in batches:
+            stats.update(batch)          # or stats.merge(worker_stats)
+        stats.mean, stats.std, stats.probability(85), stats.percentiles()
+    """
+
+    def __init__(self, targets=DEFAULT_TARGETS, sample_size=DEFAULT_SAMPLE_SIZE,
+                 low=0.0, high=200.0, resolution=0.01):
+        """
+        Args:
+            targets: RE% thresholds to count exceedances of
+            sample_size: int, number of leading results to keep
+            low, high, resolution: quantile sketch range and bin width
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.exceedances = {target: 0 for target in targets}
+        self.sketch = QuantileSketch(low, high, resolution)
+        self.sample_size = sample_size
+        self.samples = np.empty(0, dtype=np.float64)
+
+    def update(self, values):
+        """
+        Add a batch of results.
+
+        Args:
+            values: 1D numpy array of RE% values
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return self
+
+        batch_mean = float(values.mean())
+        batch_m2 = float(np.square(values - batch_mean).sum())
+        self._combine_moments(len(values), batch_mean, batch_m2)
+
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        for target in self.exceedances:
+            self.exceedances[target] += int((values >= target).sum())
+        self.sketch.update(values)
+        self._keep_samples(values)
+        return self
+
+    def merge(self, other):
+        """
+        Add the results summarised by another accumulator.
+
+        Merge in batch order for reproducible floating point moments and
+        samples.
+
+        Returns:
+            self
+        """
+        if set(self.exceedances) != set(other.exceedances):
+            raise ValueError("Cannot merge statistics with different targets")
+        if not other.count:
+            return self
+
+        self._combine_moments(other.count, other.mean, other.m2)
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        for target, count in other.exceedances.items():
+            self.exceedances[target] += count
+        self.sketch.merge(other.sketch)
+        self._keep_samples(other.samples)
+        return self
+
+    def _combine_moments(self, n, mean, m2):
+        """Chan et al.: combine (count, mean, M2) of another set of values"""
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def _keep_samples(self, values):
+        needed = self.sample_size - len(self.samples)
+        if needed > 0:
+            self.samples = np.concatenate([self.samples, values[:needed]])
+
+    @property
+    def variance(self):
+        """Population variance, as np.var"""
+        return self.m2 / self.count if self.count else np.nan
+
+    @property
+    def std(self):
+        """Population standard deviation, as np.std"""
+        return float(np.sqrt(self.variance))
+
+    def probability(self, target):
+        """Percentage of results >= target"""
+        if target not in self.exceedances:
+            raise ValueError(f"Target {target} is not tracked")
+        return self.exceedances[target] / self.count * 100 if self.count else 0.0
+
+    def percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        """Estimated percentiles as a numpy array"""
+        return self.sketch.quantiles(percentiles, self.minimum, self.maximum)
+
+    def histogram(self, bins=50):
+        """Histogram for MonteCarloResult.re_percentage_distribution"""
+        return self.sketch.histogram(bins)
+
+    def probability_half_width(self, target, z):
+        """
+        Half-width (percentage points) of the Wilson score interval for the
+        probability of reaching target; unlike the normal approximation it
+        does not collapse to zero for probabilities near 0% or 100%.
+        """
+        n = self.count
+        if not n:
+            return np.inf
+        p = self.exceedances[target] / n
+        spread = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+        return float(spread / (1 + z * z / n) * 100)
+
+    def percentile_half_width(self, percentile, z):
+        """
+        Half-width (percentage points) of the distribution-free interval for a
+        percentile, read from the sketch at the order statistics
+        n*q -/+ z*sqrt(n*q*(1-q)).
+        """
+        n = self.count
+        if n < 2:
+            return np.inf
+        q = percentile / 100
+        offset = z * np.sqrt(q * (1 - q) / n)
+        lower, upper = self.percentiles([max(q - offset, 0) * 100, min(q + offset, 1) * 100])
+        return float(upper - lower) / 2
+
+
+class ConvergenceMonitor:
+    """
+    Stopping rule for adaptive Monte Carlo runs.
+
+    A run has converged when, at the given confidence level, the interval
+    half-widths of every tracked target probability and percentile are within
+    their tolerances (percentage points).
+    """
+
+    def __init__(self, probability_tolerance=0.1, percentile_tolerance=0.1,
+                 confidence=0.95, min_iterations=20000, targets=DEFAULT_TARGETS):
+        """
+        Args:
+            probability_tolerance: float, max half-width of P(target), in pp
+            percentile_tolerance: float, max half-width of P10/median/P90, in pp
+            confidence: float, confidence level of the intervals
+            min_iterations: int, never stop before this many iterations
+            targets: RE% targets whose probabilities are tracked
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        self.probability_tolerance = probability_tolerance
+        self.percentile_tolerance = percentile_tolerance
+        self.confidence = confidence
+        self.min_iterations = min_iterations
+        self.targets = tuple(targets)
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    def precision(self, results):
+        """
+        Current interval half-widths.
+
+        Returns:
+            dict {stored field name: half-width in pp}, e.g.
+            {'probability_85_percent': 0.08, 'median_re_percentage': 0.05, ...}
+        """
+        precision = {
+            f'probability_{target}_percent': results.probability_half_width(target, self.z)
+            for target in self.targets
+        }
+        for field, percentile in CONVERGENCE_PERCENTILES.items():
+            precision[field] = results.percentile_half_width(percentile, self.z)
+        return precision
+
+    def is_converged(self, results):
+        """True once min_iterations have run and every tolerance is met"""
+        if results.count < self.min_iterations:
+            return False
+        for field, half_width in self.precision(results).items():
+            tolerance = (self.probability_tolerance if field.startswith('probability_')
+                         else self.percentile_tolerance)
+            if half_width > tolerance:
+                return False
+        return True
+
+    def settings(self):
+        """Settings for recording with the simulation parameters"""
+        return {
+            'probability_tolerance': self.probability_tolerance,
+            'percentile_tolerance': self.percentile_tolerance,
+            'confidence': self.confidence,
+            'min_iterations': self.min_iterations,
+        }
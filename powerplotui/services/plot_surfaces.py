@@ -0,0 +1,319 @@
+# powerplot/services/plot_surfaces.py
+"""
+Precomputed surfaces for the 3D history charts (plot3D_views).
+
+Both charts are built from monthly aggregates held in the plot_surface table,
+one row per surface per month:
+
+- wem_price: WholesalePrice by trading interval (1-48); max, avg and min
+  price and the interval count for the month
+- swis_demand: hour-of-day (0-23) sums for the month, from the
+  facility_scada_monthly rollup (operational demand as the net SCADA total,
+  fossil and RE generation) and DPVGeneration (estimated rooftop PV), each
+  with its interval count so months combine exactly into yearly averages
+
+Months are recomputed with one grouped query per source, so ingest can
+refresh just the months it touched (refresh_for_dates) and the views only
+read a few hundred small rows. Rebuild everything with
+``python manage.py rebuild_plot_surfaces``.
+"""
+from collections import defaultdict
+from datetime import date
+import logging
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Avg, Count, F, Max, Min, Sum
+from django.db.models.functions import ExtractHour, ExtractMonth, ExtractYear
+
+from siren_web.models import (
+    DPVGeneration, FacilityScadaMonthly, PlotSurface, WholesalePrice,
+)
+
+logger = logging.getLogger(__name__)
+
+PRICE_SURFACE = 'wem_price'
+DEMAND_SURFACE = 'swis_demand'
+SURFACES = (PRICE_SURFACE, DEMAND_SURFACE)
+
+PRICE_INTERVALS = 48  # half-hourly trading intervals per day
+HOURS_PER_DAY = 24
+
+# Classification as used by update_ret_dashboard (storage counts as RE)
+RE_FUEL_TYPES = ('WIND', 'SOLAR', 'BIOMASS', 'HYDRO')
+FOSSIL_FUEL_TYPES = ('COAL', 'GAS', 'NATURAL_GAS', 'DISTILLATE')
+
+DEMAND_SERIES = ('operational', 'fossil', 're', 'intervals', 'dpv', 'dpv_intervals')
+
+
+def months_for_dates(dates):
+    """Sorted (year, month) tuples covering the given dates or datetimes"""
+    return sorted({(d.year, d.month) for d in dates})
+
+
+def _next_month(year, month):
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _month_span(months):
+    """(first day, first day after the last month) of a set of months"""
+    return date(*min(months), 1), date(*_next_month(*max(months)), 1)
+
+
+def _round_list(values, places):
+    return [None if v is None else round(float(v), places) for v in values]
+
+
+def _nan_to_none(array, places):
+    return [None if np.isnan(v) else round(float(v), places) for v in array]
+
+
+class PlotSurfaceService:
+    """Refresh and read the plot_surface table"""
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def _price_months(self, months):
+        """Price series per (year, month) from one grouped query"""
+        start, end = _month_span(months)
+        rows = WholesalePrice.objects.filter(
+            trading_date__gte=start,
+            trading_date__lt=end,
+            interval_number__gte=1,
+            interval_number__lte=PRICE_INTERVALS,
+        ).order_by().values(
+            year=ExtractYear('trading_date'),
+            month=ExtractMonth('trading_date'),
+            interval=F('interval_number'),
+        ).annotate(
+            max_price=Max('wholesale_price'),
+            avg_price=Avg('wholesale_price'),
+            min_price=Min('wholesale_price'),
+            count=Count('id'),
+        ).values_list('year', 'month', 'interval', 'max_price', 'avg_price', 'min_price', 'count')
+
+        series = {}
+        for year, month, interval, max_price, avg_price, min_price, count in rows:
+            month_series = series.setdefault((year, month), {
+                'max': [None] * PRICE_INTERVALS,
+                'avg': [None] * PRICE_INTERVALS,
+                'min': [None] * PRICE_INTERVALS,
+                'count': [0] * PRICE_INTERVALS,
+            })
+            column = interval - 1
+            month_series['max'][column] = max_price
+            month_series['avg'][column] = avg_price
+            month_series['min'][column] = min_price
+            month_series['count'][column] = count
+
+        for month_series in series.values():
+            for name in ('max', 'avg', 'min'):
+                month_series[name] = _round_list(month_series[name], 2)
+        return series
+
+    def _demand_months(self, months):
+        """Demand sums per (year, month) from the SCADA rollup and DPV"""
+        start, end = _month_span(months)
+        wanted = set(months)
+        series = defaultdict(lambda: {
+            name: [0] * HOURS_PER_DAY if name.endswith('intervals') else [0.0] * HOURS_PER_DAY
+            for name in DEMAND_SERIES
+        })
+
+        rollup = FacilityScadaMonthly.objects.filter(
+            year__gte=start.year, year__lte=end.year
+        ).order_by()
+
+        # Net total and generation by fuel type for each hour of day
+        for year, month, hour, fuel_type, category, quantity, generation in rollup.values(
+            'year', 'month', 'hour',
+            fuel_type=F('facility__idtechnologies__fuel_type'),
+            category=F('facility__idtechnologies__category'),
+        ).annotate(
+            total=Sum('quantity'), generated=Sum('generation'),
+        ).values_list('year', 'month', 'hour', 'fuel_type', 'category', 'total', 'generated'):
+            if (year, month) not in wanted:
+                continue
+            month_series = series[(year, month)]
+            month_series['operational'][hour] += float(quantity or 0)
+            fuel_type = (fuel_type or '').upper()
+            if fuel_type in RE_FUEL_TYPES or (category or '').lower() == 'storage':
+                month_series['re'][hour] += float(generation or 0)
+            elif fuel_type in FOSSIL_FUEL_TYPES:
+                month_series['fossil'][hour] += float(generation or 0)
+
+        # Half-hourly intervals with data: the best-covered facility's count
+        for year, month, hour, intervals in rollup.values(
+            'year', 'month', 'hour', 'minute'
+        ).annotate(
+            intervals=Max('interval_count'),
+        ).values_list('year', 'month', 'hour', 'intervals'):
+            if (year, month) in wanted:
+                series[(year, month)]['intervals'][hour] += intervals or 0
+
+        dpv = DPVGeneration.objects.filter(
+            trading_date__gte=start,
+            trading_date__lt=end,
+        ).order_by().values(
+            year=ExtractYear('trading_date'),
+            month=ExtractMonth('trading_date'),
+            hour=ExtractHour('trading_interval'),
+        ).annotate(
+            total=Sum('estimated_generation'), intervals=Count('id'),
+        ).values_list('year', 'month', 'hour', 'total', 'intervals')
+        for year, month, hour, total, intervals in dpv:
+            month_series = series[(year, month)]
+            month_series['dpv'][hour] += float(total or 0)
+            month_series['dpv_intervals'][hour] += intervals
+
+        for month_series in series.values():
+            for name in ('operational', 'fossil', 're', 'dpv'):
+                month_series[name] = _round_list(month_series[name], 3)
+        return dict(series)
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    @transaction.atomic
+    def refresh_months(self, surface, months):
+        """
+        Recompute a surface for the given months.
+
+        Args:
+            surface: PRICE_SURFACE or DEMAND_SURFACE
+            months: iterable of (year, month)
+
+        Returns:
+            int: number of months stored (months without data are removed)
+        """
+        if surface not in SURFACES:
+            raise ValueError(f"Unknown surface: {surface}")
+        months = sorted(set(months))
+        if not months:
+            return 0
+
+        if surface == PRICE_SURFACE:
+            series = self._price_months(months)
+        else:
+            series = self._demand_months(months)
+
+        stored = 0
+        for year, month in months:
+            month_series = series.get((year, month))
+            if month_series is None:
+                PlotSurface.objects.filter(surface=surface, year=year, month=month).delete()
+                continue
+            PlotSurface.objects.update_or_create(
+                surface=surface, year=year, month=month,
+                defaults={'series': month_series},
+            )
+            stored += 1
+
+        logger.debug(f"Refreshed {surface} surface for {stored} of {len(months)} months")
+        return stored
+
+    def refresh_for_dates(self, surface, dates):
+        """
+        Refresh the months containing the given dates, after ingestion.
+
+        Failures are logged rather than raised so they never fail an import;
+        the surfaces can be rebuilt later with rebuild_plot_surfaces.
+        """
+        try:
+            return self.refresh_months(surface, months_for_dates(dates))
+        except Exception as e:
+            logger.warning(f"Could not refresh {surface} surface: {e}")
+            return 0
+
+    def source_months(self, surface):
+        """Every (year, month) from the first to the last month of source data"""
+        if surface == PRICE_SURFACE:
+            spans = [WholesalePrice.objects.aggregate(first=Min('trading_date'), last=Max('trading_date'))]
+        else:
+            spans = [DPVGeneration.objects.aggregate(first=Min('trading_date'), last=Max('trading_date'))]
+            rollup = FacilityScadaMonthly.objects.values_list('year', 'month')
+            first = rollup.order_by('year', 'month').first()
+            if first:
+                last = rollup.order_by('-year', '-month').first()
+                spans.append({'first': date(*first, 1), 'last': date(*last, 1)})
+
+        spans = [span for span in spans if span['first']]
+        if not spans:
+            return []
+
+        first = min(span['first'] for span in spans)
+        last = max(span['last'] for span in spans)
+        months = []
+        year, month = first.year, first.month
+        while (year, month) <= (last.year, last.month):
+            months.append((year, month))
+            year, month = _next_month(year, month)
+        return months
+
+    # ------------------------------------------------------------------
+    # Read helpers
+    # ------------------------------------------------------------------
+
+    def _rows(self, surface):
+        return list(
+            PlotSurface.objects.filter(surface=surface)
+            .order_by('year', 'month')
+            .values_list('year', 'month', 'series')
+        )
+
+    def get_price_surface(self):
+        """
+        Monthly price surfaces.
+
+        Returns:
+            dict with 'months' [(year, month)] and 'max', 'avg', 'min' lists
+            of rows (one per month, PRICE_INTERVALS columns), or None if the
+            table holds no price data
+        """
+        rows = self._rows(PRICE_SURFACE)
+        if not rows:
+            return None
+        return {
+            'months': [(year, month) for year, month, _ in rows],
+            **{name: [series[name] for _, _, series in rows] for name in ('max', 'avg', 'min')},
+        }
+
+    def get_demand_surface(self):
+        """
+        Yearly average demand by hour of day (MW, i.e. MWh per hour).
+
+        Returns:
+            dict with 'years' and 'underlying', 'fossil', 're', 'dpv' lists of
+            rows (one per year, HOURS_PER_DAY columns; None where there is no
+            data), or None if the table holds no demand data
+        """
+        rows = self._rows(DEMAND_SURFACE)
+        if not rows:
+            return None
+
+        years = sorted({year for year, _, _ in rows})
+        position = {year: i for i, year in enumerate(years)}
+        totals = {name: np.zeros((len(years), HOURS_PER_DAY)) for name in DEMAND_SERIES}
+        for year, _, series in rows:
+            for name in DEMAND_SERIES:
+                totals[name][position[year]] += np.asarray(series[name], dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intervals = np.where(totals['intervals'] > 0, totals['intervals'], np.nan)
+            dpv_intervals = np.where(totals['dpv_intervals'] > 0, totals['dpv_intervals'], np.nan)
+            operational = totals['operational'] / intervals
+            dpv = totals['dpv'] / dpv_intervals
+            averages = {
+                'underlying': operational + np.nan_to_num(dpv),
+                'fossil': totals['fossil'] / intervals,
+                're': totals['re'] / intervals,
+                'dpv': dpv,
+            }
+
+        return {
+            'years': years,
+            **{name: [_nan_to_none(row, 3) for row in values] for name, values in averages.items()},
+        }
@@ -0,0 +1,201 @@
+# powerplot/services/response_cache.py
+"""
+Conditional GET and a bounded response cache for analytical views.
+
+Views decorated with @versioned_view(version_func) are keyed on the view, the
+request path and query string, the user and a data version token returned by
+version_func (see data_versions.py). Because the token changes whenever the
+underlying data does, the key doubles as a strong ETag:
+
+- If-None-Match / If-Modified-Since matching the current version returns
+  304 Not Modified without running the view
+- otherwise a rendered 200 response for the same key is served from an
+  in-process LRU cache, bounded by entry count and total size
+- otherwise the view runs and its response is stored
+
+Responses that set cookies, render a CSRF token or consume flash messages are
+not stored, as they are specific to one session; they still get an ETag.
+Requests with flash messages waiting to be shown always run the view, so the
+messages are not held back by a cached or 304 response.
+
+Settings:
+    ANALYTICS_CACHE_MAX_ENTRIES (default 256)
+    ANALYTICS_CACHE_MAX_BYTES (default 64 MB)
+    ANALYTICS_CACHE_TIMEOUT seconds an entry may be reused (default 1 hour)
+"""
+from collections import OrderedDict, namedtuple
+from functools import wraps
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+logger = logging.getLogger(__name__)
+
+# token: str identifying the data state; last_modified: aware datetime or None
+DataVersion = namedtuple('DataVersion', ['token', 'last_modified'])
+
+CachedResponse = namedtuple(
+    'CachedResponse', ['status', 'content', 'headers', 'stored_at']
+)
+
+
+class LRUResponseCache:
+    """Thread-safe least-recently-used store of rendered responses"""
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024, timeout=3600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.timeout and time.monotonic() - entry.stored_at > self.timeout:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, response):
+        """Store a rendered HttpResponse; returns False if it is too large"""
+        content = response.content
+        if len(content) > self.max_bytes:
+            return False
+
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ('content-length', 'etag', 'last-modified', 'set-cookie')
+        }
+        entry = CachedResponse(response.status_code, content, headers, time.monotonic())
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += len(content)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._size -= len(entry.content)
+
+
+response_cache = LRUResponseCache(
+    max_entries=getattr(settings, 'ANALYTICS_CACHE_MAX_ENTRIES', 256),
+    max_bytes=getattr(settings, 'ANALYTICS_CACHE_MAX_BYTES', 64 * 1024 * 1024),
+    timeout=getattr(settings, 'ANALYTICS_CACHE_TIMEOUT', 3600),
+)
+
+
+def _cache_key(view_func, request, args, kwargs, token):
+    user = getattr(request, 'user', None)
+    user_key = user.pk if user is not None and user.is_authenticated else 'anon'
+    parts = [
+        f'{view_func.__module__}.{view_func.__qualname__}',
+        request.path,
+        repr(sorted(request.GET.lists())),
+        repr(args),
+        repr(sorted(kwargs.items())),
+        str(user_key),
+        token,
+    ]
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _is_storable(request, response):
+    """Only keep plain 200 responses that are not tied to one session"""
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return False
+    messages = getattr(request, '_messages', None)
+    return not getattr(messages, 'used', False)
+
+
+def _has_pending_messages(request):
+    """True if flash messages are queued for the request (without consuming them)"""
+    return len(get_messages(request)) > 0
+
+
+def _set_validators(response, etag, last_modified):
+    response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def versioned_view(version_func):
+    """
+    Add ETag/Last-Modified validation and response caching to a GET view.
+
+    Args:
+        version_func: callable taking the view's (request, *args, **kwargs)
+            and returning a DataVersion for the data the response depends on,
+            or None to bypass caching for the request
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or _has_pending_messages(request):
+                return view_func(request, *args, **kwargs)
+
+            try:
+                version = version_func(request, *args, **kwargs)
+            except Exception as e:
+                logger.warning(f"Data version lookup failed for {view_func.__name__}: {e}")
+                version = None
+            if version is None:
+                return view_func(request, *args, **kwargs)
+
+            key = _cache_key(view_func, request, args, kwargs, version.token)
+            etag = quote_etag(key)
+            last_modified = (
+                int(version.last_modified.timestamp()) if version.last_modified else None
+            )
+
+            not_modified = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if not_modified is not None:
+                return _set_validators(not_modified, etag, last_modified)
+
+            cached = response_cache.get(key)
+            if cached is not None:
+                response = HttpResponse(cached.content, status=cached.status)
+                for name, value in cached.headers.items():
+                    response.headers[name] = value
+            else:
+                response = view_func(request, *args, **kwargs)
+                if _is_storable(request, response):
+                    response_cache.set(key, response)
+
+            if response.status_code == 200:
+                _set_validators(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,230 @@
+# powerplot/services/scada_period_query.py
+"""
+Database-side period aggregation of SCADA data for the plot and export endpoints.
+
+Periods are derived from the hour of year (1-based) of each dispatch interval,
+as get_hour_of_year() does in Python:
+
+- hour: hour of year, value = total MWh for the hour
+- day: (hour - 1) // 24 + 1
+- week: get_week_from_hour() (168-hour weeks)
+- month: get_month_from_hour() (non-leap month boundaries)
+
+For day/week/month the value is the mean hourly total over the hours with
+data in the period, matching the averaging previously done in the views.
+Both levels are computed in one GROUP BY as SUM(quantity) / COUNT(DISTINCT
+hour), so only one row per period (and group) leaves the database.
+
+The hourly rollup is queried first; facility_scada is used when the rollup
+holds nothing for the selection, and the archive when neither does.
+"""
+from collections import defaultdict
+import logging
+
+import numpy as np
+from django.db.models import Count, Func, IntegerField, Sum
+
+from siren_web.models import FacilityScada, FacilityScadaHourly, facilities
+from .generation_utils import aggregate_arrays_by_period, get_hours_of_year
+from .scada_storage import get_scada_values, month_start
+
+logger = logging.getLogger(__name__)
+
+AGGREGATIONS = ('hour', 'day', 'week', 'month')
+
+# Last hour of each month in a non-leap year, as used by get_month_from_hour()
+MONTH_END_HOURS = np.cumsum([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]) * 24
+
+
+class HourOfYear(Func):
+    """Hour of year (1-based) of a datetime column"""
+    output_field = IntegerField()
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template='((DAYOFYEAR(%(expressions)s) - 1) * 24 + HOUR(%(expressions)s) + 1)',
+            **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template=(
+                "((CAST(strftime('%%%%j', %(expressions)s) AS INTEGER) - 1) * 24"
+                " + CAST(strftime('%%%%H', %(expressions)s) AS INTEGER) + 1)"
+            ),
+            **extra_context
+        )
+
+
+class PeriodOfHour(Func):
+    """Day, week or month number derived from an hour-of-year expression"""
+    output_field = IntegerField()
+
+    def __init__(self, expression, aggregation, **extra):
+        self.aggregation = aggregation
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        div = 'DIV' if connection.vendor == 'mysql' else '/'
+        if self.aggregation == 'day':
+            template = f'(((%(expressions)s) - 1) {div} 24 + 1)'
+        elif self.aggregation == 'week':
+            template = f'(((%(expressions)s) - 1) {div} 168 + 1)'
+        elif self.aggregation == 'month':
+            cases = ' '.join(
+                f'WHEN %(expressions)s <= {int(end_hour)} THEN {month}'
+                for month, end_hour in enumerate(MONTH_END_HOURS[:-1], start=1)
+            )
+            template = f'(CASE {cases} ELSE 12 END)'
+        else:
+            template = '%(expressions)s'
+        return super().as_sql(compiler, connection, template=template, **extra_context)
+
+
+class ScadaPeriodQuery:
+    """Hour/day/week/month SCADA series for facilities, summed in the database"""
+
+    def get_series(self, facility_ids, year, aggregation='hour',
+                   start_hour=None, end_hour=None, group_by=None):
+        """
+        SCADA series for a year, summed across the selected facilities.
+
+        Args:
+            facility_ids: iterable of facility ids, facility instances or a
+                facilities queryset
+            year: int
+            aggregation: 'hour', 'day', 'week' or 'month'
+            start_hour: Optional start hour filter (1-based, inclusive; applied
+                only together with end_hour)
+            end_hour: Optional end hour filter (1-based, inclusive)
+            group_by: None to sum across all facilities, 'facility' or
+                'technology' for one series per facility / technology
+
+        Returns:
+            dict of group key (None, facility id or technology id) ->
+            {'periods': int64 array, 'quantity': float64 array}, sorted by
+            period. Groups without data are omitted.
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Invalid aggregation: {aggregation}")
+        if not (start_hour and end_hour):
+            start_hour = end_hour = None
+
+        series = self._query(
+            FacilityScadaHourly.objects.filter(
+                facility__in=facility_ids, hour_start__year=year
+            ),
+            'hour_start', aggregation, start_hour, end_hour, group_by
+        )
+        if not series:
+            series = self._query(
+                FacilityScada.objects.filter(
+                    facility__in=facility_ids, dispatch_interval__year=year
+                ),
+                'dispatch_interval', aggregation, start_hour, end_hour, group_by
+            )
+        if not series:
+            series = self._from_archive(
+                facility_ids, year, aggregation, start_hour, end_hour, group_by
+            )
+        return series
+
+    def get_group_series(self, facility_ids, year, aggregation='hour',
+                         start_hour=None, end_hour=None):
+        """
+        Single series summed across facilities.
+
+        Returns:
+            {'periods': int64 array, 'quantity': float64 array}, or None if
+            there is no data
+        """
+        return self.get_series(
+            facility_ids, year, aggregation, start_hour, end_hour
+        ).get(None)
+
+    def _group_field(self, group_by):
+        if group_by == 'facility':
+            return 'facility_id'
+        if group_by == 'technology':
+            return 'facility__idtechnologies'
+        return None
+
+    def _query(self, queryset, datetime_field, aggregation, start_hour, end_hour, group_by):
+        """Run the GROUP BY against facility_scada or the hourly rollup"""
+        queryset = queryset.order_by().annotate(hour=HourOfYear(datetime_field))
+        if start_hour is not None:
+            queryset = queryset.filter(hour__gte=start_hour, hour__lte=end_hour)
+
+        group_field = self._group_field(group_by)
+        fields = [group_field] if group_field else []
+        rows = queryset.annotate(
+            period=PeriodOfHour('hour', aggregation)
+        ).values(*fields, 'period').annotate(
+            total=Sum('quantity'),
+            hours=Count('hour', distinct=True),
+        ).values_list(*fields, 'period', 'total', 'hours')
+
+        grouped = defaultdict(list)
+        for row in rows.iterator(chunk_size=10000):
+            key = row[0] if group_field else None
+            period, total, hours = row[-3:]
+            grouped[key].append((period, float(total or 0) / hours))
+
+        return self._to_arrays(grouped)
+
+    def _from_archive(self, facility_ids, year, aggregation, start_hour, end_hour, group_by):
+        """Aggregate archived half-hourly values for a year with no database rows"""
+        technology_map = {}
+        if group_by == 'technology':
+            technology_map = dict(
+                facilities.objects.filter(
+                    idfacilities__in=[getattr(f, 'pk', f) for f in facility_ids]
+                ).values_list('idfacilities', 'idtechnologies')
+            )
+
+        points = defaultdict(list)
+        for dispatch_interval, facility_id, quantity in get_scada_values(
+            month_start(year, 1), month_start(year + 1, 1), facility_ids
+        ):
+            if group_by == 'facility':
+                key = facility_id
+            elif group_by == 'technology':
+                key = technology_map.get(facility_id)
+            else:
+                key = None
+            points[key].append((int(dispatch_interval.timestamp()), float(quantity or 0)))
+
+        grouped = {}
+        for key, values in points.items():
+            timestamps, quantities = np.array(values).T
+            hours = get_hours_of_year(timestamps.astype(np.int64))
+            if start_hour is not None:
+                in_range = (hours >= start_hour) & (hours <= end_hour)
+                hours, quantities = hours[in_range], quantities[in_range]
+            if not len(hours):
+                continue
+
+            # Hourly totals, then the mean hourly total per period
+            unique_hours, hour_index = np.unique(hours, return_inverse=True)
+            hour_totals = np.bincount(hour_index, weights=quantities)
+            period_means = aggregate_arrays_by_period(
+                unique_hours, aggregation, {'quantity': hour_totals}
+            )
+            grouped[key] = list(zip(
+                period_means['periods'].tolist(), period_means['quantity'].tolist()
+            ))
+
+        return self._to_arrays(grouped)
+
+    @staticmethod
+    def _to_arrays(grouped):
+        series = {}
+        for key, points in grouped.items():
+            points.sort()
+            series[key] = {
+                'periods': np.array([p for p, _ in points], dtype=np.int64),
+                'quantity': np.array([q for _, q in points], dtype=np.float64),
+            }
+        return series
@@ -0,0 +1,326 @@
+# powerplot/services/scada_rollups.py
+"""
+Pre-aggregated SCADA rollups maintained alongside facility_scada.
+
+Three rollup tables are kept in step with the half-hourly data:
+
+- facility_scada_hourly: per facility per hour
+- technology_scada_daily: per technology (fuel type) per day
+- facility_scada_monthly: per facility per month, split by time of day
+
+Ingest applies the change in each half-hourly value as an additive upsert, so
+re-fetching a day corrects the rollups rather than double counting. Buckets are
+taken from the dispatch_interval value as it is stored in facility_scada, so
+they line up with the dispatch_interval__year/__month filters used elsewhere.
+
+Migration 0169 rebuilds the rollups for every month in facility_scada, so
+months ingested before the tables existed are complete. If they drift, or to
+rebuild archived months, use ``python manage.py rebuild_scada_rollups``.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal, ROUND_HALF_UP
+import logging
+
+from django.db import connection, transaction
+from django.db.models import F, Sum
+
+from siren_web.models import (
+    FacilityScada, FacilityScadaHourly, FacilityScadaMonthly,
+    TechnologyScadaDaily, facilities,
+)
+from .scada_storage import get_scada_values
+
+logger = logging.getLogger(__name__)
+
+QUANTITY_PLACES = Decimal('0.000001')
+ZERO = Decimal('0')
+
+
+def stored_interval(dispatch_interval):
+    """
+    Return the naive wall-clock value of a dispatch interval as held in the DB.
+
+    The raw-cursor upsert in AEMOScadaFetcher writes the wall-clock time of the
+    parsed interval, and Django reads stored values back as UTC, so dropping
+    tzinfo gives the same value for ingest records and rows read from the DB.
+    """
+    return dispatch_interval.replace(tzinfo=None)
+
+
+class ScadaRollupService:
+    """Maintain and query the hourly, daily and monthly SCADA rollups"""
+
+    BATCH_SIZE = 1000
+
+    HOURLY_SQL = """
+        INSERT INTO facility_scada_hourly
+            (hour_start, idfacilities, quantity, generation, consumption,
+             interval_count, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, NOW())
+        ON DUPLICATE KEY UPDATE
+            quantity = quantity + VALUES(quantity),
+            generation = generation + VALUES(generation),
+            consumption = consumption + VALUES(consumption),
+            interval_count = interval_count + VALUES(interval_count),
+            updated_at = NOW()
+    """
+
+    DAILY_SQL = """
+        INSERT INTO technology_scada_daily
+            (day, idtechnologies, quantity, generation, consumption,
+             interval_count, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, NOW())
+        ON DUPLICATE KEY UPDATE
+            quantity = quantity + VALUES(quantity),
+            generation = generation + VALUES(generation),
+            consumption = consumption + VALUES(consumption),
+            interval_count = interval_count + VALUES(interval_count),
+            updated_at = NOW()
+    """
+
+    MONTHLY_SQL = """
+        INSERT INTO facility_scada_monthly
+            (year, month, hour, minute, idfacilities, quantity, generation,
+             consumption, interval_count, updated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+        ON DUPLICATE KEY UPDATE
+            quantity = quantity + VALUES(quantity),
+            generation = generation + VALUES(generation),
+            consumption = consumption + VALUES(consumption),
+            interval_count = interval_count + VALUES(interval_count),
+            updated_at = NOW()
+    """
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def get_stored_quantities(self, records):
+        """
+        Fetch the currently stored quantity for each (interval, facility) in records.
+
+        Args:
+            records: list of dicts with dispatch_interval, facility_id, quantity
+
+        Returns:
+            dict keyed by (naive dispatch_interval, facility_id) -> Decimal
+        """
+        if not records:
+            return {}
+
+        intervals = [stored_interval(r['dispatch_interval']) for r in records]
+        facility_ids = {r['facility_id'] for r in records}
+
+        stored = FacilityScada.objects.filter(
+            dispatch_interval__gte=min(intervals).replace(tzinfo=dt_timezone.utc),
+            dispatch_interval__lte=max(intervals).replace(tzinfo=dt_timezone.utc),
+            facility_id__in=facility_ids,
+        ).order_by().values_list('dispatch_interval', 'facility_id', 'quantity')
+
+        return {
+            (stored_interval(dispatch_interval), facility_id): quantity
+            for dispatch_interval, facility_id, quantity in stored
+        }
+
+    def apply_changes(self, records, previous=None):
+        """
+        Apply half-hourly value changes to all rollup tables.
+
+        Args:
+            records: list of dicts with dispatch_interval, facility_id, quantity
+                (the values just written to facility_scada)
+            previous: dict from get_stored_quantities() taken before the write;
+                None when every record is new
+
+        Returns:
+            int: number of half-hourly values whose rollups changed
+        """
+        previous = previous or {}
+        hourly = defaultdict(lambda: [ZERO, ZERO, ZERO, 0])
+        daily = defaultdict(lambda: [ZERO, ZERO, ZERO, 0])
+        monthly = defaultdict(lambda: [ZERO, ZERO, ZERO, 0])
+
+        technology_map = self._technology_map({r['facility_id'] for r in records})
+        changed = 0
+
+        for record in records:
+            interval = stored_interval(record['dispatch_interval'])
+            facility_id = record['facility_id']
+            new = Decimal(record['quantity']).quantize(QUANTITY_PLACES, rounding=ROUND_HALF_UP)
+            old = previous.get((interval, facility_id))
+
+            if old is None:
+                delta = (new, max(new, ZERO), min(new, ZERO), 1)
+            else:
+                if old == new:
+                    continue
+                delta = (
+                    new - old,
+                    max(new, ZERO) - max(old, ZERO),
+                    min(new, ZERO) - min(old, ZERO),
+                    0,
+                )
+            changed += 1
+
+            buckets = [
+                hourly[(interval.replace(minute=0, second=0, microsecond=0), facility_id)],
+                monthly[(interval.year, interval.month, interval.hour, interval.minute, facility_id)],
+            ]
+            technology_id = technology_map.get(facility_id)
+            if technology_id is not None:
+                buckets.append(daily[(interval.date(), technology_id)])
+
+            for bucket in buckets:
+                for i, value in enumerate(delta):
+                    bucket[i] += value
+
+        self._upsert(self.HOURLY_SQL, [key + tuple(v) for key, v in hourly.items()])
+        self._upsert(self.DAILY_SQL, [key + tuple(v) for key, v in daily.items()])
+        self._upsert(self.MONTHLY_SQL, [key + tuple(v) for key, v in monthly.items()])
+
+        logger.debug(
+            f"Rollups updated from {changed} half-hourly values: {len(hourly)} hourly, "
+            f"{len(daily)} daily, {len(monthly)} monthly buckets"
+        )
+        return changed
+
+    @transaction.atomic
+    def rebuild_month(self, year, month):
+        """
+        Recompute all rollups for a calendar month from facility_scada
+        (or its archive).
+
+        Args:
+            year: int
+            month: int (1-12)
+
+        Returns:
+            int: number of half-hourly records rolled up
+        """
+        month_start = datetime(year, month, 1)
+        month_end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+        start_utc = month_start.replace(tzinfo=dt_timezone.utc)
+        end_utc = month_end.replace(tzinfo=dt_timezone.utc)
+
+        FacilityScadaHourly.objects.filter(
+            hour_start__gte=start_utc, hour_start__lt=end_utc
+        ).delete()
+        TechnologyScadaDaily.objects.filter(
+            day__gte=month_start.date(), day__lt=month_end.date()
+        ).delete()
+        FacilityScadaMonthly.objects.filter(year=year, month=month).delete()
+
+        # Read through the archive so archived years can still be rebuilt
+        records = [
+            {'dispatch_interval': dispatch_interval, 'facility_id': facility_id, 'quantity': quantity}
+            for dispatch_interval, facility_id, quantity in get_scada_values(start_utc, end_utc)
+        ]
+
+        self.apply_changes(records)
+        return len(records)
+
+    def _technology_map(self, facility_ids):
+        """Map facility id -> technology id for the given facilities"""
+        return dict(
+            facilities.objects.filter(
+                idfacilities__in=facility_ids,
+                idtechnologies__isnull=False,
+            ).values_list('idfacilities', 'idtechnologies')
+        )
+
+    def _upsert(self, sql, values):
+        """Execute an additive upsert in batches"""
+        if not values:
+            return
+        with connection.cursor() as cursor:
+            for i in range(0, len(values), self.BATCH_SIZE):
+                cursor.executemany(sql, values[i:i + self.BATCH_SIZE])
+
+    # ------------------------------------------------------------------
+    # Read helpers
+    # ------------------------------------------------------------------
+
+    def get_monthly_facility_totals(self, year, month):
+        """
+        Monthly SCADA totals per facility.
+
+        Returns:
+            dict of facility_id -> {'quantity', 'interval_count'}. Empty if the
+            rollup holds no data for the month.
+        """
+        rows = FacilityScadaMonthly.objects.filter(
+            year=year, month=month
+        ).values('facility_id').annotate(
+            total=Sum('quantity'),
+            intervals=Sum('interval_count'),
+        ).values_list('facility_id', 'total', 'intervals')
+
+        return {
+            facility_id: {'quantity': float(total or 0), 'interval_count': intervals or 0}
+            for facility_id, total, intervals in rows
+        }
+
+    def get_diurnal_averages(self, start_year, start_month, end_year, end_month):
+        """
+        Average half-hourly quantity by time of day across whole months.
+
+        Matches averaging every facility_scada row in the months by
+        (hour, minute) of its dispatch interval.
+
+        Args:
+            start_year, start_month: first month (inclusive)
+            end_year, end_month: last month (inclusive)
+
+        Returns:
+            dict of fractional hour-of-day -> average quantity. Empty if the
+            rollup holds no data for the months.
+        """
+        start_key = start_year * 12 + start_month
+        end_key = end_year * 12 + end_month
+
+        rows = FacilityScadaMonthly.objects.filter(
+            year__gte=start_year, year__lte=end_year
+        ).values('year', 'month', 'hour', 'minute').annotate(
+            total=Sum('quantity'),
+            intervals=Sum('interval_count'),
+        ).order_by().values_list('year', 'month', 'hour', 'minute', 'total', 'intervals')
+
+        totals = defaultdict(lambda: [0.0, 0])
+        for year, month, hour, minute, total, intervals in rows:
+            if not start_key <= year * 12 + month <= end_key:
+                continue
+            bucket = totals[hour + minute / 60.0]
+            bucket[0] += float(total or 0)
+            bucket[1] += intervals or 0
+
+        return {
+            time_of_day: total / intervals
+            for time_of_day, (total, intervals) in sorted(totals.items())
+            if intervals
+        }
+
+    def get_technology_totals(self, start_day, end_day):
+        """
+        Generation (positive) and consumption (negative) totals per technology.
+
+        Args:
+            start_day: datetime.date (inclusive)
+            end_day: datetime.date (inclusive)
+
+        Returns:
+            list of dicts with fuel_type, technology_name, category,
+            generation_total and consumption_total (summed half-hourly MW values)
+        """
+        return list(
+            TechnologyScadaDaily.objects.filter(
+                day__gte=start_day, day__lte=end_day
+            ).values(
+                fuel_type=F('technology__fuel_type'),
+                technology_name=F('technology__technology_name'),
+                category=F('technology__category'),
+            ).annotate(
+                generation_total=Sum('generation'),
+                consumption_total=Sum('consumption'),
+            ).order_by()
+        )
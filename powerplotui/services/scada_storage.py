@@ -0,0 +1,401 @@
+# powerplot/services/scada_storage.py
+"""
+Storage management for the facility_scada table.
+
+- ScadaPartitionManager: facility_scada is RANGE partitioned by month on
+  dispatch_interval (see migration 0163) so current-month queries only touch
+  recent partitions. New partitions are split off the catch-all p_future
+  partition ahead of time by ``manage_scada_partitions``.
+- ScadaArchive: closed years can be exported to compressed columnar files
+  (one numpy .npz per month) by ``archive_scada_year``, after which their
+  partitions can be dropped to shrink the live table and its backups.
+
+get_scada_values() reads half-hourly values for a time range from the archive
+for archived months and from the database otherwise, so callers do not need
+to know where a month is held. Aggregating callers can use split_by_storage()
+to run their grouped queries on the database months only.
+"""
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+import logging
+import os
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+
+from siren_web.models import FacilityScada
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(year, month):
+    """First instant of a month (UTC, as dispatch_interval is read back)"""
+    return datetime(year, month, 1, tzinfo=dt_timezone.utc)
+
+
+def next_month(year, month):
+    """(year, month) of the following month"""
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def months_between(start, end):
+    """List (year, month) for every month overlapping [start, end)"""
+    months = []
+    year, month = start.year, start.month
+    while month_start(year, month) < end:
+        months.append((year, month))
+        year, month = next_month(year, month)
+    return months
+
+
+class ScadaPartitionManager:
+    """Inspect and maintain the monthly partitions of facility_scada (MySQL/MariaDB only)"""
+
+    TABLE = 'facility_scada'
+    FUTURE_PARTITION = 'p_future'
+
+    @staticmethod
+    def partition_name(year, month):
+        return f"p{year}{month:02d}"
+
+    @staticmethod
+    def partition_definition(year, month):
+        """PARTITION clause holding rows for the given month"""
+        ny, nm = next_month(year, month)
+        return (
+            f"PARTITION {ScadaPartitionManager.partition_name(year, month)} "
+            f"VALUES LESS THAN (TO_DAYS('{ny:04d}-{nm:02d}-01'))"
+        )
+
+    def is_supported(self):
+        return connection.vendor == 'mysql'
+
+    def get_partitions(self):
+        """
+        List the partitions of facility_scada.
+
+        Returns:
+            list of dicts with name, year, month (None for p_future) and
+            approximate row count, in partition order
+        """
+        if not self.is_supported():
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT PARTITION_NAME, TABLE_ROWS
+                FROM information_schema.PARTITIONS
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = %s
+                  AND PARTITION_NAME IS NOT NULL
+                ORDER BY PARTITION_ORDINAL_POSITION
+                """,
+                [self.TABLE]
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, table_rows in rows:
+            year = month = None
+            if name != self.FUTURE_PARTITION:
+                year, month = int(name[1:5]), int(name[5:7])
+            partitions.append({
+                'name': name, 'year': year, 'month': month, 'rows': table_rows or 0,
+            })
+        return partitions
+
+    def is_partitioned(self):
+        return bool(self.get_partitions())
+
+    def ensure_future_partitions(self, months_ahead=3):
+        """
+        Split monthly partitions off p_future up to months_ahead past the current month.
+
+        Returns:
+            list of partition names created
+        """
+        partitions = [p for p in self.get_partitions() if p['year']]
+        if not partitions:
+            return []
+
+        today = datetime.now(dt_timezone.utc)
+        target = (today.year, today.month)
+        for _ in range(months_ahead):
+            target = next_month(*target)
+
+        year, month = next_month(partitions[-1]['year'], partitions[-1]['month'])
+        new_months = []
+        while (year, month) <= target:
+            new_months.append((year, month))
+            year, month = next_month(year, month)
+
+        if not new_months:
+            return []
+
+        definitions = [self.partition_definition(y, m) for y, m in new_months]
+        definitions.append(f"PARTITION {self.FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {self.TABLE} REORGANIZE PARTITION {self.FUTURE_PARTITION} "
+                f"INTO ({', '.join(definitions)})"
+            )
+
+        created = [self.partition_name(y, m) for y, m in new_months]
+        logger.info(f"Created facility_scada partitions: {', '.join(created)}")
+        return created
+
+    def drop_month(self, year, month):
+        """Drop the partition (and all rows) for a month"""
+        name = self.partition_name(year, month)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {self.TABLE} DROP PARTITION {name}")
+        logger.info(f"Dropped facility_scada partition {name}")
+
+
+class ScadaArchive:
+    """
+    Monthly columnar archive of facility_scada.
+
+    Each month is stored as an .npz file with three columns:
+    dispatch_interval (int64 epoch seconds, as read back by Django),
+    facility_id (int64) and quantity (int64 micro-units, so the DECIMAL(12,6)
+    values round-trip exactly).
+    """
+
+    def __init__(self, archive_dir=None):
+        self.archive_dir = Path(
+            archive_dir or getattr(
+                settings, 'SCADA_ARCHIVE_DIR', Path(settings.BASE_DIR) / 'scada_archive'
+            )
+        )
+
+    def month_path(self, year, month):
+        return self.archive_dir / str(year) / f"facility_scada_{year}_{month:02d}.npz"
+
+    def is_archived(self, year, month):
+        return self.month_path(year, month).exists()
+
+    def archived_years(self):
+        """Years with at least one archived month, in ascending order"""
+        if not self.archive_dir.is_dir():
+            return []
+        return sorted(
+            int(year_dir.name) for year_dir in self.archive_dir.iterdir()
+            if year_dir.name.isdigit() and any(year_dir.glob('facility_scada_*_??.npz'))
+        )
+
+    def export_month(self, year, month):
+        """
+        Write a month of facility_scada to its archive file.
+
+        Returns:
+            int: number of rows archived (no file is written for an empty month)
+        """
+        ny, nm = next_month(year, month)
+        rows = FacilityScada.objects.filter(
+            dispatch_interval__gte=month_start(year, month),
+            dispatch_interval__lt=month_start(ny, nm),
+        ).order_by('dispatch_interval', 'facility_id').values_list(
+            'dispatch_interval', 'facility_id', 'quantity'
+        )
+
+        intervals, facility_ids, quantities = [], [], []
+        for dispatch_interval, facility_id, quantity in rows.iterator(chunk_size=10000):
+            intervals.append(int(dispatch_interval.timestamp()))
+            facility_ids.append(facility_id)
+            quantities.append(int(quantity.scaleb(6)))
+
+        if not intervals:
+            return 0
+
+        path = self.month_path(year, month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            dispatch_interval=np.array(intervals, dtype=np.int64),
+            facility_id=np.array(facility_ids, dtype=np.int64),
+            quantity=np.array(quantities, dtype=np.int64),
+        )
+        os.replace(tmp_path, path)
+
+        logger.info(f"Archived {len(intervals):,} facility_scada rows to {path}")
+        return len(intervals)
+
+    def load_month(self, year, month):
+        """Load the column arrays for an archived month"""
+        with np.load(self.month_path(year, month)) as data:
+            return {name: data[name] for name in data.files}
+
+    def verify_month(self, year, month):
+        """
+        Check an archived month against the database.
+
+        Returns:
+            bool: True if row count and quantity total match facility_scada
+        """
+        from django.db.models import Count, Sum
+
+        ny, nm = next_month(year, month)
+        stored = FacilityScada.objects.filter(
+            dispatch_interval__gte=month_start(year, month),
+            dispatch_interval__lt=month_start(ny, nm),
+        ).aggregate(records=Count('id'), total=Sum('quantity'))
+
+        columns = self.load_month(year, month)
+        archived_total = Decimal(int(columns['quantity'].sum())).scaleb(-6)
+        return (
+            stored['records'] == len(columns['quantity'])
+            and (stored['total'] or Decimal('0')) == archived_total
+        )
+
+    def interval_summary(self, year, month, start=None, end=None, facility_ids=None):
+        """
+        Aggregate an archived month by dispatch interval.
+
+        Args:
+            start, end: optional aware datetimes bounding [start, end)
+            facility_ids: optional set of facility ids whose positive quantities
+                are also totalled separately (e.g. renewable facilities)
+
+        Returns:
+            list of (dispatch_interval, records, positive_total, selected_total):
+            aware UTC datetime, row count, total of the positive quantities and
+            total of the positive quantities of facility_ids (Decimals)
+        """
+        columns = self.load_month(year, month)
+        intervals = columns['dispatch_interval']
+        mask = np.ones(len(intervals), dtype=bool)
+        if start is not None:
+            mask &= intervals >= int(start.timestamp())
+        if end is not None:
+            mask &= intervals < int(end.timestamp())
+        if not mask.any():
+            return []
+
+        # Files are written ordered by dispatch_interval, so each interval's
+        # rows are contiguous and can be summed exactly with reduceat
+        intervals = intervals[mask]
+        quantities = columns['quantity'][mask]
+        positive = np.where(quantities > 0, quantities, 0)
+        selected = positive
+        if facility_ids is not None:
+            selected = np.where(np.isin(columns['facility_id'][mask], list(facility_ids)), positive, 0)
+
+        starts = np.flatnonzero(np.r_[True, intervals[1:] != intervals[:-1]])
+        counts = np.diff(np.r_[starts, len(intervals)])
+        positive_totals = np.add.reduceat(positive, starts)
+        selected_totals = np.add.reduceat(selected, starts)
+
+        return [
+            (
+                datetime.fromtimestamp(ts, tz=dt_timezone.utc),
+                records,
+                Decimal(positive_total).scaleb(-6),
+                Decimal(selected_total).scaleb(-6),
+            )
+            for ts, records, positive_total, selected_total in zip(
+                intervals[starts].tolist(), counts.tolist(),
+                positive_totals.tolist(), selected_totals.tolist(),
+            )
+        ]
+
+    def iter_month(self, year, month, start=None, end=None, facility_ids=None):
+        """
+        Yield (dispatch_interval, facility_id, quantity) from an archived month.
+
+        Values match what FacilityScada.objects.values_list() returns:
+        aware UTC datetimes and Decimal quantities.
+        """
+        columns = self.load_month(year, month)
+        mask = np.ones(len(columns['dispatch_interval']), dtype=bool)
+        if start is not None:
+            mask &= columns['dispatch_interval'] >= int(start.timestamp())
+        if end is not None:
+            mask &= columns['dispatch_interval'] < int(end.timestamp())
+        if facility_ids is not None:
+            mask &= np.isin(columns['facility_id'], list(facility_ids))
+
+        for ts, facility_id, quantity in zip(
+            columns['dispatch_interval'][mask].tolist(),
+            columns['facility_id'][mask].tolist(),
+            columns['quantity'][mask].tolist(),
+        ):
+            yield (
+                datetime.fromtimestamp(ts, tz=dt_timezone.utc),
+                facility_id,
+                Decimal(quantity).scaleb(-6),
+            )
+
+
+def split_by_storage(start, end, archive=None):
+    """
+    Split [start, end) into archived months and time ranges held in facility_scada.
+
+    Args:
+        start: aware datetime (inclusive)
+        end: aware datetime (exclusive)
+        archive: optional ScadaArchive
+
+    Returns:
+        (archived, db_ranges): archived is a list of (year, month) to read from
+        the archive, db_ranges a list of (start, end) ranges of consecutive
+        months in the database, clipped to [start, end)
+    """
+    archive = archive or ScadaArchive()
+
+    archived = []
+    db_runs = []
+    # Months are UTC, as dispatch_interval is stored
+    for year, month in months_between(start.astimezone(dt_timezone.utc), end):
+        if archive.is_archived(year, month):
+            archived.append((year, month))
+        elif db_runs and next_month(*db_runs[-1][1]) == (year, month):
+            db_runs[-1][1] = (year, month)
+        else:
+            db_runs.append([(year, month), (year, month)])
+
+    db_ranges = [
+        (max(start, month_start(*first)), min(end, month_start(*next_month(*last))))
+        for first, last in db_runs
+    ]
+    return archived, db_ranges
+
+
+def get_scada_values(start, end, facility_ids=None, archive=None):
+    """
+    Yield half-hourly (dispatch_interval, facility_id, quantity) for [start, end).
+
+    Archived months are read from the archive and the rest from facility_scada,
+    so analysis code works the same whether or not a year has been archived.
+
+    Args:
+        start: aware datetime (inclusive)
+        end: aware datetime (exclusive)
+        facility_ids: optional iterable of facility ids (or facility instances)
+        archive: optional ScadaArchive
+    """
+    archive = archive or ScadaArchive()
+    if facility_ids is not None:
+        facility_ids = {getattr(f, 'pk', f) for f in facility_ids}
+
+    # Consecutive months held in the database are read with one query each
+    archived, db_ranges = split_by_storage(start, end, archive)
+    for year, month in archived:
+        yield from archive.iter_month(year, month, start, end, facility_ids)
+
+    for range_start, range_end in db_ranges:
+        queryset = FacilityScada.objects.filter(
+            dispatch_interval__gte=range_start,
+            dispatch_interval__lt=range_end,
+        )
+        if facility_ids is not None:
+            queryset = queryset.filter(facility_id__in=facility_ids)
+
+        yield from queryset.order_by().values_list(
+            'dispatch_interval', 'facility_id', 'quantity'
+        ).iterator(chunk_size=10000)
@@ -0,0 +1,283 @@
+"""
+Global Sensitivity Analysis for Monte Carlo Simulations
+
+Attributes the variance of the simulated 2040 RE% - and of meeting the 75%
+and 85% targets - to the simulator's four uncertainties, with variance-based
+(Sobol') indices:
+
+- first-order index S: share of the variance explained by the uncertainty
+  on its own
+- total index ST: share involving the uncertainty at all, including its
+  interactions with the others (ST - S measures the interactions)
+
+The uncertainties are analysed as groups - demand, commissioning, delays and
+capacity factors, each a block of uniforms (see
+MonteCarloSimulator.split_uniforms) - so a run costs (groups + 2) x N = 6N
+model evaluations whatever the number of facilities. The Saltelli design
+takes two independent sample matrices A and B and, for each group, a matrix
+AB_g equal to A with the group's columns taken from B; the indices use the
+Saltelli (2010) first-order and Jansen total estimators. A and B come from
+one scrambled Sobol' sequence of twice the dimension, drawn in batches that
+can run in a process pool like the simulator's.
+
+Confidence intervals are bootstrap percentile intervals, resampling the N
+rows of model outputs; the model is not re-run.
+
+With the default N = 16,384 a scenario takes about 100k evaluations, the
+cost of a default simulation, so it can run for every active scenario
+overnight (run_monte_carlo --all --sensitivity).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import time
+import warnings
+import numpy as np
+from django.db import connections
+from scipy.stats import qmc
+
+from .monte_carlo_simulator import MonteCarloSimulator
+from .monte_carlo_statistics import DEFAULT_TARGETS
+
+logger = logging.getLogger(__name__)
+
+# Uncertainty groups, as keys of MonteCarloSimulator.split_uniforms
+UNCERTAINTY_GROUPS = ('commissioning', 'delay', 'cf', 'demand')
+
+# Simulator holding the shared inputs in a pool worker (see _init_worker)
+_worker_simulator = None
+
+
+def _init_worker(inputs):
+    """Process pool initializer: build a simulator from the shared inputs"""
+    global _worker_simulator
+    _worker_simulator = MonteCarloSimulator.from_inputs(inputs)
+
+
+def _run_batch_worker(batch_size, seed_sequence):
+    """Process pool entry point: model outputs for one batch of the design"""
+    return evaluate_saltelli_batch(_worker_simulator, batch_size, seed_sequence)
+
+
+def evaluate_saltelli_batch(simulator, batch_size, seed_sequence):
+    """
+    RE% for one batch of rows of the Saltelli design.
+
+    Args:
+        simulator: MonteCarloSimulator with its inputs loaded
+        batch_size: int, rows of A and B in the batch
+        seed_sequence: numpy.random.SeedSequence scrambling the batch's points
+
+    Returns:
+        numpy array (batch_size, groups + 2): columns f(A), f(B) and f(AB_g)
+        for each group in UNCERTAINTY_GROUPS order
+    """
+    dims = simulator.uniform_dimensions()
+    # scipy warns when n is not a power of 2; the points are still valid
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        block = qmc.Sobol(d=2 * dims, scramble=True,
+                          seed=np.random.default_rng(seed_sequence)).random(batch_size)
+    uniforms_a = simulator.split_uniforms(block[:, :dims])
+    uniforms_b = simulator.split_uniforms(block[:, dims:])
+    del block
+
+    outputs = np.empty((batch_size, len(UNCERTAINTY_GROUPS) + 2))
+    outputs[:, 0] = simulator._calculate_iteration_batch(batch_size, uniforms=uniforms_a)
+    outputs[:, 1] = simulator._calculate_iteration_batch(batch_size, uniforms=uniforms_b)
+    for i, group in enumerate(UNCERTAINTY_GROUPS):
+        # A with the group's uniforms taken from B (the samplers only read them)
+        uniforms_ab = {**uniforms_a, group: uniforms_b[group]}
+        outputs[:, i + 2] = simulator._calculate_iteration_batch(batch_size, uniforms=uniforms_ab)
+    return outputs
+
+
+def sobol_indices(outputs):
+    """
+    First-order and total Sobol' indices from Saltelli design outputs.
+
+    Args:
+        outputs: numpy array (N, groups + 2) as from evaluate_saltelli_batch
+
+    Returns:
+        (first_order, total) numpy arrays (groups,), NaN if the output
+        does not vary
+    """
+    # Centring leaves the indices unchanged but greatly reduces the variance
+    # of the first-order estimator when the mean is large (RE% ~ 100)
+    centred = outputs - outputs[:, :2].mean()
+    f_a = centred[:, 0]
+    f_b = centred[:, 1]
+    f_ab = centred[:, 2:]
+    variance = np.var(centred[:, :2])
+    if variance <= 0:
+        nan = np.full(f_ab.shape[1], np.nan)
+        return nan, nan
+
+    first_order = np.mean(f_b[:, np.newaxis] * (f_ab - f_a[:, np.newaxis]), axis=0) / variance
+    total = 0.5 * np.mean((f_a[:, np.newaxis] - f_ab) ** 2, axis=0) / variance
+    return first_order, total
+
+
+class SobolSensitivityAnalyzer:
+    """
+    Sobol' sensitivity analysis of a MonteCarloSimulator's uncertainties.
+
+    Usage:
+        analyzer = SobolSensitivityAnalyzer(simulator, base_samples=16384)
+        indices = analyzer.run()
+        analyzer.store(simulation_record, indices)
+    """
+
+    def __init__(self, simulator, base_samples=16384, bootstrap=200, confidence=0.95,
+                 seed=None, workers=1):
+        """
+        Args:
+            simulator: MonteCarloSimulator (its inputs are loaded if needed);
+                its probability profile and target year are analysed
+            base_samples: int, rows N of the A and B matrices (a power of 2
+                balances the Sobol' points; 6N model evaluations)
+            bootstrap: int, bootstrap resamples for the confidence intervals
+            confidence: float, confidence level of the intervals
+            seed: int, random seed (default: fresh entropy, recorded with the results)
+            workers: int, worker processes for the model evaluations (default 1)
+        """
+        if base_samples < 2:
+            raise ValueError("base_samples must be at least 2")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        self.simulator = simulator
+        self.base_samples = base_samples
+        self.bootstrap = bootstrap
+        self.confidence = confidence
+        self.seed = np.random.SeedSequence().entropy if seed is None else seed
+        self.workers = max(1, workers)
+        self.batch_size = 4096
+
+    def _streams(self):
+        """(design, bootstrap) SeedSequences, children of the seed"""
+        return np.random.SeedSequence(self.seed).spawn(2)
+
+    def _batches(self):
+        """Batch sizes and their scrambling streams (as MonteCarloSimulator._batches)"""
+        sizes = [
+            min(self.batch_size, self.base_samples - batch_start)
+            for batch_start in range(0, self.base_samples, self.batch_size)
+        ]
+        design_stream, _ = self._streams()
+        return list(zip(sizes, design_stream.spawn(len(sizes))))
+
+    def evaluate(self):
+        """
+        Run the model over the Saltelli design.
+
+        Returns:
+            numpy array (base_samples, groups + 2) of RE% (see evaluate_saltelli_batch)
+        """
+        simulator = self.simulator
+        if simulator.pipeline_df is None:
+            simulator.load_inputs()
+
+        batches = self._batches()
+        if self.workers == 1 or len(batches) == 1:
+            return np.concatenate([
+                evaluate_saltelli_batch(simulator, size, stream) for size, stream in batches
+            ])
+
+        # Workers must not share the parent's connection
+        connections.close_all()
+
+        workers = min(self.workers, len(batches))
+        logger.info(f"Evaluating {len(batches)} sensitivity batches with {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(simulator.shared_inputs(),)) as executor:
+            # map() returns the batches in order, so results do not depend on workers
+            return np.concatenate(list(executor.map(_run_batch_worker, *zip(*batches))))
+
+    def analyse(self, outputs):
+        """
+        Indices and bootstrap confidence intervals for one output.
+
+        Args:
+            outputs: numpy array (N, groups + 2) of the quantity analysed
+
+        Returns:
+            dict {group: {'first_order', 'first_order_ci', 'total', 'total_ci'}},
+            values None where the output does not vary
+        """
+        first_order, total = sobol_indices(outputs)
+
+        # The same resamples for every output analysed
+        _, bootstrap_stream = self._streams()
+        rng = np.random.default_rng(bootstrap_stream)
+        n = len(outputs)
+        resampled_first = np.empty((self.bootstrap, len(UNCERTAINTY_GROUPS)))
+        resampled_total = np.empty_like(resampled_first)
+        for b in range(self.bootstrap):
+            resampled_first[b], resampled_total[b] = sobol_indices(outputs[rng.integers(0, n, n)])
+
+        tail = (1 - self.confidence) / 2 * 100
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+            first_ci = np.nanpercentile(resampled_first, [tail, 100 - tail], axis=0)
+            total_ci = np.nanpercentile(resampled_total, [tail, 100 - tail], axis=0)
+
+        def value(x):
+            return None if np.isnan(x) else round(float(x), 4)
+
+        return {
+            group: {
+                'first_order': value(first_order[i]),
+                'first_order_ci': [value(first_ci[0, i]), value(first_ci[1, i])],
+                'total': value(total[i]),
+                'total_ci': [value(total_ci[0, i]), value(total_ci[1, i])],
+            }
+            for i, group in enumerate(UNCERTAINTY_GROUPS)
+        }
+
+    def run(self):
+        """
+        Run the analysis for RE% and for meeting each target.
+
+        Returns:
+            dict with the settings and 'indices': {output: analyse() result},
+            outputs 're_percentage' and 'probability_<target>_percent'
+        """
+        start_time = time.time()
+        re_percentage = self.evaluate()
+
+        indices = {'re_percentage': self.analyse(re_percentage)}
+        for target in DEFAULT_TARGETS:
+            # Sensitivity of P(target): the indices of the exceedance indicator
+            meets_target = (re_percentage >= target).astype(np.float64)
+            indices[f'probability_{target}_percent'] = self.analyse(meets_target)
+
+        execution_time = time.time() - start_time
+        logger.info(f"Sensitivity analysis: {6 * self.base_samples:,} evaluations in {execution_time:.1f}s")
+
+        return {
+            'method': 'sobol_saltelli',
+            'base_samples': self.base_samples,
+            'model_evaluations': (len(UNCERTAINTY_GROUPS) + 2) * self.base_samples,
+            'bootstrap': self.bootstrap,
+            'confidence': self.confidence,
+            'random_seed': str(self.seed),
+            'probability_profile': self.simulator.probability_profile,
+            'execution_time_seconds': round(execution_time, 2),
+            'indices': indices,
+        }
+
+    def store(self, simulation_record, results):
+        """
+        Save the results as the simulation's MonteCarloResult variance_contribution.
+
+        Raises:
+            MonteCarloResult.DoesNotExist if the simulation has no detailed results
+        """
+        from siren_web.models import MonteCarloResult
+
+        detailed = MonteCarloResult.objects.get(simulation=simulation_record)
+        detailed.variance_contribution = results
+        detailed.save(update_fields=['variance_contribution'])
+        return detailed
@@ -0,0 +1,162 @@
+# powerplot/services/tabular_export.py
+"""
+Streaming spreadsheet and CSV exports of chart data.
+
+Exports are described column-wise as ExportSheet(title, headers, columns),
+the same shape the chart endpoints already hold their series in. Column
+widths are computed from the columns up front (longest value + 2, capped at
+50 characters), so workbooks can be written with openpyxl's write-only mode:
+rows go straight to the sheet XML instead of a full in-memory cell model, and
+nothing has to walk the finished sheets to autosize them.
+
+Formats (?format= on the export views):
+    xlsx    every sheet, written to a temporary file and streamed back
+    csv     the first sheet, streamed as it is generated
+    csv.gz  as csv, gzip-compressed on the fly
+"""
+from collections import namedtuple
+import csv
+from itertools import zip_longest
+import io
+import logging
+import tempfile
+import zlib
+
+import openpyxl
+from django.http import FileResponse, StreamingHttpResponse
+from openpyxl.utils import get_column_letter
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('xlsx', 'csv', 'csv.gz')
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+MAX_COLUMN_WIDTH = 50
+
+# Rows per CSV chunk handed to the response
+CSV_CHUNK_ROWS = 2000
+
+# title: sheet name; headers: first row; columns: one sequence per column
+ExportSheet = namedtuple('ExportSheet', ['title', 'headers', 'columns'])
+
+
+def sheet_from_rows(title, rows):
+    """
+    ExportSheet from row-oriented data such as a metrics table.
+
+    The first row is used as the headers; short rows are padded with empty
+    cells.
+    """
+    rows = [list(row) for row in rows]
+    columns = [list(column) for column in zip_longest(*rows[1:], fillvalue=None)]
+    return ExportSheet(title, rows[0] if rows else [], columns)
+
+
+def sheet_rows(sheet, fillvalue=''):
+    """Generate the data rows of a sheet, padding shorter columns"""
+    return zip_longest(*sheet.columns, fillvalue=fillvalue)
+
+
+def _text_length(value):
+    return 0 if value is None else len(str(value))
+
+
+def column_widths(sheet, max_width=MAX_COLUMN_WIDTH):
+    """Display width of each column: longest header or value + 2, capped"""
+    count = max(len(sheet.headers), len(sheet.columns))
+    widths = []
+    for i in range(count):
+        header = sheet.headers[i] if i < len(sheet.headers) else None
+        column = sheet.columns[i] if i < len(sheet.columns) else ()
+        longest = max(map(_text_length, column), default=0)
+        widths.append(min(max(longest, _text_length(header)) + 2, max_width))
+    return widths
+
+
+def write_workbook(sheets, file_obj):
+    """
+    Write sheets to an xlsx file with openpyxl's write-only mode.
+
+    Args:
+        sheets: list of ExportSheet
+        file_obj: binary file object to save the workbook to
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet in sheets:
+        worksheet = workbook.create_sheet(sheet.title)
+        # Column dimensions must be set before the first row is written
+        for i, width in enumerate(column_widths(sheet), start=1):
+            worksheet.column_dimensions[get_column_letter(i)].width = width
+        worksheet.append(sheet.headers)
+        for row in sheet_rows(sheet):
+            worksheet.append(row)
+    workbook.save(file_obj)
+
+
+def _csv_chunks(sheet, chunk_rows=CSV_CHUNK_ROWS):
+    """Generate the CSV text of a sheet in chunks of chunk_rows rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(sheet.headers)
+    for i, row in enumerate(sheet_rows(sheet), start=1):
+        writer.writerow(row)
+        if i % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _gzip_chunks(chunks):
+    """gzip-compress a stream of byte chunks"""
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip header and trailer
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def xlsx_response(sheets, filename):
+    """FileResponse streaming a write-only workbook of all sheets"""
+    spool = tempfile.TemporaryFile()
+    write_workbook(sheets, spool)
+    spool.seek(0)
+    return FileResponse(
+        spool, as_attachment=True, filename=f'{filename}.xlsx',
+        content_type=XLSX_CONTENT_TYPE,
+    )
+
+
+def csv_response(sheet, filename, compress=False):
+    """StreamingHttpResponse of one sheet as CSV, optionally gzipped"""
+    chunks = (text.encode('utf-8') for text in _csv_chunks(sheet))
+    if compress:
+        response = StreamingHttpResponse(_gzip_chunks(chunks), content_type='application/gzip')
+        filename = f'{filename}.csv.gz'
+    else:
+        response = StreamingHttpResponse(chunks, content_type='text/csv')
+        filename = f'{filename}.csv'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def export_response(export_format, sheets, filename):
+    """
+    Streaming download of sheets in the requested format.
+
+    Args:
+        export_format: one of EXPORT_FORMATS; CSV formats export the first
+            sheet only
+        sheets: list of ExportSheet, the data sheet first
+        filename: download name without extension
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format: {export_format}")
+
+    logger.debug(f"Exporting {filename} as {export_format}")
+    if export_format == 'xlsx':
+        return xlsx_response(sheets, filename)
+    return csv_response(sheets[0], filename, compress=export_format == 'csv.gz')
@@ -10,14 +10,59 @@ for comparison and analysis.
 
 from datetime import datetime
 from typing import Optional
+import numpy as np
 from django.db.models import QuerySet
 
-from .generation_utils import get_hour_of_year, get_hour_of_day, PEAK_HOUR_PRESETS
+from .generation_utils import get_hour_of_day, get_hours_of_year, PEAK_HOUR_PRESETS
+from .scada_period_query import ScadaPeriodQuery
+from .scada_storage import ScadaArchive
 
 
 class TimeSeriesAligner:
     """Aligns SCADA (5-min datetime) with SupplyFactors (year+hour) data."""
 
+    @staticmethod
+    def _scada_hour_arrays(scada_queryset: QuerySet):
+        """Read a FacilityScada queryset as (hour of year, quantity) arrays.
+
+        Only the two columns are fetched, rather than model instances.
+        """
+        rows = scada_queryset.order_by().values_list('dispatch_interval', 'quantity')
+        timestamps = []
+        quantities = []
+        for dispatch_interval, quantity in rows.iterator(chunk_size=10000):
+            timestamps.append(int(dispatch_interval.timestamp()))
+            quantities.append(float(quantity) if quantity else 0.0)
+
+        return (
+            get_hours_of_year(np.array(timestamps, dtype=np.int64)),
+            np.array(quantities, dtype=np.float64),
+        )
+
+    @staticmethod
+    def _hour_range_mask(hours: np.ndarray, start_hour: Optional[int] = None,
+                         end_hour: Optional[int] = None) -> np.ndarray:
+        """Boolean mask of hours within the optional 1-based, inclusive range."""
+        mask = np.ones(len(hours), dtype=bool)
+        if start_hour is not None:
+            mask &= hours >= start_hour
+        if end_hour is not None:
+            mask &= hours <= end_hour
+        return mask
+
+    @staticmethod
+    def _bin_by_hour(hours: np.ndarray, values: np.ndarray):
+        """Sum values into per-hour bins.
+
+        Returns:
+            Tuple of (hours present, sorted; their totals)
+        """
+        if not len(hours):
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+        totals = np.bincount(hours, weights=values)
+        present = np.bincount(hours) > 0
+        return np.flatnonzero(present), totals[present]
+
     def convert_scada_to_hourly(self, scada_queryset: QuerySet, year: int,
                                  start_hour: Optional[int] = None,
                                  end_hour: Optional[int] = None) -> dict:
@@ -37,31 +82,16 @@ class TimeSeriesAligner:
         Returns:
             Dict with 'hours' and 'quantity' lists
         """
-        hour_totals = {}
-
-        for record in scada_queryset:
-            hour = get_hour_of_year(record.dispatch_interval)
-
-            # Apply hour range filter if specified
-            if start_hour is not None and hour < start_hour:
-                continue
-            if end_hour is not None and hour > end_hour:
-                continue
-
-            if hour not in hour_totals:
-                hour_totals[hour] = 0
-
-            quantity = float(record.quantity) if record.quantity else 0
-            hour_totals[hour] += quantity
+        hours, quantities = self._scada_hour_arrays(scada_queryset)
+        mask = self._hour_range_mask(hours, start_hour, end_hour)
 
         # Sum of half-hourly MWh = hourly MWh = average MW for the hour
-        hours = sorted(hour_totals.keys())
-        quantities = [hour_totals[h] for h in hours]
+        hours, totals = self._bin_by_hour(hours[mask], quantities[mask])
 
         return {
-            'hours': hours,
-            'quantity': quantities,
-            'record_count': sum(1 for _ in hours),
+            'hours': hours.tolist(),
+            'quantity': totals.tolist(),
+            'record_count': len(hours),
             'hour_count': len(hours)
         }
 
@@ -71,8 +101,8 @@ class TimeSeriesAligner:
         """Convert SCADA half-hourly data to hourly, summing across multiple facilities.
 
         Similar to convert_scada_to_hourly but sums values across facilities.
-        For each facility, the two half-hourly MWh values per hour are summed to
-        get hourly MWh, then summed across facilities.
+        Summing every half-hourly MWh value in an hour gives the same result as
+        summing each facility's hourly MWh and then summing across facilities.
 
         Args:
             scada_queryset: FacilityScada queryset (can span multiple facilities)
@@ -83,43 +113,61 @@ class TimeSeriesAligner:
         Returns:
             Dict with 'hours' and 'quantity' lists (summed across facilities)
         """
-        # Group by (facility, hour) and sum the half-hourly intervals
-        facility_hour_data = {}
-
-        for record in scada_queryset:
-            hour = get_hour_of_year(record.dispatch_interval)
+        hours, quantities = self._scada_hour_arrays(scada_queryset)
+        mask = self._hour_range_mask(hours, start_hour, end_hour)
+        hours, totals = self._bin_by_hour(hours[mask], quantities[mask])
 
-            if start_hour is not None and hour < start_hour:
-                continue
-            if end_hour is not None and hour > end_hour:
-                continue
-
-            facility_id = record.facility_id
-            key = (facility_id, hour)
+        return {
+            'hours': hours.tolist(),
+            'quantity': totals.tolist(),
+            'hour_count': len(hours)
+        }
 
-            if key not in facility_hour_data:
-                facility_hour_data[key] = {'total': 0}
+    def get_scada_hourly(self, scada_queryset: QuerySet, facility_list, year: int,
+                         start_hour: Optional[int] = None,
+                         end_hour: Optional[int] = None) -> dict:
+        """Get hourly SCADA totals summed across facilities.
 
-            quantity = float(record.quantity) if record.quantity else 0
-            facility_hour_data[key]['total'] += quantity
+        The hourly sums are computed in the database by ScadaPeriodQuery
+        (from the hourly rollup when it is populated). If neither the database
+        nor the archive holds data, the half-hourly queryset is converted instead.
 
-        # Sum each facility's hourly total across facilities by hour
-        hour_totals = {}
-        for (facility_id, hour), data in facility_hour_data.items():
-            hourly_quantity = data['total']  # Sum of half-hourly MWh = hourly MWh
-            if hour not in hour_totals:
-                hour_totals[hour] = 0
-            hour_totals[hour] += hourly_quantity
+        Args:
+            scada_queryset: FacilityScada queryset for the same facilities and year
+            facility_list: Facilities (instances, ids or queryset)
+            year: Year being processed
+            start_hour: Optional start hour filter
+            end_hour: Optional end hour filter
 
-        hours = sorted(hour_totals.keys())
-        quantities = [hour_totals[h] for h in hours]
+        Returns:
+            Dict with 'hours' and 'quantity' lists (summed across facilities)
+        """
+        series = ScadaPeriodQuery().get_group_series(
+            facility_list, year, 'hour', start_hour, end_hour
+        )
+        if series is None:
+            return self.convert_scada_to_hourly_aggregated(
+                scada_queryset, year, start_hour, end_hour
+            )
 
         return {
-            'hours': hours,
-            'quantity': quantities,
-            'hour_count': len(hours)
+            'hours': series['periods'].tolist(),
+            'quantity': series['quantity'].tolist(),
+            'hour_count': len(series['periods'])
         }
 
+    @staticmethod
+    def _supply_arrays(supply_queryset: QuerySet, order_by_hour: bool = False):
+        """Read a supplyfactors queryset as (hour, quantum kW) arrays."""
+        rows = supply_queryset.order_by('hour') if order_by_hour else supply_queryset.order_by()
+        hours = []
+        quantum = []
+        for hour, quantum_kw in rows.values_list('hour', 'quantum').iterator(chunk_size=10000):
+            hours.append(hour)
+            quantum.append(quantum_kw if quantum_kw is not None else 0)
+
+        return np.array(hours, dtype=np.int64), np.array(quantum, dtype=np.float64)
+
     def get_supply_data_as_dict(self, supply_queryset: QuerySet,
                                  start_hour: Optional[int] = None,
                                  end_hour: Optional[int] = None) -> dict:
@@ -133,26 +181,14 @@ class TimeSeriesAligner:
         Returns:
             Dict with 'hours' and 'quantum' lists (quantum converted from kW to MW)
         """
-        hours = []
-        quantum_values = []
-
-        for record in supply_queryset.order_by('hour'):
-            hour = record.hour
-
-            if start_hour is not None and hour < start_hour:
-                continue
-            if end_hour is not None and hour > end_hour:
-                continue
-
-            hours.append(hour)
-            # Convert quantum from kW to MW to match SCADA units
-            quantum_kw = record.quantum if record.quantum is not None else 0
-            quantum_values.append(quantum_kw / 1000)
+        hours, quantum = self._supply_arrays(supply_queryset, order_by_hour=True)
+        mask = self._hour_range_mask(hours, start_hour, end_hour)
 
+        # Convert quantum from kW to MW to match SCADA units
         return {
-            'hours': hours,
-            'quantum': quantum_values,
-            'hour_count': len(hours)
+            'hours': hours[mask].tolist(),
+            'quantum': (quantum[mask] / 1000).tolist(),
+            'hour_count': int(mask.sum())
         }
 
     def get_supply_data_aggregated(self, supply_queryset: QuerySet,
@@ -168,27 +204,14 @@ class TimeSeriesAligner:
         Returns:
             Dict with 'hours' and 'quantum' lists (summed across facilities, converted from kW to MW)
         """
-        hour_totals = {}
+        hours, quantum = self._supply_arrays(supply_queryset)
+        mask = self._hour_range_mask(hours, start_hour, end_hour)
+        hours, totals = self._bin_by_hour(hours[mask], quantum[mask])
 
-        for record in supply_queryset:
-            hour = record.hour
-
-            if start_hour is not None and hour < start_hour:
-                continue
-            if end_hour is not None and hour > end_hour:
-                continue
-
-            if hour not in hour_totals:
-                hour_totals[hour] = 0
-            hour_totals[hour] += record.quantum if record.quantum is not None else 0
-
-        hours = sorted(hour_totals.keys())
         # Convert quantum from kW to MW to match SCADA units
-        quantum_values = [hour_totals[h] / 1000 for h in hours]
-
         return {
-            'hours': hours,
-            'quantum': quantum_values,
+            'hours': hours.tolist(),
+            'quantum': (totals / 1000).tolist(),
             'hour_count': len(hours)
         }
 
@@ -204,28 +227,39 @@ class TimeSeriesAligner:
         Returns:
             Dict with aligned data, or None if no overlap
         """
-        scada_hours = set(scada_data.get('hours', []))
-        supply_hours = set(supply_data.get('hours', []))
-        common_hours = sorted(scada_hours & supply_hours)
+        scada_hours = np.asarray(scada_data.get('hours', []), dtype=np.int64)
+        supply_hours = np.asarray(supply_data.get('hours', []), dtype=np.int64)
+        if not len(scada_hours) or not len(supply_hours):
+            return None
+
+        # Presence masks and value lookups indexed by hour of year
+        size = int(max(scada_hours.max(), supply_hours.max())) + 1
+        in_scada = np.zeros(size, dtype=bool)
+        in_supply = np.zeros(size, dtype=bool)
+        in_scada[scada_hours] = True
+        in_supply[supply_hours] = True
 
-        if not common_hours:
+        common = in_scada & in_supply
+        common_hours = np.flatnonzero(common)
+        if not len(common_hours):
             return None
 
-        # Create lookup dicts
-        scada_dict = dict(zip(scada_data['hours'], scada_data['quantity']))
-        supply_dict = dict(zip(supply_data['hours'], supply_data['quantum']))
+        scada_values = np.zeros(size)
+        supply_values = np.zeros(size)
+        scada_values[scada_hours] = scada_data['quantity']
+        supply_values[supply_hours] = supply_data['quantum']
 
         # Calculate overlap statistics
-        total_hours = len(scada_hours | supply_hours)
+        total_hours = int((in_scada | in_supply).sum())
         overlap_pct = (len(common_hours) / total_hours * 100) if total_hours > 0 else 0
 
-        scada_only = len(scada_hours - supply_hours)
-        supply_only = len(supply_hours - scada_hours)
+        scada_only = int((in_scada & ~in_supply).sum())
+        supply_only = int((in_supply & ~in_scada).sum())
 
         return {
-            'hours': common_hours,
-            'scada_values': [scada_dict[h] for h in common_hours],
-            'supply_values': [supply_dict[h] for h in common_hours],
+            'hours': common_hours.tolist(),
+            'scada_values': scada_values[common].tolist(),
+            'supply_values': supply_values[common].tolist(),
             'overlap_percentage': round(overlap_pct, 1),
             'common_hours': len(common_hours),
             'scada_only_hours': scada_only,
@@ -263,21 +297,16 @@ class TimeSeriesAligner:
         if peak_start > peak_end:
             # Off-peak spans midnight
             def is_in_range(hour_of_day):
-                return hour_of_day >= peak_start or hour_of_day < peak_end
+                return (hour_of_day >= peak_start) | (hour_of_day < peak_end)
         else:
             def is_in_range(hour_of_day):
-                return peak_start <= hour_of_day < peak_end
+                return (hour_of_day >= peak_start) & (hour_of_day < peak_end)
 
-        filtered_hours = []
-        filtered_scada = []
-        filtered_supply = []
-
-        for i, hour in enumerate(aligned_data['hours']):
-            hour_of_day = get_hour_of_day(hour)
-            if is_in_range(hour_of_day):
-                filtered_hours.append(hour)
-                filtered_scada.append(aligned_data['scada_values'][i])
-                filtered_supply.append(aligned_data['supply_values'][i])
+        hours = np.asarray(aligned_data['hours'], dtype=np.int64)
+        in_range = is_in_range(get_hour_of_day(hours))
+        filtered_hours = hours[in_range].tolist()
+        filtered_scada = np.asarray(aligned_data['scada_values'])[in_range].tolist()
+        filtered_supply = np.asarray(aligned_data['supply_values'])[in_range].tolist()
 
         if not filtered_hours:
             return None
@@ -305,6 +334,8 @@ class TimeSeriesAligner:
     def get_comparable_years(self, scada_model, supply_model) -> list[int]:
         """Get years that have both SCADA and SupplyFactors data.
 
+        SCADA years include those held in the archive.
+
         Args:
             scada_model: FacilityScada model class
             supply_model: supplyfactors model class
@@ -316,6 +347,7 @@ class TimeSeriesAligner:
             scada_model.objects.dates('dispatch_interval', 'year', order='ASC')
             .values_list('dispatch_interval__year', flat=True)
         )
+        scada_years.update(ScadaArchive().archived_years())
         supply_years = set(
             supply_model.objects.values_list('year', flat=True).distinct()
         )
@@ -326,7 +358,8 @@ class TimeSeriesAligner:
         """Get facilities that have both SCADA and SupplyFactors data.
 
         SupplyFactors only has data for renewable, non-dispatchable facilities,
-        so this also filters to those characteristics.
+        so this also filters to those characteristics. Archived SCADA months
+        are found through the monthly rollup, which keeps them.
 
         Args:
             facilities_model: facilities model class
@@ -352,6 +385,14 @@ class TimeSeriesAligner:
             base_qs.filter(**scada_filter).values_list('idfacilities', flat=True).distinct()
         )
 
+        monthly_filter = {'scada_monthly__isnull': False}
+        if year:
+            monthly_filter['scada_monthly__year'] = year
+
+        facilities_with_scada.update(
+            base_qs.filter(**monthly_filter).values_list('idfacilities', flat=True).distinct()
+        )
+
         # Get facility IDs that have SupplyFactors data
         supply_filter = {}
         if year:
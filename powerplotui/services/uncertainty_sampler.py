@@ -5,14 +5,43 @@ This module provides utility classes for sampling from various probability distr
 used in the Monte Carlo simulation for renewable energy target analysis.
 
 All methods are optimized for vectorized NumPy operations to handle 100,000+ iterations efficiently.
+
+Each sampling method takes an optional ``rng`` (numpy.random.Generator) so a
+simulation can draw from its own reproducible streams; without one the global
+NumPy random state is used.
+
+Variance reduction: sample_uniform_block() draws the uniforms for a whole
+batch with scrambled Sobol' points, a Latin hypercube or antithetic pairs,
+and each sampling method accepts those ``uniforms`` in place of its own
+draws, transforming them by the inverse CDF of its distribution.
+
+Samples are float64 by default; pass dtype=np.float32 to halve the memory of
+the (iterations x facilities) matrices.
 """
 
 import numpy as np
 import logging
+import warnings
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 logger = logging.getLogger(__name__)
 
 
+def _random(rng, size, dtype):
+    """Uniform [0, 1) draws; the global NumPy random state only draws float64"""
+    if rng is None:
+        return np.random.random(size).astype(dtype, copy=False)
+    return rng.random(size, dtype=dtype)
+
+
+def _standard_normal(rng, size, dtype):
+    """Standard normal draws; the global NumPy random state only draws float64"""
+    if rng is None:
+        return np.random.standard_normal(size).astype(dtype, copy=False)
+    return rng.standard_normal(size, dtype=dtype)
+
+
 class UncertaintySampler:
     """
     Utility class for sampling from various probability distributions.
@@ -46,8 +75,55 @@ class UncertaintySampler:
         },
     }
 
+    # Ways of drawing the uniforms behind every distribution:
+    # 'random' - independent pseudo-random draws
+    # 'sobol' - scrambled Sobol' low-discrepancy points (best with 2^k iterations)
+    # 'lhs' - Latin hypercube: one draw in each of n equal strata per dimension
+    # 'antithetic' - pairs u and 1 - u
+    SAMPLING_METHODS = ('random', 'sobol', 'lhs', 'antithetic')
+
     @staticmethod
-    def sample_commissioning(status_array, profile='optimistic', n_iterations=100000):
+    def sample_uniform_block(n_iterations, n_dims, method='random', rng=None):
+        """
+        Uniform (0, 1) draws for a batch, one column per uncertain input.
+
+        Sobol' and Latin hypercube points are stratified across all columns
+        jointly, so every input is covered evenly within each batch. Each
+        call is independently scrambled, so batches remain independent
+        replicates and the usual error estimates still apply across them.
+
+        Args:
+            n_iterations: int, number of Monte Carlo iterations (rows)
+            n_dims: int, number of uncertain inputs (columns)
+            method: str, one of SAMPLING_METHODS
+            rng: numpy.random.Generator (default: global NumPy random state)
+
+        Returns:
+            2D numpy array of shape (n_iterations, n_dims)
+        """
+        if method not in UncertaintySampler.SAMPLING_METHODS:
+            raise ValueError(f"Invalid sampling method '{method}'. Choose from {list(UncertaintySampler.SAMPLING_METHODS)}")
+
+        if method == 'sobol':
+            # scipy warns when n is not a power of 2; the points are still
+            # valid, just less evenly balanced
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                return qmc.Sobol(d=n_dims, scramble=True, seed=rng).random(n_iterations)
+
+        if method == 'lhs':
+            return qmc.LatinHypercube(d=n_dims, seed=rng).random(n_iterations)
+
+        rng = np.random if rng is None else rng
+        if method == 'antithetic':
+            half = rng.random(((n_iterations + 1) // 2, n_dims))
+            return np.concatenate([half, 1.0 - half])[:n_iterations]
+
+        return rng.random((n_iterations, n_dims))
+
+    @staticmethod
+    def sample_commissioning(status_array, profile='optimistic', n_iterations=100000, rng=None,
+                             uniforms=None, dtype=np.float64):
         """
         Vectorized commissioning probability sampling using Bernoulli distribution.
 
@@ -58,6 +134,10 @@ class UncertaintySampler:
             status_array: 1D numpy array of status strings (e.g., ['planned', 'probable', ...])
             profile: str, one of 'optimistic', 'balanced', 'conservative'
             n_iterations: int, number of Monte Carlo iterations
+            rng: numpy.random.Generator (default: global NumPy random state)
+            uniforms: optional (n_iterations, n_facilities) uniforms to use
+                instead of drawing (see sample_uniform_block)
+            dtype: float dtype of the uniform draws compared with the probabilities
 
         Returns:
             2D numpy array of shape (n_iterations, n_facilities) with boolean values
@@ -74,11 +154,14 @@ class UncertaintySampler:
         prob_array = np.array([
             probabilities.get(status.lower(), 0.5)  # Default to 50% if status unknown
             for status in status_array
-        ])
+        ], dtype=dtype)
 
         # Generate random numbers for all facilities and iterations
         # Shape: (n_iterations, n_facilities)
-        random_matrix = np.random.random((n_iterations, n_facilities))
+        if uniforms is not None:
+            random_matrix = uniforms
+        else:
+            random_matrix = _random(rng, (n_iterations, n_facilities), dtype)
 
         # Commission if random < probability (broadcast comparison)
         commissioned = random_matrix < prob_array[np.newaxis, :]
@@ -89,7 +172,8 @@ class UncertaintySampler:
         return commissioned
 
     @staticmethod
-    def sample_uniform_delay(n_facilities, n_iterations=100000, min_months=0, max_months=24):
+    def sample_uniform_delay(n_facilities, n_iterations=100000, min_months=0, max_months=24, rng=None,
+                             uniforms=None, dtype=np.float64):
         """
         Sample commissioning delays uniformly between min and max months.
 
@@ -101,22 +185,25 @@ class UncertaintySampler:
             n_iterations: int, number of Monte Carlo iterations
             min_months: int, minimum delay in months (default 0)
             max_months: int, maximum delay in months (default 24)
+            rng: numpy.random.Generator (default: global NumPy random state)
+            uniforms: optional (n_iterations, n_facilities) uniforms to transform
+            dtype: float dtype of the delays
 
         Returns:
             2D numpy array of shape (n_iterations, n_facilities) with delay values in months
         """
-        delays = np.random.uniform(
-            low=min_months,
-            high=max_months,
-            size=(n_iterations, n_facilities)
-        )
+        if uniforms is None:
+            uniforms = _random(rng, (n_iterations, n_facilities), dtype)
+        delays = uniforms * (max_months - min_months)
+        delays += min_months
 
         logger.debug(f"Sampled delays for {n_facilities} facilities: uniform({min_months}, {max_months}) months")
 
         return delays
 
     @staticmethod
-    def sample_normal_cf(mean_array, std_array, n_iterations=100000, min_cf=0.0, max_cf=1.0):
+    def sample_normal_cf(mean_array, std_array, n_iterations=100000, min_cf=0.0, max_cf=1.0, rng=None,
+                         uniforms=None, dtype=np.float64):
         """
         Sample capacity factors from normal distributions (clipped to realistic bounds).
 
@@ -129,6 +216,10 @@ class UncertaintySampler:
             n_iterations: int, number of Monte Carlo iterations
             min_cf: float, minimum allowed capacity factor (default 0.0)
             max_cf: float, maximum allowed capacity factor (default 1.0)
+            rng: numpy.random.Generator (default: global NumPy random state)
+            uniforms: optional (n_iterations, n_facilities) uniforms, transformed
+                by the inverse normal CDF
+            dtype: float dtype of the capacity factors
 
         Returns:
             2D numpy array of shape (n_iterations, n_facilities) with CF values
@@ -137,14 +228,17 @@ class UncertaintySampler:
 
         # Sample from normal distribution for all iterations and facilities
         # Shape: (n_iterations, n_facilities)
-        cf_samples = np.random.normal(
-            loc=mean_array[np.newaxis, :],  # Broadcast mean to all iterations
-            scale=std_array[np.newaxis, :],  # Broadcast std to all iterations
-            size=(n_iterations, n_facilities)
-        )
+        if uniforms is not None:
+            cf_samples = ndtri(uniforms).astype(dtype, copy=False)
+        else:
+            cf_samples = _standard_normal(rng, (n_iterations, n_facilities), dtype)
+
+        # Scale and shift in place, broadcasting each facility's std and mean
+        cf_samples *= std_array[np.newaxis, :]
+        cf_samples += mean_array[np.newaxis, :]
 
         # Clip to realistic bounds (CFs must be between 0 and 1)
-        cf_samples = np.clip(cf_samples, min_cf, max_cf)
+        np.clip(cf_samples, min_cf, max_cf, out=cf_samples)
 
         logger.debug(f"Sampled capacity factors for {n_facilities} facilities")
         logger.debug(f"Mean CF range: {mean_array.min():.3f} - {mean_array.max():.3f}")
@@ -153,7 +247,8 @@ class UncertaintySampler:
         return cf_samples
 
     @staticmethod
-    def sample_demand_uncertainty(base_demand, uncertainty_pct=0.20, n_iterations=100000):
+    def sample_demand_uncertainty(base_demand, uncertainty_pct=0.20, n_iterations=100000, rng=None,
+                                  uniforms=None):
         """
         Sample demand with uniform ±X% uncertainty around base projection.
 
@@ -166,6 +261,8 @@ class UncertaintySampler:
             base_demand: float, base demand projection in GWh
             uncertainty_pct: float, uncertainty as decimal (0.20 = ±20%)
             n_iterations: int, number of Monte Carlo iterations
+            rng: numpy.random.Generator (default: global NumPy random state)
+            uniforms: optional (n_iterations,) uniforms to transform
 
         Returns:
             1D numpy array of shape (n_iterations,) with demand values in GWh
@@ -173,11 +270,15 @@ class UncertaintySampler:
         lower_bound = base_demand * (1 - uncertainty_pct)
         upper_bound = base_demand * (1 + uncertainty_pct)
 
-        demand_samples = np.random.uniform(
-            low=lower_bound,
-            high=upper_bound,
-            size=n_iterations
-        )
+        if uniforms is not None:
+            demand_samples = lower_bound + uniforms * (upper_bound - lower_bound)
+        else:
+            rng = np.random if rng is None else rng
+            demand_samples = rng.uniform(
+                low=lower_bound,
+                high=upper_bound,
+                size=n_iterations
+            )
 
         logger.debug(f"Sampled demand with ±{uncertainty_pct*100:.0f}% uncertainty")
         logger.debug(f"Base demand: {base_demand:.1f} GWh")
@@ -185,6 +286,27 @@ class UncertaintySampler:
 
         return demand_samples
 
+    @staticmethod
+    def sample_weather_year(n_years, n_iterations=100000, rng=None, uniforms=None):
+        """
+        Sample a weather year per iteration, uniformly from the years available.
+
+        Used by the chronological mode in place of capacity factor sampling:
+        each weather year brings its own hourly generation and load profiles.
+
+        Args:
+            n_years: int, number of weather years available
+            n_iterations: int, number of Monte Carlo iterations
+            rng: numpy.random.Generator (default: global NumPy random state)
+            uniforms: optional (n_iterations,) uniforms to transform
+
+        Returns:
+            1D int numpy array of shape (n_iterations,) with weather year indices
+        """
+        if uniforms is None:
+            uniforms = _random(rng, n_iterations, np.float64)
+        return np.minimum((uniforms * n_years).astype(np.int64), n_years - 1)
+
     @staticmethod
     def get_probability_for_status(status, profile='optimistic'):
         """
@@ -0,0 +1,80 @@
+/**
+ * Compact chart payloads (powerplotui/services/chart_payload.py)
+ *
+ * Chart endpoints called with ?format=f32 send numeric series as
+ * {dtype: 'f32' | 'i32', b64: '...'} objects holding base64-encoded
+ * little-endian typed array bytes. decodeChartPayload() turns them back
+ * into plain number arrays (NaN -> null) so chart code is unchanged.
+ */
+(function(global) {
+    const LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+    function base64ToBuffer(b64) {
+        const binary = atob(b64);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return bytes.buffer;
+    }
+
+    function decodeTypedArray(packed) {
+        const buffer = base64ToBuffer(packed.b64);
+        const isFloat = packed.dtype === 'f32';
+        const length = buffer.byteLength / 4;
+        const out = new Array(length);
+
+        if (LITTLE_ENDIAN) {
+            const view = isFloat ? new Float32Array(buffer) : new Int32Array(buffer);
+            for (let i = 0; i < length; i++) {
+                out[i] = view[i];
+            }
+        } else {
+            const view = new DataView(buffer);
+            for (let i = 0; i < length; i++) {
+                out[i] = isFloat ? view.getFloat32(i * 4, true) : view.getInt32(i * 4, true);
+            }
+        }
+
+        if (isFloat) {
+            for (let i = 0; i < length; i++) {
+                // float32 -> shortest decimal that round-trips, NaN -> null (gap)
+                out[i] = Number.isNaN(out[i]) ? null : parseFloat(out[i].toPrecision(7));
+            }
+        }
+        return out;
+    }
+
+    function isPacked(value) {
+        return value !== null && typeof value === 'object' && !Array.isArray(value) &&
+            (value.dtype === 'f32' || value.dtype === 'i32') && typeof value.b64 === 'string';
+    }
+
+    function decodeChartPayload(value) {
+        if (Array.isArray(value)) {
+            return value.map(decodeChartPayload);
+        }
+        if (value !== null && typeof value === 'object') {
+            if (isPacked(value)) {
+                return decodeTypedArray(value);
+            }
+            const out = {};
+            Object.keys(value).forEach(key => {
+                out[key] = decodeChartPayload(value[key]);
+            });
+            return out;
+        }
+        return value;
+    }
+
+    // fetch() a chart endpoint in the compact format and return the decoded JSON
+    function fetchChartData(url, options) {
+        const separator = url.includes('?') ? '&' : '?';
+        return fetch(url + separator + 'format=f32', options)
+            .then(response => response.json())
+            .then(decodeChartPayload);
+    }
+
+    global.decodeChartPayload = decodeChartPayload;
+    global.fetchChartData = fetchChartData;
+})(window);
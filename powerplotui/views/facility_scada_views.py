@@ -1,35 +1,36 @@
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse
 from siren_web.models import facilities, FacilityScada, Technologies
 from django.db.models import Min, Max
 from datetime import datetime, timedelta
-import openpyxl
-from openpyxl.utils import get_column_letter
 
+from ..services.chart_payload import chart_response, chart_view
+from ..services.data_versions import scada_data_version
+from ..services.response_cache import versioned_view
 from ..services.generation_utils import (
-    get_hour_of_year,
-    get_hour_range_from_months,
-    get_week_from_hour,
-    get_month_from_hour,
     calculate_correlation_metrics,
     get_x_label
 )
+from ..services.scada_period_query import AGGREGATIONS, ScadaPeriodQuery
+from ..services.scada_storage import ScadaArchive
+from ..services.tabular_export import EXPORT_FORMATS, ExportSheet, export_response
 
 
-def _consolidate_to_hourly(hour_data):
-    """Sum half-hourly entries into hourly totals.
+def _get_period_series(facility_list, year, aggregation, start_hour=None, end_hour=None):
+    """SCADA series for a facility group, aggregated in the database.
 
-    SCADA data is stored at half-hourly intervals. Multiple entries may map
-    to the same hour-of-year. This function sums them so that each hour has
-    one entry with the total MWh (= average MW for the hour).
+    Returns:
+        Dict with 'periods' and 'quantity' lists, or None if there is no data
     """
-    hourly = {}
-    for entry in hour_data:
-        h = entry['hour']
-        if h not in hourly:
-            hourly[h] = 0
-        hourly[h] += entry['quantity']
-    return [{'hour': h, 'quantity': hourly[h]} for h in sorted(hourly.keys())]
+    series = ScadaPeriodQuery().get_group_series(
+        facility_list, year, aggregation, start_hour, end_hour
+    )
+    if series is None:
+        return None
+    return {
+        'periods': series['periods'].tolist(),
+        'quantity': series['quantity'].tolist(),
+    }
 
 
 def scada_plot_view(request):
@@ -40,9 +41,9 @@ def scada_plot_view(request):
     # Get all technologies
     all_technologies = Technologies.objects.all().order_by('technology_name')
     
-    # Get available years from FacilityScada dispatch_interval
+    # Get available years from FacilityScada dispatch_interval and the archive
     years_queryset = FacilityScada.objects.dates('dispatch_interval', 'year', order='ASC')
-    years = [dt.year for dt in years_queryset]
+    years = sorted({dt.year for dt in years_queryset} | set(ScadaArchive().archived_years()))
     
     context = {
         'facilities': all_facilities,
@@ -52,6 +53,8 @@ def scada_plot_view(request):
     return render(request, 'facility_scada.html', context)
 
 
+@chart_view
+@versioned_view(scada_data_version)
 def get_scada_data(request):
     """API endpoint to get SCADA data for multiple facilities"""
     facility_ids = request.GET.getlist('facility_id[]')  # Changed to support multiple
@@ -89,54 +92,27 @@ def get_scada_data(request):
         start_hour = None
         end_hour = None
     
-    # Get data for each facility
+    if aggregation not in AGGREGATIONS:
+        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
+    x_label = get_x_label(aggregation)
+
+    # One grouped query for all selected facilities
+    series = ScadaPeriodQuery().get_series(
+        selected_facilities, year, aggregation, start_hour, end_hour, group_by='facility'
+    )
+
     facility_data = []
     for facility in selected_facilities:
-        scada_queryset = FacilityScada.objects.filter(
-            facility=facility,
-            dispatch_interval__year=year
-        ).order_by('dispatch_interval')
-        
-        if not scada_queryset.exists():
-            continue
-        
-        # Convert to hour-based data
-        hour_data = []
-        for record in scada_queryset:
-            hour = get_hour_of_year(record.dispatch_interval)
-            if start_hour and end_hour:
-                if hour < start_hour or hour > end_hour:
-                    continue
-            hour_data.append({
-                'hour': hour,
-                'quantity': float(record.quantity) if record.quantity else 0
-            })
-        
-        if not hour_data:
+        data = series.get(facility.idfacilities)
+        if data is None:
             continue
 
-        # Consolidate half-hourly entries to hourly totals
-        hour_data = _consolidate_to_hourly(hour_data)
-
-        # Aggregate data based on selected time period
-        if aggregation == 'hour':
-            data = aggregate_scada_by_hour(hour_data)
-            x_label = 'Hour of Year'
-        elif aggregation == 'week':
-            data = aggregate_scada_by_week(hour_data)
-            x_label = 'Week of Year'
-        elif aggregation == 'month':
-            data = aggregate_scada_by_month(hour_data)
-            x_label = 'Month of Year'
-        else:
-            return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
-        
         facility_data.append({
             'facility_name': facility.facility_name,
             'facility_code': facility.facility_code,
             'technology': facility.idtechnologies.technology_name,
-            'periods': data['periods'],
-            'quantity': data['quantity']
+            'periods': data['periods'].tolist(),
+            'quantity': data['quantity'].tolist()
         })
     
     if not facility_data:
@@ -144,7 +120,7 @@ def get_scada_data(request):
             'error': f'No SCADA data found for selected facilities in {year}'
         }, status=404)
     
-    return JsonResponse({
+    return chart_response(request, {
         'facilities': facility_data,
         'year': year,
         'aggregation': aggregation,
@@ -156,6 +132,8 @@ def get_scada_data(request):
     })
 
 
+@chart_view
+@versioned_view(scada_data_version)
 def get_scada_comparison_data(request):
     """API endpoint to compare SCADA data between two groups of facilities"""
     facility1_ids = request.GET.getlist('facility1_id[]')  # Changed to support multiple
@@ -204,36 +182,19 @@ def get_scada_comparison_data(request):
         start_hour_int = None
         end_hour_int = None
     
+    if aggregation not in AGGREGATIONS:
+        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
+    x_label = get_x_label(aggregation)
+
     # Get aggregated data for both facility groups
     def get_facility_group_scada_data(facility_list, year, start_hour, end_hour):
-        scada_queryset = FacilityScada.objects.filter(
-            facility__in=facility_list,
-            dispatch_interval__year=year
-        ).order_by('dispatch_interval')
+        data = _get_period_series(facility_list, year, aggregation, start_hour, end_hour)
         
-        if not scada_queryset.exists():
+        if data is None:
             return None
         
-        # Aggregate by hour first
-        hour_aggregated = {}
-        for record in scada_queryset:
-            hour = get_hour_of_year(record.dispatch_interval)
-            if start_hour and end_hour:
-                if hour < start_hour or hour > end_hour:
-                    continue
-            if hour not in hour_aggregated:
-                hour_aggregated[hour] = 0
-            hour_aggregated[hour] += float(record.quantity) if record.quantity else 0
-        
-        if not hour_aggregated:
-            return None
-        
-        hours = sorted(hour_aggregated.keys())
-        quantity_by_hour = [hour_aggregated[h] for h in hours]
-        
         return {
-            'hours': hours,
-            'quantity_by_hour': quantity_by_hour,
+            'data': data,
             'facility_count': facility_list.count(),
             'facilities': facility_list
         }
@@ -253,27 +214,8 @@ def get_scada_comparison_data(request):
             'error': f'No SCADA data found for {facility2_names} in {year}'
         }, status=404)
     
-    # Create hour data structures for aggregation
-    hour_data1 = [{'hour': h, 'quantity': q} 
-                  for h, q in zip(result1['hours'], result1['quantity_by_hour'])]
-    hour_data2 = [{'hour': h, 'quantity': q} 
-                  for h, q in zip(result2['hours'], result2['quantity_by_hour'])]
-    
-    # Aggregate based on time period
-    if aggregation == 'hour':
-        data1 = {'periods': result1['hours'], 'quantity': result1['quantity_by_hour']}
-        data2 = {'periods': result2['hours'], 'quantity': result2['quantity_by_hour']}
-        x_label = 'Hour of Year'
-    elif aggregation == 'week':
-        data1 = aggregate_scada_by_week(hour_data1)
-        data2 = aggregate_scada_by_week(hour_data2)
-        x_label = 'Week of Year'
-    elif aggregation == 'month':
-        data1 = aggregate_scada_by_month(hour_data1)
-        data2 = aggregate_scada_by_month(hour_data2)
-        x_label = 'Month of Year'
-    else:
-        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
+    data1 = result1['data']
+    data2 = result2['data']
     
     # Calculate correlation metrics
     correlation_metrics = calculate_correlation_metrics(data1['quantity'], data2['quantity'])
@@ -300,7 +242,7 @@ def get_scada_comparison_data(request):
             'facility_count': count
         })
     
-    return JsonResponse({
+    return chart_response(request, {
         'facility_group1': {
             'names': facility1_names,
             'facility_count': result1['facility_count'],
@@ -322,6 +264,8 @@ def get_scada_comparison_data(request):
     })
 
 
+@chart_view
+@versioned_view(scada_data_version)
 def get_scada_technology_data(request):
     """API endpoint to get aggregated SCADA data for all facilities of selected technologies"""
     technology_ids = request.GET.getlist('technology_id[]')
@@ -363,52 +307,23 @@ def get_scada_technology_data(request):
     if facility_count == 0:
         return JsonResponse({'error': 'No facilities found for selected technologies'}, status=404)
     
-    # Get SCADA data for all these facilities
-    scada_queryset = FacilityScada.objects.filter(
-        facility__in=tech_facilities,
-        dispatch_interval__year=year
-    ).order_by('dispatch_interval')
+    if aggregation not in AGGREGATIONS:
+        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
+    x_label = get_x_label(aggregation)
+
+    # Period totals aggregated across facilities
+    data = _get_period_series(tech_facilities, year, aggregation, start_hour, end_hour)
     
-    if not scada_queryset.exists():
+    if data is None:
+        if start_hour is not None:
+            return JsonResponse({
+                'error': 'No SCADA data found in specified hour range'
+            }, status=404)
         tech_names = ', '.join(technologies.values_list('technology_name', flat=True))
         return JsonResponse({
             'error': f'No SCADA data found for {tech_names} in {year}'
         }, status=404)
     
-    # Convert to hour-based data and aggregate across facilities
-    hour_aggregated = {}
-    for record in scada_queryset:
-        hour = get_hour_of_year(record.dispatch_interval)
-        if start_hour and end_hour:
-            if hour < start_hour or hour > end_hour:
-                continue
-        if hour not in hour_aggregated:
-            hour_aggregated[hour] = 0
-        hour_aggregated[hour] += float(record.quantity) if record.quantity else 0
-    
-    if not hour_aggregated:
-        return JsonResponse({
-            'error': 'No SCADA data found in specified hour range'
-        }, status=404)
-    
-    hours = sorted(hour_aggregated.keys())
-    quantity_by_hour = [hour_aggregated[h] for h in hours]
-    
-    hour_data = [{'hour': h, 'quantity': q} for h, q in zip(hours, quantity_by_hour)]
-    
-    # Aggregate based on time period
-    if aggregation == 'hour':
-        data = {'periods': hours, 'quantity': quantity_by_hour}
-        x_label = 'Hour of Year'
-    elif aggregation == 'week':
-        data = aggregate_scada_by_week(hour_data)
-        x_label = 'Week of Year'
-    elif aggregation == 'month':
-        data = aggregate_scada_by_month(hour_data)
-        x_label = 'Month of Year'
-    else:
-        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
-    
     technology_names = list(technologies.values_list('technology_name', flat=True))
     facility_names = list(tech_facilities.values_list('facility_name', flat=True))
     
@@ -421,7 +336,7 @@ def get_scada_technology_data(request):
             'facility_count': count
         })
     
-    return JsonResponse({
+    return chart_response(request, {
         'technology_names': technology_names,
         'technology_breakdown': tech_breakdown,
         'year': year,
@@ -436,6 +351,8 @@ def get_scada_technology_data(request):
     })
 
 
+@chart_view
+@versioned_view(scada_data_version)
 def get_scada_technology_comparison_data(request):
     """API endpoint to compare SCADA data between two groups of technology types"""
     technology1_ids = request.GET.getlist('technology1_id[]')
@@ -479,6 +396,10 @@ def get_scada_technology_comparison_data(request):
         start_hour_int = None
         end_hour_int = None
     
+    if aggregation not in AGGREGATIONS:
+        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
+    x_label = get_x_label(aggregation)
+
     # Get aggregated data for both technology groups
     def get_tech_group_scada_data(technologies, year, start_hour, end_hour):
         tech_facilities = facilities.objects.filter(idtechnologies__in=technologies)
@@ -486,34 +407,13 @@ def get_scada_technology_comparison_data(request):
         if not tech_facilities.exists():
             return None
         
-        scada_queryset = FacilityScada.objects.filter(
-            facility__in=tech_facilities,
-            dispatch_interval__year=year
-        ).order_by('dispatch_interval')
+        data = _get_period_series(tech_facilities, year, aggregation, start_hour, end_hour)
         
-        if not scada_queryset.exists():
+        if data is None:
             return None
         
-        # Aggregate by hour first
-        hour_aggregated = {}
-        for record in scada_queryset:
-            hour = get_hour_of_year(record.dispatch_interval)
-            if start_hour and end_hour:
-                if hour < start_hour or hour > end_hour:
-                    continue
-            if hour not in hour_aggregated:
-                hour_aggregated[hour] = 0
-            hour_aggregated[hour] += float(record.quantity) if record.quantity else 0
-        
-        if not hour_aggregated:
-            return None
-        
-        hours = sorted(hour_aggregated.keys())
-        quantity_by_hour = [hour_aggregated[h] for h in hours]
-        
         return {
-            'hours': hours,
-            'quantity_by_hour': quantity_by_hour,
+            'data': data,
             'facility_count': tech_facilities.count(),
             'facilities': tech_facilities
         }
@@ -533,27 +433,8 @@ def get_scada_technology_comparison_data(request):
             'error': f'No SCADA data found for {tech2_names} in {year}'
         }, status=404)
     
-    # Create hour data structures for aggregation
-    hour_data1 = [{'hour': h, 'quantity': q} 
-                  for h, q in zip(result1['hours'], result1['quantity_by_hour'])]
-    hour_data2 = [{'hour': h, 'quantity': q} 
-                  for h, q in zip(result2['hours'], result2['quantity_by_hour'])]
-    
-    # Aggregate based on time period
-    if aggregation == 'hour':
-        data1 = {'periods': result1['hours'], 'quantity': result1['quantity_by_hour']}
-        data2 = {'periods': result2['hours'], 'quantity': result2['quantity_by_hour']}
-        x_label = 'Hour of Year'
-    elif aggregation == 'week':
-        data1 = aggregate_scada_by_week(hour_data1)
-        data2 = aggregate_scada_by_week(hour_data2)
-        x_label = 'Week of Year'
-    elif aggregation == 'month':
-        data1 = aggregate_scada_by_month(hour_data1)
-        data2 = aggregate_scada_by_month(hour_data2)
-        x_label = 'Month of Year'
-    else:
-        return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
+    data1 = result1['data']
+    data2 = result2['data']
     
     # Calculate correlation metrics
     correlation_metrics = calculate_correlation_metrics(data1['quantity'], data2['quantity'])
@@ -578,7 +459,7 @@ def get_scada_technology_comparison_data(request):
             'facility_count': count
         })
     
-    return JsonResponse({
+    return chart_response(request, {
         'technology1': {
             'names': technology1_names,
             'facility_count': result1['facility_count'],
@@ -600,73 +481,16 @@ def get_scada_technology_comparison_data(request):
     })
 
 
-# Aggregation helper functions - using shared utilities
-def aggregate_scada_by_hour(hour_data):
-    """Aggregate SCADA data by hour (no aggregation needed, just format)"""
-    hour_dict = {}
-    for entry in hour_data:
-        hour = entry['hour']
-        if hour not in hour_dict:
-            hour_dict[hour] = []
-        hour_dict[hour].append(entry['quantity'])
-
-    hours = sorted(hour_dict.keys())
-    quantities = [sum(hour_dict[h]) / len(hour_dict[h]) for h in hours]
-
-    return {
-        'periods': hours,
-        'quantity': quantities
-    }
-
-
-def aggregate_scada_by_week(hour_data):
-    """Aggregate SCADA data by week using shared utilities"""
-    week_dict = {}
-
-    for entry in hour_data:
-        hour = entry['hour']
-        week = get_week_from_hour(hour)
-
-        if week not in week_dict:
-            week_dict[week] = []
-        week_dict[week].append(entry['quantity'])
-
-    weeks = sorted(week_dict.keys())
-    quantities = [sum(week_dict[w]) / len(week_dict[w]) for w in weeks]
-
-    return {
-        'periods': weeks,
-        'quantity': quantities
-    }
-
-
-def aggregate_scada_by_month(hour_data):
-    """Aggregate SCADA data by month using shared utilities"""
-    month_dict = {}
-
-    for entry in hour_data:
-        hour = entry['hour']
-        month = get_month_from_hour(hour)
-
-        if month not in month_dict:
-            month_dict[month] = []
-        month_dict[month].append(entry['quantity'])
-
-    months = sorted(month_dict.keys())
-    quantities = [sum(month_dict[m]) / len(month_dict[m]) for m in months]
-
-    return {
-        'periods': months,
-        'quantity': quantities
-    }
-
-
 # Note: calculate_correlation_metrics is now imported from generation_utils
 
 
 def export_scada_to_excel(request):
-    """Export SCADA data to Excel based on current view mode."""
+    """Export SCADA data to Excel (or CSV) based on current view mode.
+
+    ?format= selects xlsx (default), csv or csv.gz; see tabular_export.py.
+    """
     export_type = request.GET.get('type', 'single')  # single, compare, technology, techcompare
+    export_format = request.GET.get('format', 'xlsx')
     year = request.GET.get('year')
     aggregation = request.GET.get('aggregation', 'hour')
     start_hour = request.GET.get('start_hour')
@@ -675,6 +499,9 @@ def export_scada_to_excel(request):
     if not year:
         return JsonResponse({'error': 'Year is required'}, status=400)
 
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': f'Invalid format: {export_format}'}, status=400)
+
     try:
         year = int(year)
     except ValueError:
@@ -690,8 +517,8 @@ def export_scada_to_excel(request):
         except ValueError:
             pass
 
-    workbook = openpyxl.Workbook()
-    worksheet = workbook.active
+    if aggregation not in AGGREGATIONS:
+        aggregation = 'hour'
 
     if export_type == 'single':
         facility_ids = request.GET.getlist('facility_id[]')
@@ -705,72 +532,35 @@ def export_scada_to_excel(request):
         if not selected_facilities.exists():
             return JsonResponse({'error': 'No valid facilities found'}, status=404)
 
-        # Build data for each facility
+        # Build data for each facility from one grouped query
+        series = ScadaPeriodQuery().get_series(
+            selected_facilities, year, aggregation, start_hour_int, end_hour_int,
+            group_by='facility'
+        )
         all_facility_data = []
         for facility in selected_facilities:
-            scada_queryset = FacilityScada.objects.filter(
-                facility=facility,
-                dispatch_interval__year=year
-            ).order_by('dispatch_interval')
-
-            if not scada_queryset.exists():
+            data = series.get(facility.idfacilities)
+            if data is None:
                 continue
 
-            hour_data = []
-            for record in scada_queryset:
-                hour = get_hour_of_year(record.dispatch_interval)
-                if start_hour_int and end_hour_int:
-                    if hour < start_hour_int or hour > end_hour_int:
-                        continue
-                hour_data.append({
-                    'hour': hour,
-                    'quantity': float(record.quantity) if record.quantity else 0
-                })
-
-            if not hour_data:
-                continue
-
-            # Consolidate half-hourly entries to hourly totals
-            hour_data = _consolidate_to_hourly(hour_data)
-
-            if aggregation == 'hour':
-                data = aggregate_scada_by_hour(hour_data)
-            elif aggregation == 'week':
-                data = aggregate_scada_by_week(hour_data)
-            elif aggregation == 'month':
-                data = aggregate_scada_by_month(hour_data)
-            else:
-                data = aggregate_scada_by_hour(hour_data)
-
             all_facility_data.append({
                 'facility_name': facility.facility_name,
                 'technology': facility.idtechnologies.technology_name,
-                'periods': data['periods'],
-                'quantity': data['quantity']
+                'periods': data['periods'].tolist(),
+                'quantity': data['quantity'].tolist()
             })
 
         if not all_facility_data:
             return JsonResponse({'error': 'No data found'}, status=404)
 
-        # Create worksheet
-        worksheet.title = 'SCADA Data'
-
-        # Headers
         headers = [get_x_label(aggregation)]
         for fd in all_facility_data:
             headers.append(f"{fd['facility_name']} ({fd['technology']})")
-        worksheet.append(headers)
 
-        # Data rows - use periods from first facility as reference
+        # Use periods from first facility as reference
         periods = all_facility_data[0]['periods']
-        for i, period in enumerate(periods):
-            row = [period]
-            for fd in all_facility_data:
-                if i < len(fd['quantity']):
-                    row.append(fd['quantity'][i])
-                else:
-                    row.append('')
-            worksheet.append(row)
+        columns = [periods] + [fd['quantity'][:len(periods)] for fd in all_facility_data]
+        sheet = ExportSheet('SCADA Data', headers, columns)
 
         filename = f"scada_data_{year}_{aggregation}"
 
@@ -785,47 +575,21 @@ def export_scada_to_excel(request):
         facilities2 = facilities.objects.filter(idfacilities__in=facility2_ids).select_related('idtechnologies')
 
         def get_group_data(facility_list):
-            scada_queryset = FacilityScada.objects.filter(
-                facility__in=facility_list,
-                dispatch_interval__year=year
-            ).order_by('dispatch_interval')
-
-            hour_aggregated = {}
-            for record in scada_queryset:
-                hour = get_hour_of_year(record.dispatch_interval)
-                if start_hour_int and end_hour_int:
-                    if hour < start_hour_int or hour > end_hour_int:
-                        continue
-                if hour not in hour_aggregated:
-                    hour_aggregated[hour] = 0
-                hour_aggregated[hour] += float(record.quantity) if record.quantity else 0
-
-            hours = sorted(hour_aggregated.keys())
-            quantity = [hour_aggregated[h] for h in hours]
-            hour_data = [{'hour': h, 'quantity': q} for h, q in zip(hours, quantity)]
-
-            if aggregation == 'week':
-                return aggregate_scada_by_week(hour_data)
-            elif aggregation == 'month':
-                return aggregate_scada_by_month(hour_data)
-            return {'periods': hours, 'quantity': quantity}
+            return _get_period_series(
+                facility_list, year, aggregation, start_hour_int, end_hour_int
+            ) or {'periods': [], 'quantity': []}
 
         data1 = get_group_data(facilities1)
         data2 = get_group_data(facilities2)
 
-        worksheet.title = 'SCADA Comparison'
-
         group1_names = ', '.join(facilities1.values_list('facility_name', flat=True)[:3])
         group2_names = ', '.join(facilities2.values_list('facility_name', flat=True)[:3])
 
         headers = [get_x_label(aggregation), f'Group 1: {group1_names}', f'Group 2: {group2_names}']
-        worksheet.append(headers)
-
-        for i, period in enumerate(data1['periods']):
-            row = [period]
-            row.append(data1['quantity'][i] if i < len(data1['quantity']) else '')
-            row.append(data2['quantity'][i] if i < len(data2['quantity']) else '')
-            worksheet.append(row)
+        periods = data1['periods']
+        sheet = ExportSheet('SCADA Comparison', headers, [
+            periods, data1['quantity'][:len(periods)], data2['quantity'][:len(periods)]
+        ])
 
         filename = f"scada_comparison_{year}_{aggregation}"
 
@@ -838,40 +602,13 @@ def export_scada_to_excel(request):
         technologies = Technologies.objects.filter(idtechnologies__in=technology_ids)
         tech_facilities = facilities.objects.filter(idtechnologies__in=technologies)
 
-        scada_queryset = FacilityScada.objects.filter(
-            facility__in=tech_facilities,
-            dispatch_interval__year=year
-        ).order_by('dispatch_interval')
-
-        hour_aggregated = {}
-        for record in scada_queryset:
-            hour = get_hour_of_year(record.dispatch_interval)
-            if start_hour_int and end_hour_int:
-                if hour < start_hour_int or hour > end_hour_int:
-                    continue
-            if hour not in hour_aggregated:
-                hour_aggregated[hour] = 0
-            hour_aggregated[hour] += float(record.quantity) if record.quantity else 0
-
-        hours = sorted(hour_aggregated.keys())
-        quantity = [hour_aggregated[h] for h in hours]
-        hour_data = [{'hour': h, 'quantity': q} for h, q in zip(hours, quantity)]
-
-        if aggregation == 'week':
-            data = aggregate_scada_by_week(hour_data)
-        elif aggregation == 'month':
-            data = aggregate_scada_by_month(hour_data)
-        else:
-            data = {'periods': hours, 'quantity': quantity}
-
-        worksheet.title = 'Technology SCADA'
+        data = _get_period_series(
+            tech_facilities, year, aggregation, start_hour_int, end_hour_int
+        ) or {'periods': [], 'quantity': []}
 
         tech_names = ', '.join(technologies.values_list('technology_name', flat=True))
         headers = [get_x_label(aggregation), f'{tech_names} Generation (MW)']
-        worksheet.append(headers)
-
-        for i, period in enumerate(data['periods']):
-            worksheet.append([period, data['quantity'][i]])
+        sheet = ExportSheet('Technology SCADA', headers, [data['periods'], data['quantity']])
 
         filename = f"scada_technology_{year}_{aggregation}"
 
@@ -887,71 +624,25 @@ def export_scada_to_excel(request):
 
         def get_tech_data(technologies):
             tech_facilities = facilities.objects.filter(idtechnologies__in=technologies)
-            scada_queryset = FacilityScada.objects.filter(
-                facility__in=tech_facilities,
-                dispatch_interval__year=year
-            ).order_by('dispatch_interval')
-
-            hour_aggregated = {}
-            for record in scada_queryset:
-                hour = get_hour_of_year(record.dispatch_interval)
-                if start_hour_int and end_hour_int:
-                    if hour < start_hour_int or hour > end_hour_int:
-                        continue
-                if hour not in hour_aggregated:
-                    hour_aggregated[hour] = 0
-                hour_aggregated[hour] += float(record.quantity) if record.quantity else 0
-
-            hours = sorted(hour_aggregated.keys())
-            quantity = [hour_aggregated[h] for h in hours]
-            hour_data = [{'hour': h, 'quantity': q} for h, q in zip(hours, quantity)]
-
-            if aggregation == 'week':
-                return aggregate_scada_by_week(hour_data)
-            elif aggregation == 'month':
-                return aggregate_scada_by_month(hour_data)
-            return {'periods': hours, 'quantity': quantity}
+            return _get_period_series(
+                tech_facilities, year, aggregation, start_hour_int, end_hour_int
+            ) or {'periods': [], 'quantity': []}
 
         data1 = get_tech_data(technologies1)
         data2 = get_tech_data(technologies2)
 
-        worksheet.title = 'Technology Comparison'
-
         tech1_names = ', '.join(technologies1.values_list('technology_name', flat=True))
         tech2_names = ', '.join(technologies2.values_list('technology_name', flat=True))
 
         headers = [get_x_label(aggregation), f'Group 1: {tech1_names}', f'Group 2: {tech2_names}']
-        worksheet.append(headers)
-
-        for i, period in enumerate(data1['periods']):
-            row = [period]
-            row.append(data1['quantity'][i] if i < len(data1['quantity']) else '')
-            row.append(data2['quantity'][i] if i < len(data2['quantity']) else '')
-            worksheet.append(row)
+        periods = data1['periods']
+        sheet = ExportSheet('Technology Comparison', headers, [
+            periods, data1['quantity'][:len(periods)], data2['quantity'][:len(periods)]
+        ])
 
         filename = f"scada_tech_comparison_{year}_{aggregation}"
 
     else:
         return JsonResponse({'error': 'Invalid export type'}, status=400)
 
-    # Auto-size columns
-    for column_cells in worksheet.columns:
-        max_length = 0
-        column = column_cells[0].column_letter
-        for cell in column_cells:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        worksheet.column_dimensions[column].width = adjusted_width
-
-    # Create response
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
-    workbook.save(response)
-
-    return response
\ No newline at end of file
+    return export_response(export_format, [sheet], filename)
@@ -6,26 +6,56 @@ with simulated SupplyFactors data for facilities, facility groups, and technolog
 """
 
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse
 from siren_web.models import facilities, FacilityScada, supplyfactors, Technologies
-import openpyxl
-from openpyxl.utils import get_column_letter
 
 from ..services.generation_utils import (
     get_hour_range_from_months,
     aggregate_by_period,
-    aggregate_multiple_fields,
+    aggregate_arrays_by_period,
     calculate_correlation_metrics,
     calculate_error_metrics,
     get_x_label,
     PEAK_HOUR_PRESETS
 )
+from ..services.chart_payload import chart_response, chart_view
+from ..services.data_versions import scada_vs_supply_version
+from ..services.response_cache import versioned_view
+from ..services.downsampling import DOWNSAMPLE_METHODS, downsample_series
+from ..services.tabular_export import EXPORT_FORMATS, ExportSheet, export_response, sheet_from_rows
 from ..services.time_series_aligner import TimeSeriesAligner
 
 # Initialize the time series aligner
 aligner = TimeSeriesAligner()
 
 
+def get_downsampling_params(request):
+    """Parse the chart downsampling query parameters.
+
+    max_points sets the target number of plotted points (omit for full
+    resolution); downsample selects 'lttb' (default) or 'minmax'.
+
+    Returns:
+        Tuple of (max_points or None, method)
+
+    Raises:
+        ValueError: If either parameter is invalid
+    """
+    max_points = request.GET.get('max_points')
+    method = request.GET.get('downsample', 'lttb')
+
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f'Invalid downsample method: {method}')
+    if not max_points:
+        return None, method
+    try:
+        max_points = int(max_points)
+    except ValueError:
+        raise ValueError('Invalid max_points')
+    if max_points < 10:
+        raise ValueError('max_points must be at least 10')
+    return max_points, method
+
 def generation_comparison_view(request):
     """Main view for SCADA vs SupplyFactors comparison.
 
@@ -52,6 +82,8 @@ def generation_comparison_view(request):
     return render(request, 'generation_comparison.html', context)
 
 
+@chart_view
+@versioned_view(scada_vs_supply_version)
 def get_facility_scada_vs_supply(request):
     """API endpoint to compare SCADA vs SupplyFactors for a single facility."""
     facility_id = request.GET.get('facility_id')
@@ -85,19 +117,24 @@ def get_facility_scada_vs_supply(request):
         except ValueError:
             return JsonResponse({'error': 'Invalid hour range'}, status=400)
 
+    try:
+        max_points, downsample_method = get_downsampling_params(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
     # Get SCADA data and convert to hourly
     scada_qs = FacilityScada.objects.filter(
         facility=facility,
         dispatch_interval__year=year
     ).order_by('dispatch_interval')
 
-    if not scada_qs.exists():
+    scada_hourly = aligner.get_scada_hourly(scada_qs, [facility], year, start_hour_int, end_hour_int)
+
+    if not scada_hourly['hours']:
         return JsonResponse({
             'error': f'No SCADA data found for {facility.facility_name} in {year}'
         }, status=404)
 
-    scada_hourly = aligner.convert_scada_to_hourly(scada_qs, year, start_hour_int, end_hour_int)
-
     # Get SupplyFactors data
     supply_qs = supplyfactors.objects.filter(
         idfacilities=facility,
@@ -131,15 +168,13 @@ def get_facility_scada_vs_supply(request):
 
     # Aggregate by period if needed
     if aggregation != 'hour':
-        # Create hour_data format for aggregation
-        hour_data = [
-            {'hour': h, 'scada': s, 'supply': p}
-            for h, s, p in zip(aligned['hours'], aligned['scada_values'], aligned['supply_values'])
-        ]
-        aggregated = aggregate_multiple_fields(hour_data, aggregation, ['scada', 'supply'])
-        periods = aggregated['periods']
-        scada_values = aggregated['scada']
-        supply_values = aggregated['supply']
+        aggregated = aggregate_arrays_by_period(aligned['hours'], aggregation, {
+            'scada': aligned['scada_values'],
+            'supply': aligned['supply_values'],
+        })
+        periods = aggregated['periods'].tolist()
+        scada_values = aggregated['scada'].tolist()
+        supply_values = aggregated['supply'].tolist()
     else:
         periods = aligned['hours']
         scada_values = aligned['scada_values']
@@ -150,6 +185,12 @@ def get_facility_scada_vs_supply(request):
     error_metrics = calculate_error_metrics(scada_values, supply_values)
 
     # Build response
+    # Downsample for plotting; the metrics above use the full series
+    plot_periods, plot_series = downsample_series(
+        periods, {'scada': scada_values, 'supply': supply_values},
+        max_points, downsample_method
+    )
+
     response_data = {
         'facility_name': facility.facility_name,
         'facility_code': facility.facility_code,
@@ -157,13 +198,14 @@ def get_facility_scada_vs_supply(request):
         'year': year,
         'aggregation': aggregation,
         'x_label': get_x_label(aggregation),
-        'periods': periods,
-        'scada_values': scada_values,
-        'supply_values': supply_values,
+        'periods': plot_periods,
+        'scada_values': plot_series['scada'],
+        'supply_values': plot_series['supply'],
         'correlation_metrics': correlation_metrics,
         'error_metrics': error_metrics,
         'overlap_percentage': aligned['overlap_percentage'],
         'data_points': len(periods),
+        'plotted_points': len(plot_periods),
         'scada_only_hours': aligned['scada_only_hours'],
         'supply_only_hours': aligned['supply_only_hours'],
     }
@@ -174,9 +216,11 @@ def get_facility_scada_vs_supply(request):
         response_data['peak_filter_label'] = aligned.get('peak_filter_label', '')
         response_data['filter_retention_pct'] = aligned.get('filter_retention_pct', 100)
 
-    return JsonResponse(response_data)
+    return chart_response(request, response_data)
 
 
+@chart_view
+@versioned_view(scada_vs_supply_version)
 def get_facility_group_scada_vs_supply(request):
     """API endpoint to compare SCADA vs SupplyFactors for a group of facilities."""
     facility_ids = request.GET.getlist('facility_id[]')
@@ -214,21 +258,26 @@ def get_facility_group_scada_vs_supply(request):
         except ValueError:
             return JsonResponse({'error': 'Invalid hour range'}, status=400)
 
+    try:
+        max_points, downsample_method = get_downsampling_params(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
     # Get SCADA data aggregated across facilities
     scada_qs = FacilityScada.objects.filter(
         facility__in=selected_facilities,
         dispatch_interval__year=year
     ).order_by('dispatch_interval')
 
-    if not scada_qs.exists():
+    scada_hourly = aligner.get_scada_hourly(
+        scada_qs, selected_facilities, year, start_hour_int, end_hour_int
+    )
+
+    if not scada_hourly['hours']:
         return JsonResponse({
             'error': f'No SCADA data found for selected facilities in {year}'
         }, status=404)
 
-    scada_hourly = aligner.convert_scada_to_hourly_aggregated(
-        scada_qs, year, start_hour_int, end_hour_int
-    )
-
     # Get SupplyFactors data aggregated across facilities
     supply_qs = supplyfactors.objects.filter(
         idfacilities__in=selected_facilities,
@@ -262,14 +311,13 @@ def get_facility_group_scada_vs_supply(request):
 
     # Aggregate by period if needed
     if aggregation != 'hour':
-        hour_data = [
-            {'hour': h, 'scada': s, 'supply': p}
-            for h, s, p in zip(aligned['hours'], aligned['scada_values'], aligned['supply_values'])
-        ]
-        aggregated = aggregate_multiple_fields(hour_data, aggregation, ['scada', 'supply'])
-        periods = aggregated['periods']
-        scada_values = aggregated['scada']
-        supply_values = aggregated['supply']
+        aggregated = aggregate_arrays_by_period(aligned['hours'], aggregation, {
+            'scada': aligned['scada_values'],
+            'supply': aligned['supply_values'],
+        })
+        periods = aggregated['periods'].tolist()
+        scada_values = aggregated['scada'].tolist()
+        supply_values = aggregated['supply'].tolist()
     else:
         periods = aligned['hours']
         scada_values = aligned['scada_values']
@@ -287,6 +335,12 @@ def get_facility_group_scada_vs_supply(request):
         count = selected_facilities.filter(idtechnologies__technology_name=tech_name).count()
         tech_breakdown.append({'name': tech_name, 'facility_count': count})
 
+    # Downsample for plotting; the metrics above use the full series
+    plot_periods, plot_series = downsample_series(
+        periods, {'scada': scada_values, 'supply': supply_values},
+        max_points, downsample_method
+    )
+
     response_data = {
         'facility_names': facility_names[:10],  # Limit display
         'facility_count': selected_facilities.count(),
@@ -294,13 +348,14 @@ def get_facility_group_scada_vs_supply(request):
         'year': year,
         'aggregation': aggregation,
         'x_label': get_x_label(aggregation),
-        'periods': periods,
-        'scada_values': scada_values,
-        'supply_values': supply_values,
+        'periods': plot_periods,
+        'scada_values': plot_series['scada'],
+        'supply_values': plot_series['supply'],
         'correlation_metrics': correlation_metrics,
         'error_metrics': error_metrics,
         'overlap_percentage': aligned['overlap_percentage'],
         'data_points': len(periods),
+        'plotted_points': len(plot_periods),
     }
 
     # Add peak filter info if applied
@@ -309,9 +364,11 @@ def get_facility_group_scada_vs_supply(request):
         response_data['peak_filter_label'] = aligned.get('peak_filter_label', '')
         response_data['filter_retention_pct'] = aligned.get('filter_retention_pct', 100)
 
-    return JsonResponse(response_data)
+    return chart_response(request, response_data)
 
 
+@chart_view
+@versioned_view(scada_vs_supply_version)
 def get_technology_scada_vs_supply(request):
     """API endpoint to compare SCADA vs SupplyFactors aggregated by technology."""
     technology_ids = request.GET.getlist('technology_id[]')
@@ -346,6 +403,11 @@ def get_technology_scada_vs_supply(request):
         except ValueError:
             return JsonResponse({'error': 'Invalid hour range'}, status=400)
 
+    try:
+        max_points, downsample_method = get_downsampling_params(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
     # Get facilities with these technologies
     tech_facilities = facilities.objects.filter(idtechnologies__in=technologies)
     facility_count = tech_facilities.count()
@@ -361,16 +423,16 @@ def get_technology_scada_vs_supply(request):
         dispatch_interval__year=year
     ).order_by('dispatch_interval')
 
-    if not scada_qs.exists():
+    scada_hourly = aligner.get_scada_hourly(
+        scada_qs, tech_facilities, year, start_hour_int, end_hour_int
+    )
+
+    if not scada_hourly['hours']:
         tech_names = ', '.join(technologies.values_list('technology_name', flat=True))
         return JsonResponse({
             'error': f'No SCADA data found for {tech_names} in {year}'
         }, status=404)
 
-    scada_hourly = aligner.convert_scada_to_hourly_aggregated(
-        scada_qs, year, start_hour_int, end_hour_int
-    )
-
     # Get SupplyFactors data aggregated
     supply_qs = supplyfactors.objects.filter(
         idfacilities__idtechnologies__in=technologies,
@@ -405,14 +467,13 @@ def get_technology_scada_vs_supply(request):
 
     # Aggregate by period if needed
     if aggregation != 'hour':
-        hour_data = [
-            {'hour': h, 'scada': s, 'supply': p}
-            for h, s, p in zip(aligned['hours'], aligned['scada_values'], aligned['supply_values'])
-        ]
-        aggregated = aggregate_multiple_fields(hour_data, aggregation, ['scada', 'supply'])
-        periods = aggregated['periods']
-        scada_values = aggregated['scada']
-        supply_values = aggregated['supply']
+        aggregated = aggregate_arrays_by_period(aligned['hours'], aggregation, {
+            'scada': aligned['scada_values'],
+            'supply': aligned['supply_values'],
+        })
+        periods = aggregated['periods'].tolist()
+        scada_values = aggregated['scada'].tolist()
+        supply_values = aggregated['supply'].tolist()
     else:
         periods = aligned['hours']
         scada_values = aligned['scada_values']
@@ -429,6 +490,12 @@ def get_technology_scada_vs_supply(request):
         count = tech_facilities.filter(idtechnologies=tech).count()
         tech_breakdown.append({'name': tech.technology_name, 'facility_count': count})
 
+    # Downsample for plotting; the metrics above use the full series
+    plot_periods, plot_series = downsample_series(
+        periods, {'scada': scada_values, 'supply': supply_values},
+        max_points, downsample_method
+    )
+
     response_data = {
         'technology_names': technology_names,
         'technology_breakdown': tech_breakdown,
@@ -436,13 +503,14 @@ def get_technology_scada_vs_supply(request):
         'year': year,
         'aggregation': aggregation,
         'x_label': get_x_label(aggregation),
-        'periods': periods,
-        'scada_values': scada_values,
-        'supply_values': supply_values,
+        'periods': plot_periods,
+        'scada_values': plot_series['scada'],
+        'supply_values': plot_series['supply'],
         'correlation_metrics': correlation_metrics,
         'error_metrics': error_metrics,
         'overlap_percentage': aligned['overlap_percentage'],
         'data_points': len(periods),
+        'plotted_points': len(plot_periods),
     }
 
     # Add peak filter info if applied
@@ -451,9 +519,11 @@ def get_technology_scada_vs_supply(request):
         response_data['peak_filter_label'] = aligned.get('peak_filter_label', '')
         response_data['filter_retention_pct'] = aligned.get('filter_retention_pct', 100)
 
-    return JsonResponse(response_data)
+    return chart_response(request, response_data)
 
 
+@chart_view
+@versioned_view(scada_vs_supply_version)
 def get_technology_group_scada_vs_supply(request):
     """API endpoint to compare two technology groups, each with SCADA vs SupplyFactors."""
     technology1_ids = request.GET.getlist('technology1_id[]')
@@ -498,6 +568,11 @@ def get_technology_group_scada_vs_supply(request):
         except ValueError:
             return JsonResponse({'error': 'Invalid hour range'}, status=400)
 
+    try:
+        max_points, downsample_method = get_downsampling_params(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
     # Helper to get data for a technology group
     def get_tech_group_data(technologies):
         tech_facilities = facilities.objects.filter(idtechnologies__in=technologies)
@@ -510,12 +585,11 @@ def get_technology_group_scada_vs_supply(request):
             dispatch_interval__year=year
         ).order_by('dispatch_interval')
 
-        if not scada_qs.exists():
-            return None, None, "No SCADA data"
-
-        scada_hourly = aligner.convert_scada_to_hourly_aggregated(
-            scada_qs, year, start_hour_int, end_hour_int
+        scada_hourly = aligner.get_scada_hourly(
+            scada_qs, tech_facilities, year, start_hour_int, end_hour_int
         )
+        if not scada_hourly['hours']:
+            return None, None, "No SCADA data"
 
         # SupplyFactors
         supply_qs = supplyfactors.objects.filter(
@@ -574,13 +648,10 @@ def get_technology_group_scada_vs_supply(request):
 
     # Aggregate by period if needed
     if aggregation != 'hour':
-        hour_data = [
-            {'hour': h, 'scada1': s1, 'supply1': p1, 'scada2': s2, 'supply2': p2}
-            for h, s1, p1, s2, p2 in zip(common_hours, scada1, supply1, scada2, supply2)
-        ]
-        aggregated = aggregate_multiple_fields(
-            hour_data, aggregation, ['scada1', 'supply1', 'scada2', 'supply2']
-        )
+        aggregated = aggregate_arrays_by_period(common_hours, aggregation, {
+            'scada1': scada1, 'supply1': supply1, 'scada2': scada2, 'supply2': supply2,
+        })
+        aggregated = {field: values.tolist() for field, values in aggregated.items()}
         periods = aggregated['periods']
         scada1, supply1 = aggregated['scada1'], aggregated['supply1']
         scada2, supply2 = aggregated['scada2'], aggregated['supply2']
@@ -593,38 +664,51 @@ def get_technology_group_scada_vs_supply(request):
     correlation2 = calculate_correlation_metrics(scada2, supply2)
     error_metrics2 = calculate_error_metrics(scada2, supply2)
 
+    # Downsample for plotting; the metrics above use the full series
+    plot_periods, plot_series = downsample_series(
+        periods,
+        {'scada1': scada1, 'supply1': supply1, 'scada2': scada2, 'supply2': supply2},
+        max_points, downsample_method
+    )
+
     # Build response
     tech1_names = list(technologies1.values_list('technology_name', flat=True))
     tech2_names = list(technologies2.values_list('technology_name', flat=True))
 
-    return JsonResponse({
+    return chart_response(request, {
         'technology_group1': {
             'names': tech1_names,
             'facility_count': facilities1.count(),
-            'scada_values': scada1,
-            'supply_values': supply1,
+            'scada_values': plot_series['scada1'],
+            'supply_values': plot_series['supply1'],
             'correlation_metrics': correlation1,
             'error_metrics': error_metrics1,
         },
         'technology_group2': {
             'names': tech2_names,
             'facility_count': facilities2.count(),
-            'scada_values': scada2,
-            'supply_values': supply2,
+            'scada_values': plot_series['scada2'],
+            'supply_values': plot_series['supply2'],
             'correlation_metrics': correlation2,
             'error_metrics': error_metrics2,
         },
         'year': year,
         'aggregation': aggregation,
         'x_label': get_x_label(aggregation),
-        'periods': periods,
+        'periods': plot_periods,
         'data_points': len(periods),
+        'plotted_points': len(plot_periods),
     })
 
 
 def export_generation_comparison_to_excel(request):
-    """Export SCADA vs SupplyFactors comparison data to Excel."""
+    """Export SCADA vs SupplyFactors comparison data to Excel (or CSV).
+
+    ?format= selects xlsx (default), csv or csv.gz; CSV exports leave out
+    the Metrics sheet. See tabular_export.py.
+    """
     export_type = request.GET.get('type', 'single')  # single, group, technology, techcompare
+    export_format = request.GET.get('format', 'xlsx')
     year = request.GET.get('year')
     aggregation = request.GET.get('aggregation', 'hour')
     start_hour = request.GET.get('start_hour')
@@ -634,6 +718,9 @@ def export_generation_comparison_to_excel(request):
     if not year:
         return JsonResponse({'error': 'Year is required'}, status=400)
 
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': f'Invalid format: {export_format}'}, status=400)
+
     try:
         year = int(year)
     except ValueError:
@@ -649,9 +736,6 @@ def export_generation_comparison_to_excel(request):
         except ValueError:
             pass
 
-    workbook = openpyxl.Workbook()
-    worksheet = workbook.active
-
     if export_type == 'single':
         facility_id = request.GET.get('facility_id')
         if not facility_id:
@@ -668,7 +752,7 @@ def export_generation_comparison_to_excel(request):
             dispatch_interval__year=year
         ).order_by('dispatch_interval')
 
-        scada_hourly = aligner.convert_scada_to_hourly(scada_qs, year, start_hour_int, end_hour_int)
+        scada_hourly = aligner.get_scada_hourly(scada_qs, [facility], year, start_hour_int, end_hour_int)
 
         # Get SupplyFactors data
         supply_qs = supplyfactors.objects.filter(
@@ -694,46 +778,41 @@ def export_generation_comparison_to_excel(request):
 
         # Aggregate if needed
         if aggregation != 'hour':
-            hour_data = [
-                {'hour': h, 'scada': s, 'supply': p}
-                for h, s, p in zip(aligned['hours'], aligned['scada_values'], aligned['supply_values'])
-            ]
-            aggregated = aggregate_multiple_fields(hour_data, aggregation, ['scada', 'supply'])
-            periods = aggregated['periods']
-            scada_values = aggregated['scada']
-            supply_values = aggregated['supply']
+            aggregated = aggregate_arrays_by_period(aligned['hours'], aggregation, {
+                'scada': aligned['scada_values'],
+                'supply': aligned['supply_values'],
+            })
+            periods = aggregated['periods'].tolist()
+            scada_values = aggregated['scada'].tolist()
+            supply_values = aggregated['supply'].tolist()
         else:
             periods = aligned['hours']
             scada_values = aligned['scada_values']
             supply_values = aligned['supply_values']
 
-        worksheet.title = 'SCADA vs Simulated'
-
         headers = [get_x_label(aggregation), 'SCADA (Actual)', 'Simulated (SupplyFactors)']
-        worksheet.append(headers)
-
-        for i, period in enumerate(periods):
-            worksheet.append([period, scada_values[i], supply_values[i]])
+        data_sheet = ExportSheet('SCADA vs Simulated', headers, [periods, scada_values, supply_values])
 
         # Add metrics sheet
-        metrics_sheet = workbook.create_sheet('Metrics')
         correlation_metrics = calculate_correlation_metrics(scada_values, supply_values)
         error_metrics = calculate_error_metrics(scada_values, supply_values)
 
-        metrics_sheet.append(['Metric', 'Value'])
-        metrics_sheet.append(['Facility', facility.facility_name])
-        metrics_sheet.append(['Technology', facility.idtechnologies.technology_name])
-        metrics_sheet.append(['Year', year])
-        metrics_sheet.append(['Aggregation', aggregation])
-        metrics_sheet.append(['Peak Filter', peak_filter])
-        metrics_sheet.append(['Data Points', len(periods)])
-        metrics_sheet.append(['Overlap %', aligned.get('overlap_percentage', '-')])
-        metrics_sheet.append([''])
-        metrics_sheet.append(['Correlation', correlation_metrics.get('correlation', '-')])
-        metrics_sheet.append(['MAE', error_metrics.get('mae', '-')])
-        metrics_sheet.append(['RMSE', error_metrics.get('rmse', '-')])
-        metrics_sheet.append(['MBE', error_metrics.get('mbe', '-')])
-        metrics_sheet.append(['MAPE', error_metrics.get('mape', '-')])
+        metrics_sheet = sheet_from_rows('Metrics', [
+            ['Metric', 'Value'],
+            ['Facility', facility.facility_name],
+            ['Technology', facility.idtechnologies.technology_name],
+            ['Year', year],
+            ['Aggregation', aggregation],
+            ['Peak Filter', peak_filter],
+            ['Data Points', len(periods)],
+            ['Overlap %', aligned.get('overlap_percentage', '-')],
+            [''],
+            ['Correlation', correlation_metrics.get('correlation', '-')],
+            ['MAE', error_metrics.get('mae', '-')],
+            ['RMSE', error_metrics.get('rmse', '-')],
+            ['MBE', error_metrics.get('mbe', '-')],
+            ['MAPE', error_metrics.get('mape', '-')],
+        ])
 
         filename = f"generation_comparison_{facility.facility_code or facility.facility_name}_{year}"
 
@@ -755,8 +834,8 @@ def export_generation_comparison_to_excel(request):
             dispatch_interval__year=year
         ).order_by('dispatch_interval')
 
-        scada_hourly = aligner.convert_scada_to_hourly_aggregated(
-            scada_qs, year, start_hour_int, end_hour_int
+        scada_hourly = aligner.get_scada_hourly(
+            scada_qs, selected_facilities, year, start_hour_int, end_hour_int
         )
 
         # Get aggregated SupplyFactors data
@@ -783,45 +862,40 @@ def export_generation_comparison_to_excel(request):
 
         # Aggregate if needed
         if aggregation != 'hour':
-            hour_data = [
-                {'hour': h, 'scada': s, 'supply': p}
-                for h, s, p in zip(aligned['hours'], aligned['scada_values'], aligned['supply_values'])
-            ]
-            aggregated = aggregate_multiple_fields(hour_data, aggregation, ['scada', 'supply'])
-            periods = aggregated['periods']
-            scada_values = aggregated['scada']
-            supply_values = aggregated['supply']
+            aggregated = aggregate_arrays_by_period(aligned['hours'], aggregation, {
+                'scada': aligned['scada_values'],
+                'supply': aligned['supply_values'],
+            })
+            periods = aggregated['periods'].tolist()
+            scada_values = aggregated['scada'].tolist()
+            supply_values = aggregated['supply'].tolist()
         else:
             periods = aligned['hours']
             scada_values = aligned['scada_values']
             supply_values = aligned['supply_values']
 
-        worksheet.title = 'Facility Group Comparison'
-
         headers = [get_x_label(aggregation), 'SCADA (Actual)', 'Simulated (SupplyFactors)']
-        worksheet.append(headers)
-
-        for i, period in enumerate(periods):
-            worksheet.append([period, scada_values[i], supply_values[i]])
+        data_sheet = ExportSheet('Facility Group Comparison', headers, [periods, scada_values, supply_values])
 
         # Add metrics sheet
-        metrics_sheet = workbook.create_sheet('Metrics')
         correlation_metrics = calculate_correlation_metrics(scada_values, supply_values)
         error_metrics = calculate_error_metrics(scada_values, supply_values)
 
-        metrics_sheet.append(['Metric', 'Value'])
-        metrics_sheet.append(['Facilities', ', '.join(list(selected_facilities.values_list('facility_name', flat=True))[:5])])
-        metrics_sheet.append(['Facility Count', selected_facilities.count()])
-        metrics_sheet.append(['Year', year])
-        metrics_sheet.append(['Aggregation', aggregation])
-        metrics_sheet.append(['Peak Filter', peak_filter])
-        metrics_sheet.append(['Data Points', len(periods)])
-        metrics_sheet.append([''])
-        metrics_sheet.append(['Correlation', correlation_metrics.get('correlation', '-')])
-        metrics_sheet.append(['MAE', error_metrics.get('mae', '-')])
-        metrics_sheet.append(['RMSE', error_metrics.get('rmse', '-')])
-        metrics_sheet.append(['MBE', error_metrics.get('mbe', '-')])
-        metrics_sheet.append(['MAPE', error_metrics.get('mape', '-')])
+        metrics_sheet = sheet_from_rows('Metrics', [
+            ['Metric', 'Value'],
+            ['Facilities', ', '.join(list(selected_facilities.values_list('facility_name', flat=True))[:5])],
+            ['Facility Count', selected_facilities.count()],
+            ['Year', year],
+            ['Aggregation', aggregation],
+            ['Peak Filter', peak_filter],
+            ['Data Points', len(periods)],
+            [''],
+            ['Correlation', correlation_metrics.get('correlation', '-')],
+            ['MAE', error_metrics.get('mae', '-')],
+            ['RMSE', error_metrics.get('rmse', '-')],
+            ['MBE', error_metrics.get('mbe', '-')],
+            ['MAPE', error_metrics.get('mape', '-')],
+        ])
 
         filename = f"generation_comparison_group_{year}"
 
@@ -842,8 +916,8 @@ def export_generation_comparison_to_excel(request):
             dispatch_interval__year=year
         ).order_by('dispatch_interval')
 
-        scada_hourly = aligner.convert_scada_to_hourly_aggregated(
-            scada_qs, year, start_hour_int, end_hour_int
+        scada_hourly = aligner.get_scada_hourly(
+            scada_qs, tech_facilities, year, start_hour_int, end_hour_int
         )
 
         # Get aggregated SupplyFactors data
@@ -870,46 +944,41 @@ def export_generation_comparison_to_excel(request):
 
         # Aggregate if needed
         if aggregation != 'hour':
-            hour_data = [
-                {'hour': h, 'scada': s, 'supply': p}
-                for h, s, p in zip(aligned['hours'], aligned['scada_values'], aligned['supply_values'])
-            ]
-            aggregated = aggregate_multiple_fields(hour_data, aggregation, ['scada', 'supply'])
-            periods = aggregated['periods']
-            scada_values = aggregated['scada']
-            supply_values = aggregated['supply']
+            aggregated = aggregate_arrays_by_period(aligned['hours'], aggregation, {
+                'scada': aligned['scada_values'],
+                'supply': aligned['supply_values'],
+            })
+            periods = aggregated['periods'].tolist()
+            scada_values = aggregated['scada'].tolist()
+            supply_values = aggregated['supply'].tolist()
         else:
             periods = aligned['hours']
             scada_values = aligned['scada_values']
             supply_values = aligned['supply_values']
 
-        worksheet.title = 'Technology Comparison'
-
         tech_names = ', '.join(list(technologies.values_list('technology_name', flat=True)))
         headers = [get_x_label(aggregation), 'SCADA (Actual)', 'Simulated (SupplyFactors)']
-        worksheet.append(headers)
-
-        for i, period in enumerate(periods):
-            worksheet.append([period, scada_values[i], supply_values[i]])
+        data_sheet = ExportSheet('Technology Comparison', headers, [periods, scada_values, supply_values])
 
         # Add metrics sheet
-        metrics_sheet = workbook.create_sheet('Metrics')
         correlation_metrics = calculate_correlation_metrics(scada_values, supply_values)
         error_metrics = calculate_error_metrics(scada_values, supply_values)
 
-        metrics_sheet.append(['Metric', 'Value'])
-        metrics_sheet.append(['Technologies', tech_names])
-        metrics_sheet.append(['Facility Count', tech_facilities.count()])
-        metrics_sheet.append(['Year', year])
-        metrics_sheet.append(['Aggregation', aggregation])
-        metrics_sheet.append(['Peak Filter', peak_filter])
-        metrics_sheet.append(['Data Points', len(periods)])
-        metrics_sheet.append([''])
-        metrics_sheet.append(['Correlation', correlation_metrics.get('correlation', '-')])
-        metrics_sheet.append(['MAE', error_metrics.get('mae', '-')])
-        metrics_sheet.append(['RMSE', error_metrics.get('rmse', '-')])
-        metrics_sheet.append(['MBE', error_metrics.get('mbe', '-')])
-        metrics_sheet.append(['MAPE', error_metrics.get('mape', '-')])
+        metrics_sheet = sheet_from_rows('Metrics', [
+            ['Metric', 'Value'],
+            ['Technologies', tech_names],
+            ['Facility Count', tech_facilities.count()],
+            ['Year', year],
+            ['Aggregation', aggregation],
+            ['Peak Filter', peak_filter],
+            ['Data Points', len(periods)],
+            [''],
+            ['Correlation', correlation_metrics.get('correlation', '-')],
+            ['MAE', error_metrics.get('mae', '-')],
+            ['RMSE', error_metrics.get('rmse', '-')],
+            ['MBE', error_metrics.get('mbe', '-')],
+            ['MAPE', error_metrics.get('mape', '-')],
+        ])
 
         filename = f"generation_comparison_technology_{year}"
 
@@ -933,8 +1002,8 @@ def export_generation_comparison_to_excel(request):
                 dispatch_interval__year=year
             ).order_by('dispatch_interval')
 
-            scada_hourly = aligner.convert_scada_to_hourly_aggregated(
-                scada_qs, year, start_hour_int, end_hour_int
+            scada_hourly = aligner.get_scada_hourly(
+                scada_qs, tech_facilities, year, start_hour_int, end_hour_int
             )
 
             supply_qs = supplyfactors.objects.filter(
@@ -976,21 +1045,16 @@ def export_generation_comparison_to_excel(request):
 
         # Aggregate if needed
         if aggregation != 'hour':
-            hour_data = [
-                {'hour': h, 'scada1': s1, 'supply1': p1, 'scada2': s2, 'supply2': p2}
-                for h, s1, p1, s2, p2 in zip(common_hours, scada1, supply1, scada2, supply2)
-            ]
-            aggregated = aggregate_multiple_fields(
-                hour_data, aggregation, ['scada1', 'supply1', 'scada2', 'supply2']
-            )
+            aggregated = aggregate_arrays_by_period(common_hours, aggregation, {
+                'scada1': scada1, 'supply1': supply1, 'scada2': scada2, 'supply2': supply2,
+            })
+            aggregated = {field: values.tolist() for field, values in aggregated.items()}
             periods = aggregated['periods']
             scada1, supply1 = aggregated['scada1'], aggregated['supply1']
             scada2, supply2 = aggregated['scada2'], aggregated['supply2']
         else:
             periods = common_hours
 
-        worksheet.title = 'Tech Group Comparison'
-
         tech1_names = ', '.join(list(technologies1.values_list('technology_name', flat=True)))
         tech2_names = ', '.join(list(technologies2.values_list('technology_name', flat=True)))
 
@@ -1001,54 +1065,31 @@ def export_generation_comparison_to_excel(request):
             f'Group 2 SCADA ({tech2_names})',
             f'Group 2 Simulated ({tech2_names})'
         ]
-        worksheet.append(headers)
-
-        for i, period in enumerate(periods):
-            worksheet.append([period, scada1[i], supply1[i], scada2[i], supply2[i]])
+        data_sheet = ExportSheet('Tech Group Comparison', headers, [periods, scada1, supply1, scada2, supply2])
 
         # Add metrics sheet
-        metrics_sheet = workbook.create_sheet('Metrics')
         corr1 = calculate_correlation_metrics(scada1, supply1)
         error1 = calculate_error_metrics(scada1, supply1)
         corr2 = calculate_correlation_metrics(scada2, supply2)
         error2 = calculate_error_metrics(scada2, supply2)
 
-        metrics_sheet.append(['Metric', 'Group 1', 'Group 2'])
-        metrics_sheet.append(['Technologies', tech1_names, tech2_names])
-        metrics_sheet.append(['Facility Count', count1, count2])
-        metrics_sheet.append(['Year', year, year])
-        metrics_sheet.append(['Data Points', len(periods), len(periods)])
-        metrics_sheet.append([''])
-        metrics_sheet.append(['Correlation', corr1.get('correlation', '-'), corr2.get('correlation', '-')])
-        metrics_sheet.append(['MAE', error1.get('mae', '-'), error2.get('mae', '-')])
-        metrics_sheet.append(['RMSE', error1.get('rmse', '-'), error2.get('rmse', '-')])
-        metrics_sheet.append(['MBE', error1.get('mbe', '-'), error2.get('mbe', '-')])
-        metrics_sheet.append(['MAPE', error1.get('mape', '-'), error2.get('mape', '-')])
+        metrics_sheet = sheet_from_rows('Metrics', [
+            ['Metric', 'Group 1', 'Group 2'],
+            ['Technologies', tech1_names, tech2_names],
+            ['Facility Count', count1, count2],
+            ['Year', year, year],
+            ['Data Points', len(periods), len(periods)],
+            [''],
+            ['Correlation', corr1.get('correlation', '-'), corr2.get('correlation', '-')],
+            ['MAE', error1.get('mae', '-'), error2.get('mae', '-')],
+            ['RMSE', error1.get('rmse', '-'), error2.get('rmse', '-')],
+            ['MBE', error1.get('mbe', '-'), error2.get('mbe', '-')],
+            ['MAPE', error1.get('mape', '-'), error2.get('mape', '-')],
+        ])
 
         filename = f"generation_comparison_techgroups_{year}"
 
     else:
         return JsonResponse({'error': 'Invalid export type'}, status=400)
 
-    # Auto-size columns for all sheets
-    for sheet in workbook.worksheets:
-        for column_cells in sheet.columns:
-            max_length = 0
-            column = column_cells[0].column_letter
-            for cell in column_cells:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            sheet.column_dimensions[column].width = adjusted_width
-
-    # Create response
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
-    workbook.save(response)
-
-    return response
+    return export_response(export_format, [data_sheet, metrics_sheet], filename)
@@ -3,6 +3,11 @@ from django.utils.safestring import mark_safe
 import plotly.graph_objs as go
 from plotly.offline import plot
 
+from ..services.data_versions import plot_surface_version
+from ..services.plot_surfaces import HOURS_PER_DAY, PRICE_INTERVALS, PlotSurfaceService
+from ..services.response_cache import versioned_view
+
+@versioned_view(plot_surface_version)
 def wem_price_history(request):
     # Initialise data
     html_content = mark_safe("""
@@ -39,471 +44,28 @@ def wem_price_history(request):
     reduce shortage risk, though current incentives may not drive investment
     """)
     
-    z1_values = [
-    [109.35,108.43,104.12,105.0,85.02,78.42,81.5,78.99,152.06,74.19,85.54,122.24,322.5,311.81,323.0,323.0,322.5,322.5,270.44,254.14,240.52,160.03,202.56,86.44,95.5,116.83,82.12,83.1,82.19,203.02,323.0,154.51,255.26,286.25,323.0,323.0,323.0,170.11,121.77,129.33,322.5,322.5,322.5,258.8,80.25,73.24,83.04,122.81],
-    [74.88,78.0,77.75,73.45,82.4,82.4,82.4,83.39,82.4,62.85,61.05,87.45,276.6,319.42,323.0,322.5,131.92,122.75,108.16,102.56,99.62,86.26,85.69,88.4,92.62,98.07,85.64,90.93,85.33,85.33,82.4,103.13,108.16,109.49,117.02,182.96,153.6,138.01,131.67,133.45,114.71,95.3,82.4,98.01,62.03,60.94,82.4,69.54],
-    [61.03,60.1,60.5,60.67,60.44,60.58,63.26,63.13,59.81,59.47,58.89,62.89,60.85,98.1,203.38,203.39,112.06,115.66,78.87,78.87,74.6,58.5,58.5,58.5,58.73,58.49,57.99,57.99,58.77,59.14,62.64,62.64,62.64,73.21,84.99,100.4,258.85,323.0,260.1,261.68,238.53,81.22,206.68,72.77,64.55,59.04,60.35,59.39],
-    [58.54,58.37,58.8,59.07,59.2,59.23,59.17,59.03,62.65,64.52,61.05,66.38,71.67,71.12,80.08,89.03,75.25,84.42,89.3,77.02,70.99,72.47,70.99,69.45,67.53,63.99,63.72,67.53,67.06,75.3,69.67,71.43,75.69,86.59,86.59,86.59,86.59,107.21,99.79,84.69,77.93,70.68,59.9,60.55,60.58,58.45,58.73,59.45],
-    [58.03,57.76,54.91,57.92,57.92,57.92,57.92,57.92,58.07,58.01,63.21,70.6,72.22,71.32,79.66,82.89,72.42,78.51,94.96,77.25,83.35,83.66,80.64,82.22,77.21,81.4,79.74,81.13,83.84,82.26,79.97,79.92,80.14,78.51,78.51,78.51,75.79,75.79,103.46,76.48,71.34,71.34,55.19,54.41,56.38,54.5,54.56,58.11],
-    [64.14,65.2,65.59,64.1,63.55,63.58,63.64,62.74,63.82,71.85,73.99,114.95,135.06,82.03,297.75,244.74,115.78,109.69,101.1,103.92,107.87,94.27,110.15,110.85,111.75,106.35,106.44,108.57,107.57,84.54,86.13,88.74,114.24,111.57,108.53,106.14,106.95,104.32,109.74,104.32,112.86,280.43,203.64,112.32,76.9,70.27,80.29,128.66],
-    [72.53,74.73,68.01,69.05,63.53,63.53,65.6,63.57,63.62,65.6,65.6,63.86,64.15,68.59,112.61,90.44,117.03,277.96,106.66,112.53,113.77,115.0,108.87,114.31,113.36,106.52,300.43,220.0,220.0,210.0,322.5,322.5,323.0,323.0,322.5,323.0,247.31,124.69,271.4,322.5,110.2,206.55,93.39,87.99,69.05,70.2,67.02,69.05],
-    [75.98,72.15,66.1,60.89,60.62,182.78,143.37,102.02,74.11,70.72,99.35,100.0,167.67,150.0,244.45,258.47,322.5,275.47,273.29,279.26,276.04,277.79,235.59,220.0,220.0,220.0,220.0,250.0,220.0,220.0,220.0,250.0,279.52,322.5,322.5,322.5,318.92,268.84,306.47,253.76,116.77,108.54,287.29,88.72,72.85,70.72,68.44,64.66],
-    [57.85,57.99,54.16,51.1,51.32,51.45,51.37,51.1,50.77,50.94,50.49,50.27,49.93,52.15,69.17,68.0,70.54,85.33,69.17,71.14,69.17,69.17,69.17,69.17,66.68,69.17,73.22,88.32,83.95,111.77,109.97,116.13,124.04,121.11,113.14,103.58,97.01,85.33,85.57,75.8,74.48,69.17,69.17,69.17,61.96,59.32,59.72,57.66],
-    [52.99,53.05,53.21,53.34,53.45,53.54,52.83,53.54,53.45,53.39,53.34,62.71,58.53,66.31,57.22,65.03,65.56,64.66,65.3,63.97,63.46,65.67,69.17,69.17,80.58,112.81,100.3,105.23,86.19,93.31,116.89,113.83,107.71,120.44,88.07,111.17,112.55,113.41,104.17,76.75,69.17,65.67,62.15,56.32,57.24,56.51,53.54,51.99],
-    [53.91,54.42,54.91,55.22,52.03,53.1,53.1,52.25,52.07,53.56,53.58,54.35,54.35,55.57,66.72,65.67,56.41,59.03,56.58,56.66,56.74,50.58,55.57,54.35,50.36,50.11,51.28,51.26,52.69,53.81,54.35,56.3,57.51,60.93,69.91,90.93,99.42,73.24,65.67,62.25,65.67,60.52,55.25,50.19,55.69,55.57,53.47,53.63],
-    [55.57,54.57,54.09,54.21,54.35,55.42,54.35,55.34,55.3,55.12,56.98,65.67,65.67,65.67,96.28,79.17,65.67,65.67,62.25,62.25,55.57,54.35,54.12,54.12,49.93,55.02,54.35,54.35,55.15,55.57,60.51,58.55,62.25,72.2,225.3,233.26,122.12,110.87,88.45,86.64,81.46,65.67,65.67,59.68,52.8,52.73,52.61,51.79],
-    [62.19,62.19,63.94,64.05,62.19,64.61,64.77,64.63,64.41,64.57,64.5,69.61,87.97,104.35,235.15,116.59,121.78,121.19,89.0,90.9,78.32,69.96,71.05,73.04,73.04,88.5,83.59,89.29,75.72,81.55,111.98,114.39,113.47,241.41,287.66,301.25,273.15,129.97,129.55,131.04,132.37,129.64,119.71,107.38,64.16,64.16,61.73,62.12],
-    [64.16,62.6,62.69,63.01,62.38,62.55,63.65,63.76,63.78,64.56,64.16,64.16,91.16,97.38,121.34,111.47,116.18,118.6,121.5,113.93,112.11,113.73,113.73,113.76,113.75,113.75,113.75,114.54,114.94,114.94,114.16,113.75,113.75,112.66,117.61,130.56,140.75,131.71,125.08,127.67,110.11,99.12,71.74,63.6,68.2,61.49,62.17,64.16],
-    [61.95,57.93,57.95,56.71,55.53,58.03,58.05,58.05,58.16,60.14,62.77,64.16,69.08,68.53,92.18,69.07,108.2,99.04,98.16,92.72,94.88,87.0,86.44,86.44,86.44,83.26,75.02,73.7,70.08,85.49,80.23,81.13,80.38,93.82,111.43,108.21,126.42,304.5,125.06,116.73,107.17,66.41,69.25,91.72,81.81,58.54,60.1,61.55],
-    [65.62,65.62,62.74,60.86,64.68,65.57,65.62,65.62,65.62,78.38,91.05,94.37,101.31,110.03,111.38,113.4,96.53,109.08,109.08,112.65,112.86,113.7,114.32,114.96,72.73,91.51,72.53,72.26,73.93,105.86,105.93,112.29,109.88,108.2,112.46,123.97,128.4,136.93,126.62,117.25,113.39,113.96,99.95,94.63,61.73,59.1,60.7,65.62],
-    [61.08,58.88,60.58,57.25,56.57,55.53,55.53,56.02,56.34,56.5,57.25,57.97,64.76,72.06,64.16,65.75,65.12,66.33,84.45,112.23,84.0,84.45,112.92,112.41,111.65,111.38,110.63,110.83,111.29,114.5,116.14,167.49,120.9,120.9,120.73,118.28,117.56,120.02,121.94,128.62,114.47,89.77,72.47,65.02,66.13,66.13,65.62,58.12],
-    [60.7,59.79,60.58,59.8,59.83,60.7,60.7,59.83,60.7,62.09,60.58,60.7,63.05,83.12,64.5,64.16,106.89,112.97,100.89,100.87,109.31,113.32,105.56,115.56,114.02,117.95,109.22,112.79,105.71,89.87,121.19,124.32,113.08,115.79,115.7,122.83,110.86,97.24,89.18,107.99,106.73,108.11,94.31,78.98,79.54,64.98,64.86,60.7],
-    [66.85,64.24,65.1,65.52,66.14,67.41,68.04,68.13,64.88,60.9,56.5,60.3,60.58,63.35,68.65,73.78,67.12,79.37,84.95,92.82,94.36,103.4,108.64,114.3,115.26,114.17,117.92,115.28,113.7,117.02,120.22,118.56,118.98,122.33,120.31,118.4,112.72,112.9,112.19,117.83,111.08,113.42,112.24,113.23,82.94,79.37,74.56,68.19],
-    [63.37,61.69,60.07,60.07,52.48,52.7,52.83,57.25,52.66,52.57,53.33,57.0,60.75,61.69,64.6,67.58,78.11,68.22,80.88,93.6,103.18,105.49,104.76,106.19,107.22,110.1,118.72,113.03,118.75,139.07,136.99,232.53,139.05,198.31,157.94,125.73,118.13,115.07,115.58,116.66,107.6,93.5,82.13,69.92,65.7,64.7,61.99,62.73],
-    [62.79,55.48,55.41,57.49,53.35,54.52,57.49,57.49,60.05,61.05,62.21,62.95,67.64,67.99,69.21,69.17,72.59,92.38,92.9,92.6,90.4,99.44,101.73,108.31,104.84,113.95,110.21,119.09,119.28,118.79,119.7,121.23,122.83,123.95,123.41,123.41,120.34,126.21,120.0,105.4,105.4,91.62,77.57,68.2,62.58,60.92,62.69,62.04],
-    [67.12,62.19,63.24,67.64,69.3,67.64,67.64,67.64,67.64,67.64,67.64,69.08,69.23,69.43,91.7,74.88,69.14,69.08,72.94,69.26,69.28,69.45,69.3,79.24,73.25,93.54,105.81,107.01,112.99,116.75,114.63,122.06,120.26,116.28,112.54,119.98,117.38,109.42,107.01,107.01,88.74,72.99,73.16,73.91,67.64,67.64,69.19,67.32],
-    [67.44,67.35,67.64,67.12,65.35,67.12,63.25,56.9,61.13,67.35,67.13,92.38,92.05,108.31,105.86,105.64,97.61,98.88,99.96,94.49,92.27,72.05,100.0,100.79,70.16,98.88,79.66,70.2,70.53,74.53,93.49,100.0,99.34,110.54,135.86,304.5,304.5,304.5,236.84,133.19,106.1,95.82,75.78,71.69,71.35,70.77,65.24,60.53],
-    [243.62,243.62,243.62,243.62,243.62,243.63,243.63,243.64,243.64,243.64,305.0,243.62,243.63,243.62,243.62,128.68,110.41,122.27,118.37,107.13,105.57,110.5,112.49,113.08,114.48,114.49,111.16,114.4,109.09,124.34,124.34,233.78,232.77,233.62,305.0,305.0,143.01,305.0,145.77,141.87,132.28,234.23,243.62,120.96,240.79,108.34,94.56,91.5],
-    [97.21,82.78,79.15,70.6,72.04,64.03,64.94,67.2,71.63,76.6,89.09,104.8,127.94,120.97,130.59,129.94,255.39,251.92,252.12,112.96,111.86,111.67,111.44,82.46,82.17,79.97,82.96,88.83,98.45,98.13,116.08,112.71,113.17,114.04,117.96,203.71,131.88,133.24,132.97,134.28,122.46,121.42,119.06,120.95,121.48,112.46,103.93,101.15],
-    [50.73,48.1,45.64,43.47,43.54,41.1,41.09,45.62,45.9,48.39,52.64,60.04,76.46,89.85,102.64,100.6,107.25,105.55,95.9,104.6,92.75,91.21,95.55,100.72,98.27,95.91,94.17,92.96,91.27,89.99,90.66,90.02,87.84,94.18,89.69,114.09,127.94,117.18,104.09,105.25,105.99,104.26,87.75,93.42,85.58,55.1,53.37,50.81],
-    [35.74,35.04,35.29,35.37,35.43,35.44,35.44,35.44,35.44,35.41,38.13,42.11,57.94,71.5,81.85,81.5,73.43,79.71,86.11,86.55,80.72,86.22,81.64,83.09,81.61,90.61,91.15,90.7,91.76,82.87,69.01,84.35,96.01,96.01,84.44,105.91,114.7,115.34,95.39,73.79,83.33,67.33,64.96,52.49,37.89,39.07,37.44,35.05],
-    [36.59,35.02,34.98,35.11,35.86,35.27,35.22,34.87,35.24,35.71,36.87,42.37,62.79,61.38,82.23,92.43,68.15,80.97,60.98,76.18,60.86,39.92,63.35,43.37,49.02,54.28,49.02,49.02,48.22,50.67,77.61,87.47,86.69,88.78,87.08,86.0,106.18,103.19,103.65,100.6,86.59,61.79,48.25,34.59,57.38,38.69,39.17,35.97],
-    [52.99,46.41,46.74,44.48,52.68,47.26,47.36,47.29,62.04,77.11,59.35,81.32,85.02,74.73,89.13,92.07,80.49,80.32,85.7,85.97,84.21,81.22,87.73,92.98,61.5,74.48,87.35,91.22,92.74,88.75,88.42,89.22,87.88,89.45,89.46,111.51,110.06,99.52,98.27,94.06,95.89,91.2,83.11,72.37,92.89,66.12,82.69,74.06],
-    [35.07,34.79,35.38,35.71,34.77,34.8,35.04,35.71,35.52,35.59,35.51,35.2,35.26,38.38,44.15,46.45,43.86,43.37,50.3,63.49,59.73,64.03,63.43,46.3,55.03,67.11,53.23,58.58,72.05,73.04,67.64,80.38,81.42,83.29,79.34,64.47,63.98,57.79,59.42,63.05,77.87,58.61,37.99,33.22,33.41,33.67,34.15,34.21],
-    [119.98,81.09,80.08,49.16,45.9,46.02,44.29,44.29,39.48,39.9,41.93,44.04,54.09,65.93,91.26,78.78,261.02,261.02,261.02,265.31,261.02,199.0,91.88,245.49,229.25,87.11,92.33,195.26,190.54,195.25,195.26,195.43,330.0,330.0,330.0,330.0,330.0,330.0,330.0,330.0,330.0,330.0,330.0,330.0,261.02,299.1,330.0,256.51],
-    [94.85,51.96,54.13,43.93,38.62,37.99,37.21,37.15,37.99,44.09,44.19,44.29,61.76,62.59,75.89,94.85,216.65,217.23,326.7,252.46,225.64,228.38,221.63,164.32,159.73,195.26,192.31,190.76,190.52,189.99,194.8,193.58,197.05,195.26,199.57,106.98,107.93,104.93,107.59,103.54,207.06,313.75,196.48,200.33,181.26,139.69,55.03,54.13],
-    [56.17,51.27,51.32,42.02,42.08,42.12,38.31,42.1,42.1,40.7,41.22,41.48,41.47,42.49,46.42,54.13,73.52,80.11,78.86,68.72,79.9,84.28,77.42,82.96,75.06,84.22,86.49,93.56,86.01,88.54,95.79,197.09,195.79,195.24,105.24,106.35,108.6,103.14,103.82,97.49,92.19,80.62,67.95,67.98,44.78,44.78,51.22,56.2],
-    [58.19,61.39,59.27,62.03,63.7,62.69,39.67,39.67,44.29,63.02,54.85,56.35,60.32,62.51,90.98,90.54,56.35,71.2,46.08,43.81,46.5,46.06,46.19,45.03,43.69,47.23,59.73,50.82,54.95,63.44,91.87,93.56,115.06,107.31,119.24,120.4,119.79,125.25,122.96,107.03,80.08,59.32,67.74,47.75,49.14,43.51,54.81,57.79],
-    [53.22,53.97,55.64,43.51,43.3,43.3,43.3,43.45,43.38,44.63,44.26,44.32,78.28,81.31,107.24,109.74,111.54,108.23,77.95,75.32,72.83,49.49,53.43,56.09,69.31,75.56,80.61,81.05,79.94,52.26,60.7,78.19,101.38,94.53,118.54,119.14,126.82,124.8,128.26,117.87,110.37,96.29,74.66,69.03,71.12,78.05,67.99,55.0],
-    [43.02,40.25,40.07,39.29,38.6,38.69,38.74,38.78,38.73,39.18,40.36,48.57,57.46,75.57,110.25,145.07,77.46,58.51,51.76,64.87,55.74,51.96,47.21,48.18,47.7,46.71,47.93,47.82,47.91,47.14,50.89,61.68,76.77,99.41,330.0,125.4,150.91,143.36,140.83,139.51,130.64,95.03,70.93,68.55,62.21,44.78,43.93,43.93],
-    [43.65,42.77,39.13,38.94,39.11,44.0,44.0,39.06,39.06,45.91,52.87,68.85,79.42,80.28,92.11,102.19,103.84,92.15,78.88,77.3,70.63,83.41,75.8,62.1,63.82,46.17,46.21,45.73,52.18,52.39,51.05,63.03,81.99,86.16,124.94,195.91,140.87,142.09,114.43,110.79,110.86,89.96,89.09,73.88,59.27,63.92,48.86,45.22],
-    [40.49,40.59,38.97,39.19,38.65,38.69,38.78,38.98,38.81,40.61,46.71,47.86,59.71,87.36,126.6,166.1,160.19,137.98,123.04,109.84,90.85,74.12,83.06,94.59,104.37,94.82,85.28,59.09,78.74,89.0,90.0,76.67,101.85,98.5,127.61,168.47,178.11,163.64,143.62,139.01,142.07,127.3,116.99,96.92,75.27,63.49,46.21,41.11],
-    [46.0,45.5,45.5,39.38,39.38,38.65,39.38,39.34,39.35,39.41,40.47,42.17,47.78,61.56,69.55,82.07,91.48,79.67,62.91,61.96,64.14,59.0,61.64,61.6,63.37,59.58,60.26,60.35,62.12,64.19,86.42,79.28,111.6,82.21,131.53,146.4,170.26,172.3,147.64,135.41,121.43,113.7,70.99,65.07,54.21,40.13,39.4,39.23],
-    [74.39,75.58,79.08,81.32,81.36,51.84,79.99,70.58,78.02,80.44,77.31,85.82,86.69,167.93,166.68,165.66,179.3,194.39,209.1,209.33,209.33,204.08,206.02,100.56,89.41,95.45,87.05,92.39,89.39,94.77,91.19,109.02,116.28,202.92,123.42,200.85,199.74,199.57,199.57,200.51,200.46,203.06,201.43,86.09,89.17,84.26,77.74,75.65],
-    [81.91,85.58,79.89,83.63,92.25,92.22,92.22,92.27,92.25,89.01,71.89,68.19,68.23,149.74,88.79,191.59,169.59,217.0,215.14,216.54,217.25,210.97,204.93,99.62,93.78,100.68,104.37,105.76,106.85,106.85,111.8,110.41,108.64,105.71,112.06,118.64,118.64,127.2,127.2,131.23,126.54,117.06,90.67,91.01,75.33,95.36,85.64,83.83],
-    [79.15,67.96,68.82,162.67,60.84,61.2,60.94,60.37,60.74,61.12,61.85,57.88,51.12,55.67,148.14,148.28,66.88,96.78,99.14,100.3,86.03,91.6,102.63,122.69,150.87,177.85,95.72,98.01,106.0,102.44,123.08,122.76,113.21,110.0,116.22,134.44,112.33,127.05,118.99,136.19,126.92,106.66,82.79,90.75,87.31,92.86,83.15,69.93],
-    [67.83,47.55,45.05,43.02,44.02,43.03,43.02,43.03,45.02,49.12,49.45,49.53,50.28,53.44,81.95,90.43,123.54,138.89,134.9,127.16,100.28,106.14,108.47,123.89,142.52,117.24,122.16,126.79,228.11,228.23,141.08,155.24,161.72,173.35,138.99,134.87,124.51,118.43,133.18,141.97,110.34,109.54,153.47,98.97,82.05,125.13,82.58,71.97],
-    [50.53,50.81,51.45,49.05,52.06,49.4,46.21,45.88,48.57,46.15,44.4,48.25,48.88,49.57,61.72,71.73,78.65,94.46,95.48,91.6,94.11,87.81,75.23,91.0,97.83,94.83,95.72,84.99,78.65,78.35,78.65,81.96,92.74,95.86,101.81,99.4,87.58,82.69,78.65,78.65,94.56,81.81,86.43,71.6,62.83,53.75,46.37,51.59],
-    [82.67,58.0,46.21,43.43,44.67,44.11,44.18,43.69,43.75,43.74,43.77,43.26,42.45,46.25,81.1,81.21,71.59,68.22,88.3,77.99,76.27,109.6,105.37,105.54,107.43,103.97,103.16,111.83,168.19,111.35,110.76,114.55,114.15,119.6,109.51,111.67,111.67,120.46,109.34,110.8,117.06,112.22,110.44,88.95,153.89,92.99,53.87,62.98],
-    [46.62,46.21,80.87,62.03,80.0,76.15,78.65,78.25,80.51,86.49,80.19,79.22,90.33,101.11,98.1,102.08,119.53,117.16,118.55,116.22,112.96,108.37,123.86,124.5,109.15,107.93,106.54,105.04,96.95,97.27,96.47,100.72,104.09,125.25,141.48,146.89,142.88,157.5,140.66,129.1,153.65,100.73,94.91,90.79,84.95,65.71,55.94,60.57],
-    [84.68,81.57,88.69,85.27,71.87,96.27,88.54,95.36,73.68,86.38,86.73,95.6,120.92,183.0,185.98,200.96,184.35,147.26,103.5,140.84,101.07,112.92,90.31,106.07,105.63,104.18,101.01,100.22,100.22,100.81,89.13,98.78,118.18,120.58,195.0,205.17,209.9,167.12,144.52,121.47,149.63,147.83,130.21,113.91,101.09,95.46,90.35,85.93],
-    [55.89,54.16,54.16,54.16,54.23,54.16,54.21,51.0,54.16,55.94,65.36,79.71,115.32,128.92,174.66,191.39,162.05,150.07,138.82,130.56,129.38,102.98,102.16,107.39,108.17,90.0,82.23,95.71,97.9,97.24,97.66,99.24,130.6,177.05,163.21,205.08,219.21,196.13,165.44,146.12,152.36,133.96,120.87,118.97,102.63,95.41,95.41,55.94],
-    [43.64,43.78,43.81,39.58,38.73,41.91,39.68,39.29,42.04,44.52,44.53,47.28,63.4,117.55,183.21,208.38,236.16,193.85,138.66,132.68,104.09,82.93,99.83,90.4,89.19,87.33,119.46,119.79,114.93,123.1,122.38,119.6,163.08,132.85,184.33,239.16,240.0,232.75,193.69,185.71,151.05,138.58,132.51,109.13,93.42,80.76,44.22,44.09],
-    [43.87,44.23,44.17,43.52,41.97,42.39,40.51,40.51,41.3,42.59,83.42,147.76,157.16,172.08,193.15,209.47,196.04,218.7,177.89,177.33,156.02,147.9,144.56,144.94,153.18,144.6,149.09,145.84,144.83,122.45,121.57,169.11,149.51,160.92,192.93,240.0,240.0,240.0,240.0,240.0,219.07,181.29,182.74,158.06,154.52,71.96,53.09,60.23],
-    [100.18,109.32,77.18,76.89,81.39,76.89,76.89,76.89,76.89,76.89,77.18,109.07,120.57,197.95,219.89,218.47,149.19,137.32,141.57,88.87,87.7,88.85,88.85,115.76,89.05,90.93,91.22,88.85,77.83,96.93,143.42,146.04,154.67,129.05,240.0,240.0,240.0,240.0,223.97,205.22,202.61,213.66,180.48,152.22,156.86,112.12,121.87,92.42],
-    [44.64,44.28,44.67,44.7,44.91,44.98,44.85,44.48,55.18,55.72,78.18,96.02,76.77,86.54,87.14,146.93,129.27,168.71,180.2,163.57,156.44,129.61,78.98,78.98,74.04,60.98,69.14,77.15,77.15,87.91,81.75,84.25,124.93,131.86,124.38,142.02,143.88,180.05,177.75,160.19,146.22,123.28,148.54,93.67,82.75,74.12,61.31,55.54],
-    [77.89,77.89,77.89,83.78,83.78,83.78,77.65,77.67,66.26,83.79,77.65,77.65,130.99,78.67,80.89,84.49,101.5,82.43,94.78,81.55,127.96,82.06,135.52,82.06,82.06,83.92,84.06,86.69,98.0,117.96,116.01,177.43,131.41,142.55,142.67,143.37,144.24,135.95,105.21,111.85,91.48,90.2,85.73,78.63,77.65,79.95,115.67,93.09],
-    [41.32,41.1,40.76,41.15,53.42,53.42,69.23,43.64,69.23,69.23,69.23,58.7,141.63,69.23,142.08,140.94,116.99,97.84,82.26,112.84,99.98,101.04,104.92,121.62,138.8,143.02,168.64,181.57,170.8,173.56,124.47,119.99,126.74,155.99,167.44,123.1,120.88,120.88,122.89,122.29,152.1,106.25,90.88,84.56,82.44,48.53,51.35,48.6],
-    [82.31,84.35,75.77,77.78,84.34,44.13,44.53,44.79,55.54,114.68,81.98,44.42,54.78,65.96,77.34,77.34,84.12,112.92,143.43,139.55,130.85,158.32,155.42,157.69,154.58,162.21,186.99,189.86,192.43,199.56,204.71,203.03,194.12,208.03,194.18,197.04,192.86,205.66,193.85,173.36,182.86,167.0,161.67,121.94,92.85,85.04,80.4,91.03],
-    [85.7,45.38,44.63,44.84,58.01,45.54,45.5,45.23,45.22,45.25,145.93,118.87,108.97,81.64,106.32,97.92,107.02,179.05,198.76,188.17,169.21,122.12,119.78,146.71,155.71,173.01,169.17,142.16,172.26,184.76,186.87,195.22,185.44,194.82,198.31,190.38,176.85,169.85,196.1,185.81,122.36,173.43,129.42,95.47,98.48,90.46,80.73,68.66],
-    [80.49,75.98,61.85,59.39,49.79,57.38,45.46,73.31,73.31,73.31,159.83,124.89,100.68,79.64,171.24,205.34,161.04,134.07,156.63,158.9,155.88,153.08,154.08,139.51,126.19,140.07,151.36,139.24,155.35,161.76,168.96,169.11,163.74,222.78,186.46,203.42,202.53,183.93,145.08,196.86,142.86,147.39,110.57,99.94,138.66,113.28,91.59,80.27],
-    [44.52,43.87,43.1,43.07,41.42,41.38,41.38,40.87,43.65,42.11,43.56,44.07,59.73,65.04,82.34,88.91,102.4,93.58,87.01,79.63,80.25,57.51,60.24,82.73,82.73,76.52,78.61,88.76,91.7,91.7,191.07,115.88,92.71,137.93,127.06,165.61,212.27,200.35,180.13,123.87,145.41,93.26,76.36,58.5,45.6,44.5,43.59,44.46],
-    [64.14,57.24,49.96,46.07,48.04,45.13,46.78,48.15,49.69,72.94,93.23,119.79,240.0,240.0,240.0,228.73,207.44,177.68,155.3,127.65,102.94,97.0,83.79,82.61,89.94,85.87,85.87,83.79,87.41,89.85,140.04,175.96,240.0,198.77,195.73,208.82,200.56,181.49,178.48,170.61,154.12,193.94,98.4,101.76,97.33,89.45,89.41,77.01],
-    [86.89,76.24,76.24,76.24,76.24,76.24,76.24,76.18,76.24,84.29,97.65,111.29,145.37,173.17,212.59,216.11,218.27,217.62,160.26,103.55,126.64,119.34,91.26,88.74,88.12,91.3,88.74,93.61,88.5,97.87,101.27,127.89,171.3,186.84,228.25,234.05,215.91,203.72,133.34,215.95,184.15,135.34,130.03,161.25,133.74,90.76,97.38,85.77],
-    [146.89,121.51,95.39,87.56,107.62,107.62,97.93,98.98,101.3,107.62,145.82,136.28,130.11,140.79,169.2,198.8,202.09,206.62,202.33,177.45,166.67,200.83,205.94,164.01,174.33,194.61,189.5,189.46,195.8,186.76,178.67,156.67,141.98,164.04,197.25,198.48,194.74,193.07,193.07,163.33,150.06,150.93,164.85,135.65,141.99,134.89,126.15,138.85],
-    [100.47,81.07,81.07,81.07,55.67,55.88,74.22,80.36,83.44,107.62,172.18,150.25,128.5,133.66,189.59,192.61,187.54,173.12,173.18,177.18,179.12,155.66,156.77,148.9,136.9,127.29,130.47,112.73,155.29,130.0,112.83,125.0,133.42,154.08,197.44,191.14,193.01,203.15,199.17,189.7,186.34,161.52,134.57,154.42,132.01,136.79,167.4,107.62],
-    [156.3,138.8,124.54,108.66,114.24,117.35,116.91,107.62,107.62,131.99,131.14,135.38,155.41,153.48,173.32,176.2,170.52,160.33,154.92,154.63,151.11,163.01,160.96,218.02,200.85,145.28,136.97,158.62,161.63,164.8,147.71,144.89,153.58,173.92,166.39,172.83,183.76,184.68,198.21,198.64,193.5,185.23,164.46,154.43,148.86,129.13,118.23,106.94],
-    [128.98,107.62,107.62,107.62,107.62,121.8,115.85,107.94,108.06,111.67,105.66,90.73,165.21,168.28,164.74,165.65,141.25,146.64,142.45,147.29,136.82,181.03,100.97,92.95,92.95,129.28,81.68,92.95,64.36,69.19,105.52,140.15,125.65,174.05,190.41,205.87,212.28,213.37,211.18,202.36,187.47,184.24,183.45,89.41,167.82,148.24,155.28,107.62],
-    [141.67,138.23,126.71,130.02,140.07,139.1,135.51,138.13,140.12,155.47,173.21,156.82,183.24,148.9,164.92,156.86,140.7,141.05,141.83,155.63,169.33,173.55,207.25,151.54,155.66,173.36,148.7,156.28,145.85,168.89,171.15,156.72,171.07,197.57,194.1,187.44,181.57,176.01,182.86,185.54,171.75,174.08,170.12,159.01,193.55,160.55,169.63,156.76],
-    [86.97,62.28,46.85,55.67,45.12,44.98,44.96,44.91,44.4,44.89,67.9,55.67,92.99,121.06,150.8,160.7,151.38,177.21,183.34,189.45,158.04,162.98,165.94,176.17,186.41,193.66,180.65,170.21,150.89,159.54,156.87,163.57,166.18,164.49,179.01,179.01,172.0,175.85,133.8,134.84,116.0,143.59,113.55,88.24,125.35,80.73,113.11,71.75],
-    [42.05,42.25,43.46,41.42,40.54,39.45,39.63,39.45,40.04,39.59,40.36,42.45,45.08,44.76,45.12,45.14,65.44,45.28,110.55,45.22,45.05,45.06,55.67,160.34,235.04,269.07,268.71,268.28,269.38,268.15,262.34,150.07,161.52,187.65,195.38,197.44,184.15,185.93,200.15,200.17,160.17,124.81,88.93,88.93,81.86,55.67,44.15,40.28],
-    [78.3,55.3,44.02,43.93,40.38,42.26,43.46,40.24,42.16,44.51,45.11,54.84,81.91,68.68,115.79,115.85,90.84,88.93,90.0,88.98,95.77,88.98,88.93,78.32,81.75,71.82,83.04,88.93,101.33,156.38,137.29,138.6,161.63,135.07,160.23,156.43,107.23,127.86,126.97,128.19,107.55,90.2,98.23,98.23,86.7,88.93,55.67,45.1],
-    [67.21,60.42,52.5,45.3,45.71,44.81,45.28,45.6,45.58,45.64,59.08,67.17,88.93,102.84,120.55,128.94,125.7,113.32,108.98,114.49,95.81,91.08,91.64,92.95,92.2,116.3,113.64,163.1,169.19,243.38,242.14,174.83,188.62,189.26,176.39,177.02,144.68,146.38,143.96,137.13,139.84,167.57,98.76,88.93,104.7,90.92,88.93,77.65],
-    [47.19,47.98,48.17,48.17,46.07,46.07,42.85,42.85,42.85,46.88,45.66,45.74,62.15,68.27,91.4,85.31,82.14,100.64,88.93,81.8,79.85,82.93,82.14,88.47,79.85,87.95,97.45,97.45,103.4,110.33,104.96,103.81,145.23,110.33,117.75,126.32,141.65,185.13,110.75,90.65,101.44,88.66,81.26,55.67,67.75,52.06,46.97,46.35],
-    [41.49,47.84,51.85,45.97,40.88,40.88,40.88,40.88,40.88,40.7,44.4,58.21,87.91,102.06,115.75,146.72,94.47,94.47,93.56,90.65,121.03,123.01,92.95,92.95,92.95,92.95,88.93,86.89,74.03,110.75,65.19,82.42,85.75,88.93,115.78,155.34,123.67,105.56,88.93,105.23,88.93,88.93,102.16,83.75,86.42,64.83,50.17,47.26],
-    [107.34,92.94,84.07,83.75,89.78,84.23,89.31,107.62,101.84,150.37,149.85,159.05,136.54,146.33,178.87,144.14,121.59,126.37,205.28,179.5,240.26,238.11,238.06,269.34,268.76,268.92,126.98,105.86,117.76,93.23,91.91,160.42,170.1,145.61,210.52,173.31,190.92,187.64,147.66,152.15,185.65,168.17,117.36,137.99,161.1,159.34,150.95,129.33],
-    [56.86,55.14,56.17,54.86,45.93,45.95,45.82,50.17,55.14,72.58,107.35,68.86,113.12,95.17,110.25,126.7,103.26,89.97,79.84,80.29,87.67,80.58,57.93,66.68,79.1,79.86,80.19,80.22,55.14,92.71,132.4,153.27,152.36,135.8,165.8,175.59,161.4,139.23,166.01,151.4,126.04,166.3,108.55,150.44,110.11,101.33,86.3,66.14],
-    [88.1,88.1,88.1,87.01,91.38,91.38,96.73,96.73,96.73,96.57,96.57,97.52,172.62,149.48,185.09,196.53,195.04,191.3,175.03,158.32,109.81,99.13,99.13,96.73,104.83,161.98,302.0,100.52,302.0,302.0,115.16,148.16,156.42,130.41,146.95,200.34,175.44,212.43,202.03,163.11,167.19,137.57,176.55,130.24,122.72,110.5,89.64,86.41],
-    [81.14,79.23,62.88,63.46,109.3,109.3,109.3,101.12,100.19,102.49,131.02,124.86,125.63,141.89,160.3,178.68,119.76,111.84,100.52,100.52,95.3,86.91,87.32,84.22,81.29,69.8,52.9,48.26,63.92,68.85,74.77,79.39,85.7,96.6,124.88,120.89,175.03,196.91,200.99,196.78,199.47,198.83,187.45,175.04,120.09,81.8,82.21,81.55],
-    [82.23,82.23,57.21,63.26,49.09,49.09,46.17,62.97,62.97,104.96,119.52,105.35,112.76,107.92,130.14,151.29,131.08,148.61,131.54,107.21,99.57,87.67,100.52,108.42,100.52,134.97,119.82,102.31,138.85,136.21,134.93,137.84,139.28,118.23,122.1,117.81,181.78,173.25,161.85,90.41,93.45,80.12,117.76,77.0,100.47,89.22,97.08,97.08],
-    [71.26,74.24,58.71,60.78,83.74,72.03,62.92,100.65,116.44,144.57,137.85,118.33,114.46,163.69,171.57,126.91,84.61,87.1,86.08,84.58,83.59,83.59,85.37,86.15,83.59,83.59,87.67,82.02,84.02,92.71,92.71,94.44,106.59,133.25,142.49,134.4,137.98,140.13,146.57,107.12,128.78,129.01,129.31,129.54,114.5,100.9,89.45,64.35],
-    [47.61,48.3,44.45,44.33,45.38,45.81,44.48,45.33,49.05,45.54,45.09,69.66,90.39,70.28,87.67,57.58,53.68,87.67,49.56,47.6,48.1,87.67,83.76,60.39,68.82,58.75,65.18,76.8,83.05,71.53,80.05,66.8,78.28,101.58,90.2,146.62,141.56,140.28,134.96,98.36,96.29,98.04,98.68,78.58,56.07,61.58,49.69,55.68],
-    [45.09,43.03,42.92,42.93,46.83,47.42,43.22,42.53,43.92,46.94,60.94,61.28,46.5,51.14,55.47,54.23,56.08,53.93,55.77,48.16,54.01,64.13,146.33,92.11,102.83,87.67,71.07,87.98,101.19,70.61,68.27,78.23,97.31,94.8,100.78,138.46,130.63,107.62,97.46,94.62,91.62,87.67,87.67,68.61,68.36,49.42,49.34,46.75],
-    [111.25,102.28,45.98,45.92,45.54,47.05,45.54,42.17,45.54,62.66,44.88,45.54,70.71,111.25,99.5,126.51,102.16,103.38,101.23,92.47,92.17,63.47,87.74,100.73,105.77,118.49,118.46,124.82,105.44,107.96,83.78,99.48,114.15,107.69,114.15,118.91,140.86,140.85,159.43,153.68,192.7,87.67,80.1,104.75,143.22,120.25,115.88,111.25],
-    [93.71,96.88,102.55,101.88,104.41,106.89,84.3,87.88,92.83,102.71,96.65,87.67,106.46,110.42,150.13,90.34,172.88,102.94,112.3,114.49,114.63,112.08,135.73,146.18,175.88,190.18,185.14,138.48,182.7,138.77,186.08,185.19,192.43,143.08,125.79,144.4,127.39,135.93,135.83,124.78,107.9,79.45,106.84,70.89,187.57,174.52,109.91,114.18],
-    [45.08,44.0,43.98,45.08,43.88,43.72,43.87,43.55,45.0,45.54,45.56,48.58,96.39,154.56,192.19,192.33,111.21,96.67,70.98,69.7,96.58,94.92,94.98,95.41,99.99,100.35,101.07,102.06,96.02,62.89,87.67,87.67,94.88,99.57,112.11,137.88,140.93,177.29,177.16,96.91,93.68,123.44,87.67,114.75,87.07,60.02,52.87,48.12],
-    [44.23,44.21,44.11,44.0,43.92,43.84,43.72,43.68,43.69,43.76,43.98,50.23,88.44,155.01,268.76,200.48,136.69,120.28,96.66,96.76,122.2,110.97,103.22,130.66,130.66,53.29,57.21,64.67,47.27,52.19,48.73,87.67,108.5,111.99,143.88,141.12,143.35,107.85,125.96,126.45,135.82,110.16,111.87,114.18,118.33,67.9,50.09,46.93],
-    [43.15,43.34,43.4,43.16,45.54,46.37,46.73,46.63,46.35,46.33,46.35,47.98,272.56,184.58,292.68,290.93,163.98,163.98,158.9,159.0,174.94,100.62,100.6,100.6,165.18,165.18,154.22,165.18,155.07,87.67,155.92,90.27,71.06,86.64,118.11,137.39,138.53,139.67,79.6,68.9,91.51,110.18,138.71,115.97,140.06,107.84,47.27,46.11],
-    [42.41,41.03,40.9,41.4,40.83,40.77,41.43,41.47,41.45,41.67,43.38,46.66,206.08,232.69,279.0,302.0,227.62,157.03,196.14,277.7,277.57,88.04,72.78,100.72,88.04,100.72,100.72,94.05,100.72,144.28,142.13,146.28,139.0,101.49,116.67,131.64,132.63,133.71,97.05,121.37,135.47,239.97,212.06,207.04,86.33,72.78,46.99,45.17],
-    [79.75,80.41,85.21,81.82,46.51,46.32,46.3,46.45,45.41,45.39,50.98,81.11,128.09,141.89,169.58,118.76,111.83,93.9,89.08,78.47,100.72,83.99,79.64,89.94,213.61,100.72,212.57,106.65,47.37,75.63,79.58,156.75,151.91,90.39,188.17,190.07,151.51,142.37,193.2,109.59,101.06,158.07,205.58,111.18,189.03,103.02,64.76,109.37],
-    [45.7,42.03,69.77,68.02,100.97,101.33,42.77,42.66,42.7,44.01,45.7,85.32,107.01,109.43,104.65,86.37,70.96,87.17,100.75,44.38,43.8,43.04,42.55,45.7,41.87,42.3,41.6,70.92,41.78,72.78,70.57,84.18,98.44,116.84,119.84,107.26,116.98,117.78,110.12,115.85,102.45,95.4,117.43,101.67,104.47,54.04,62.43,70.32],
-    [128.93,129.04,94.15,81.77,61.48,130.07,130.55,138.59,131.11,126.16,81.21,87.85,79.73,111.38,117.86,110.14,103.8,92.19,70.02,133.32,59.27,58.95,58.91,74.5,45.7,74.5,125.36,125.45,104.67,89.83,99.76,153.1,114.82,141.73,146.65,144.65,149.72,150.02,136.64,133.53,131.42,110.35,125.59,128.4,128.52,128.63,128.74,128.92],
-    [205.7,204.57,81.64,71.01,82.17,93.64,135.72,168.06,156.04,99.49,189.09,94.27,83.57,85.11,104.36,85.83,134.47,84.3,135.24,78.57,74.79,78.12,78.19,79.58,82.84,95.95,96.49,137.34,94.24,113.8,124.5,147.51,157.93,145.72,160.48,232.82,154.29,190.1,189.64,112.55,114.92,120.26,168.2,211.65,234.62,214.88,212.23,209.62],
-    [93.51,91.35,88.43,89.54,86.48,77.67,85.52,88.7,88.54,73.89,84.39,73.01,73.54,77.47,137.26,72.14,72.8,86.04,92.84,87.9,98.95,104.05,113.86,120.28,117.92,137.49,155.45,158.03,148.6,160.37,159.86,159.17,181.08,180.11,163.4,195.91,182.44,190.49,165.08,153.11,209.53,227.78,125.93,124.17,200.09,93.16,103.24,94.34],
-    [102.07,102.38,102.0,62.02,54.54,65.54,60.13,61.33,71.59,83.74,82.43,68.41,73.59,72.48,76.43,76.0,68.35,89.6,87.71,86.23,79.19,79.64,79.91,85.98,126.32,93.65,100.79,85.6,214.26,90.14,148.79,128.67,176.12,198.85,190.63,235.0,235.0,217.73,146.06,143.5,105.72,92.46,100.86,90.28,90.96,90.0,90.04,101.28],
-    [235.0,235.0,235.0,224.95,189.19,188.67,188.6,188.53,139.46,137.03,118.34,160.25,191.05,191.05,191.05,177.51,83.21,82.81,88.69,88.04,76.15,77.83,77.88,235.0,89.94,135.47,173.78,173.38,135.65,120.2,132.69,135.17,138.02,160.53,199.35,192.42,208.2,207.7,183.91,167.26,154.85,183.3,185.77,184.71,145.98,197.65,162.88,202.87],
-    [52.12,53.66,53.83,50.41,54.54,49.5,68.32,49.64,51.26,49.46,68.5,68.55,68.49,68.67,122.73,235.0,189.44,140.74,138.71,132.82,71.93,88.23,75.1,143.11,138.67,126.56,149.5,140.37,197.76,142.03,110.27,115.2,142.52,142.9,143.22,123.81,124.42,166.96,128.43,136.17,91.95,92.0,78.48,73.24,115.9,54.32,92.2,54.47],
-    [48.99,48.98,51.09,51.23,48.89,48.82,48.81,48.87,48.84,58.91,48.98,55.98,99.8,96.93,138.81,153.72,133.03,133.13,133.14,133.15,133.24,133.33,147.25,133.33,148.29,133.25,147.26,112.48,79.21,87.42,89.84,157.99,159.34,144.47,141.11,140.54,140.37,140.77,119.06,86.92,114.8,107.06,113.39,109.53,96.79,96.23,71.3,50.21],
-    [50.35,48.9,63.25,60.02,67.41,48.14,71.78,88.25,89.32,64.89,92.06,99.15,101.6,154.64,175.83,155.3,153.7,147.15,191.22,173.93,158.73,172.77,173.47,173.33,235.0,172.35,175.69,179.27,191.84,191.42,142.28,152.78,188.2,167.05,194.15,191.92,178.04,177.06,166.35,145.52,117.1,164.09,116.1,116.09,137.1,88.91,92.37,71.52],
-    [49.21,48.98,48.6,48.61,48.84,48.98,48.76,49.01,48.92,48.83,59.5,52.99,141.91,188.01,171.95,193.75,171.09,153.96,152.78,142.68,144.43,131.8,144.28,89.61,78.55,79.85,98.0,77.9,191.04,191.01,190.81,190.72,112.35,145.38,160.43,163.96,160.39,157.92,158.77,155.91,129.21,110.47,115.91,124.86,132.82,106.51,105.11,69.34],
-    [48.8,48.23,48.08,47.92,47.93,47.84,47.76,47.64,47.82,47.89,48.74,49.14,80.17,157.89,159.99,158.06,136.87,128.35,117.64,80.17,49.5,49.24,49.24,49.23,49.19,48.93,48.97,48.99,48.61,57.56,58.69,132.72,54.64,138.34,156.67,157.96,154.5,154.12,131.9,132.14,146.02,146.42,146.82,147.23,63.87,147.89,49.3,49.04],
-    [91.39,88.89,87.74,86.29,86.94,87.05,87.26,85.96,87.83,87.48,85.47,104.93,122.88,135.43,147.28,153.17,157.73,154.39,154.24,178.83,178.66,179.05,179.54,171.63,172.04,172.29,172.4,172.41,74.34,68.81,123.98,83.21,109.49,124.54,235.0,235.0,175.33,175.19,173.4,174.82,146.3,143.15,135.09,121.93,120.68,125.25,116.97,101.46],
-    [103.29,93.29,89.28,85.23,106.17,106.23,102.96,96.7,96.72,109.18,124.21,140.16,267.0,157.68,158.01,157.85,155.81,155.81,169.53,133.72,77.64,51.47,50.36,49.85,60.13,49.5,48.9,49.21,74.6,88.73,168.81,102.4,106.05,107.13,136.83,267.0,128.83,130.2,131.44,136.64,135.72,127.86,118.99,109.91,121.61,102.0,103.75,105.72],
-    [114.88,120.73,103.59,119.58,129.27,129.27,129.27,118.78,108.35,115.05,134.1,131.92,132.62,132.51,132.62,132.62,132.62,132.62,132.51,80.17,132.87,80.17,80.17,52.37,48.1,47.81,47.48,48.7,48.33,51.96,52.61,56.69,168.9,169.96,169.94,267.0,174.4,187.95,173.65,167.13,137.41,137.59,132.51,132.97,134.79,132.62,132.62,125.52],
-    [58.95,59.29,78.33,59.43,87.4,90.81,92.48,109.83,109.4,113.11,110.31,56.37,171.83,171.86,172.12,172.37,110.08,175.12,169.81,133.2,134.34,50.96,80.17,168.82,51.59,59.58,49.66,49.45,51.75,51.88,61.07,55.55,58.52,129.64,113.87,117.52,109.94,113.44,114.26,130.16,158.56,114.98,125.56,104.35,136.35,145.9,63.86,55.58],
-    [107.51,52.24,51.88,58.73,56.91,67.15,53.35,51.49,51.59,52.13,52.07,54.04,54.02,53.44,50.36,49.87,49.92,50.18,50.39,50.44,77.86,130.9,267.0,159.61,125.58,109.0,118.09,151.13,108.38,93.79,160.37,160.33,160.4,156.15,156.04,148.51,149.08,169.23,136.31,134.56,160.38,159.65,141.83,115.05,85.37,83.3,71.97,75.51],
-    [80.31,112.58,106.82,67.34,66.16,66.79,66.73,66.49,66.49,70.91,73.69,75.44,103.38,103.38,103.47,103.66,100.84,113.03,167.83,167.9,174.01,174.22,174.4,177.23,176.85,167.15,167.14,175.63,167.9,132.28,126.41,175.39,175.73,175.31,175.01,174.73,183.26,174.67,174.08,174.07,169.99,174.38,170.35,100.26,134.49,125.18,122.33,81.27],
-    [96.52,91.94,60.99,52.25,51.38,51.0,50.77,50.99,54.14,57.43,74.86,62.84,63.71,66.42,64.64,57.03,56.23,55.99,57.78,62.31,62.31,62.31,94.81,119.82,161.91,161.98,74.41,169.05,85.48,138.94,136.49,129.64,132.22,124.34,126.16,126.2,138.18,128.75,126.51,129.05,126.38,126.3,88.03,99.26,93.99,108.49,109.73,95.25],
-    [123.76,123.76,123.87,106.82,63.77,62.44,96.99,97.77,100.48,103.33,77.1,85.21,123.65,123.52,137.7,118.2,115.36,105.27,101.31,71.25,69.5,123.88,124.0,109.69,165.37,120.68,125.08,129.88,128.96,267.0,145.99,132.97,143.29,267.0,267.0,267.0,133.22,139.21,138.8,130.03,123.83,119.43,117.18,109.0,101.44,123.87,123.87,106.82],
-    [53.33,53.07,59.11,79.24,58.61,118.06,122.12,106.82,132.72,111.1,111.1,112.26,156.23,156.07,156.07,156.24,171.03,155.47,155.49,155.65,155.67,155.84,53.27,144.91,57.86,50.83,53.33,57.86,153.95,62.44,114.37,114.34,110.22,101.72,168.74,168.61,169.79,169.64,146.41,128.42,101.4,140.54,122.25,106.82,93.35,84.42,79.05,74.11],
-    [133.67,106.82,125.02,125.02,125.02,106.82,124.96,124.95,125.22,106.82,132.41,85.59,133.67,161.8,267.0,170.02,178.97,165.33,155.27,155.46,155.65,155.82,155.83,118.56,75.11,155.81,116.11,155.81,156.03,156.05,156.06,267.0,267.0,173.47,173.1,176.38,172.02,157.21,156.97,155.09,157.93,159.47,159.14,158.95,101.06,121.42,119.48,133.67],
-    [53.28,66.73,54.79,53.59,53.59,52.51,53.59,53.59,68.55,71.29,71.15,67.62,89.85,174.57,175.22,176.61,173.38,182.57,182.76,155.09,168.5,155.24,155.24,155.24,57.86,70.93,77.38,127.85,127.85,139.87,176.11,178.05,158.16,173.55,267.0,193.2,181.66,193.72,192.95,178.26,175.77,175.66,175.57,160.04,89.11,74.3,73.22,68.52],
-    [73.34,72.73,63.79,59.53,59.53,59.52,59.15,51.09,49.98,59.1,62.37,78.56,102.37,165.09,161.64,151.77,113.36,105.71,126.03,71.87,76.4,59.75,69.72,115.67,115.37,115.36,115.66,59.75,115.63,162.49,149.49,115.6,130.12,267.0,150.2,267.0,175.39,140.64,140.15,139.41,136.74,113.82,110.12,114.77,104.55,110.71,68.75,76.5],
-    [59.53,59.53,58.23,57.05,56.46,52.25,52.39,52.45,64.11,64.04,59.58,71.68,117.39,132.77,149.48,149.48,131.46,125.62,109.4,139.33,114.19,114.45,69.11,58.57,146.28,146.28,146.28,146.19,64.43,152.35,152.19,119.45,115.55,152.34,122.54,133.93,139.62,134.38,133.5,132.95,125.51,118.74,114.24,110.47,105.99,101.45,64.69,74.82],
-    [67.12,66.08,64.83,64.37,62.41,62.9,64.5,63.01,66.3,61.15,66.21,99.84,153.09,153.26,150.49,150.14,152.44,152.44,152.59,164.27,158.24,157.85,126.74,124.1,152.14,93.83,77.77,61.83,76.94,55.24,55.67,56.7,115.68,114.4,138.09,149.54,168.81,169.96,154.6,142.64,127.69,118.71,121.23,119.19,104.51,70.67,70.28,65.33],
-    [93.24,105.99,119.72,105.99,105.99,121.51,135.55,81.06,82.71,92.1,135.55,135.55,139.61,139.61,140.9,141.41,91.81,166.1,166.27,141.91,143.71,143.71,57.12,51.0,50.96,55.5,52.57,61.83,50.17,74.56,51.77,64.64,76.54,267.0,267.0,133.02,161.86,145.29,141.63,141.46,133.09,119.25,131.57,128.32,114.24,105.99,92.23,80.01],
-    [87.53,61.09,57.77,64.32,68.56,99.98,68.09,103.75,105.94,66.04,102.05,84.76,102.47,100.23,79.49,75.04,61.83,55.82,110.69,61.09,59.95,61.09,88.32,88.32,88.32,121.51,121.19,61.09,134.39,93.7,106.74,169.77,169.56,171.5,171.38,137.5,138.56,142.05,135.18,130.53,133.21,108.31,109.62,112.99,111.85,109.1,112.48,105.99],
-    [128.7,105.99,106.44,109.82,107.95,110.51,109.47,108.35,120.84,76.63,84.72,84.52,92.25,82.17,79.7,80.34,62.83,62.81,61.73,267.0,117.87,117.88,117.88,166.01,117.88,166.38,166.45,167.42,166.51,168.64,168.46,132.74,168.85,168.36,267.0,267.0,267.0,267.0,267.0,169.74,267.0,162.68,162.45,161.21,161.25,126.62,115.47,105.55],
-    [67.93,67.38,64.28,59.76,63.84,66.83,57.65,56.68,58.71,57.85,56.4,56.62,57.59,56.54,57.33,55.12,61.73,61.44,63.67,75.96,127.77,171.58,121.86,171.27,167.52,167.63,168.29,168.16,168.19,173.0,168.79,169.17,168.86,168.74,166.05,166.02,267.0,169.76,171.48,161.09,159.66,157.97,172.69,172.62,164.92,77.63,68.94,69.2],
-    [88.64,115.22,109.18,106.13,103.87,68.26,67.52,65.22,64.66,83.28,97.51,136.86,138.26,139.81,97.22,95.21,83.45,68.84,69.06,87.51,101.71,172.39,172.52,172.63,172.62,172.76,128.95,172.53,173.61,132.26,173.19,174.97,150.49,165.56,142.03,149.55,153.87,159.43,156.71,290.0,145.13,141.57,140.08,134.66,121.14,109.44,95.35,88.32],
-    [60.12,55.9,54.45,54.45,53.44,68.09,54.45,67.5,54.45,54.45,83.19,80.19,95.97,90.14,82.33,103.39,88.05,70.95,58.88,53.35,64.83,88.32,290.0,290.0,173.34,118.41,125.21,130.45,102.38,131.03,290.0,141.3,135.78,141.98,142.43,143.49,138.12,150.36,139.47,140.34,152.72,130.1,125.55,115.6,88.76,70.82,82.33,62.52],
-    [134.34,130.51,142.72,80.27,82.33,121.74,121.74,121.74,117.14,133.41,128.83,168.14,172.37,173.82,174.19,182.57,150.02,144.1,137.62,131.83,130.12,192.67,174.02,174.64,174.76,174.75,174.35,174.58,174.56,124.2,151.49,151.49,290.0,147.75,157.51,153.3,156.58,156.86,145.1,150.61,150.61,142.38,137.28,146.39,138.87,142.67,151.08,144.3],
-    [86.38,94.91,75.97,71.86,69.04,58.37,58.37,58.37,78.87,108.95,110.88,102.54,155.39,175.02,175.02,175.44,173.65,153.55,153.55,138.13,86.95,79.07,55.39,78.85,290.0,118.43,118.43,118.64,153.75,118.43,164.16,121.04,154.95,139.29,147.26,152.69,143.17,128.99,132.65,136.07,135.57,138.78,114.43,117.4,93.93,103.38,92.01,65.8],
-    [134.38,117.69,105.67,104.68,104.84,96.61,68.82,69.37,126.18,124.83,142.42,113.68,132.51,139.32,176.19,188.57,154.69,150.29,142.64,148.5,142.98,159.9,149.25,139.13,74.44,63.48,84.25,88.32,128.09,173.14,179.89,130.3,137.46,139.61,144.85,152.93,147.64,146.28,126.58,143.77,143.5,135.16,136.62,136.92,132.52,136.7,136.16,141.07],
-    [108.79,88.11,78.64,120.05,89.59,67.55,65.59,64.99,65.56,83.56,116.07,114.35,120.24,150.51,175.66,176.92,150.61,140.74,138.36,127.76,91.45,117.2,115.47,135.44,177.53,177.26,177.4,123.06,121.86,121.55,132.35,149.54,178.67,136.21,290.0,290.0,290.0,290.0,290.0,290.0,290.0,132.41,130.02,125.69,128.35,128.97,120.05,111.38],
-    [113.56,102.89,95.76,98.67,85.21,84.57,85.12,84.43,94.47,87.72,115.19,105.51,122.75,148.8,151.33,179.23,179.39,179.6,180.21,180.25,175.16,195.13,127.61,128.69,66.33,127.93,109.09,90.23,125.5,107.77,171.36,130.38,130.6,135.48,144.94,290.0,290.0,290.0,290.0,142.26,290.0,134.85,132.08,132.19,131.55,121.22,118.33,114.63],
-    [121.13,116.61,117.2,116.98,119.08,117.81,121.34,115.8,122.28,124.96,130.2,138.84,175.91,141.88,290.0,143.46,135.17,139.2,135.59,125.98,132.36,127.58,112.99,290.0,107.06,104.7,106.29,148.09,122.0,115.9,137.82,120.3,131.22,170.18,213.89,290.0,290.0,290.0,290.0,290.0,271.21,290.0,162.22,268.28,124.03,129.34,123.16,115.33],
-    [133.4,140.31,140.7,124.58,120.05,112.16,112.51,112.51,113.75,123.81,141.79,145.19,140.22,150.15,137.54,178.17,135.5,148.55,189.63,189.81,120.05,178.65,178.9,158.75,149.83,179.05,117.41,119.31,121.75,178.24,138.92,151.7,182.9,290.0,290.0,290.0,290.0,290.0,290.0,290.0,290.0,115.47,119.09,120.05,127.26,129.2,134.85,135.15],
-    [122.69,123.64,131.9,120.86,132.96,110.23,134.77,134.37,130.8,136.62,119.19,128.35,135.81,128.83,129.57,106.98,128.11,134.0,124.41,177.92,175.33,175.35,57.48,290.0,120.05,178.95,110.3,102.32,109.86,120.05,118.32,100.76,175.09,290.0,290.0,1018.0,1018.0,1018.0,1018.0,290.0,290.0,290.0,290.0,134.9,133.51,125.17,122.63,125.78],
-    [136.54,134.66,120.0,132.79,101.24,132.28,133.7,135.31,135.32,139.12,123.36,123.07,141.1,142.0,168.55,168.75,174.56,171.75,172.02,172.19,172.3,139.41,142.21,175.24,137.57,175.26,175.27,175.39,130.12,133.34,175.89,290.0,290.0,290.0,290.0,290.0,290.0,290.0,290.0,290.0,154.05,133.89,130.75,142.18,136.37,133.52,137.82,139.62],
-    [109.68,94.6,110.45,111.65,111.65,111.1,110.26,109.41,108.55,107.68,170.01,96.71,123.01,108.38,120.12,109.04,115.08,114.88,115.29,115.29,93.14,93.59,105.21,111.85,124.23,174.75,174.74,174.56,138.29,137.41,142.86,141.15,144.31,138.93,144.56,290.0,290.0,290.0,290.0,290.0,290.0,141.94,137.08,290.0,137.76,136.25,119.39,121.94],
-    [101.6,89.23,87.61,79.97,88.5,88.56,88.75,88.74,88.82,79.04,88.94,100.1,129.52,101.2,123.02,114.75,100.15,108.08,123.32,105.15,95.63,123.73,177.2,131.45,178.48,124.1,130.95,128.46,124.1,171.84,172.02,125.06,158.94,141.4,324.0,324.0,324.0,324.0,149.77,149.03,135.78,133.54,121.51,129.79,129.13,118.54,101.62,106.1],
-    [117.41,110.29,98.5,84.18,103.27,103.33,124.62,106.05,102.4,124.42,124.13,177.99,175.62,157.99,159.03,113.64,124.12,105.3,104.27,102.66,102.68,106.3,105.3,126.33,109.28,176.35,176.48,324.0,178.2,188.73,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,148.24,148.72,149.48,150.51,149.81,151.68,140.93,135.65,135.72],
-    [133.51,127.39,128.98,127.17,126.92,124.31,124.31,124.31,124.31,158.85,126.23,132.27,180.03,180.03,186.75,186.28,178.39,174.13,174.35,178.6,178.83,174.73,174.79,199.38,199.76,200.14,175.2,175.25,175.26,133.31,175.42,123.92,130.52,150.8,177.51,324.0,324.0,184.63,154.37,151.62,173.75,147.44,135.15,136.33,134.25,116.42,132.38,133.3],
-    [105.66,104.99,79.02,80.52,79.02,79.0,82.57,89.91,90.87,107.58,123.75,132.31,139.78,324.0,324.0,324.0,155.78,126.06,140.37,122.06,121.36,123.6,123.8,139.73,185.99,186.2,324.0,302.75,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,129.33,130.45,122.21,124.19,121.61,116.11],
-    [192.95,192.77,192.64,192.62,192.47,192.6,192.47,142.2,156.27,143.72,192.45,190.67,324.0,324.0,324.0,324.0,324.0,324.0,324.0,216.77,324.0,209.1,157.37,139.32,139.8,138.11,133.92,175.18,175.12,178.61,324.0,144.77,324.0,324.0,324.0,805.0,805.0,751.8,324.0,324.0,324.0,324.0,324.0,324.0,145.66,137.94,143.94,142.3],
-    [133.08,139.84,149.16,137.9,121.34,135.93,135.9,135.89,134.26,141.0,162.37,170.49,169.54,179.44,200.85,194.37,215.27,171.54,168.12,157.56,160.38,164.56,168.65,167.92,167.91,215.68,215.66,155.72,168.3,164.95,179.21,158.6,174.09,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,324.0,159.8,162.65,159.38,160.53],
-    [149.2,131.82,125.56,124.97,125.22,116.12,122.41,116.12,129.56,131.56,156.05,161.44,211.32,324.0,324.0,324.0,209.66,210.02,210.21,153.25,173.5,152.21,160.89,324.0,324.0,160.77,158.41,159.2,155.25,155.17,154.51,161.06,209.38,209.34,163.7,324.0,324.0,324.0,324.0,196.6,169.4,163.02,159.96,153.11,213.25,151.98,138.9,110.54],
-    [126.79,125.79,125.18,126.79,126.79,101.3,126.79,126.79,101.57,126.79,126.82,131.08,149.6,156.97,160.47,157.9,150.79,122.29,120.59,134.99,134.99,134.99,96.28,81.33,80.92,81.11,135.1,96.28,154.38,77.22,104.65,134.05,151.71,132.51,150.88,163.43,291.6,294.42,291.6,291.6,160.78,160.05,154.55,159.59,126.82,139.94,132.51,125.93],
-    [115.79,136.82,119.28,114.28,315.96,439.3,639.73,325.98,525.61,738.0,193.41,553.36,356.47,110.19,534.78,190.82,555.99,281.84,341.98,643.77,397.06,545.73,546.92,738.0,547.19,418.96,738.0,738.0,529.78,301.94,419.27,334.16,675.93,738.0,738.0,738.0,738.0,738.0,738.0,663.3,348.53,340.34,249.1,348.72,252.95,227.66,552.97,640.12],
-    [564.56,449.89,531.06,161.75,350.84,138.26,228.91,136.44,538.23,738.0,236.63,208.93,293.24,215.79,564.84,349.08,144.16,101.61,525.61,426.14,642.3,177.63,341.34,738.0,343.4,411.78,738.0,525.02,738.0,738.0,538.38,738.0,635.33,738.0,652.3,738.0,738.0,738.0,738.0,461.12,425.74,335.76,356.98,330.14,334.39,221.8,573.55,738.0],
-    [104.99,101.68,104.96,212.6,321.69,642.27,738.0,210.82,109.52,638.75,330.94,638.14,109.88,100.82,100.25,90.16,158.0,200.49,191.69,340.97,738.0,331.14,302.1,212.6,282.63,354.92,307.35,738.0,633.28,641.97,335.42,643.83,544.99,738.0,733.84,490.3,738.0,738.0,738.0,738.0,634.27,240.04,446.53,738.0,738.0,737.75,439.21,633.1],
-    [644.08,378.12,315.28,401.8,738.0,161.08,111.68,112.47,99.32,98.21,101.57,100.82,101.11,96.78,102.6,107.73,97.62,99.9,97.58,103.96,150.28,213.2,564.7,557.38,138.73,169.05,265.89,212.26,147.8,537.48,238.6,631.7,303.84,182.02,257.03,642.9,738.0,738.0,738.0,738.0,738.0,656.17,256.86,271.89,462.09,738.0,488.54,277.7],
-    [120.18,117.94,118.9,125.56,108.31,99.68,93.48,95.8,99.99,102.54,118.47,646.04,365.95,499.58,275.01,138.04,425.94,102.82,100.82,215.78,310.82,179.76,532.4,738.0,436.99,468.34,347.84,522.54,738.0,738.0,738.0,738.0,440.59,738.0,738.0,738.0,738.0,738.0,719.25,320.2,231.15,582.67,148.86,146.86,131.8,141.86,165.61,163.7],
-    [99.49,100.06,97.42,94.46,90.98,90.87,99.51,100.25,101.69,101.13,100.82,118.83,527.69,639.12,426.79,111.28,211.7,436.1,399.31,738.0,113.97,101.61,111.62,117.09,738.0,738.0,572.82,640.15,266.78,334.37,738.0,459.63,551.06,738.0,738.0,738.0,738.0,738.0,738.0,738.0,419.44,440.41,297.28,219.26,145.66,444.19,110.34,102.21],
-    [259.5,738.0,738.0,156.14,145.8,144.05,141.13,140.54,133.54,132.79,152.79,738.0,738.0,738.0,738.0,556.16,627.56,639.01,667.71,549.01,534.03,160.19,364.96,738.0,738.0,640.33,448.65,525.28,539.56,153.91,156.39,366.27,326.4,457.54,735.85,738.0,737.59,738.0,477.68,389.59,229.06,738.0,548.28,545.42,738.0,738.0,738.0,738.0],
-    [137.2,130.63,205.44,411.13,199.21,169.66,174.74,123.07,193.7,313.06,272.33,738.0,738.0,738.0,738.0,738.0,738.0,738.0,738.0,246.09,152.11,239.77,231.06,550.14,738.0,637.06,644.37,642.4,409.74,222.92,385.95,544.18,738.0,738.0,737.96,734.63,461.03,738.0,738.0,200.38,738.0,356.66,550.68,738.0,734.58,738.0,738.0,140.14],
-    [126.27,118.81,113.46,114.48,112.08,112.32,118.47,126.14,144.09,162.94,220.76,258.67,279.41,637.03,372.36,652.42,640.2,437.47,738.0,549.14,167.79,738.0,542.83,738.0,240.39,565.46,738.0,453.77,570.67,210.08,332.98,531.69,738.0,495.16,626.48,638.3,729.97,316.48,192.5,158.29,177.97,145.16,239.41,736.29,346.49,220.04,153.35,147.48],
-    [116.93,107.52,109.01,114.25,112.96,113.85,117.03,118.3,124.87,134.92,127.58,532.42,738.0,440.12,738.0,638.54,648.31,738.0,527.09,667.12,738.0,738.0,536.09,153.76,738.0,738.0,636.99,350.02,543.33,544.65,433.4,540.99,738.0,738.0,646.75,738.0,738.0,460.3,244.67,162.4,202.15,172.63,342.22,163.47,152.98,139.05,130.66,143.94],
-    [348.62,127.67,111.68,111.41,119.04,117.47,116.15,117.8,119.08,120.65,135.95,355.45,451.57,549.02,738.0,738.0,647.66,325.2,329.64,518.83,640.81,664.97,356.04,732.81,128.88,105.26,499.87,608.01,175.88,442.84,738.0,254.82,127.7,344.26,738.0,738.0,738.0,738.0,560.59,326.08,551.86,578.03,553.04,738.0,448.48,638.67,566.91,543.96],
-    [440.82,344.69,457.53,349.21,391.94,514.46,393.82,331.88,157.22,222.9,341.78,325.3,440.76,550.58,734.77,738.0,672.21,427.36,256.79,687.98,198.21,298.47,625.95,125.23,108.54,57.94,83.94,216.96,403.65,96.97,95.26,111.74,212.32,127.65,641.81,738.0,640.21,518.7,736.38,534.94,738.0,738.0,738.0,339.04,426.8,139.66,523.93,734.77],
-    [440.4,631.69,355.24,323.08,378.54,729.9,734.76,731.53,458.37,393.88,263.82,728.28,551.72,343.71,462.96,240.28,332.76,253.47,250.01,118.79,387.8,99.48,169.37,170.75,145.89,132.13,605.23,728.28,379.95,728.28,427.67,555.73,642.82,631.25,286.72,715.92,697.51,658.64,728.31,637.68,701.9,639.11,734.76,542.34,543.12,657.03,458.06,330.16],
-    [714.3,628.3,134.71,141.32,126.62,128.41,395.66,728.28,324.86,472.25,629.69,728.28,228.37,146.91,419.59,516.36,280.36,207.05,127.39,116.64,134.12,646.06,323.28,223.64,137.9,152.66,151.95,136.14,142.62,235.72,546.02,247.04,531.22,440.18,327.05,431.58,725.1,738.0,738.0,730.18,230.9,290.59,246.0,256.16,137.0,129.91,145.45,406.59]
-    ];
-    z2_values = [
-    [49.03,53.33,49.84,47.57,47.32,47.95,50.11,51.21,53.96,52.22,53.11,63.21,78.39,95.79,169.34,136.95,83.90,82.15,72.94,68.98,65.38,55.82,59.83,56.02,54.05,54.25,52.86,53.70,53.94,59.15,67.68,65.99,101.40,118.06,162.33,194.72,141.09,99.55,85.17,84.76,84.59,76.46,79.76,63.51,46.65,44.41,45.48,48.38],
-    [48.63,47.54,46.31,46.58,46.28,46.72,48.13,48.79,48.64,40.99,43.24,56.48,64.96,72.14,88.12,82.81,59.90,55.97,54.61,53.38,55.35,53.08,53.09,51.50,51.85,51.18,49.89,50.66,48.56,49.48,52.68,56.54,62.49,69.61,81.54,97.15,108.01,102.11,81.79,74.54,66.65,63.57,58.91,55.96,45.89,41.26,45.88,45.69],
-    [39.57,40.46,40.19,43.48,40.70,38.52,39.78,43.46,42.75,36.92,36.25,37.82,37.65,44.34,63.15,60.98,53.16,50.83,47.78,46.53,44.12,43.24,44.52,43.99,44.33,42.27,41.87,42.42,43.08,44.48,46.07,47.23,48.86,52.31,56.49,63.92,79.25,83.67,67.67,63.22,58.53,50.01,51.76,44.20,42.30,39.52,41.02,38.71],
-    [38.37,36.32,37.73,37.51,37.85,37.12,39.02,40.15,41.83,43.42,44.15,44.41,46.83,47.20,52.23,53.00,50.37,52.36,51.13,51.71,51.37,51.69,52.04,51.69,50.15,51.12,49.98,50.21,49.87,50.54,51.24,53.35,55.57,57.50,59.14,59.24,62.46,67.22,62.02,57.09,52.97,49.56,45.97,44.99,42.49,40.63,38.80,37.83],
-    [27.65,16.38,13.92,9.29,9.83,10.61,6.03,13.11,20.84,29.61,31.90,40.44,43.49,44.36,48.64,47.89,45.37,47.33,48.56,48.31,45.18,45.63,47.35,46.63,45.64,45.24,45.79,48.32,47.74,47.82,48.17,48.71,49.30,50.79,51.90,53.13,52.90,57.57,59.80,55.77,48.59,42.54,40.43,38.19,37.94,32.26,28.93,26.81],
-    [39.76,38.68,35.48,32.98,36.72,37.03,36.95,34.51,37.80,36.62,36.56,39.50,46.63,51.12,58.92,61.01,56.73,58.76,59.89,60.01,59.48,58.71,61.38,60.66,60.41,60.15,60.88,60.32,59.74,59.10,61.43,62.41,64.01,66.62,66.18,66.47,63.55,60.62,61.01,62.68,60.32,61.54,54.32,49.23,49.90,48.52,46.53,45.07],
-    [36.53,34.72,30.87,29.03,30.69,30.29,33.30,30.93,38.16,43.67,31.89,40.85,37.91,40.93,47.09,48.43,49.53,56.25,51.97,53.59,53.20,54.59,54.23,56.35,57.56,58.19,66.05,66.28,65.36,66.25,68.92,72.14,73.77,72.78,71.53,71.20,72.28,61.16,64.48,66.08,57.26,56.08,48.96,45.85,42.44,40.14,38.22,35.67],
-    [42.50,39.22,41.58,37.48,30.61,33.01,35.09,32.23,32.33,38.61,44.91,42.92,48.85,47.77,54.27,55.51,65.47,62.08,62.38,63.75,68.87,70.54,72.63,76.24,78.29,81.36,78.20,82.64,84.44,84.29,84.56,88.86,95.12,99.05,101.98,94.45,89.32,79.63,89.84,75.79,66.69,63.80,68.60,49.48,48.76,48.41,47.12,44.69],
-    [13.79,7.85,3.67,-2.91,-2.29,-11.68,-8.35,-0.17,0.56,9.21,13.75,21.55,24.41,24.07,36.73,40.06,41.66,44.45,45.21,46.29,46.21,45.95,45.90,46.00,46.27,46.78,47.10,48.79,47.63,49.59,50.61,52.56,53.33,53.70,52.92,51.82,51.27,51.61,50.83,48.49,46.57,40.72,36.81,31.64,27.74,26.42,23.48,15.02],
-    [40.37,36.88,32.92,31.19,29.80,29.81,29.28,30.35,29.25,29.53,38.88,44.54,40.56,39.02,43.29,46.78,47.71,48.43,49.26,49.10,48.31,49.47,50.40,51.87,52.60,54.52,53.52,54.11,54.67,56.31,57.23,58.88,57.85,59.53,57.37,59.25,61.60,58.19,53.62,50.75,49.50,48.64,46.64,44.15,45.51,45.35,43.56,42.02],
-    [18.10,9.17,12.21,7.22,1.35,2.68,4.06,3.35,6.87,16.12,23.37,29.29,42.70,46.59,45.61,49.87,47.10,47.50,46.07,45.92,45.20,44.42,44.17,43.93,44.62,44.95,45.37,45.57,45.50,45.89,46.54,47.43,48.68,51.69,56.37,61.95,61.55,56.93,52.66,50.11,48.96,45.61,41.81,39.37,43.12,35.58,32.16,21.57],
-    [33.49,35.58,31.60,27.60,26.29,30.52,29.22,31.34,31.01,35.29,35.81,39.79,42.02,44.38,59.36,55.26,49.36,48.29,47.38,46.89,45.99,44.36,44.08,44.39,44.72,45.42,45.78,46.46,45.91,46.05,46.61,49.27,53.47,58.40,75.39,93.55,78.19,69.22,63.36,57.66,55.93,52.59,47.92,45.12,39.99,39.10,38.65,36.10],
-    [42.57,44.51,42.07,39.81,39.58,41.73,41.74,43.56,44.54,43.27,45.55,47.64,50.85,53.61,75.18,65.80,66.69,63.00,61.35,60.50,58.28,55.64,54.83,52.98,52.34,54.88,54.28,55.91,55.19,56.11,60.48,63.92,68.42,82.00,98.51,119.73,113.59,100.02,90.57,84.01,78.34,75.32,65.80,61.17,49.58,46.39,45.94,44.36],
-    [41.51,42.40,42.89,42.36,40.76,41.42,42.03,44.74,43.49,38.61,39.98,45.85,50.83,53.65,69.06,66.04,64.31,63.63,59.85,55.79,55.20,54.72,56.43,55.29,53.56,54.22,53.78,53.56,55.20,55.31,56.02,58.27,59.81,61.45,70.84,86.92,95.10,88.30,78.50,72.18,68.37,63.92,56.32,51.68,44.37,39.13,44.14,42.95],
-    [38.49,37.67,34.04,36.01,36.34,36.86,40.57,38.18,41.20,36.31,38.27,45.15,47.54,52.39,60.67,56.85,56.95,55.41,53.45,51.41,51.22,52.69,51.39,50.90,50.37,50.33,48.69,49.54,49.59,51.06,54.01,56.22,58.28,61.47,67.57,74.89,87.38,96.92,78.12,70.40,63.23,58.72,56.77,58.11,51.19,43.58,43.21,42.05],
-    [43.57,44.15,44.77,43.34,43.51,43.36,43.40,43.81,44.76,48.66,51.20,53.00,56.36,58.33,63.52,63.62,60.61,61.38,61.78,59.37,59.94,59.39,58.42,57.93,55.01,56.57,54.83,55.88,55.35,58.75,59.04,62.50,65.19,64.73,70.66,77.26,86.98,96.77,85.59,74.67,68.04,60.93,55.47,51.90,47.53,46.62,46.82,45.95],
-    [35.15,36.44,33.82,28.60,32.94,36.80,33.34,29.86,33.58,31.48,42.44,43.34,46.47,50.42,45.29,47.22,50.41,52.50,53.18,56.16,56.07,55.86,58.29,60.55,60.74,61.93,60.73,62.39,61.92,63.98,64.62,69.69,70.20,71.54,68.70,67.85,64.83,66.64,70.67,65.26,60.16,54.21,49.95,45.29,47.23,44.87,39.84,37.52],
-    [40.10,38.23,41.46,38.91,36.92,40.74,39.75,39.18,40.82,42.32,44.85,47.37,47.49,50.12,44.57,49.68,51.17,52.26,53.45,57.26,59.79,59.82,59.51,61.54,60.35,61.88,58.41,60.63,58.91,58.54,60.52,62.85,64.35,64.38,63.76,63.37,61.66,57.55,59.54,65.04,60.45,55.45,49.57,42.93,47.98,42.75,44.47,43.29],
-    [41.51,40.98,39.91,33.97,38.16,36.30,36.87,35.18,39.19,45.00,42.54,42.86,44.83,44.22,46.49,48.86,51.61,53.64,56.11,56.75,57.88,60.00,62.25,63.60,63.44,65.03,68.40,69.80,68.46,69.10,70.51,71.14,71.96,72.08,70.81,71.01,67.46,65.91,62.99,64.92,60.66,58.27,55.70,54.13,48.81,47.60,45.21,39.56],
-    [44.77,44.10,43.67,41.01,37.51,41.45,39.18,41.17,40.70,43.23,44.91,44.36,46.83,45.07,49.74,48.17,51.55,52.93,55.28,58.69,60.61,62.28,64.76,66.09,65.50,67.71,72.60,75.09,74.13,76.16,79.35,86.65,87.23,90.95,87.02,83.72,79.35,77.74,78.97,75.06,67.24,60.33,55.22,51.11,46.78,45.64,43.65,42.67],
-    [43.95,45.27,45.72,45.86,44.91,44.69,45.10,46.81,47.67,48.02,50.27,50.64,51.93,51.42,56.19,55.91,56.82,57.98,58.98,60.43,60.87,60.90,63.58,64.78,67.13,70.74,67.95,69.10,67.78,68.82,69.34,73.47,75.34,76.48,72.69,69.20,69.97,71.29,69.50,65.00,60.87,58.07,54.30,51.88,47.44,46.32,45.18,45.73],
-    [50.55,50.63,48.69,45.13,45.86,50.16,50.55,48.04,48.52,50.92,53.75,55.26,56.72,55.47,59.03,58.87,56.22,56.48,57.49,57.62,57.55,57.01,58.35,59.26,58.96,60.82,60.95,61.93,61.61,62.09,62.53,64.27,65.20,66.38,67.73,73.27,80.01,73.70,67.04,63.55,60.19,56.82,52.82,51.72,51.17,49.93,49.75,48.79],
-    [47.08,47.99,47.00,47.17,45.08,49.12,48.37,46.25,46.34,49.94,53.14,55.58,60.84,62.32,69.91,63.48,58.95,59.98,60.44,59.12,59.31,58.45,58.92,58.38,55.27,56.87,56.83,55.97,56.84,57.37,60.72,62.19,64.92,69.94,77.79,92.30,89.12,79.92,73.59,65.55,66.29,63.44,57.86,54.54,51.28,51.08,49.61,48.81],
-    [53.36,52.98,53.80,50.85,48.37,48.51,50.97,51.80,50.83,54.37,58.13,60.97,74.87,69.76,87.92,78.55,68.26,72.02,69.56,68.64,63.86,63.88,62.35,63.64,61.83,61.81,62.17,62.89,62.44,63.26,66.64,75.98,80.86,85.88,116.07,128.09,105.25,104.46,91.57,88.09,85.24,83.14,75.74,66.11,64.95,57.65,52.46,50.43],
-    [54.93,53.61,50.89,47.08,45.34,44.66,44.50,45.20,47.11,50.43,57.07,65.12,68.17,68.75,78.82,75.92,80.88,82.59,80.51,72.35,64.41,62.63,62.22,59.40,57.44,56.62,57.77,59.03,59.65,62.95,67.58,74.18,75.56,74.48,85.18,106.16,98.95,91.65,88.33,89.51,87.28,82.41,80.31,80.53,70.77,61.76,54.23,52.80],
-    [32.84,31.96,29.85,27.55,28.50,27.80,30.67,30.02,31.81,32.86,34.48,38.68,45.47,48.51,66.05,63.58,52.57,53.68,53.55,51.90,50.35,46.67,45.65,45.70,43.22,43.96,44.16,44.20,43.70,45.30,47.11,50.58,53.78,57.69,67.64,79.20,86.33,77.51,67.55,63.50,58.69,55.13,49.69,47.30,38.08,35.42,33.52,31.83],
-    [27.96,29.75,25.01,23.90,23.72,22.97,22.26,25.26,25.04,30.32,31.20,33.89,35.02,34.94,41.07,39.74,39.12,38.53,37.99,37.72,38.98,39.09,40.92,41.83,40.30,42.88,40.95,39.26,38.34,37.92,38.87,40.33,44.05,45.49,44.94,49.25,65.11,65.66,47.47,41.72,43.39,39.97,37.03,34.93,32.08,31.37,30.89,30.32],
-    [29.84,28.45,28.55,28.63,29.35,29.23,29.36,29.14,29.85,30.16,32.22,32.92,33.89,34.02,38.73,38.30,35.67,36.25,35.22,34.72,34.73,33.50,34.58,34.35,34.52,34.57,34.51,33.71,33.07,33.08,35.17,36.90,36.76,36.92,38.93,41.33,47.75,57.51,52.00,40.25,35.48,33.25,31.69,29.96,31.52,31.08,31.27,31.11],
-    [33.53,32.74,32.42,32.08,32.51,32.47,32.47,32.28,33.66,35.06,35.26,38.78,41.35,39.09,46.83,45.88,40.99,43.86,43.35,43.19,41.21,40.68,43.28,42.02,39.56,38.11,39.37,38.74,39.92,39.11,41.20,44.00,46.66,48.27,47.49,51.43,51.50,55.97,62.00,57.60,54.74,51.01,47.69,42.26,40.96,37.59,35.72,34.59],
-    [26.32,26.09,25.83,24.78,24.76,24.87,25.96,27.06,27.25,27.07,27.70,28.32,28.12,28.08,31.13,31.21,30.40,31.30,31.37,32.82,32.83,33.07,33.45,32.96,31.87,32.67,31.79,31.83,33.43,34.63,34.00,35.73,34.97,36.20,35.32,33.90,32.74,32.86,34.08,34.57,33.80,30.43,28.39,27.75,27.29,27.15,27.09,26.63],
-    [32.32,31.86,32.18,29.03,27.59,28.33,26.09,25.80,23.78,25.43,25.77,26.53,26.99,28.16,35.41,38.55,47.73,52.91,51.64,59.42,58.51,58.28,51.53,60.11,55.57,49.77,50.74,55.94,55.89,65.09,60.11,64.64,85.64,91.80,95.10,84.13,85.78,81.27,81.21,76.53,73.52,65.43,58.36,47.37,41.76,41.35,41.18,36.03],
-    [35.86,34.30,34.65,32.61,31.33,31.52,31.22,30.63,32.12,32.51,33.39,34.29,33.82,36.44,40.41,45.26,56.92,62.78,74.51,74.40,72.61,79.94,79.25,64.60,64.02,71.03,66.68,67.75,66.82,68.79,69.91,71.40,73.20,70.72,69.30,65.61,69.53,67.57,68.55,64.52,64.14,71.32,53.45,46.40,42.96,39.08,34.37,33.48],
-    [28.27,29.86,29.68,27.24,27.21,27.53,26.15,27.21,28.77,32.20,33.99,35.04,35.11,36.00,37.53,37.79,40.73,40.22,41.05,40.84,41.88,41.25,44.03,43.72,43.28,44.03,43.58,45.24,45.42,45.54,47.95,52.44,53.68,54.42,52.09,52.35,53.89,55.07,51.54,46.41,42.51,40.06,38.09,36.45,33.18,31.52,30.43,30.26],
-    [18.03,16.28,13.09,11.72,16.08,16.11,14.86,16.23,15.12,21.43,26.00,29.60,31.65,33.56,38.14,38.51,35.61,36.26,34.74,34.58,35.33,35.91,37.41,37.47,36.48,36.97,37.41,37.10,38.94,40.03,43.08,42.64,45.09,45.87,51.03,55.70,59.91,55.90,48.89,43.00,41.34,37.17,34.48,31.99,29.37,27.51,26.44,21.47],
-    [23.60,21.51,20.56,17.44,14.30,15.82,15.96,15.69,18.41,23.66,27.05,32.51,38.10,39.32,48.14,46.85,44.97,44.77,41.23,39.74,38.74,37.90,37.95,38.48,39.36,39.45,39.46,39.93,39.97,39.32,39.53,41.45,44.21,47.35,57.17,67.99,67.46,59.74,52.38,50.00,49.75,44.83,40.21,36.28,31.73,30.02,28.50,22.00],
-    [23.44,21.41,19.10,10.27,10.72,12.38,8.14,13.62,18.88,24.33,27.23,31.80,36.07,41.16,47.28,47.86,39.61,39.50,39.98,41.21,39.44,38.44,35.74,36.08,35.63,35.56,36.08,37.42,38.29,39.20,39.98,42.98,46.27,54.77,77.51,86.52,84.94,71.25,62.43,53.12,54.09,46.45,40.97,36.30,36.50,31.14,24.85,21.10],
-    [27.03,26.19,21.69,22.78,23.23,21.71,25.35,23.30,24.51,27.74,31.49,35.79,38.78,44.10,48.65,51.61,47.15,46.55,45.63,43.73,42.30,42.16,40.17,39.90,38.56,38.07,38.02,37.83,38.38,39.91,40.20,42.86,48.41,54.37,68.60,90.30,92.05,84.42,72.35,60.32,63.48,54.62,46.25,40.51,37.05,33.95,29.97,27.79],
-    [30.24,30.90,29.73,27.42,26.28,26.34,28.01,26.45,27.45,30.69,32.65,36.87,41.68,50.40,59.01,60.52,57.26,59.45,54.45,49.09,49.93,43.10,42.89,42.32,41.20,40.62,40.94,37.01,40.16,42.52,43.04,48.22,54.45,60.14,72.68,91.20,102.89,95.55,83.43,74.68,70.20,62.12,55.90,48.23,42.93,37.25,33.70,31.01],
-    [27.50,29.72,27.94,26.43,25.64,24.85,25.03,24.37,24.58,28.92,31.86,34.31,33.68,38.21,42.06,43.35,39.81,37.87,35.18,34.88,35.46,35.19,34.14,34.33,33.36,32.81,33.95,32.00,37.59,37.79,39.30,41.92,50.36,49.22,58.62,69.95,98.79,104.41,81.23,64.47,60.08,51.85,42.83,38.74,36.68,33.76,31.58,30.06],
-    [41.50,41.71,41.38,40.57,40.18,39.40,41.18,40.35,42.89,44.73,45.74,48.53,49.94,57.49,60.80,59.78,57.74,59.93,55.26,54.91,52.19,54.24,53.43,47.91,47.61,47.62,46.16,48.74,49.64,51.75,53.26,59.80,59.59,65.36,67.04,67.73,79.42,85.49,77.95,63.69,64.60,60.54,57.50,49.69,46.57,44.54,40.79,41.82],
-    [42.01,41.42,39.91,39.77,40.40,40.52,40.17,40.06,40.52,40.59,40.62,41.32,44.62,48.76,45.14,49.07,51.28,57.33,57.88,54.89,56.00,53.77,51.47,44.94,45.43,46.29,45.87,46.53,47.15,51.31,49.50,54.80,56.12,58.95,60.37,63.22,64.34,71.62,74.44,64.88,61.64,52.10,46.56,43.22,44.12,45.56,42.52,41.39],
-    [37.65,36.21,33.64,36.56,33.03,33.07,31.92,34.16,34.60,35.20,33.54,32.80,34.56,34.24,39.14,37.21,35.69,39.68,39.71,40.03,41.31,43.34,44.69,46.78,45.12,44.23,41.81,42.74,42.66,45.03,47.33,50.04,50.82,51.81,50.91,53.17,51.51,50.59,49.58,54.28,50.70,45.01,43.20,39.46,41.50,40.14,38.81,38.10],
-    [37.13,36.45,35.44,35.40,33.50,32.03,32.04,31.79,30.89,32.37,31.68,31.88,31.56,32.88,36.77,39.28,42.43,47.39,47.38,47.96,49.96,51.60,54.06,57.20,58.61,60.58,62.58,62.31,66.30,73.72,70.09,75.12,78.08,79.63,75.63,72.09,66.38,62.35,57.39,57.53,58.05,55.93,53.48,46.88,43.05,43.57,37.84,37.76],
-    [34.73,33.83,33.07,31.97,29.53,29.74,28.73,28.60,30.42,32.18,35.00,36.46,35.88,36.84,40.14,39.50,40.12,40.54,43.84,45.92,47.88,48.04,47.25,48.22,48.15,49.69,48.20,47.99,48.45,49.93,52.68,56.01,57.42,58.06,61.28,61.84,59.38,59.75,56.89,53.02,55.32,48.57,46.31,42.47,39.29,37.23,35.66,35.42],
-    [35.53,33.87,32.55,32.87,32.83,33.67,32.97,32.90,33.94,35.23,35.95,37.44,36.23,36.02,39.03,38.88,38.63,39.93,41.93,43.02,43.83,48.83,50.45,50.51,50.48,49.78,49.22,48.51,54.16,52.99,52.56,55.87,56.18,56.43,55.83,55.16,56.39,63.33,56.45,49.10,50.53,47.66,43.94,41.06,41.14,37.75,36.26,34.79],
-    [36.47,37.25,39.06,37.49,38.87,38.82,38.20,38.53,39.84,40.77,42.00,44.23,45.61,46.81,54.49,53.59,53.67,55.79,54.42,52.19,51.29,50.42,50.48,52.41,51.90,50.32,51.13,48.28,49.11,49.69,50.88,52.10,56.16,62.69,69.64,84.31,91.01,87.43,68.50,57.63,61.49,51.92,49.02,44.53,43.59,40.38,38.19,38.08],
-    [42.59,40.51,39.88,39.92,39.63,39.83,39.72,40.52,40.67,43.18,45.46,51.88,57.64,74.45,86.02,86.86,82.31,77.03,67.85,63.59,57.37,55.64,52.82,53.69,52.39,51.72,52.61,54.09,54.49,56.45,54.26,61.17,69.11,80.25,108.39,133.58,127.52,109.35,89.90,82.87,88.62,81.77,67.24,55.80,53.61,46.95,43.80,42.76],
-    [41.59,40.52,39.84,39.82,39.34,38.93,39.06,39.27,40.34,42.01,44.46,46.94,50.71,64.16,80.44,83.48,73.92,76.80,66.21,62.61,56.41,56.06,55.14,52.78,49.30,48.08,45.55,49.77,47.57,49.79,49.70,55.21,63.67,82.57,107.02,121.95,113.98,107.98,100.58,88.07,91.39,78.97,66.49,57.76,52.34,46.99,44.72,41.97],
-    [34.56,35.25,33.46,32.76,30.23,30.32,31.18,30.76,32.82,35.54,36.90,37.60,40.66,52.48,79.50,87.57,76.94,76.22,58.27,54.21,47.45,42.24,42.41,42.31,40.97,40.76,41.28,40.90,43.51,44.55,46.51,49.53,60.43,72.21,99.11,141.98,142.01,130.94,114.58,96.30,87.01,79.07,61.02,51.10,45.19,39.33,36.88,35.48],
-    [34.34,33.03,32.63,32.13,31.67,31.38,31.24,31.41,31.75,34.61,38.48,47.27,56.88,80.87,121.44,124.82,102.34,98.24,78.17,66.18,61.34,58.16,53.81,57.72,50.27,46.44,48.13,47.60,48.41,44.75,47.67,53.08,59.98,75.67,101.16,152.62,192.22,192.71,171.91,146.42,124.77,101.32,80.87,65.88,55.53,40.68,37.92,36.28],
-    [44.71,42.32,40.48,39.85,41.09,38.33,37.36,38.71,40.05,42.88,48.68,60.37,67.95,86.32,118.99,118.82,84.61,75.14,67.44,61.04,56.16,54.97,52.31,56.68,53.97,50.95,49.84,45.77,45.71,51.34,59.80,65.53,67.81,75.69,98.22,122.59,157.97,170.86,166.10,138.70,135.36,115.49,95.57,87.14,75.33,62.12,51.88,45.76],
-    [36.07,36.07,35.71,35.45,36.10,35.93,34.93,35.51,36.98,37.93,38.76,42.87,43.11,47.59,49.00,49.50,45.95,49.05,51.24,47.34,44.84,44.40,41.09,40.22,37.40,37.55,37.31,38.70,40.09,44.00,44.98,46.51,55.27,64.04,71.51,78.62,79.95,98.62,89.94,77.93,72.58,65.46,60.61,54.20,46.86,40.81,38.00,36.67],
-    [33.36,33.46,31.91,32.77,33.17,32.69,32.06,31.77,32.40,33.91,33.17,36.27,45.53,39.43,40.68,40.03,42.18,41.36,44.67,42.56,45.82,45.42,48.42,48.52,47.25,47.03,47.41,46.40,46.88,48.50,52.26,55.90,59.35,64.51,64.00,69.82,65.53,63.87,62.88,60.46,53.08,48.49,43.75,41.06,39.83,40.80,38.75,35.79],
-    [27.77,27.21,26.62,26.36,27.27,27.55,27.32,26.72,28.35,28.43,29.66,33.13,36.58,31.47,37.46,38.05,37.14,36.22,36.01,39.56,41.85,43.38,42.44,43.88,44.71,44.57,45.47,48.30,50.14,50.90,48.77,48.64,51.25,61.65,60.75,59.88,61.05,60.29,60.28,57.77,54.31,49.16,39.67,36.18,35.57,32.25,30.33,29.19],
-    [36.34,36.50,36.06,35.11,34.90,33.03,33.03,32.58,33.55,36.26,33.66,35.18,35.82,33.57,38.72,40.42,39.43,44.43,49.68,49.79,53.22,54.86,58.52,65.45,64.41,66.98,70.12,72.04,71.66,73.25,71.58,73.55,81.03,88.91,92.44,94.52,90.44,86.08,79.22,75.35,70.57,66.08,54.77,45.57,44.74,41.48,38.87,37.05],
-    [36.09,34.65,33.95,32.94,33.69,33.31,33.79,33.33,33.54,34.50,39.38,38.68,41.49,42.63,49.32,52.83,46.24,51.23,54.86,56.80,58.16,58.28,61.44,61.97,64.36,68.81,63.46,65.81,64.16,72.11,75.73,79.86,84.19,88.70,89.22,86.28,86.02,79.35,83.61,76.85,72.05,64.08,59.65,50.82,50.93,43.87,39.88,36.91],
-    [39.22,38.66,37.29,37.22,36.46,37.36,36.33,37.19,37.35,39.15,43.17,44.73,45.47,45.32,57.40,59.32,55.40,57.59,59.33,59.70,57.88,58.18,61.65,61.22,60.07,63.32,64.31,60.19,60.82,63.48,70.55,71.64,76.65,81.10,85.61,87.10,83.73,88.72,82.25,80.34,74.37,68.17,57.45,51.08,48.18,43.26,40.67,38.58],
-    [35.45,34.03,34.66,35.72,35.13,35.07,35.67,35.79,35.66,36.81,37.92,38.81,40.19,40.14,45.96,49.70,48.13,50.64,47.35,44.18,41.64,41.18,41.24,43.91,43.69,42.81,43.40,45.60,44.28,45.80,52.20,48.89,54.15,61.60,68.79,81.58,95.04,85.13,73.21,62.51,58.46,49.41,41.87,38.06,36.97,35.94,35.67,35.58],
-    [37.95,37.55,37.08,35.97,36.10,37.10,37.32,36.53,36.06,40.96,42.70,47.94,58.08,59.97,78.04,82.38,66.97,68.58,63.53,59.76,54.10,49.54,46.31,45.16,44.96,45.31,46.81,47.33,46.81,50.64,60.53,66.62,82.76,81.27,101.05,115.26,101.63,84.45,80.09,78.23,76.30,73.74,61.26,51.23,47.53,42.21,39.89,38.57],
-    [42.93,42.86,43.12,40.85,41.22,40.82,41.35,41.59,42.51,45.58,50.09,56.64,58.40,68.27,84.44,84.46,80.34,77.20,65.59,60.96,60.18,57.11,57.11,54.51,53.03,56.48,56.69,57.85,57.09,64.43,66.23,70.86,76.13,82.26,94.65,119.71,106.44,93.09,81.65,86.98,86.88,71.99,65.03,58.96,63.90,53.15,49.26,45.27],
-    [56.82,53.79,49.35,47.92,48.64,48.31,46.14,48.47,50.07,56.29,60.05,64.09,58.73,62.67,77.90,83.47,82.40,85.89,77.06,70.88,67.17,65.04,70.24,59.36,60.18,65.20,60.81,61.79,61.67,64.57,68.73,65.10,76.01,83.60,98.53,118.47,114.88,104.26,98.66,91.79,90.27,83.49,79.15,68.37,72.42,68.07,58.06,55.94],
-    [38.23,35.42,35.03,34.60,33.12,32.86,33.76,34.22,34.95,39.38,47.87,53.47,58.92,69.96,94.60,85.00,78.39,77.52,75.52,64.19,63.48,53.44,51.01,53.49,50.28,49.61,47.90,47.63,49.56,50.89,52.21,57.47,62.13,73.62,94.98,121.91,138.81,134.57,121.68,113.33,104.16,81.57,68.28,64.06,58.12,53.26,47.42,41.46],
-    [45.26,43.62,39.93,38.39,38.73,38.89,38.29,41.25,42.51,50.94,50.53,60.25,69.63,69.58,84.06,78.40,77.35,64.62,56.88,55.40,49.04,48.34,46.58,47.55,54.03,51.63,44.76,43.97,50.67,51.88,50.39,51.96,62.84,71.56,89.94,109.39,125.14,124.01,110.81,98.87,96.83,87.36,79.09,71.59,73.20,57.31,52.51,47.27],
-    [54.83,51.26,47.68,50.03,50.61,49.96,51.85,48.59,56.02,55.28,55.48,44.85,68.27,62.59,64.62,48.99,53.58,53.44,46.66,45.97,44.45,46.08,41.76,40.37,36.91,37.23,36.03,36.97,38.24,39.92,41.93,48.92,53.99,69.21,83.08,94.28,114.47,147.77,131.01,115.72,94.75,80.81,59.71,45.71,73.60,52.28,50.80,52.40],
-    [52.03,54.29,50.02,46.97,50.31,48.41,47.79,50.84,52.00,53.38,50.35,51.83,59.51,48.04,48.69,52.91,48.77,52.51,54.55,59.44,55.17,59.36,54.68,57.10,58.49,58.55,58.95,56.70,58.49,62.89,66.01,66.22,77.63,86.71,94.11,98.89,96.82,88.04,93.88,87.55,77.02,67.26,66.59,57.39,71.95,51.05,54.45,54.95],
-    [34.11,32.09,29.27,31.72,29.77,28.81,28.55,26.50,30.36,30.46,33.68,35.14,39.98,40.13,41.84,42.48,43.57,45.71,47.76,49.23,49.74,47.86,47.92,44.74,44.23,44.40,45.10,45.75,47.53,44.11,48.93,53.23,63.83,69.81,81.17,87.01,80.76,76.10,64.64,62.52,53.67,53.02,42.50,39.77,41.06,36.62,35.12,33.36],
-    [28.07,27.19,26.85,26.88,25.30,24.13,26.60,24.37,25.33,25.53,27.02,27.58,30.74,28.39,29.04,29.50,33.36,32.27,32.84,34.33,33.71,33.18,33.59,38.77,43.01,46.37,43.07,44.68,49.44,50.32,54.60,54.01,63.54,68.75,79.13,81.17,73.62,69.25,68.21,74.98,62.76,53.84,45.20,41.40,37.30,32.58,29.94,28.63],
-    [32.49,31.07,29.82,29.69,30.98,29.83,29.90,28.97,31.01,32.20,33.46,33.41,39.95,38.00,47.82,42.22,41.67,45.37,42.55,42.20,43.05,43.93,41.14,38.54,39.71,40.44,39.83,42.96,43.32,45.91,45.63,50.79,59.04,57.39,65.83,67.79,64.79,59.82,63.78,62.15,59.14,52.80,47.67,43.28,40.86,36.40,30.42,30.51],
-    [31.20,27.89,29.95,28.22,28.15,28.03,28.12,28.28,28.28,28.74,31.96,36.76,40.91,41.22,45.75,46.13,41.25,41.44,41.64,42.21,37.64,38.60,41.14,40.99,40.62,42.49,40.75,45.09,52.16,58.00,60.71,58.87,61.95,66.80,68.60,66.90,67.48,72.30,64.58,60.34,53.71,52.74,47.14,41.43,42.83,36.41,33.46,31.16],
-    [31.86,31.13,31.05,26.90,27.44,27.88,27.52,27.77,29.73,30.66,33.12,37.25,41.70,41.94,43.32,45.35,39.88,40.34,36.83,35.74,32.43,34.71,34.49,36.28,37.22,34.34,39.63,41.40,39.84,43.75,45.29,48.19,53.85,55.77,58.20,61.25,73.00,67.13,50.17,47.56,47.25,44.83,41.92,36.24,38.01,34.56,32.89,32.01],
-    [28.47,27.39,27.25,26.91,26.45,21.11,22.87,22.98,26.93,28.07,29.25,34.91,47.32,50.61,57.69,53.55,39.64,40.09,42.78,40.96,39.70,41.21,37.08,35.47,34.73,37.84,38.53,40.62,40.82,43.01,43.67,46.78,50.00,60.59,67.27,88.63,74.13,59.49,51.89,51.49,45.12,41.94,44.15,38.70,39.28,34.17,31.60,30.42],
-    [49.08,46.90,43.03,42.22,44.49,42.73,43.53,44.36,45.66,53.07,53.80,59.54,64.37,77.97,85.60,72.45,61.93,64.93,61.45,63.39,61.12,58.48,56.78,54.18,55.40,57.77,52.90,51.82,54.58,54.15,52.50,62.15,68.11,73.97,99.21,115.33,105.22,94.77,83.90,79.46,84.42,82.08,78.17,69.39,78.38,73.34,64.38,57.79],
-    [39.39,37.40,36.20,33.82,34.76,35.64,35.04,31.45,37.04,39.91,43.56,43.59,54.20,59.53,65.91,56.73,54.26,46.91,41.99,40.23,36.45,35.81,34.32,33.47,32.50,33.54,34.21,37.31,37.86,41.02,42.95,45.91,52.83,57.02,76.45,103.34,99.59,93.70,85.24,76.23,65.74,62.54,58.26,55.84,59.15,49.98,43.07,42.12],
-    [40.12,35.68,32.89,31.19,30.55,29.36,30.85,30.20,34.71,36.58,40.20,46.17,59.27,68.09,81.83,84.28,71.75,64.44,53.44,48.57,41.60,35.35,34.05,33.90,34.30,39.47,45.46,36.42,47.49,50.55,49.93,55.06,60.24,69.67,77.27,101.66,109.14,111.62,100.55,90.80,83.30,73.60,75.09,66.29,64.40,50.87,48.65,42.67],
-    [45.39,42.92,39.83,37.54,40.81,41.57,43.50,43.90,43.55,44.81,49.28,54.72,57.99,66.68,67.75,71.60,55.37,55.90,48.73,40.84,30.00,29.03,26.59,27.84,26.21,21.16,20.22,19.70,23.84,25.92,36.62,42.72,47.51,54.98,67.25,79.05,105.24,106.86,98.26,94.94,80.01,78.02,83.93,75.74,68.47,55.77,49.74,46.53],
-    [39.47,42.23,37.23,37.88,37.49,37.79,36.39,37.54,39.62,43.43,45.12,48.74,54.99,56.07,53.37,53.52,46.41,47.61,46.70,39.54,39.39,37.04,34.52,36.40,30.90,32.82,26.53,31.80,29.98,33.01,42.31,47.51,49.33,49.96,58.95,61.14,70.69,84.82,74.19,62.63,55.58,49.44,52.09,48.88,53.84,46.53,44.99,41.42],
-    [43.38,42.51,40.31,40.20,41.13,40.68,40.92,42.70,45.30,50.77,50.73,49.74,51.57,52.42,48.61,44.89,39.73,38.96,37.12,32.18,28.31,27.89,18.86,21.94,13.87,14.93,18.23,18.08,18.36,23.66,26.02,34.71,44.31,52.67,62.38,65.25,69.34,73.60,79.93,72.89,67.30,63.44,59.94,53.51,53.84,47.21,44.92,42.04],
-    [33.90,34.35,32.62,32.62,32.41,33.45,33.52,33.37,33.75,32.76,34.30,36.95,39.42,39.71,37.41,36.10,36.14,36.89,34.39,34.46,33.25,35.10,34.30,31.01,28.79,26.22,25.04,29.15,29.55,32.07,36.65,39.37,43.85,48.58,53.44,56.42,59.39,58.26,60.34,62.98,54.96,53.45,51.34,43.62,40.93,40.66,38.71,35.57],
-    [30.16,27.70,24.67,24.72,27.90,28.18,27.47,27.68,27.80,32.05,32.78,34.28,32.50,35.83,31.59,32.18,32.30,31.96,31.69,27.42,26.12,28.35,33.29,30.94,30.31,30.43,26.61,27.14,31.58,34.71,35.76,40.12,43.83,51.32,55.78,58.48,60.08,62.42,53.04,57.49,51.77,46.48,44.67,43.02,42.13,37.99,36.03,32.28],
-    [40.96,35.13,34.65,33.37,32.36,32.02,32.36,30.51,30.37,33.75,34.54,37.73,40.20,44.28,42.43,41.33,39.33,40.66,40.34,38.42,37.39,37.51,44.02,44.16,43.50,43.40,43.17,45.84,43.09,44.13,43.98,46.31,50.52,54.74,59.64,63.89,67.14,65.20,62.80,65.30,58.78,51.70,48.44,44.61,47.97,43.21,41.88,40.64],
-    [38.92,38.21,38.33,36.96,34.99,36.38,35.15,36.24,38.35,41.57,42.83,45.16,46.32,48.72,54.94,49.78,49.50,47.03,49.31,47.26,44.92,45.66,47.20,50.37,49.58,49.19,48.71,49.34,57.30,55.30,59.41,65.32,71.29,70.67,66.88,69.54,66.80,74.95,67.33,63.74,59.55,49.87,47.64,43.98,46.84,46.04,41.66,38.32],
-    [35.50,33.48,28.80,30.06,28.51,29.24,26.36,27.95,29.44,30.31,35.72,37.99,44.08,53.65,60.45,58.84,48.30,42.20,38.76,32.93,33.29,31.43,32.90,32.22,28.25,29.13,30.91,35.75,33.21,37.90,40.32,43.44,48.59,54.88,61.84,72.80,76.42,69.62,61.27,49.76,48.66,46.84,46.90,44.94,44.18,40.83,39.56,35.62],
-    [29.36,26.78,29.16,26.69,23.72,27.41,26.41,26.53,26.93,31.67,36.49,40.35,47.63,63.51,85.55,73.68,63.02,55.81,46.41,41.10,38.17,36.99,37.02,35.32,32.85,32.40,31.34,32.96,36.04,37.83,40.12,45.08,50.60,61.10,72.71,91.92,84.98,71.61,62.24,63.99,60.72,50.07,50.33,45.15,46.08,40.97,36.81,33.11],
-    [31.99,30.29,28.67,28.45,29.92,29.65,29.33,27.91,29.76,34.19,35.72,39.70,52.15,64.80,96.73,91.53,73.98,63.13,59.40,49.99,45.19,39.31,38.15,37.73,41.76,41.37,42.73,42.51,45.19,45.31,48.96,46.20,47.06,49.30,70.91,79.32,73.31,64.00,55.55,47.83,46.18,47.46,48.57,45.29,47.17,40.45,36.48,35.18],
-    [33.44,30.38,27.29,27.68,25.53,23.99,21.59,22.31,25.09,26.56,32.11,37.42,48.31,65.17,88.53,86.26,70.34,52.06,49.28,48.29,42.00,33.11,31.47,30.67,30.18,28.82,32.02,32.68,34.91,40.12,41.85,43.04,44.73,48.68,61.03,75.48,77.51,64.32,55.72,55.90,51.47,55.60,59.85,53.87,47.10,40.67,36.82,35.88],
-    [34.29,33.51,32.14,32.95,30.40,28.51,28.67,30.23,30.80,33.26,36.28,41.04,45.63,63.65,73.96,64.24,53.52,49.11,46.40,35.88,32.76,26.04,22.93,24.64,26.04,23.52,27.70,30.86,31.83,34.97,40.64,43.46,46.05,48.21,59.11,71.34,82.17,76.20,68.35,57.98,53.63,57.69,67.32,51.70,55.94,47.39,39.44,38.60],
-    [34.84,33.24,33.44,32.25,33.10,32.87,31.53,31.97,33.71,36.31,39.49,45.37,46.16,48.49,50.38,43.88,42.64,39.32,38.77,30.61,29.11,25.58,21.59,21.37,20.53,16.67,15.09,20.51,23.01,29.87,33.17,39.63,42.73,48.94,56.84,66.73,71.37,71.28,62.80,58.60,53.04,49.11,53.07,49.25,47.27,41.29,39.66,38.02],
-    [47.49,44.20,41.00,39.77,39.66,43.33,42.68,44.64,46.41,47.57,46.16,48.51,51.71,57.22,55.09,49.66,45.39,39.78,38.63,37.93,33.64,28.48,28.97,30.07,-3.52,28.01,-33.94,19.92,30.97,33.92,39.43,46.13,49.68,59.55,69.56,78.47,85.34,93.70,80.80,75.68,75.72,65.05,62.95,58.05,61.48,56.75,50.55,47.95],
-    [55.75,49.37,43.61,44.76,43.01,44.73,49.18,50.16,52.86,53.42,55.39,47.05,47.80,45.93,47.18,42.72,40.64,38.55,38.31,37.20,35.61,37.01,37.05,38.27,37.86,40.05,40.26,45.86,43.27,43.22,48.13,56.24,54.33,59.01,68.08,76.17,74.85,77.89,80.42,66.99,58.01,54.57,57.19,56.72,61.59,59.91,58.70,60.41],
-    [52.89,51.05,46.80,46.31,44.38,44.59,44.84,44.88,45.35,43.79,44.48,43.04,45.16,46.22,50.00,42.46,43.64,47.47,47.10,47.22,48.85,51.14,50.48,55.29,50.36,56.00,56.16,59.64,61.30,63.63,72.01,79.38,86.85,92.82,90.23,94.94,92.91,94.41,88.37,90.73,89.61,79.68,65.84,60.75,61.87,52.91,53.29,51.91],
-    [47.34,45.74,46.54,45.19,44.21,44.16,43.84,44.74,45.82,47.90,46.12,46.87,48.70,47.09,44.68,42.32,44.65,43.09,39.94,38.68,39.39,39.74,39.14,37.99,39.83,38.80,40.21,40.62,45.27,46.13,49.91,51.59,56.34,66.97,72.66,93.21,86.32,82.93,71.98,72.12,65.15,60.83,58.11,51.44,53.66,50.75,51.89,49.60],
-    [69.80,64.41,59.21,60.42,58.90,60.09,58.38,55.38,54.15,54.20,55.21,59.63,59.86,57.24,63.56,57.96,48.18,46.90,46.41,45.48,44.13,46.55,45.65,54.72,48.12,53.65,58.28,60.03,57.08,54.97,58.96,62.57,66.23,76.31,85.93,95.68,97.24,91.04,91.46,87.22,80.26,75.42,71.56,67.33,65.79,65.49,60.29,66.00],
-    [40.37,39.30,37.68,34.98,35.62,38.17,37.89,36.82,36.02,37.21,41.36,44.82,45.47,46.98,47.59,52.63,45.10,41.18,40.67,38.40,35.36,36.10,37.63,43.23,42.29,41.78,44.17,47.44,52.54,55.39,51.61,52.40,61.02,68.46,68.16,68.63,72.40,81.62,73.92,60.68,52.23,45.59,45.11,45.46,49.57,44.62,44.23,41.98],
-    [41.04,39.87,39.36,39.27,38.62,38.59,38.57,38.87,40.54,41.16,42.31,44.07,46.61,45.92,49.96,49.88,46.71,42.05,38.10,36.21,31.81,29.52,30.92,30.20,27.64,34.05,32.92,32.57,34.30,36.32,41.44,48.34,52.45,57.18,66.87,80.75,91.14,79.58,62.77,51.99,50.36,47.62,47.05,45.82,48.27,47.81,44.58,41.26],
-    [40.45,37.71,37.62,35.13,35.86,35.44,35.37,37.69,38.00,40.82,45.38,48.53,57.58,64.26,79.91,81.82,76.59,67.65,59.57,57.32,46.99,40.80,36.82,38.33,42.24,37.09,38.05,41.88,43.27,47.76,48.37,55.32,63.95,76.84,100.35,125.59,119.76,102.94,84.77,68.92,57.80,56.61,52.30,49.83,55.88,49.85,45.47,44.48],
-    [41.15,39.88,38.49,38.46,36.93,36.57,35.61,35.70,37.52,40.21,43.32,45.14,52.92,63.20,88.90,86.31,69.01,62.80,61.07,53.55,52.01,47.28,42.31,39.14,36.78,34.19,32.74,36.46,44.76,46.06,50.53,54.83,55.96,72.76,101.99,119.09,113.94,95.62,83.45,73.82,67.56,56.92,56.65,51.82,54.63,46.77,48.60,43.42],
-    [40.08,37.01,36.62,35.67,34.95,34.36,34.39,35.09,37.11,39.04,42.16,45.15,48.13,63.91,76.47,80.02,69.63,57.37,47.68,42.15,37.91,34.60,31.61,27.42,27.22,27.67,29.07,31.39,35.40,40.47,42.43,46.50,44.65,57.83,79.32,96.84,96.51,94.78,81.48,71.87,64.52,64.07,53.57,48.73,47.01,47.06,42.71,41.69],
-    [39.73,36.19,34.79,32.73,30.62,33.07,30.50,31.87,35.52,38.76,42.64,47.92,59.99,78.17,87.76,84.02,70.89,59.21,51.71,45.65,5.00,21.26,22.58,-4.47,-8.79,24.49,30.12,28.42,31.60,37.15,42.91,46.98,54.81,53.77,77.99,101.01,106.21,105.72,92.57,79.06,82.29,74.11,66.91,56.83,57.13,48.27,45.26,41.92],
-    [42.27,40.13,34.91,34.48,31.60,36.81,37.42,32.43,38.27,44.95,52.17,52.89,69.52,72.77,73.83,66.96,55.71,51.17,36.58,23.36,26.40,15.03,7.87,13.87,18.91,-27.64,15.81,-15.41,-11.77,26.29,36.31,42.71,43.24,54.67,70.60,85.42,93.15,98.03,83.63,75.92,75.01,66.28,63.84,55.59,57.78,50.91,48.33,45.64],
-    [41.36,39.22,36.94,36.40,38.94,39.75,43.56,40.73,43.19,46.40,51.66,51.59,50.91,48.69,46.95,47.36,43.42,34.02,25.91,26.50,27.46,26.98,27.66,20.24,10.68,10.20,7.73,14.25,9.83,19.09,24.85,22.01,38.33,52.41,69.21,109.00,113.76,119.47,104.34,95.27,77.77,70.99,60.15,59.75,56.90,50.60,46.49,45.24],
-    [38.01,36.97,38.38,38.16,39.04,38.47,39.37,38.79,41.09,44.03,43.61,40.78,45.23,44.15,41.26,41.57,38.70,43.11,36.77,37.70,34.01,23.62,27.18,25.67,18.63,13.90,10.39,15.58,22.27,21.19,20.67,34.79,34.25,44.58,50.70,55.31,61.85,64.39,66.71,66.33,63.00,53.76,51.87,47.97,46.37,44.53,41.59,36.25],
-    [38.64,33.00,33.21,32.98,32.71,32.78,30.56,29.98,29.39,29.82,34.68,29.77,31.81,22.64,17.95,17.66,20.28,24.80,23.68,24.11,27.73,29.39,34.55,36.52,30.97,25.86,24.39,-2.04,-5.27,27.84,38.18,42.16,48.30,57.44,65.19,74.84,81.60,85.05,79.62,77.14,74.78,63.90,60.49,51.87,47.28,43.29,41.89,39.54],
-    [39.03,39.96,38.77,37.23,35.93,35.98,35.20,35.10,35.79,38.42,38.42,38.13,36.71,32.54,27.64,28.52,27.41,31.33,27.85,21.42,25.63,32.15,32.98,31.50,42.53,37.89,37.23,49.72,50.89,52.22,61.28,67.07,74.12,81.33,92.85,97.79,102.32,100.68,90.84,86.56,80.65,75.80,66.54,56.70,59.26,50.91,48.44,44.43],
-    [33.49,29.62,31.88,28.51,28.07,26.83,29.27,26.01,31.39,33.56,36.65,34.94,37.72,32.45,27.66,24.67,23.12,22.70,15.88,18.47,20.69,22.09,21.19,24.90,27.77,31.81,20.28,32.89,27.78,34.57,35.74,40.84,49.10,53.46,55.76,62.80,70.89,68.47,65.92,59.31,55.29,51.46,46.26,42.26,39.72,39.10,37.34,35.26],
-    [39.74,40.69,39.98,37.83,35.00,34.42,37.96,36.56,36.11,40.20,40.32,45.83,53.64,52.98,47.83,40.04,38.09,35.06,34.12,31.50,26.11,40.91,38.46,43.55,46.37,43.15,36.55,47.43,47.07,55.98,54.28,51.78,57.33,72.35,85.22,88.71,81.89,82.28,81.06,70.55,66.09,59.48,61.34,51.20,48.28,44.29,43.51,41.90],
-    [44.25,43.81,45.09,44.90,44.61,48.54,48.72,48.22,49.69,50.90,53.08,53.57,62.88,68.30,65.31,58.60,58.09,50.28,44.67,41.13,35.19,24.90,25.82,27.08,29.79,25.71,29.65,38.37,40.85,42.09,48.76,53.65,58.80,61.96,71.57,84.00,89.38,82.84,65.63,63.20,58.83,60.19,59.82,57.68,53.95,51.41,49.11,47.39],
-    [46.84,42.26,43.26,41.86,44.15,41.96,44.53,42.51,42.88,47.24,49.67,46.72,58.69,70.62,93.22,84.50,75.70,71.88,56.54,47.50,50.25,44.42,42.03,33.43,35.64,42.35,41.28,49.81,49.70,58.18,57.21,71.28,74.71,89.05,104.77,122.96,109.19,92.88,80.34,77.39,72.20,72.16,67.47,56.50,52.27,54.62,50.05,48.78],
-    [38.68,37.09,31.51,36.10,36.96,33.33,34.56,34.73,38.73,39.23,42.41,43.22,56.43,81.40,102.56,98.35,89.35,80.43,69.96,54.34,49.47,36.11,30.35,23.37,27.50,33.18,34.38,40.28,43.65,47.83,54.39,64.24,78.03,96.45,130.50,139.85,131.66,109.22,100.79,94.63,87.41,79.55,75.30,66.53,56.91,47.33,46.08,41.32],
-    [43.39,38.29,35.90,37.31,36.01,35.14,33.12,32.56,32.25,38.55,36.58,39.88,49.91,58.14,66.87,71.35,64.61,56.80,52.26,46.31,41.98,40.96,36.58,37.89,30.53,34.63,32.91,23.07,40.88,44.37,47.01,50.82,61.69,78.29,87.85,112.01,105.10,96.66,79.49,75.10,72.23,70.75,70.43,61.57,54.22,49.89,43.49,40.34],
-    [39.43,42.34,39.46,39.81,32.71,32.34,36.59,39.27,42.21,40.42,37.58,43.26,58.08,69.03,82.62,75.10,62.31,50.93,48.54,42.08,35.78,34.27,10.69,10.89,14.56,13.45,19.19,29.26,24.43,41.13,43.47,45.15,49.66,60.64,73.16,85.31,88.53,87.29,79.74,71.31,65.94,65.48,64.55,58.78,56.57,47.01,43.52,41.30],
-    [39.15,41.23,38.72,40.01,38.19,40.01,38.83,40.97,40.53,42.35,43.38,48.12,59.93,59.68,60.45,52.14,43.97,39.23,28.65,30.91,27.54,22.89,16.80,13.43,23.93,19.47,19.79,22.97,24.42,28.02,28.51,36.41,47.07,56.05,68.09,84.08,96.96,95.48,81.57,72.88,60.19,55.52,60.43,56.66,51.72,48.03,44.50,41.73],
-    [47.75,48.63,46.21,46.24,42.97,48.12,48.64,45.41,46.14,51.96,54.56,52.54,54.87,51.40,50.83,48.43,38.28,42.79,38.76,31.61,35.40,34.00,20.91,16.25,7.91,4.17,8.48,10.94,-2.38,21.06,19.87,32.75,36.65,52.66,68.09,75.00,92.71,97.76,95.33,87.15,77.00,70.32,69.23,67.20,65.17,57.16,54.47,49.65],
-    [41.86,42.13,44.05,42.35,39.95,42.62,41.33,42.46,43.63,42.14,43.92,39.39,42.99,44.75,40.40,37.36,29.23,25.25,33.18,29.36,34.27,20.52,15.02,24.92,15.69,4.00,14.26,13.94,8.94,15.20,15.47,31.61,36.95,52.93,56.84,66.86,71.78,77.57,77.35,72.08,64.48,58.37,56.81,55.36,55.97,50.24,48.46,44.63],
-    [53.24,48.21,48.24,46.43,44.12,44.28,45.56,45.40,49.18,46.36,46.48,38.77,40.90,35.89,32.51,31.86,31.82,39.03,27.29,38.34,24.66,22.66,35.61,29.05,22.27,32.01,39.13,40.83,40.15,41.85,49.55,52.63,68.67,77.95,90.55,105.22,108.26,114.04,107.84,105.20,96.59,78.63,76.77,74.00,71.38,64.65,59.03,53.76],
-    [45.35,43.29,41.74,41.07,40.73,39.32,38.98,38.02,39.62,41.80,41.35,35.54,32.92,28.92,29.86,30.88,31.86,33.01,32.53,27.66,33.85,33.58,32.79,48.15,46.43,37.80,55.12,51.49,50.85,55.51,72.57,68.68,73.44,73.42,85.17,93.71,99.51,102.63,88.17,84.72,78.27,72.97,67.80,63.19,58.37,51.41,49.26,48.00],
-    [52.83,50.28,46.99,44.99,45.82,43.24,44.18,42.68,44.44,45.87,47.96,49.61,51.04,51.11,48.59,43.80,39.58,43.16,36.60,35.78,37.34,53.85,58.86,65.76,62.35,62.25,56.67,63.58,70.72,66.41,76.86,83.40,89.05,95.28,98.93,106.29,104.24,101.76,96.66,97.24,89.52,86.60,87.26,74.06,66.47,59.25,56.70,54.69],
-    [42.02,38.98,37.82,37.09,38.16,35.85,37.67,35.58,38.83,38.56,43.75,42.85,48.73,45.19,44.57,44.31,33.96,33.98,27.57,23.79,20.79,28.89,32.82,43.01,33.88,29.67,37.74,42.50,46.17,55.73,63.31,64.18,68.05,72.06,81.04,88.98,85.69,84.96,77.74,69.94,64.89,63.37,60.65,57.00,48.53,47.17,45.61,43.05],
-    [58.01,56.15,53.66,50.70,49.71,53.75,53.67,54.95,52.08,60.54,63.70,67.02,76.85,90.30,88.20,72.00,62.98,60.50,54.77,39.47,35.25,39.21,40.38,46.77,38.08,55.45,53.28,53.14,49.45,52.58,63.47,72.11,93.36,99.22,114.87,115.17,112.96,102.90,86.66,78.11,72.73,69.18,70.39,68.12,64.69,57.99,57.63,57.12],
-    [47.85,49.09,47.53,45.36,43.84,43.77,42.34,43.79,48.43,50.37,56.12,57.12,72.78,85.96,97.24,85.36,73.42,66.82,59.32,55.12,43.99,46.03,35.74,33.69,45.58,40.40,41.57,45.03,52.35,49.78,58.90,57.66,70.29,91.45,96.74,110.01,94.88,80.34,73.26,70.91,66.46,71.14,64.16,62.66,57.56,56.05,54.16,46.97],
-    [59.84,54.30,51.59,49.35,50.99,48.95,49.48,49.48,53.87,54.98,61.43,60.12,67.38,84.83,105.42,104.81,82.82,75.77,73.19,67.66,55.26,48.18,45.05,41.69,30.95,37.95,37.84,48.85,54.49,61.01,63.34,67.37,79.60,89.15,102.43,112.04,101.40,89.96,82.81,78.75,77.41,70.42,71.99,71.05,70.33,66.26,65.82,63.82],
-    [58.08,55.74,53.12,54.24,51.14,50.29,51.08,50.80,51.16,54.44,67.63,64.79,73.22,84.52,103.93,103.96,88.11,88.27,76.45,66.97,56.91,58.96,52.89,47.55,49.59,50.60,52.46,57.69,58.80,57.70,67.28,76.96,83.02,94.18,104.58,110.94,107.81,103.08,100.15,93.41,94.62,84.78,82.45,76.36,70.57,68.12,62.79,61.63],
-    [64.87,59.33,57.21,53.28,52.59,52.79,53.13,54.23,57.18,57.47,67.75,66.96,83.11,105.19,117.35,103.31,92.60,79.42,72.10,58.06,51.24,49.24,30.89,33.47,21.46,34.69,26.08,44.37,41.26,52.18,55.59,62.84,74.59,90.22,103.38,127.71,141.02,131.31,109.23,95.83,98.45,91.51,85.66,82.15,75.18,70.00,63.48,63.43],
-    [70.03,67.11,68.11,69.05,66.88,66.08,67.98,70.52,70.65,74.28,81.83,86.13,95.41,99.05,96.36,84.52,70.87,66.39,55.07,48.06,44.18,49.60,36.47,33.10,23.56,31.80,27.01,44.38,43.27,49.39,55.96,56.85,62.32,85.69,92.23,119.88,132.05,127.30,116.45,105.80,93.50,94.60,88.12,89.35,77.65,74.81,75.06,71.88],
-    [82.62,82.32,82.72,80.22,80.07,81.28,81.24,81.19,83.69,88.36,92.60,97.23,100.71,90.15,89.87,78.90,62.11,58.22,53.75,51.26,34.46,48.69,52.97,48.33,6.98,49.45,41.53,35.54,44.29,47.63,59.40,62.68,74.29,91.03,93.40,109.66,120.57,131.97,120.48,97.83,96.51,79.92,84.11,80.63,80.89,77.92,87.50,83.14],
-    [74.81,75.53,74.92,73.12,69.07,67.88,71.40,71.40,76.01,78.35,83.05,77.83,76.10,69.81,65.13,51.48,45.45,41.98,34.68,26.10,41.17,25.05,27.00,37.23,31.46,33.71,7.81,22.82,29.81,38.21,41.85,51.96,66.72,91.44,99.44,129.05,144.40,157.14,154.38,116.40,104.10,103.30,94.25,86.42,88.23,84.88,84.28,83.35],
-    [72.24,68.88,64.25,65.53,64.55,66.30,69.15,68.08,72.98,71.11,71.80,64.48,65.84,66.37,59.76,49.76,57.46,49.35,48.87,43.84,37.79,38.52,33.71,39.07,32.34,42.98,51.25,40.78,43.94,53.25,64.67,72.99,85.29,90.11,102.31,124.09,152.73,152.10,142.06,124.87,102.10,96.77,92.57,92.23,87.47,78.83,81.25,74.69],
-    [69.63,66.13,68.19,66.96,68.12,67.72,68.37,66.44,69.23,68.79,70.24,64.18,65.53,52.14,54.18,49.41,50.00,43.30,34.76,7.31,28.08,27.57,34.90,47.78,36.93,55.44,55.48,68.14,71.66,68.49,70.55,75.54,80.00,86.07,88.70,101.26,107.78,107.60,108.90,101.74,95.12,87.35,86.25,87.14,77.71,74.43,71.02,70.93],
-    [71.91,68.56,68.38,68.22,69.25,68.65,68.80,68.15,68.50,68.29,70.57,71.84,74.19,73.16,68.39,68.74,60.30,57.09,51.53,43.78,45.66,46.17,54.00,63.02,63.73,57.38,59.77,55.14,52.93,58.55,77.24,80.34,81.56,82.66,102.71,119.73,133.29,117.72,102.76,96.71,88.46,85.03,85.06,81.47,76.27,75.78,73.13,72.61],
-    [76.84,74.09,72.28,68.96,71.90,69.15,69.60,71.51,71.87,74.58,76.56,81.29,89.89,88.12,87.04,73.52,63.75,65.48,47.87,43.80,50.00,40.68,45.73,58.06,59.78,73.61,69.56,79.98,83.22,83.60,88.01,97.37,113.07,104.01,123.31,130.15,133.67,127.94,115.56,102.89,100.94,97.15,93.14,89.20,85.57,79.85,79.03,76.74],
-    [81.38,78.00,79.35,80.87,82.08,79.35,78.82,79.32,81.39,84.64,87.70,90.28,104.97,113.82,114.77,100.25,91.47,81.16,80.33,63.86,57.74,46.72,50.48,47.99,14.17,30.51,61.18,60.33,65.17,67.14,82.58,81.73,91.06,108.36,116.01,131.49,140.49,126.29,119.14,114.53,109.91,100.21,97.41,92.63,93.53,83.09,86.18,81.37],
-    [69.53,69.22,65.66,67.30,65.32,64.51,66.37,67.33,69.17,72.87,73.00,80.39,89.50,105.09,118.45,111.26,94.94,82.76,76.04,63.17,44.14,38.32,48.24,37.43,32.96,64.13,71.82,69.67,77.57,88.02,94.45,108.48,126.39,157.30,189.92,213.51,189.05,168.12,147.03,136.48,118.07,99.91,90.69,85.80,81.43,76.37,75.24,72.33],
-    [97.99,91.12,90.38,90.18,91.52,87.57,87.78,87.15,89.23,94.08,103.42,108.71,130.60,167.76,217.90,214.56,173.71,148.91,120.44,103.02,101.43,84.20,72.83,66.08,58.98,71.38,78.02,82.22,87.60,95.66,106.71,109.18,127.79,149.01,208.85,314.84,297.15,241.39,206.10,199.88,192.06,180.76,161.98,137.53,110.89,104.89,101.09,99.06],
-    [82.84,80.10,80.50,76.84,78.59,66.97,73.98,75.60,77.88,80.44,87.61,96.42,103.11,116.73,133.23,128.02,116.02,113.33,108.11,98.43,84.10,70.54,54.57,52.32,49.64,43.16,63.17,67.52,73.23,86.97,94.84,99.50,113.71,152.62,161.70,178.86,180.64,164.41,140.77,133.86,136.11,137.15,132.96,133.13,117.13,101.62,95.23,87.37],
-    [85.23,82.19,78.46,77.95,78.91,76.43,75.17,75.44,80.42,80.36,96.95,105.77,117.47,140.60,159.36,131.48,110.96,101.93,90.70,84.58,77.19,72.39,65.62,70.42,61.46,61.82,67.21,71.70,71.19,74.60,77.26,84.95,93.75,109.12,124.91,141.84,161.29,162.83,130.99,123.80,115.85,108.23,110.87,101.71,101.97,96.03,88.27,83.60],
-    [72.00,69.14,64.86,61.52,61.10,63.77,64.15,61.94,69.56,66.79,70.47,77.87,83.42,85.41,89.37,78.49,69.51,66.02,56.18,44.03,54.32,5.17,2.77,27.06,-13.00,-0.92,38.05,26.15,44.63,34.22,62.08,69.47,80.33,91.36,105.31,118.46,125.15,129.76,117.32,111.20,98.10,90.83,91.21,86.68,80.85,78.84,78.15,73.61],
-    [80.19,78.96,73.77,73.10,80.61,80.72,102.10,79.14,98.85,113.88,95.57,100.86,95.63,66.88,69.70,42.14,33.93,11.67,18.63,11.95,12.76,11.46,-4.10,-1.26,-12.29,5.47,17.71,35.87,50.22,8.53,31.54,55.44,95.83,123.98,173.05,225.98,207.20,179.09,182.30,163.61,115.78,109.01,102.73,93.77,92.61,96.31,97.11,95.46],
-    [109.09,86.90,92.25,73.01,79.54,72.06,77.07,71.78,88.14,99.90,81.15,73.60,68.25,60.93,86.37,38.94,18.81,12.36,35.98,28.34,69.14,28.08,39.54,43.11,18.77,51.50,55.22,59.86,95.22,65.73,60.37,112.34,136.75,147.07,188.25,305.98,398.47,322.32,197.04,154.22,132.11,111.67,108.86,106.01,114.80,90.76,101.89,110.74],
-    [69.81,65.78,64.29,67.79,77.37,94.05,109.17,63.82,60.11,76.95,69.49,71.79,48.00,33.73,29.33,15.09,2.61,-4.04,-3.26,-2.22,-26.56,-44.86,-11.40,-12.51,9.73,9.97,15.12,33.03,39.85,62.84,56.21,76.50,106.26,141.77,128.60,158.04,212.84,285.91,206.97,201.08,150.04,109.34,115.53,126.26,105.02,101.48,84.24,90.12],
-    [85.79,76.26,70.08,70.31,81.07,61.00,61.01,59.55,60.40,60.37,60.51,52.24,56.10,43.74,35.67,24.30,16.71,13.60,18.63,8.83,-13.67,-29.74,-16.92,35.38,20.32,26.17,32.66,33.08,26.92,59.35,43.51,86.80,78.16,90.12,117.92,174.08,287.19,344.19,229.23,195.14,177.89,132.78,113.38,109.69,123.04,105.81,90.61,77.55],
-    [47.47,43.81,44.22,45.59,43.93,45.90,47.09,44.52,43.18,44.46,49.98,62.24,63.80,53.20,41.69,30.09,34.59,22.89,23.07,24.95,37.49,30.70,51.82,71.85,35.46,35.82,30.09,60.78,106.87,94.53,134.63,159.21,107.95,131.49,135.21,199.65,211.77,194.34,159.14,117.04,104.01,118.62,95.93,84.96,77.13,69.73,66.24,57.18],
-    [63.81,62.19,61.35,55.95,55.48,53.72,57.95,54.18,60.36,63.03,72.76,75.73,109.41,124.45,92.32,49.25,41.38,36.43,27.11,19.34,-3.35,0.73,-11.53,-5.31,19.31,37.96,26.75,36.47,29.48,43.98,63.32,88.11,115.24,146.74,193.56,262.24,229.67,232.37,191.80,193.43,140.31,121.53,103.53,90.63,82.77,86.58,71.45,63.98],
-    [41.25,56.51,54.37,34.49,34.12,31.70,32.64,33.81,36.13,36.74,49.94,72.79,97.51,112.20,128.07,87.55,58.81,41.09,16.59,-4.76,-9.21,-21.48,-21.06,6.61,21.48,32.97,45.36,76.75,68.51,49.79,70.23,98.50,119.74,170.11,246.74,240.59,221.40,197.22,134.80,102.31,90.38,112.90,114.64,106.50,103.21,74.12,67.53,69.90],
-    [46.05,38.49,36.58,39.65,36.58,35.19,34.00,36.81,47.29,57.09,65.77,85.99,149.60,146.43,178.65,146.39,110.36,103.35,131.12,53.08,29.57,30.22,19.00,15.18,38.40,46.35,45.97,59.59,65.07,39.37,76.14,108.63,136.85,168.91,216.74,258.04,146.01,140.03,126.24,110.17,132.86,114.78,123.95,126.03,117.21,93.55,82.53,57.62],
-    [47.22,43.16,47.03,38.90,30.79,28.15,32.59,33.05,38.02,52.48,68.25,77.90,100.91,112.52,140.06,159.21,121.43,72.68,122.77,89.38,22.53,30.37,-20.67,-113.98,-138.13,-94.93,-54.48,-10.91,54.94,45.36,66.46,106.28,140.35,161.51,198.73,199.98,184.86,138.78,121.44,115.24,114.97,115.58,119.59,122.94,98.45,78.29,65.47,53.39],
-    [54.42,46.05,42.36,39.60,37.26,36.83,39.88,36.28,40.80,49.02,63.78,77.58,149.80,141.45,197.76,160.42,145.38,127.57,127.14,108.40,101.25,63.36,24.02,-19.71,16.78,-22.43,22.68,7.32,15.27,38.47,49.83,72.67,138.19,177.28,239.16,171.20,169.49,157.70,135.99,123.53,124.51,119.43,125.97,102.80,91.66,78.59,69.37,55.84],
-    [84.13,68.29,66.25,63.86,63.85,59.46,61.06,61.92,68.90,70.67,83.49,106.50,112.74,176.11,296.58,247.95,128.89,92.00,87.67,90.16,68.91,39.64,15.29,23.10,-26.47,-36.47,-29.80,3.33,10.57,40.62,46.46,61.61,77.07,107.12,183.35,192.58,212.69,227.80,168.37,134.43,155.75,142.32,165.08,153.42,117.53,102.43,97.50,93.42],
-    [94.51,83.40,86.55,73.13,73.15,75.77,65.99,69.54,65.33,70.91,85.76,94.96,109.13,110.93,133.14,79.12,63.14,24.75,6.87,22.51,-68.15,-71.57,-141.51,-137.05,-182.93,-183.62,-159.07,-95.92,-53.14,-24.09,8.22,42.31,54.57,84.89,164.01,261.40,218.23,170.99,159.79,154.60,159.49,161.47,165.33,111.81,105.75,89.07,99.61,107.71],
-    [121.26,122.58,120.90,109.87,113.34,141.28,133.39,142.93,138.69,115.43,112.48,163.15,168.46,120.70,122.15,67.90,68.85,49.26,33.70,-7.76,-30.31,-88.85,-129.41,-137.61,-146.88,-145.51,-121.73,-52.56,-46.33,23.87,50.89,73.54,99.13,120.28,137.27,228.70,255.77,212.46,215.55,204.89,178.50,141.77,166.30,153.90,159.84,151.83,130.59,122.34],
-    [120.14,122.77,94.59,91.81,89.40,94.63,108.58,121.46,117.09,117.48,146.47,140.24,94.86,64.01,74.47,70.77,30.65,15.27,-13.38,-48.52,-45.46,-28.29,-22.73,-38.79,-70.82,-61.99,-55.16,-43.70,-14.53,9.04,19.26,27.62,61.83,80.15,99.83,131.46,213.65,222.92,195.41,168.43,126.06,123.71,116.04,117.60,104.92,101.61,99.30,112.47],
-    [114.41,109.87,108.02,106.15,105.08,95.18,101.74,103.01,101.52,103.03,108.61,103.03,98.06,96.19,95.06,92.66]
-   ];
-    z3_values = [
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-0.99,-0.75,-0.88,-0.76,-0.73,-0.69,-0.53,0,0.0,0,0,0,0,0,0,0,0,0,-0.9,-1.34,-2.89,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-13.65,-36.56,-32.93,-40.88,-36.75,-40.96,-40.9,-22.38,-3.97,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-6.33,-33.6],
-    [-40.22,-55.37,-40.65,-55.37,-40.51,-40.74,-40.51,-40.51,-40.06,-39.99,-40.04,-39.99,-39.99,-17.19,0,-39.99,0,0,0,0,-16.04,-41.15,-14.49,-41.33,-41.15,-39.8,-11.67,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-32.7,-40.16,-55.39],
-    [-36.09,-40.71,-40.76,-40.73,-39.99,-39.99,-39.99,-39.99,-39.99,-39.99,-40.0,-54.12,-39.99,-37.97,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-21.95,-28.26],
-    [-32.38,-38.95,-38.95,-38.95,-40.29,-36.74,-33.28,-38.95,-11.99,0,-144.01,-33.34,-51.61,-9.31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-19.39,-19.32],
-    [-32.15,-34.39,0,-38.84,-38.84,-94.19,-94.19,-94.19,-94.22,-17.95,0,-20.47,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-24.77,0,0,0,-29.94],
-    [-144.01,-164.85,-191.29,-192.38,-193.86,-193.84,-193.82,-193.82,-193.84,-193.85,-193.75,-144.01,-144.01,-138.99,-127.08,-84.37,-85.64,-14.55,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-14.36,-46.53,-95.69,-144.01,-111.8,-125.8,-144.01],
-    [-30.84,-31.41,-38.84,-38.84,-38.84,-38.84,-38.84,-38.84,-94.06,-91.55,-15.91,0,-86.04,-83.35,-30.4,-25.33,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-23.85],
-    [-75.2,-124.63,-94.0,-93.86,-124.47,-124.47,-124.47,-124.48,-124.5,-124.54,-91.32,-124.8,-16.13,0,-89.88,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-8.83,0,-51.77,-38.84,-94.19],
-    [-37.97,-37.97,-44.2,-47.54,-44.55,-37.97,-38.84,-37.97,-37.97,-37.97,-37.97,-37.97,-35.83,-26.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0.0,0,-50.89,-50.89,-50.89,-19.24,-38.89,-37.97,-37.97,-26.18,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-49.45,-49.45,-49.45,-49.45,-49.45,-49.45,-49.45,-49.45,-46.51,-18.71,-34.73,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-34.73,-34.73,-34.73,-34.73,-34.73,-42.65,-41.81,-34.73,-34.73,-34.73,-34.73,-18.25,-34.73,-34.73,-17.85,-0.96,0,0,0,0,0,0,0,0,0,0,-4.27,-4.17,-20.67,-17.84,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0.0,0.0,0.0,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,0,-14.76,-34.73,0,-23.67,-22.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-34.73,-34.73],
-    [-34.73,-34.73,-34.73,-34.73,-34.73,-28.73,-28.73,-34.73,-34.73,-34.73,-34.73,0,-34.73,-24.9,-34.73,0,0,-28.61,-28.61,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,-34.73,0,-34.73,-34.73,-34.73,-34.73,-34.73,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-34.73],
-    [0,0,0,0,-34.73,0,-34.73,0,0,0,0,0,0,-20.71,0,-34.73,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-17.24,0,0,0,0,0,-13.06,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-25.69,-25.69,0,0,-25.69,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,0,-25.69,-18.93,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,-25.69,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-2.18,-8.8,-30.27,-2.42,-30.27,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-30.27,0,-29.52,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-0.74,-27.56,-27.56,-27.56,-27.56,-27.56,-27.56,-27.56,-27.56,-27.56,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-30.27,-30.27,-30.27,-7.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-30.27,0,0,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.27],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-29.52,-29.52,-29.52,-30.02,-30.12,-30.27,-30.02,-30.02,-30.02,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-29.52,-29.52],
-    [-30.07,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-30.27,-29.82,-29.82,-0.04,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-0.2,-29.92,-30.07,-30.12],
-    [-30.22,-30.22,-30.27,-30.27,-30.27,-30.22,-30.22,-30.27,-30.27,-30.22,-30.12,-27.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.12,-30.12,-30.22,-30.27],
-    [-30.25,-30.25,-30.25,-30.25,-30.27,-30.27,-30.27,-30.27,-30.25,-30.25,-30.25,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.02,-30.25],
-    [0,0,-30.13,-30.13,-30.13,-30.13,0,-30.13,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-30.13,-30.13,-30.13,0,-30.13,-30.13,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-29.61,-29.61,-29.61,-29.61,-29.61,-29.61,-29.61,-29.61,-29.61,-29.61,0,0,0,0,-0.68,0,0,0,0,0,0,0,-0.99,-1.0,-1.0,-29.51,0,-29.12,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.59,-29.56,-29.56,-29.56,-29.56,-29.56,-29.56,0,-29.56,-29.56,-29.56,-29.56,-29.56,-29.56,-29.56,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,-29.56,-29.56,-29.56,-30.01,-30.09,-29.56,-30.06,-29.56,-29.61,-30.06,-30.06,-30.03,-29.59,-28.41,-29.56,-29.56,-29.56,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-29.56,-29.56],
-    [-30.09,-30.09,-30.09,-30.09,-30.13,-30.13,-30.09,-30.09,-29.56,-29.56,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-14.31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-29.07,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,-29.94,-29.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,-29.03,-29.94,0,0,-29.03,-29.94,-29.94,-29.94,-29.94,-29.94,-29.94,-29.94,-30.15,-30.15,-30.2,-29.94,-29.03,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,-29.03,-29.03,-9.71,0,-29.03,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,-29.4,-30.16,-30.15,-29.4,-30.15,-30.15,-30.15,-30.16,-30.16,-30.21,-30.21,-30.21,-30.26,-30.45,-30.26,-30.21,-30.26,-30.21,-30.21,-30.15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,-26.29,0,0,-30.16,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,-30.15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,-30.06,-30.2,-30.06,-30.06,-30.06,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.0,-30.06,-30.06,-30.06,-30.06,-30.49,-30.06,-30.06,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.1,-30.1,-30.2,0,0,-30.36,-30.3,-30.3,-30.3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,-30.1,0,-30.1,-30.3,-30.1,-30.3,0,0,0,0,0,0,-30.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,-30.3,-30.2,0,-30.4,-30.4,-30.36,-30.4,-30.4,-30.4,-30.46,-30.36,-30.3,-30.3,-30.3,-30.3,-30.2,-30.3,-30.2,-30.3,-30.2,-30.2,0,-30.2,-30.2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-30.35,-30.4,-30.4,-30.4,-30.4,-30.4,-30.36,-30.36,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-29.69,0,-29.71,-29.69,-29.69,-29.69,-30.35,-30.35,-29.69,0,0,0,0,0,-29.71,-30.25,-30.4,-30.4,-30.49,-30.49,-30.35,-30.35,-30.31,0,0,-30.31,-30.31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-30.3,-30.35,-30.35,-30.35,-30.3,0,-30.3,-30.25,0,0,0,0,0,-26.69,-30.3,-30.3,-30.31,-30.35,-30.31,-30.35,-30.35,-30.36,-30.35,0,0,-30.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,-30.35,-30.35,-30.36,0,0,-30.35,0,0,0,0,0,0,0,0,0,0,0,-30.25,-30.3,-30.35,-30.31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0.0,0,0.0,-30.35,-30.36,-30.3,-30.3,-30.3,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-29.94,-29.95,-30.04,-29.95,-29.94,-29.95,-30.04,0,0,0,0,0,0,0,0,0,0,0,0,0.0,0,0.0,0.0,-30.04,-29.87,-29.9,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-29.91,-29.91,-29.95,-29.94,-29.94,-29.97,-29.91,0,0,0,0,0,0,0,0,0,0,0,-29.9,-29.94,-29.95,-29.95,-29.95,-29.99,-29.99,-29.97,-29.95,-29.94,-29.9,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-29.87,-29.9,-29.94,-29.97,-29.99,-29.97,-29.99,-30.01,-29.97,-29.91,-29.9,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-29.9,-29.9,-29.9,-29.97,-29.95,-29.94,-29.94,-29.94,-29.95,-29.95,-29.95,-29.95,-29.94,-29.91,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-29.87,-29.87,-29.9,-29.9,-29.99,-29.99,-65.47,-29.99,-30.04,-30.01,-30.04,-30.01,-29.97,-29.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-7.49,-29.87,-5.5,-29.87,-29.87,-5.51,-29.87,-29.9,-29.94,-29.94,-29.95,-29.91,-29.9,-7.02,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-7.47,-9.94,-29.9,-29.9,-9.94,-9.94,-9.94,-9.94,-29.87,0,0,0,-29.87,0,-9.94,-9.94,-9.94,-29.95,-29.95,-29.94,-29.95,-29.97,-29.99,-29.97,-29.95,-29.95,-29.97,-29.97,-29.94,-29.94,-29.91,-9.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94],
-    [0,-5.09,0,-5.03,-5.09,-5.09,-5.06,-5.12,-5.12,-5.09,-5.09,0,0,0,0,-9.94,-9.94,-9.94,-9.94,-5.21,-9.94,-9.94,-5.21,-9.94,-5.18,-5.15,-5.12,-5.09,-5.06,-5.03,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-5.03],
-    [0,-5.09,-5.15,-9.94,-9.94,-9.94,-9.94,-5.21,-5.21,0,0,0,0,0,0,0,0,-5.09,-5.21,-9.94,-9.94,-9.94,-15.0,-15.0,-9.37,-9.37,-9.37,-15.0,-9.47,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,-9.94,-9.94,-9.94,-9.94,-9.94,-9.94,-9.94,-9.94,-5.15,-5.12,0,0,-5.06,-5.06,0,0,-5.03,-5.15,-5.15,-5.09,-5.09,-5.21,-15.0,-15.0,-9.94,-9.94,-9.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94],
-    [-5.09,-5.18,-5.03,-5.21,-9.94,-5.06,-5.12,-5.18,-5.18,0,0,0,0,0,0,0,0,0,0,0,-9.94,-9.94,-9.94,-43.57,-43.57,-5.06,-5.09,-5.03,-5.03,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-5.12,-5.12,-9.94,-9.94,-5.18,-5.18,-5.18,-9.94,-5.12,0,0,0,0,0,0,0,0,0,0,0,-5.18,-9.94,-9.94,-5.15,-5.12,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-5.09,-5.18,-9.94,-9.94,-9.94,-9.94,-9.94,-9.94,-9.94,-9.94,-5.18,0,0,0,0,0,0,0,0,0,-5.18,-9.94,-15.13,-15.13,-9.94,-43.62,-9.94,-5.18,-5.12,-5.06,-5.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,-5.09,0,-5.15,-5.15,-5.15,0,0,0,0,0,0,0,0,0,0,0,0,-9.94,-15.13,-15.13,-45.62,-45.62,-45.62,-45.62,-9.94,-5.15,-5.21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-5.21,-5.21,-5.21,0,0,0,0,0,0,0,0,0,0,0,0,0,-45.43,-5.21,-15.13,-45.43,-45.43,-45.43,-45.43,-43.48,-43.48,-15.13,-9.25,-9.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94,-9.94,-9.94,-8.9,-9.94,-9.94,-15.13,-1000.0,-36.88,-1000.0,-195.98,-9.94,-5.21,-5.15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-5.06,0.0,-9.94,0.0,0.0,0.0,0.0,-15.13,0.0,0.0,-9.94,-9.94,-9.94,-9.94,0,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94,-15.13,-36.81,-37.44,-36.81,-52.79,-43.19,-52.79,-52.79,-36.81,-15.13,-5.15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94,-9.94,-15.13,-15.13,-45.2,-45.2,-45.2,-45.2,-45.2,-45.2,-45.2,-15.13,-5.18,-5.06,-15.13,-9.94,-15.13,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94,-9.94,0,0,0,-15.13,0.0,-5.09,0.0,0.0,-9.94,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,-5.06,-5.15,-5.09,0,-5.09,-5.21,-5.15,0,0,0,0,0,-9.94,-5.21,-9.94,-38.32,-38.32,-42.89,-42.89,-60.25,-60.25,-42.89,-42.89,-42.89,-42.89,-5.15,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,-5.15,0,0,0,0,0,0,0,0,0,0,-5.06,-9.94,-38.32,-38.8,-50.07,-38.79,-38.79,-38.79,-46.59,-47.38,-38.32,-38.32,-5.21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-5.15,0,-5.18,0,0,-5.21,0,-5.15,0,0,0,0,0,0,0,0,0,0,-5.18,0,-38.32,-9.94,0.0,-4.94,-5.06,-5.09,0.0,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-5.15,0],
-    [0,0,0,0,-9.94,-9.94,-9.94,-9.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-9.94,-9.94,0.0,-9.94,-38.32,-9.94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.08,0.0,-10.08,-38.66,-10.08,-10.08,-10.08,-10.08,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-5.15,-5.21,-5.21,-5.21,-5.21,-10.08,-10.08,-10.08,-10.08,-5.15,-5.15,0,-10.08,-5.21,0,0,0,0,-5.21,-38.97,-1000.0,-202.41,-115.0,-1000.0,-1000.0,-115.0,-38.97,-40.57,-40.34,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-5.09,-5.12],
-    [-10.08,-10.08,-10.08,-5.21,-10.08,-10.08,-5.21,-10.08,-5.21,-10.08,0,0,0,0,0,0,0,-10.08,-38.88,-38.97,-38.97,-75.0,-202.41,-75.0,-75.0,-1000.0,-202.41,-1000.0,-1000.0,-75.0,-28.75,-5.15,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.08,-5.21],
-    [-5.15,-5.21,-10.08,-5.21,-10.08,-10.08,-10.08,-10.08,0,0,0,-10.08,-10.08,-10.08,-28.75,-10.08,-10.08,-28.75,-38.97,-28.75,-28.75,-28.75,-14.83,-38.97,-75.0,-75.0,-75.0,-75.0,-38.97,-40.01,-49.79,-38.97,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-5.21,-10.08,-10.08,-5.09,-10.08,-10.08,0,-5.09,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-40.0,-10.08,-28.75,-38.97,-28.75,-28.75,-38.97,-40.0,-38.97,-38.97,-38.97,-40.0,-76.0,-76.0,-56.59,-40.0,-202.41,-10.08,-28.75,-5.09,-3.95,0,0,0,0,0,0,0,0,0,-5.21,-10.08,-10.08,-10.08],
-    [0,-10.08,-10.08,-10.08,-5.15,-10.08,-10.08,-10.08,-10.08,-10.08,-5.21,-28.75,-10.08,-38.97,-38.97,-40.0,-38.97,-38.97,-38.88,-38.97,-28.75,-40.0,-40.0,-38.97,-40.0,-202.41,-202.41,-999.47,-999.47,-202.41,-38.97,-38.97,-28.75,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-4.98,-5.04,-4.92,0,-5.19,-5.19,-10.08,-10.08,-10.08,0,-10.08,-10.08,-10.08,-10.08,-10.08,-33.84,-33.84,-38.77,-40.0,-40.0,-40.0,-38.77,-75.0,-75.0,-47.92,-40.48,-40.0,-38.2,-33.84,-33.84,-10.08,-33.84,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-5.25,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-4.88,0,0,-10.08,-10.08,-10.08,-10.08,-33.84,-33.84,-33.84,-46.7,-47.92,-49.45,-47.92,-47.92,-75.0,-47.92,-40.0,-47.92,-47.92,-47.92,-47.92,-40.0,-40.0,-10.08,0,0,0,0,0,0,0,0,0,0,0,-10.08,0,-5.25,-10.08],
-    [-10.08,-10.08,-5.25,-10.08,-10.08,-10.08,0,-33.84,-10.08,0,-4.86,0,0,-10.08,-33.05,-33.05,-33.84,-40.0,-40.0,-40.0,-47.92,-47.92,-47.92,-40.0,-47.92,-47.92,-47.92,-40.0,-40.0,-33.05,-33.05,-33.05,0,0,0,0,0,0,0,0,0,0,0,-5.01,-4.83,-5.01,-5.13,-10.08],
-    [-10.08,0,0,-10.08,-10.08,0,0,0,0,0,0,-10.08,0,-10.08,0,-10.08,0,-10.08,-33.05,-33.05,-40.0,-47.92,-47.92,-72.52,-61.21,-61.54,-47.92,0,-47.92,-33.05,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-10.08,-10.08,-10.08,-10.08,0,-33.05,0,-10.08,-10.08,0,-10.08,-10.08,0,0,0,0,0,-10.08,-10.08,-10.08,-10.08,-10.08,-33.05,-33.05,-40.0,-33.05,-33.05,-10.08,-33.05,-10.08,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.08],
-    [-10.08,-10.08,-33.05,-10.08,-10.08,-33.05,-33.05,-10.08,-10.08,-10.08,-10.08,-10.08,0,0,0,0,0,0,0,0,-33.05,-47.92,-47.92,-73.83,-73.83,-47.92,-47.92,0,-40.0,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.08,0,-10.08],
-    [0,-10.24,-33.76,-33.76,-10.24,-10.24,-33.76,-10.24,-10.24,-10.24,-10.24,-33.76,-10.24,0,-10.24,0,0,0,-10.24,0,-33.76,-10.24,-33.76,-40.0,-40.0,-33.76,-33.76,-40.0,-33.76,-10.24,-10.24,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.24,-10.24,-10.24,-10.24],
-    [-33.76,0,-10.24,-10.24,-33.76,-33.76,-10.24,-10.24,0,-10.24,-10.24,-10.24,0,0,0,0,0,-10.24,-10.24,-33.76,-33.76,-75.0,-75.0,-75.0,-78.88,-78.88,-75.0,-75.0,-75.0,-33.76,-33.76,-33.76,-33.76,0,0,0,0,0,0,0,0,0,0,0,0,-10.24,-10.24,-10.24],
-    [-10.24,-10.24,-10.24,-10.24,-10.24,0,-10.24,0,-10.24,0,0,0,0,0,0,-10.24,-33.76,-33.76,-78.88,-90.94,-73.89,-78.88,-90.94,-90.94,-78.88,-90.94,-75.0,-75.0,-75.0,-75.0,-73.89,-33.76,0,0,0,0,0,0,0,0,0,0,0,0,-10.24,0,-10.24,-10.24],
-    [-10.24,0,-10.24,0,-10.24,0,-10.24,-10.24,-10.24,0,0,-10.24,-10.24,-40.0,-40.0,0,-33.76,-10.24,-40.0,-73.89,-40.0,-75.0,-79.48,-90.94,-90.94,-90.94,-90.94,-90.94,-79.48,-79.48,-75.0,-40.0,-43.1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-10.24,-10.24,0,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-39.0,-40.0,-39.0,-10.24,-40.0,-40.0,-71.5,-71.5,-43.1,-71.5,-71.5,-90.94,-90.94,-90.94,-90.94,-79.48,-79.48,-71.5,-90.94,-71.5,-75.0,-71.5,-53.56,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.24],
-    [0,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,0,-10.24,-10.24,-39.0,-39.0,-39.0,-50.16,-50.16,-50.16,0,-71.5,-71.5,-71.5,-71.5,-71.5,-71.5,-90.94,-79.48,-50.16,-79.48,-50.16,-39.0,-39.0,-39.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,-10.24,-10.24,-39.0,-39.0,-50.16,-50.57,-50.57,-50.57,-50.57,-50.57,-71.5,-71.5,-50.57,-71.5,-79.48,-50.57,-71.5,-71.5,-71.5,-10.78,-50.57,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,-10.24,-10.24,0,-10.24,0,-10.24,0,0,0,0,-10.24,-10.24,-10.24,-10.78,-10.78,0,-50.57,-50.57,-71.5,-50.57,-50.57,-10.78,-50.57,-10.78,-50.57,-10.78,-10.78,-10.78,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,-10.24,0,-10.24,-10.24,-10.78,-50.57,-50.57,-71.5,-71.5,-71.5,-71.5,-71.5,-50.57,-50.57,-75.32,-75.32,-71.5,-50.57,-10.78,-50.57,-10.24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.24,0],
-    [0,0,0,0,-10.24,-10.72,0,0,-10.72,-10.24,0,-10.24,0,0,0,-10.24,-10.24,-10.72,-40.0,-71.84,-71.84,-71.84,-79.48,-75.0,-90.94,-40.0,-40.0,-75.0,-79.48,-10.72,-10.72,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-10.72,-10.24,-10.24,-10.24,-10.24,0,-10.24,0,0,0,0,0,0,0,-10.24,-10.24,-10.24,-40.0,-10.72,-75.0,-75.0,-75.0,-71.84,-40.0,-10.72,0,-10.24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.24],
-    [0,-10.24,-10.24,-10.24,0,-10.24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.24,-10.72,-10.72,-10.72,-40.0,-40.0,-10.72,-10.72,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,-10.49,-10.49,-10.69,-10.49,0,0,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,-39.77,-79.48,-80.91,-78.79,-78.35,-79.47,-80.92,-73.53,-10.69,-38.27,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,-10.49,-10.49,0,0,-10.49,0,0,0,0,0,0,0,0,-10.49,-50.76,-59.15,-72.19,-72.19,-75.0,-90.28,-75.0,-90.28,-90.28,-79.48,-79.48,-10.49,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,-10.49,-39.77,-59.15,-10.49,0.0,-79.48,-203.33,-72.19,-59.15,-59.15,-1000.0,-39.77,-72.19,-72.19,-72.19,-58.28,0,-10.49,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0.0,-10.49,-10.49,-40.0,-40.0,-59.15,-90.28,-90.28,-90.28,-90.28,-79.48,-90.28,-79.48,-203.33,-90.28,-72.19,-59.15,-10.49,0,0.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,-40.0,-10.49,-10.49,-40.0,-59.15,-59.15,-72.19,-72.19,-79.48,-90.28,-72.19,-79.48,-59.15,-90.28,-90.28,-79.48,-79.48,-72.19,-72.19,-72.19,-59.15,-59.15,-40.0,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-10.49,0,0,0,0,0,-10.49,0,-10.49,-10.49,-10.49,-10.49,-40.0,-40.0,-72.19,-72.19,-90.28,-203.33,-999.56,-203.33,-203.33,-90.28,-70.28,-203.33,-203.33,-90.28,-90.28,-40.0,-59.82,-70.28,-40.0,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,-10.49,-40.0,-40.0,-59.82,-70.28,-70.28,-70.28,-70.28,-59.82,-59.82,-59.82,-59.82,-59.82,-59.82,-40.0,-10.49,0,-10.49,-40.0,0,0,0,0,0,0,0,0,0,0,-10.49,0,0,0],
-    [0,0,0,0.0,0,0.0,0.0,0,0,0,0,0,0,0,0,-40.0,-59.82,-40.0,-40.0,-70.28,-70.28,-79.48,-70.28,-90.28,-70.28,-70.28,-70.28,-70.28,-40.0,-40.0,-59.82,-59.82,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-10.49,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,0,-40.0,-70.28,-90.28,-90.28,-203.33,-999.56,-1000.0,-59.82,-59.82,-59.82,-59.82,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49],
-    [0,0,-10.49,0,0,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,-62.0,-70.28,-70.28,-90.28,-90.28,-90.28,-59.82,-62.0,-59.82,-62.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.49,-62.0,-62.0,-70.28,-70.28,-70.28,-62.0,-62.0,-10.49,-10.49,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,-10.08,0,-10.08,0,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,0,0,0,0,0,0,0,-10.08,-10.08,-62.0,-62.0,-80.99,-88.5,-80.99,-79.48,-60.0,-62.0,-62.0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.08,0,-10.08],
-    [0,0,0,0,0,0,-10.08,-10.08,-10.08,-10.08,0,0,0,0,0,0,0,0,-60.0,0,-10.08,-38.41,-30.83,-73.0,-88.5,-88.5,-62.0,-10.08,-60.0,-10.08,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,-10.08,0,-10.08,-60.0,-62.0,-80.99,-88.5,-89.76,-999.78,-999.78,-88.5,-1000.0,-999.78,-88.5,-88.5,-205.99,-205.99,-60.0,-10.08,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10.08],
-    [0,0,0,0,0,-1.39,-10.32,-10.32,-10.32,0,0,-10.32,0,-24.02,-52.77,-55.47,-55.13,-55.6,-79.25,-104.83,-144.75,-275.6,-261.9,-716.71,-716.71,-110.3,-213.23,-393.59,-231.05,-93.71,-61.22,-57.7,-55.32,-45.81,0,0,0,0,0,0,0,0,0,-1.1,0,0,0,0],
-    [-10.32,-10.32,-10.32,-10.32,-10.32,-10.32,-10.32,0,0,0,-1.37,-10.32,-10.32,-22.82,-45.64,-57.97,-56.65,-70.94,-66.08,-85.52,-85.52,-105.44,-130.22,-90.38,-341.58,-90.38,-70.94,-70.94,-67.42,-59.36,-61.22,-54.19,-33.94,-36.38,0,0,0,0,0,0,0,0,0,0,0,0,-1.39,-10.32],
-    [-10.32,-10.32,-10.32,-10.32,-10.32,-10.32,-10.32,-10.32,-56.59,-55.43,-56.59,-57.44,-56.9,-55.82,-57.44,-61.22,-240.49,-240.49,-110.78,-471.29,-687.07,-588.44,-687.07,-530.61,-266.61,-242.46,-85.52,-61.22,-61.22,-61.04,-61.22,-58.07,-47.19,-32.03,-39.34,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [-10.32,-12.15,-12.76,-12.15,-12.15,-54.19,-46.88,-54.19,-46.88,-17.63,-10.32,-40.16,-43.66,-40.16,-55.15,-56.11,-57.38,-59.96,-61.22,-225.96,-440.25,-868.32,-571.94,-234.45,-110.82,-115.07,-69.5,-102.55,-61.22,-61.22,-58.92,-51.76,-36.65,-14.12,0,0,0,0,0,0,0,0,0,0,0,-10.32,-10.32,-10.32],
-    [-34.68,-15.27,-33.08,-10.62,-10.62,-10.32,-10.32,-14.98,-25.16,-10.32,-10.32,-10.32,-10.32,-25.43,-35.05,-54.19,-54.86,-55.54,-58.49,-61.22,-61.22,-69.5,-259.01,-693.94,-868.32,-1000.0,-868.32,-868.32,-110.82,-84.07,-61.22,-60.59,-58.79,-39.57,-15.58,0,0,0,0,0,0,0,0,-0.31,-10.32,-10.32,-10.32,-14.89],
-    [-10.32,-10.32,-10.32,-10.32,-10.32,-10.32,-15.27,-10.32,-10.32,-1.2,-10.32,-10.32,-10.32,-10.32,-18.46,-38.99,-40.0,-48.45,-54.7,-58.24,-58.96,-59.34,-116.41,-61.22,-83.82,-61.22,-61.22,-61.22,-58.75,-56.22,-56.22,-48.95,-19.2,-10.32,0,0,0,0,0,0,0,0,0,0,-10.32,0,0,-10.32],
-    [-11.84,-12.15,-28.69,-36.96,-36.96,-36.96,-36.46,-43.12,-47.01,-35.05,-10.93,-10.32,-10.32,-32.52,-17.73,-40.0,-42.36,-54.19,-56.11,-79.07,-59.73,-61.22,-239.8,-86.0,-374.15,-687.07,-86.0,-61.22,-59.73,-49.77,-54.67,-25.16,0,0,0,0,0,0,0,0,-1.56,0,0,0,-10.32,-10.32,-10.32,-10.93],
-    [-54.19,-54.5,-58.84,-60.0,-61.21,-60.54,-61.16,-61.16,-58.84,-57.68,-54.19,-54.2,-36.36,-10.32,-10.32,-44.56,-54.67,-57.46,-56.22,-60.24,-61.16,-61.2,-61.22,-61.22,-61.22,-61.22,-61.22,-61.22,-58.85,-159.84,-55.75,-51.4,-30.11,0,0,0,0,0,0,0,-10.32,-10.32,-10.32,-10.32,-10.32,-42.06,-54.19,-54.19],
-    [-55.66,-57.07,-61.16,-61.16,-61.16,-61.16,-61.16,-60.0,-55.94,-54.19,-59.8,-60.0,-54.19,-50.98,-44.56,-45.86,-54.22,-56.2,-56.99,-60.19,-61.19,-108.79,-736.63,-1000.0,-1000.0,-1000.0,-1000.0,-736.63,-69.95,-61.22,-60.67,-55.54,-43.67,0,0,0,0,0,0,0,-10.32,-10.32,-10.32,-26.43,-33.15,-49.38,-54.19,-54.19],
-    [-44.21,-52.14,-53.73,-53.73,-53.73,-53.73,-53.73,-53.73,-53.73,-47.38,-21.43,-27.12,-28.37,-10.04,-10.04,-10.04,-10.04,-39.78,-32.48,-46.38,-54.63,-56.77,-378.5,-452.0,-529.82,-1000.0,-239.76,-139.17,-61.19,-59.92,-55.14,-37.52,-10.04,0,0,0,0,0,0,0,0,0,0,0,-10.04,-21.43,-15.74,-27.12],
-    [-10.04,-10.04,-10.04,-10.04,-27.12,-44.21,-27.12,-10.04,-10.04,-10.04,-10.04,-10.04,0,0,0,-10.04,-0.09,-32.49,-52.99,-45.46,-53.86,-57.72,-61.65,-66.02,-427.59,-414.46,-541.24,-92.52,-61.37,-61.56,-54.2,-35.99,-30.73,0,0,0,0,0,0,0,0,0,0,0,0,-10.04,-10.04,-10.04],
-    [-10.04,-10.04,-10.04,-10.04,-10.04,-10.04,-35.99,-31.88,-10.04,-10.04,-10.04,0,0,0,-15.65,-43.7,-45.11,-59.83,-66.92,-241.49,-848.81,-869.82,-1000.0,-1000.0,-1000.0,-998.18,-877.12,-868.03,-754.23,-158.7,-71.11,-56.56,-53.73,-26.87,0,0,0,0,0,0,0,0,0,0,0,0,-10.04,-10.04],
-    [-44.21,-44.21,-44.21,-44.21,-44.21,-44.21,-44.21,-44.21,-32.82,-10.04,-10.04,-0.9,0,0,-27.07,-44.48,-60.26,-61.37,-61.74,-330.02,-1000.0,-1000.0,-1000.0,-1000.0,-1000.0,-1000.0,-1000.0,-1000.0,-868.03,-256.15,-79.12,-63.43,-44.19,-19.6,-5.56,0,0,0,0,0,0,0,0,-8.22,-10.04,-10.04,-21.43,-44.33],
-    [0,0,0,-10.04,0,0,0,0,0,0,0,-0.82,-15.65,-42.08,-42.16,-44.6,-55.77,-61.37,-357.04,-745.15,-1000.0,-1000.0,-1000.0,-716.84,-1000.0,-1000.0,-1000.0,-1000.0,-716.84,-125.2,-72.11,-55.83,-44.92,-38.55,-15.65,0,0,0,0,0,0,0,0,0,0,0,0,0],
-    [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
-    ];
+    surface = PlotSurfaceService().get_price_surface()
+    if surface is None:
+        return render_chart(request, html_content, _no_data_figure("WEM Monthly Price History"))
+
+    months = surface['months']
+    x_values = list(range(1, PRICE_INTERVALS + 1))
+    y_values = list(range(len(months)))
 
-    x_tickvals = [1, 8, 16, 24, 32, 40]
+    # Trading interval n starts at (n - 1) * 30 minutes
+    x_tickvals = [1, 9, 17, 25, 33, 41]
     x_ticktext = ["00:00", "04:00", "08:00", "12:00", "16:00", "20:00"]
-    
-    y_tickvals = [7, 31, 55, 79, 103, 127, 139]
-    y_ticktext = ['2013-01', '2015-01', '2017-01', '2019-01', '2021-01', '2023-01', '2024-01']
-    
+
+    # Every second January
+    y_tickvals = [i for i, (_, month) in enumerate(months) if month == 1][::2]
+    y_ticktext = [f"{months[i][0]}-01" for i in y_tickvals]
+    period = f"{months[0][0]}-{months[0][1]:02d} to {months[-1][0]}-{months[-1][1]:02d}"
+
     # Create the 3D surface plots
     surface1 = go.Surface(
-        z=z1_values,
+        x=x_values,
+        y=y_values,
+        z=surface['max'],
         name="Max. Price",
         showlegend=True,
         colorscale='RdBu',
@@ -516,7 +78,9 @@ def wem_price_history(request):
         showscale=True
     )
     surface2 = go.Surface(
-        z=z2_values,
+        x=x_values,
+        y=y_values,
+        z=surface['avg'],
         name="Avg. Price",
         showlegend=True,
         reversescale=False,
@@ -530,7 +94,9 @@ def wem_price_history(request):
         showscale=True
     )
     surface3 = go.Surface(
-        z=z3_values,
+        x=x_values,
+        y=y_values,
+        z=surface['min'],
         name="Min. Price",
         showlegend=True,
         reversescale=True,
@@ -546,7 +112,7 @@ def wem_price_history(request):
     # Define the layout with responsive settings
     layout = go.Layout(
         title=dict(
-            text="WEM Monthly Price History (Max. / Avg. / Min.)<br><sub>(2012-07-01 08:00:00 to 2024-12-01 07:30:00)<br><sup>(Data derived from: https://data.wa.aemo.com.au)</sup></sub>",
+            text=f"WEM Monthly Price History (Max. / Avg. / Min.)<br><sub>({period})<br><sup>(Data derived from: https://data.wa.aemo.com.au)</sup></sub>",
             y=0.85,
             x=0.5,  # Centers the title
             xanchor='center',  # Anchors the title at its center
@@ -588,6 +154,7 @@ def wem_price_history(request):
     fig = go.Figure(data=[surface1, surface2, surface3], layout=layout)
     return render_chart(request, html_content, fig)
     
+@versioned_view(plot_surface_version)
 def swis_demand_history(request):
     # Initialise data
     html_content = mark_safe("""
@@ -622,100 +189,27 @@ def swis_demand_history(request):
     </p>
     """)
     
-    z1_values = [
-    [1319.485,1301.974,1298.594,1332.811,1418.833,1608.493,1805.263,1903.317,1949.529,1975.292,1995.518,2006.547,2016.277,2021.672,2024.570,2019.712,1995.687,1995.223,2002.006,1912.380,1763.786,1594.313,1451.499,1365.041],
-    [1364.125,1344.265,1345.041,1391.507,1519.153,1730.512,1920.782,2003.883,2027.026,2030.931,2036.158,2038.385,2037.804,2040.738,2051.517,2067.427,2121.345,2178.563,2133.715,2022.109,1855.734,1663.612,1504.734,1410.897],
-    [1404.207,1382.174,1381.458,1430.457,1560.845,1775.950,1973.147,2055.456,2078.725,2083.073,2087.944,2090.786,2094.151,2101.339,2115.154,2133.115,2187.774,2250.321,2204.490,2094.788,1923.590,1722.993,1557.904,1455.968],
-    [1432.409,1408.196,1403.800,1439.890,1549.612,1758.440,1974.783,2076.158,2116.349,2126.801,2140.942,2151.349,2158.565,2167.291,2178.627,2199.862,2256.065,2310.894,2255.382,2144.316,1975.829,1774.847,1599.864,1490.700],
-    [1527.490,1500.982,1490.684,1511.302,1599.317,1792.270,2031.798,2140.062,2183.664,2188.925,2204.700,2215.160,2223.383,2234.962,2250.744,2284.333,2349.331,2408.626,2362.580,2257.576,2088.399,1884.107,1701.075,1588.645],
-    [1560.750,1534.631,1524.622,1544.649,1631.578,1813.736,2035.662,2140.020,2181.693,2190.655,2208.891,2224.018,2239.773,2259.171,2285.305,2330.979,2396.561,2447.421,2399.391,2289.826,2118.524,1913.777,1734.228,1622.886],
-    [1598.398,1570.052,1560.022,1581.832,1670.556,1869.014,2083.752,2190.574,2233.234,2242.406,2261.074,2276.557,2292.686,2312.541,2339.292,2386.047,2453.176,2505.238,2456.073,2333.961,2162.833,1956.928,1778.190,1661.912],
-    [1630.707,1601.801,1593.345,1615.764,1705.823,1907.806,2127.119,2236.165,2279.711,2289.075,2308.129,2323.936,2340.399,2360.668,2387.976,2435.702,2504.232,2557.377,2507.187,2370.901,2195.440,1986.817,1809.181,1695.646],
-    [1693.165,1663.703,1655.475,1678.767,1770.915,1968.630,2209.510,2322.776,2368.011,2377.738,2397.530,2413.948,2431.049,2452.104,2480.470,2530.045,2601.229,2656.431,2604.299,2406.930,2233.210,2035.619,1864.340,1754.127],
-    [1694.184,1665.681,1656.236,1679.765,1772.174,1970.029,2211.080,2324.429,2369.694,2379.428,2399.236,2415.665,2432.779,2453.848,2482.234,2531.845,2603.079,2658.320,2606.150,2421.622,2243.771,2038.232,1864.918,1754.253],
-    [1736.899,1707.885,1698.653,1723.688,1819.141,2020.420,2267.634,2383.882,2430.307,2440.288,2460.602,2477.452,2495.003,2516.612,2545.724,2596.603,2669.659,2726.314,2672.810,2495.927,2308.065,2097.299,1915.956,1800.049],
-    [1732.614,1706.352,1698.302,1721.867,1815.399,2018.081,2265.010,2381.123,2427.493,2437.464,2457.754,2474.586,2492.116,2513.700,2542.777,2593.598,2666.571,2723.157,2669.717,2397.673,2221.296,2051.540,1893.643,1789.697],
-    [1725.249,1699.434,1691.780,1714.208,1807.867,2009.709,2255.613,2371.245,2417.423,2427.352,2447.558,2464.319,2481.776,2503.270,2532.230,2582.839,2655.507,2711.861,2658.641,2379.010,2223.945,2043.243,1885.022,1782.504],
-    [1747.408,1720.708,1711.786,1733.067,1829.649,2033.920,2282.788,2399.812,2446.547,2456.595,2477.045,2494.006,2511.675,2533.430,2562.736,2613.955,2687.498,2744.532,2690.671,2395.337,2244.169,2058.705,1903.854,1804.575],
-    [1751.675,1723.699,1714.999,1734.535,1832.806,2037.430,2286.728,2403.954,2450.770,2460.834,2481.320,2498.311,2516.011,2537.802,2567.158,2618.466,2692.136,2749.270,2695.315,2401.241,2245.220,2061.818,1909.041,1808.386],
-    [1815.769,1785.553,1776.733,1799.891,1886.435,2069.009,2269.144,2379.891,2467.023,2535.841,2594.525,2619.118,2603.803,2574.117,2546.285,2564.954,2643.473,2690.574,2625.668,2497.218,2335.028,2141.286,1978.665,1875.136],
-    [1838.314,1806.609,1796.639,1820.197,1906.965,2089.331,2307.315,2437.575,2556.264,2638.207,2715.359,2748.380,2734.710,2683.211,2633.044,2628.878,2691.001,2725.656,2666.618,2540.622,2359.814,2161.925,2002.534,1898.782],
-    [1841.071,1807.897,1796.776,1819.866,1906.764,2092.433,2319.380,2457.450,2595.556,2698.179,2785.747,2819.327,2809.945,2760.906,2707.390,2688.857,2730.876,2739.933,2671.452,2547.759,2369.314,2172.320,2012.270,1905.636],
-    [1876.063,1842.681,1834.625,1860.584,1942.139,2110.506,2342.804,2521.716,2711.004,2872.419,2985.938,3013.094,2962.824,2900.068,2789.888,2721.208,2707.597,2703.343,2652.313,2529.397,2362.936,2179.360,2029.952,1932.705]
-    ]
-    z2_values = [
-    [1234.955,1216.265,1214.302,1250.001,1338.820,1533.917,1733.943,1835.575,1887.354,1919.780,1936.880,1937.583,1934.800,1926.035,1918.978,1910.538,1887.870,1895.980,1909.298,1822.332,1673.782,1505.322,1362.247,1278.606],
-    [1274.275,1253.496,1254.655,1301.489,1429.542,1641.815,1834.261,1922.892,1950.471,1957.515,1965.353,1966.024,1959.696,1955.732,1960.020,1972.684,2027.890,2087.806,2043.568,1929.733,1763.321,1571.726,1412.342,1320.004],
-    [1319.599,1295.576,1294.337,1342.684,1472.719,1689.237,1887.847,1974.802,2005.360,2015.233,2022.424,2024.830,2023.832,2025.826,2035.071,2051.076,2106.699,2170.723,2124.782,2013.298,1841.776,1641.038,1475.328,1372.828],
-    [1350.844,1325.309,1320.656,1356.771,1466.835,1675.144,1892.848,2001.317,2049.045,2065.192,2082.290,2089.612,2090.981,2090.033,2096.214,2115.142,2173.483,2229.885,2174.317,2060.769,1891.492,1691.527,1517.712,1409.046],
-    [1438.778,1412.711,1402.493,1422.750,1509.760,1702.350,1944.612,2061.293,2114.858,2127.641,2148.567,2157.604,2161.144,2164.638,2173.842,2203.463,2269.169,2328.649,2279.637,2171.958,2000.929,1795.666,1612.732,1500.513],
-    [1437.280,1412.637,1403.651,1424.229,1510.549,1693.647,1919.538,2033.836,2086.057,2101.646,2122.591,2137.332,2148.243,2159.851,2180.450,2222.178,2288.081,2338.361,2286.111,2170.118,1993.891,1787.695,1609.229,1498.500],
-    [1417.367,1390.267,1382.447,1404.865,1492.800,1692.981,1912.283,2008.992,2039.109,2043.170,2058.298,2067.152,2078.200,2094.284,2125.909,2188.376,2278.466,2344.652,2287.576,2161.151,1980.355,1770.081,1592.492,1477.974],
-    [1429.591,1406.883,1400.662,1424.048,1515.672,1718.575,1927.877,2012.193,2031.844,2028.664,2038.338,2049.278,2065.558,2087.464,2125.831,2198.072,2301.201,2364.671,2303.980,2175.052,1988.509,1775.068,1597.354,1489.608],
-    [1471.722,1446.370,1441.858,1465.157,1554.806,1751.475,1946.382,2015.890,2033.306,2027.467,2035.433,2041.954,2057.114,2078.555,2127.023,2213.568,2326.527,2392.074,2328.078,2195.854,2011.385,1811.046,1637.704,1530.657],
-    [1473.003,1446.248,1438.792,1462.315,1552.733,1754.072,1954.401,2014.154,2011.686,1997.117,2003.864,2011.614,2028.686,2061.836,2117.987,2213.545,2337.471,2413.023,2349.331,2209.389,2019.902,1809.041,1636.295,1529.027],
-    [1523.631,1496.892,1488.165,1514.989,1614.022,1814.475,2007.308,2048.652,2024.564,1987.176,1976.993,1972.485,1981.404,2013.580,2081.208,2204.426,2368.503,2472.664,2421.233,2289.265,2092.369,1878.575,1697.936,1582.505],
-    [1517.087,1493.673,1487.638,1511.282,1604.669,1779.117,1920.243,1940.673,1905.810,1863.215,1850.281,1851.361,1872.544,1918.289,1998.547,2132.863,2298.455,2390.216,2329.154,2194.707,2005.663,1830.296,1672.008,1571.921],
-    [1504.860,1482.087,1477.382,1503.043,1594.857,1774.373,1894.816,1874.790,1801.108,1734.721,1704.438,1694.824,1718.368,1772.744,1874.422,2038.124,2228.530,2338.429,2285.992,2165.917,1999.963,1816.899,1658.000,1558.460],
-    [1451.676,1428.127,1421.974,1447.260,1536.016,1703.984,1811.203,1764.115,1673.999,1597.502,1577.420,1575.735,1606.221,1676.653,1798.958,1986.333,2204.612,2318.514,2250.593,2113.802,1948.923,1759.232,1602.555,1506.361],
-    [1406.033,1382.901,1376.928,1397.040,1474.379,1610.210,1697.353,1633.254,1528.778,1444.279,1413.783,1420.868,1452.151,1525.946,1657.275,1874.939,2142.275,2290.530,2230.287,2085.523,1910.569,1714.706,1557.971,1457.113],
-    [1361.255,1332.663,1329.747,1350.327,1428.681,1556.677,1617.470,1518.485,1383.304,1279.265,1233.740,1231.433,1264.735,1351.444,1502.899,1760.099,2090.003,2271.294,2212.653,2063.838,1878.847,1671.437,1510.914,1416.256],
-    [1343.611,1314.934,1310.843,1336.072,1422.135,1542.865,1588.778,1469.019,1318.649,1208.066,1173.299,1172.847,1211.540,1305.698,1473.041,1762.883,2113.414,2292.793,2235.058,2080.153,1873.409,1664.017,1500.791,1400.483],
-    [1377.527,1347.657,1340.777,1367.333,1456.043,1583.152,1619.551,1477.431,1301.475,1167.342,1114.798,1118.660,1162.756,1275.982,1476.185,1788.537,2147.120,2320.861,2253.493,2102.237,1902.133,1698.059,1537.129,1438.408],
-    [1371.750,1343.353,1337.905,1360.980,1433.684,1547.263,1575.723,1431.469,1280.493,1193.511,1153.677,1151.446,1196.919,1297.710,1466.505,1763.999,2099.279,2243.828,2177.107,2030.380,1843.841,1655.162,1507.657,1419.208]
-    ]
-    z3_values = [
-    [84.530,85.709,84.292,82.810,80.013,74.575,71.320,67.742,62.175,55.512,58.638,68.964,81.478,95.637,105.592,109.174,107.818,99.244,92.707,90.048,90.004,88.991,89.251,86.435],
-    [89.850,90.769,90.386,90.017,89.612,88.697,86.521,80.991,76.555,73.416,70.805,72.362,78.107,85.006,91.497,94.743,93.455,90.758,90.148,92.376,92.413,91.886,92.392,90.894],
-    [84.608,86.598,87.122,87.773,88.126,86.713,85.300,80.654,73.365,67.840,65.519,65.957,70.319,75.513,80.083,82.039,81.075,79.598,79.708,81.490,81.814,81.955,82.577,83.140],
-    [81.565,82.887,83.144,83.119,82.777,83.295,81.935,74.842,67.303,61.609,58.652,61.737,67.584,77.258,82.413,84.720,82.582,81.009,81.065,83.548,84.338,83.320,82.152,81.654],
-    [88.712,88.271,88.191,88.552,89.556,89.920,87.186,78.769,68.805,61.284,56.132,57.556,62.239,70.323,76.902,80.870,80.162,79.977,82.943,85.619,87.470,88.441,88.343,88.132],
-    [123.470,121.994,120.971,120.420,121.029,120.088,116.124,106.184,95.636,89.009,86.300,86.687,91.530,99.319,104.855,108.801,108.480,109.060,113.280,119.708,124.633,126.083,124.999,124.385],
-    [181.031,179.784,177.576,176.967,177.756,176.033,171.461,162.906,151.726,141.597,133.493,130.550,133.385,138.509,142.417,144.084,144.466,147.728,157.809,172.810,182.478,186.847,185.698,183.937],
-    [201.116,194.918,192.682,191.716,190.151,189.231,183.753,171.564,159.172,151.086,147.161,147.709,152.332,159.626,167.950,170.728,168.229,171.540,182.121,195.849,206.931,211.749,211.827,206.037],
-    [221.443,217.333,213.617,213.610,212.626,206.899,201.126,189.726,173.349,161.763,155.515,156.022,162.219,173.179,179.402,180.418,177.773,181.743,194.474,211.076,221.824,224.573,226.636,223.470],
-    [221.180,219.434,217.444,217.450,215.405,209.277,200.260,188.852,176.344,164.604,154.372,151.371,155.734,161.756,168.664,171.021,169.158,177.612,193.446,212.233,223.869,229.191,228.623,225.226],
-    [213.267,210.993,210.489,208.699,205.119,198.314,191.854,180.768,168.338,159.157,153.440,154.785,161.934,170.126,177.036,178.968,176.291,182.128,194.099,206.663,215.696,218.724,218.020,217.544],
-    [215.527,212.679,210.663,210.585,207.422,203.479,195.686,181.510,165.292,153.309,146.372,149.367,155.039,164.023,174.527,178.853,174.694,178.169,188.321,202.966,215.634,221.244,221.635,217.776],
-    [220.390,217.347,214.398,211.166,207.467,201.179,198.190,188.927,179.348,170.107,167.121,171.972,178.966,188.454,194.714,194.346,190.932,191.372,198.471,213.093,223.981,226.345,227.022,224.044],
-    [295.732,292.581,289.813,285.807,281.761,274.831,267.613,253.182,234.479,217.755,204.377,206.839,218.335,234.552,249.083,254.583,245.056,242.963,259.482,281.535,295.246,299.473,301.299,298.214],
-    [345.642,340.798,338.071,337.495,336.030,339.504,335.668,320.091,298.111,279.043,266.593,263.879,277.066,297.972,319.339,327.716,307.232,290.384,295.639,315.717,334.651,347.113,351.069,351.273],
-    [454.514,452.885,446.986,449.564,457.122,471.210,480.700,464.639,435.359,410.788,392.177,385.132,400.513,427.114,465.051,478.169,440.138,407.810,413.014,433.380,456.181,469.849,467.751,458.879],
-    [494.703,491.675,485.796,484.125,483.473,499.392,512.508,490.753,446.541,407.998,380.557,371.494,380.082,413.197,454.805,472.762,440.139,418.533,430.857,460.469,486.405,497.909,501.743,498.299],
-    [463.544,460.240,456.000,452.532,450.251,458.959,465.722,440.889,395.692,360.193,343.569,341.363,366.373,400.926,441.923,459.137,427.858,405.672,417.954,445.522,467.181,474.261,475.141,467.228],
-    [504.313,499.328,496.720,499.604,507.598,519.929,525.228,495.117,421.729,355.154,308.891,294.238,314.088,373.526,447.694,488.509,464.815,449.054,472.842,499.017,519.095,524.198,522.295,513.497]
-    ]
-    z4_values = [
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,0.008,18.676,42.400,57.639,69.283,78.856,81.101,79.748,70.966,53.587,30.244,12.859,10.688,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,0.000,15.489,52.408,88.695,109.325,122.631,126.949,122.509,113.579,94.195,66.902,34.802,21.166,21.087,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,3.483,10.256,62.002,117.160,161.356,188.508,206.582,215.972,211.717,200.370,174.045,136.060,96.929,82.614,81.747,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,4.036,6.680,56.419,121.424,181.664,217.707,241.000,252.679,248.359,230.256,195.583,147.279,96.449,67.685,63.372,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.000,7.632,68.471,154.463,237.404,293.955,330.169,350.182,351.665,332.907,287.480,213.209,124.865,71.521,57.478,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,3.308,35.485,149.081,258.940,356.392,420.940,461.101,473.858,464.533,431.388,369.703,281.881,193.421,154.772,152.242,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,5.543,34.157,162.606,307.528,436.967,522.525,575.999,597.523,584.442,542.071,463.094,350.369,236.044,182.060,174.178,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,11.872,55.105,203.972,382.515,538.069,641.338,695.248,711.432,687.119,622.225,514.695,373.039,237.831,183.055,180.596,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,22.397,87.716,253.706,450.609,623.881,737.512,800.943,813.564,786.794,713.884,590.544,415.811,242.629,168.355,169.389,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.005,0.000,0.000,0.632,41.121,170.974,396.768,648.360,845.787,968.608,1002.553,938.555,795.558,578.335,326.686,113.332,11.470,0.000,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,1.356,47.074,206.030,477.804,791.074,1022.143,1161.503,1204.039,1143.087,964.316,705.199,393.233,137.448,14.330,0.702,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.470,50.322,234.108,539.130,898.390,1170.644,1327.380,1359.305,1280.816,1083.998,789.282,441.183,155.898,13.399,0.005,0.000,0.000,0.000,0.000,0.000],
-    [0.000,0.000,0.000,0.000,0.857,43.315,241.854,595.131,1008.782,1323.754,1523.370,1567.410,1451.817,1228.832,875.690,468.700,143.504,10.462,2.364,0.000,0.000,0.000,0.000,0.000]
-    ]
-    
+    surface = PlotSurfaceService().get_demand_surface()
+    if surface is None:
+        return render_chart(request, html_content, _no_data_figure("WEM Hourly Demand"))
+
+    years = surface['years']
+    x_values = list(range(HOURS_PER_DAY))
+    y_values = years
+
     x_tickvals = [4, 8, 12, 16, 20]
     x_ticktext = ['04:00', '08:00', '12:00', '16:00', '20:00']
-    
-    y_tickvals = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
-    y_ticktext = ['2006', '2007', '2008', '2009', '2010', '2011', '2012', '2013', '2014', '2015', '2016', '2017', '2018', '2019', '2020', '2021', '2022', '2023', '2024']
+
+    y_tickvals = years
+    y_ticktext = [str(year) for year in years]
+    period = f"{years[0]} to {years[-1]}"
+
     
     # Create the 3D surface plots
     surface1 = go.Surface(
-        z=z1_values,
+        x=x_values,
+        y=y_values,
+        z=surface['underlying'],
         name="Underlying",
         showlegend=True,
         colorscale='RdBu',
@@ -729,7 +223,9 @@ def swis_demand_history(request):
         showscale=True
     )
     surface2 = go.Surface(
-        z=z2_values,
+        x=x_values,
+        y=y_values,
+        z=surface['fossil'],
         name="Fossil",
         showlegend=True,
         reversescale=True,
@@ -744,7 +240,9 @@ def swis_demand_history(request):
         showscale=True
     )
     surface3 = go.Surface(
-        z=z3_values,
+        x=x_values,
+        y=y_values,
+        z=surface['re'],
         name="RE",
         showlegend=True,
         reversescale=True,
@@ -759,7 +257,9 @@ def swis_demand_history(request):
         showscale=True
     )
     surface4 = go.Surface(
-        z=z4_values,
+        x=x_values,
+        y=y_values,
+        z=surface['dpv'],
         name="DPV",
         showlegend=True,
         reversescale=True,
@@ -776,7 +276,7 @@ def swis_demand_history(request):
     # Define the layout with responsive settings
     layout = go.Layout(
         title=dict(
-            text="WEM Hourly Demand - Underlying, Fossil, RE, DPV (adj.)<br><sub>(2006-09-20 00:00 to 2024-11-30 23:00)<br><sup>(Data derived from: https://data.wa.aemo.com.au/)</sup></sub>",
+            text=f"WEM Hourly Demand - Underlying, Fossil, RE, DPV (adj.)<br><sub>({period})<br><sup>(Data derived from: https://data.wa.aemo.com.au/)</sup></sub>",
             y=0.85,
             x=0.5,  # Centers the title
             xanchor='center',  # Anchors the title at its center
@@ -830,6 +330,18 @@ def swis_demand_history(request):
     fig = go.Figure(data=[surface1, surface2, surface3, surface4], layout=layout)
     return render_chart(request, html_content, fig)
     
+def _no_data_figure(title):
+    """Placeholder figure until the plot_surface table has been built"""
+    fig = go.Figure()
+    fig.update_layout(
+        title=dict(
+            text=f"{title}<br><sub>No data available yet (run rebuild_plot_surfaces)</sub>",
+            x=0.5,
+            xanchor='center'
+        )
+    )
+    return fig
+
 def render_chart(request, html_content, fig):
     # Define layout with autosize enabled
     fig.update_layout(
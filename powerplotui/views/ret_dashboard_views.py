@@ -43,6 +43,8 @@ from siren_web.models import (
     NewCapacityCommissioned,
     TargetScenario
 )
+from powerplotui.services.data_versions import ret_dashboard_version
+from powerplotui.services.response_cache import versioned_view
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,6 +55,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 @xframe_options_exempt
+@versioned_view(ret_dashboard_version)
 def ret_dashboard(request, year=None, month=None):
     """
     Main dashboard view for renewable energy tracking.
@@ -25,6 +25,8 @@ from siren_web.models import (
     RiskCategory, Scenarios, RiskEvent, TargetScenario,
     RISK_LIKELIHOOD_CHOICES, RISK_CONSEQUENCE_CHOICES
 )
+from ..services.data_versions import risk_dashboard_version
+from ..services.response_cache import versioned_view
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +124,7 @@ def get_scenario_energy_mix(scenario, target_year=None):
 # Dashboard and Summary Views
 # =============================================================================
 
+@versioned_view(risk_dashboard_version)
 def risk_dashboard(request):
     """
     Main dashboard view for SWIS risk analysis.
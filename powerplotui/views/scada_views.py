@@ -1,11 +1,16 @@
 # powerplot/views.py
 from django.db.models import Case, Count, FloatField, Sum, Q, When
-from django.db.models.functions import Coalesce
 from django.shortcuts import render
 from django.http import HttpResponse
-from siren_web.models import MonthlyREPerformance, facilities, Technologies
+from siren_web.models import MonthlyREPerformance, facilities, FacilityScada, Technologies
 from powerplotui.services.load_analyzer import LoadAnalyzer
+from powerplotui.services.scada_rollups import ScadaRollupService
+from powerplotui.services.scada_storage import ScadaArchive, month_start, next_month, split_by_storage
+from powerplotui.services.data_versions import scada_report_version
+from powerplotui.services.response_cache import versioned_view
+from collections import defaultdict
 from datetime import datetime, date
+from decimal import Decimal
 import calendar
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -14,6 +19,7 @@ import csv
 
 logger = logging.getLogger(__name__)
 
+@versioned_view(scada_report_version)
 def scada_analysis_report(request, year=None, month=None):
     """Display monthly load analysis report"""
     if year is None or month is None:
@@ -819,6 +825,46 @@ class FacilityManager:
         'unknown': '#bdc3c7',
     }
     
+    def get_monthly_totals(self, year, month):
+        """
+        Get monthly SCADA quantity and record count per facility id.
+        Served from the monthly rollup, falling back to facility_scada
+        (or its archive) when the rollup holds nothing for the month.
+        """
+        totals = ScadaRollupService().get_monthly_facility_totals(year, month)
+        if totals:
+            return totals
+
+        archive = ScadaArchive()
+        archived, db_ranges = split_by_storage(
+            month_start(year, month), month_start(*next_month(year, month)), archive
+        )
+
+        quantities = defaultdict(Decimal)
+        counts = defaultdict(int)
+        for range_start, range_end in db_ranges:
+            monthly = FacilityScada.objects.filter(
+                dispatch_interval__gte=range_start,
+                dispatch_interval__lt=range_end
+            ).values('facility_id').annotate(
+                total_quantity=Sum('quantity'),
+                record_count=Count('id')
+            ).values_list('facility_id', 'total_quantity', 'record_count')
+
+            for facility_id, total, count in monthly:
+                quantities[facility_id] += total or 0
+                counts[facility_id] += count
+
+        for archived_year, archived_month in archived:
+            for _, facility_id, quantity in archive.iter_month(archived_year, archived_month):
+                quantities[facility_id] += quantity
+                counts[facility_id] += 1
+
+        return {
+            facility_id: {'quantity': float(quantities[facility_id]), 'interval_count': counts[facility_id]}
+            for facility_id in counts
+        }
+
     def get_all_facilities_with_performance(self, year, month):
         """
         Get all facilities with their monthly performance metrics
@@ -829,32 +875,13 @@ class FacilityManager:
         days_in_month = calendar.monthrange(year, month)[1]
         hours_in_month = days_in_month * 24
         
-        # Get all facilities with their monthly generation in ONE query
+        # Get all facilities, with monthly generation from the monthly rollup
         facilities_qs = facilities.objects.filter(
             active=True
         ).select_related(
             'idtechnologies', 'idzones'
-        ).annotate(
-            # Aggregate SCADA data directly in the query
-            total_quantity=Coalesce(
-                Sum(
-                    'scada_records__quantity',
-                    filter=Q(
-                        scada_records__dispatch_interval__year=year,
-                        scada_records__dispatch_interval__month=month
-                    )
-                ),
-                0.0,
-                output_field=FloatField()
-            ),
-            record_count=Count(
-                'scada_records',
-                filter=Q(
-                    scada_records__dispatch_interval__year=year,
-                    scada_records__dispatch_interval__month=month
-                )
-            )
         )
+        monthly_totals = self.get_monthly_totals(year, month)
         
         # Build a mapping of technology IDs to fuel types from Technologies model
         tech_fuel_map = {
@@ -865,6 +892,10 @@ class FacilityManager:
         result = []
         
         for facility in facilities_qs:
+            facility.total_quantity = monthly_totals.get(
+                facility.idfacilities, {}
+            ).get('quantity', 0.0)
+
             # Convert to MWh (5-minute intervals = 5/60 hours)
             total_mwh = facility.total_quantity * (5/60) if facility.total_quantity else 0
             
@@ -960,32 +991,14 @@ class FacilityManager:
         days_in_month = calendar.monthrange(year, month)[1]
         hours_in_month = days_in_month * 24
         
-        # Get renewable facilities with their monthly generation in ONE query
+        # Get renewable facilities, with monthly generation from the monthly rollup
         facilities_qs = facilities.objects.filter(
             active=True,
             idtechnologies__renewable=1
         ).select_related(
             'idtechnologies', 'idzones'
-        ).annotate(
-            total_quantity=Coalesce(
-                Sum(
-                    'scada_records__quantity',
-                    filter=Q(
-                        scada_records__dispatch_interval__year=year,
-                        scada_records__dispatch_interval__month=month
-                    )
-                ),
-                0.0,
-                output_field=FloatField()
-            ),
-            record_count=Count(
-                'scada_records',
-                filter=Q(
-                    scada_records__dispatch_interval__year=year,
-                    scada_records__dispatch_interval__month=month
-                )
-            )
         )
+        monthly_totals = self.get_monthly_totals(year, month)
         
         # Build a mapping of technology IDs to fuel types
         tech_fuel_map = {
@@ -996,6 +1009,10 @@ class FacilityManager:
         result = []
         
         for facility in facilities_qs:
+            facility.total_quantity = monthly_totals.get(
+                facility.idfacilities, {}
+            ).get('quantity', 0.0)
+
             # Convert to MWh (5-minute intervals = 5/60 hours)
             total_mwh = facility.total_quantity if facility.total_quantity else 0
             
@@ -5,6 +5,9 @@ import math
 import openpyxl
 from openpyxl.utils import get_column_letter
 
+from ..services.chart_payload import chart_response, chart_view
+from ..services.data_versions import supply_data_version
+from ..services.response_cache import versioned_view
 from ..services.generation_utils import (
     get_week_from_hour,
     get_month_from_hour,
@@ -35,6 +38,8 @@ def supply_plot_view(request):
     }
     return render(request, 'facility_supply.html', context)
 
+@chart_view
+@versioned_view(supply_data_version)
 def get_supply_data(request):
     """API endpoint to get supply data for a facility and year"""
     facility_id = request.GET.get('facility_id')
@@ -96,7 +101,7 @@ def get_supply_data(request):
     else:
         return JsonResponse({'error': 'Invalid aggregation type'}, status=400)
     
-    return JsonResponse({
+    return chart_response(request, {
         'facility_name': facility.facility_name,
         'facility_code': facility.facility_code,
         'technology': facility.idtechnologies.technology_name,
@@ -111,6 +116,8 @@ def get_supply_data(request):
         'end_hour': end_hour if end_hour else max(data['periods']) if data['periods'] else 8760,
     })
 
+@chart_view
+@versioned_view(supply_data_version)
 def get_comparison_data(request):
     """API endpoint to compare supply data between two facilities"""
     facility1_id = request.GET.get('facility1_id')
@@ -190,7 +197,7 @@ def get_comparison_data(request):
     # Calculate correlation and complementarity metrics
     correlation_metrics = calculate_correlation_metrics(data1['quantum'], data2['quantum'])
     
-    return JsonResponse({
+    return chart_response(request, {
         'facility1': {
             'name': facility1.facility_name,
             'code': facility1.facility_code,
@@ -389,6 +396,8 @@ def get_facility_years(request):
         'years': list(years),
     })
 
+@chart_view
+@versioned_view(supply_data_version)
 def get_technology_data(request):
     """API endpoint to get aggregated supply data for one or more technology types"""
     technology_ids = request.GET.getlist('technology_id[]')  # Get list of technology IDs
@@ -512,7 +521,7 @@ def get_technology_data(request):
             'facility_count': count
         })
     
-    return JsonResponse({
+    return chart_response(request, {
         'technology_names': technology_names,  # List of technology names
         'technology_breakdown': tech_breakdown,  # Breakdown by technology
         'year': year,
@@ -527,6 +536,8 @@ def get_technology_data(request):
         'total_facilities': facility_count
     })
     
+@chart_view
+@versioned_view(supply_data_version)
 def get_technology_comparison_data(request):
     """API endpoint to compare supply data between two groups of technology types"""
     technology1_ids = request.GET.getlist('technology1_id[]')
@@ -681,7 +692,7 @@ def get_technology_comparison_data(request):
     else:
         x_label = 'Month of Year'
     
-    return JsonResponse({
+    return chart_response(request, {
         'technology1': {
             'names': technology1_names,
             'facility_count': facility1_count,
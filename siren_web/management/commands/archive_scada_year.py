@@ -0,0 +1,65 @@
+# powerplot/management/commands/archive_scada_year.py
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from powerplotui.services.scada_storage import ScadaArchive, ScadaPartitionManager
+
+
+class Command(BaseCommand):
+    help = (
+        'Export a closed year of facility_scada to compressed columnar files '
+        '(SCADA_ARCHIVE_DIR) and optionally drop its partitions'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--year',
+            type=int,
+            required=True,
+            help='Year to archive (must be before the current year)',
+        )
+        parser.add_argument(
+            '--drop-partitions',
+            action='store_true',
+            help='Drop the monthly partitions once each archive file has been verified',
+        )
+
+    def handle(self, *args, **options):
+        year = options['year']
+        if year >= date.today().year:
+            raise CommandError(f'{year} is not a closed year')
+
+        archive = ScadaArchive()
+        manager = ScadaPartitionManager()
+        partitions = {p['name'] for p in manager.get_partitions()}
+
+        if options['drop_partitions'] and not partitions:
+            raise CommandError('facility_scada is not partitioned; nothing can be dropped')
+
+        total = 0
+        for month in range(1, 13):
+            name = manager.partition_name(year, month)
+
+            if archive.is_archived(year, month) and options['drop_partitions'] and name not in partitions:
+                self.stdout.write(f'  {year}-{month:02d}: already archived and dropped')
+                continue
+
+            count = archive.export_month(year, month)
+            total += count
+            if not count:
+                self.stdout.write(f'  {year}-{month:02d}: no data')
+                continue
+
+            if not archive.verify_month(year, month):
+                raise CommandError(
+                    f'{year}-{month:02d}: archive does not match facility_scada; '
+                    f'partition {name} left in place'
+                )
+            self.stdout.write(f'  {year}-{month:02d}: archived {count:,} records')
+
+            if options['drop_partitions'] and name in partitions:
+                manager.drop_month(year, month)
+                self.stdout.write(f'  {year}-{month:02d}: dropped partition {name}')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ Archived {total:,} records for {year} to {archive.archive_dir}')
+        )
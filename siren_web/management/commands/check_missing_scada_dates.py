@@ -1,9 +1,7 @@
 # powerplot/management/commands/check_missing_scada_dates.py
 from django.core.management.base import BaseCommand
-from siren_web.models import FacilityScada
-from datetime import datetime, timedelta, date
-from django.db.models import Count
-from django.db.models.functions import TruncDate
+from powerplotui.services.aemo_scada_fetcher import AEMOScadaFetcher
+from datetime import datetime, date
 
 class Command(BaseCommand):
     help = 'Check for missing dates in SCADA data'
@@ -26,32 +24,30 @@ class Command(BaseCommand):
         start_date = datetime.strptime(options['start_date'], '%Y-%m-%d').date()
         end_date = datetime.strptime(options['end_date'], '%Y-%m-%d').date()
         
-        # Get dates with data
-        dates_with_data = set(
-            FacilityScada.objects.filter(
-                dispatch_interval__date__gte=start_date,
-                dispatch_interval__date__lte=end_date
-            ).annotate(
-                date=TruncDate('dispatch_interval')
-            ).values_list('date', flat=True).distinct()
-        )
-        
-        # Generate expected dates
-        current = start_date
-        expected_dates = set()
-        while current <= end_date:
-            expected_dates.add(current)
-            current += timedelta(days=1)
+        # Build the completeness index for the whole range in one query
+        plan = AEMOScadaFetcher().plan_date_range(start_date, end_date)
+        coverage = plan['coverage']
         
-        # Find missing
-        missing_dates = sorted(expected_dates - dates_with_data)
+        # Find missing (no data) and incomplete (< MIN_DAILY_INTERVALS) dates
+        missing_dates = sorted(plan['missing_dates'])
+        incomplete_dates = [d for d in missing_dates if d in coverage]
         
         if missing_dates:
             self.stdout.write(
                 self.style.WARNING(f'\nFound {len(missing_dates)} missing dates:')
             )
             for missing_date in missing_dates:
-                self.stdout.write(f'  {missing_date}')
+                if missing_date in coverage:
+                    self.stdout.write(
+                        f'  {missing_date} (incomplete: '
+                        f'{coverage[missing_date]["intervals"]} intervals)'
+                    )
+                else:
+                    self.stdout.write(f'  {missing_date}')
+            if incomplete_dates:
+                self.stdout.write(
+                    self.style.WARNING(f'{len(incomplete_dates)} of these dates have partial data')
+                )
             
             # Generate command to fetch missing dates
             self.stdout.write('\n' + self.style.SUCCESS('To fetch missing dates, run:'))
@@ -0,0 +1,51 @@
+# powerplot/management/commands/manage_scada_partitions.py
+from django.core.management.base import BaseCommand, CommandError
+from powerplotui.services.scada_storage import ScadaArchive, ScadaPartitionManager
+
+
+class Command(BaseCommand):
+    help = (
+        'Maintain the monthly partitions of facility_scada. '
+        'Run monthly (e.g. from cron) to keep partitions created ahead of incoming data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Create partitions up to this many months past the current month (default: 3)',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List partitions with approximate row counts and archive status',
+        )
+
+    def handle(self, *args, **options):
+        manager = ScadaPartitionManager()
+
+        if not manager.is_supported():
+            raise CommandError('facility_scada partitioning requires MySQL/MariaDB')
+
+        if not manager.is_partitioned():
+            raise CommandError(
+                'facility_scada is not partitioned; apply siren_web migration 0163 first'
+            )
+
+        if options['list']:
+            archive = ScadaArchive()
+            for partition in manager.get_partitions():
+                archived = ''
+                if partition['year'] and archive.is_archived(partition['year'], partition['month']):
+                    archived = ' (archived)'
+                self.stdout.write(f"  {partition['name']:<10} {partition['rows']:>12,} rows{archived}")
+            return
+
+        created = manager.ensure_future_partitions(options['months_ahead'])
+        if created:
+            self.stdout.write(
+                self.style.SUCCESS(f"✓ Created {len(created)} partitions: {', '.join(created)}")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS('✓ Partitions already cover the requested months'))
@@ -26,6 +26,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.utils.dateparse import parse_datetime
 from siren_web.models import WholesalePrice  # Replace 'your_app' with actual app name
+from powerplotui.services.plot_surfaces import PRICE_SURFACE, PlotSurfaceService
 
 
 class Command(BaseCommand):
@@ -354,5 +355,6 @@ class Command(BaseCommand):
                     self.stdout.write(f'Updated {len(records_to_update)} existing records')
                 
                 saved_count = len(records_to_create) + len(records_to_update)
-        
+
+        PlotSurfaceService().refresh_for_dates(PRICE_SURFACE, [trading_date])
         return saved_count
\ No newline at end of file
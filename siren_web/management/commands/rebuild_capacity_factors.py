@@ -0,0 +1,48 @@
+# powerplot/management/commands/rebuild_capacity_factors.py
+from django.core.management.base import BaseCommand, CommandError
+from powerplotui.services.capacity_factor_analyzer import CapacityFactorAnalyzer
+import time
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the cached capacity factor distributions (capacity_factor_distributions table)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start-year',
+            type=int,
+            help='First year of the analysis period (default: two years ago)',
+        )
+        parser.add_argument(
+            '--end-year',
+            type=int,
+            help='Last year of the analysis period (default: this year)',
+        )
+
+    def handle(self, *args, **options):
+        analyzer = CapacityFactorAnalyzer(
+            start_year=options.get('start_year'),
+            end_year=options.get('end_year'),
+        )
+        if analyzer.start_year > analyzer.end_year:
+            raise CommandError('--start-year must not be after --end-year')
+
+        started = time.time()
+        distributions = analyzer.refresh_distributions()
+
+        if not distributions:
+            self.stdout.write(self.style.WARNING(
+                f'  No capacity factor data found for {analyzer.start_year}-{analyzer.end_year}'
+            ))
+        for technology, dist in distributions.items():
+            self.stdout.write(
+                f"  {technology:<10} mean {dist['mean']:.3f}  std {dist['std']:.3f}  "
+                f"range {dist['min']:.3f}-{dist['max']:.3f}  ({dist['n_months']} months)"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✓ Rebuilt capacity factor distributions for {analyzer.start_year}-'
+                f'{analyzer.end_year} in {time.time() - started:.1f}s'
+            )
+        )
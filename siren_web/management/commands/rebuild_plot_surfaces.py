@@ -0,0 +1,60 @@
+# powerplot/management/commands/rebuild_plot_surfaces.py
+from django.core.management.base import BaseCommand, CommandError
+from powerplotui.services.plot_surfaces import SURFACES, PlotSurfaceService
+import time
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the precomputed 3D price and demand surfaces (plot_surface table)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--surface',
+            choices=SURFACES,
+            help='Rebuild a single surface (default: all)',
+        )
+        parser.add_argument(
+            '--year',
+            type=int,
+            help='Rebuild a single year',
+        )
+        parser.add_argument(
+            '--month',
+            type=int,
+            help='Rebuild a single month (requires --year)',
+        )
+
+    def handle(self, *args, **options):
+        year = options.get('year')
+        month = options.get('month')
+
+        if month and not year:
+            raise CommandError('--month requires --year')
+        if month and not 1 <= month <= 12:
+            raise CommandError('--month must be between 1 and 12')
+
+        service = PlotSurfaceService()
+        surfaces = [options['surface']] if options.get('surface') else SURFACES
+        started = time.time()
+
+        for surface in surfaces:
+            if year and month:
+                months = [(year, month)]
+            elif year:
+                months = [(year, m) for m in range(1, 13)]
+            else:
+                months = service.source_months(surface)
+
+            if not months:
+                self.stdout.write(self.style.WARNING(f'  {surface}: no source data found'))
+                continue
+
+            stored = service.refresh_months(surface, months)
+            self.stdout.write(
+                f'  {surface}: {stored} of {len(months)} months '
+                f'({months[0][0]}-{months[0][1]:02d} to {months[-1][0]}-{months[-1][1]:02d})'
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ Rebuilt plot surfaces in {time.time() - started:.1f}s')
+        )
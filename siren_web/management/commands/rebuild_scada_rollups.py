@@ -0,0 +1,70 @@
+# powerplot/management/commands/rebuild_scada_rollups.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from powerplotui.services.plot_surfaces import DEMAND_SURFACE, PlotSurfaceService
+from powerplotui.services.scada_rollups import ScadaRollupService
+from siren_web.models import FacilityScada
+import time
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the hourly, daily and monthly SCADA rollup tables from facility_scada'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--year',
+            type=int,
+            help='Rebuild a single year',
+        )
+        parser.add_argument(
+            '--month',
+            type=int,
+            help='Rebuild a single month (requires --year)',
+        )
+
+    def handle(self, *args, **options):
+        year = options.get('year')
+        month = options.get('month')
+
+        if month and not year:
+            raise CommandError('--month requires --year')
+        if month and not 1 <= month <= 12:
+            raise CommandError('--month must be between 1 and 12')
+
+        if year and month:
+            months = [(year, month)]
+        elif year:
+            months = [(year, m) for m in range(1, 13)]
+        else:
+            bounds = FacilityScada.objects.aggregate(
+                first=Min('dispatch_interval'), last=Max('dispatch_interval')
+            )
+            if not bounds['first']:
+                self.stdout.write(self.style.WARNING('No SCADA data found'))
+                return
+            first, last = bounds['first'], bounds['last']
+            months = [
+                (y, m)
+                for y in range(first.year, last.year + 1)
+                for m in range(1, 13)
+                if (first.year, first.month) <= (y, m) <= (last.year, last.month)
+            ]
+
+        service = ScadaRollupService()
+        total_records = 0
+        started = time.time()
+
+        for y, m in months:
+            count = service.rebuild_month(y, m)
+            total_records += count
+            self.stdout.write(f'  {y}-{m:02d}: {count:,} half-hourly records rolled up')
+
+        # The demand surface is derived from the monthly rollup
+        PlotSurfaceService().refresh_months(DEMAND_SURFACE, months)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✓ Rebuilt rollups for {len(months)} months '
+                f'({total_records:,} records) in {time.time() - started:.1f}s'
+            )
+        )
@@ -5,17 +5,70 @@ Usage:
     python manage.py run_monte_carlo --all
     python manage.py run_monte_carlo --scenario-id 1
     python manage.py run_monte_carlo --scenario-name "Base Case" --iterations 10000
+    python manage.py run_monte_carlo --scenario-id 1 --iterations 10000000 --workers 8 --seed 42
+    python manage.py run_monte_carlo --all --adaptive --iterations 5000000 --tolerance 0.1
+    python manage.py run_monte_carlo --all --sampling sobol --iterations 65536
+    python manage.py run_monte_carlo --all --concurrency 4
+    python manage.py run_monte_carlo --all --sensitivity
+    python manage.py run_monte_carlo --scenario-id 1 --chronological --workers 4
+
+With several scenarios the database inputs (capacity factor distributions,
+pipeline facilities and base demand) are loaded once and shared, and
+--concurrency runs scenarios in parallel worker processes. --sensitivity adds
+a Sobol sensitivity analysis of each scenario (see sensitivity_analyzer.py),
+stored in its MonteCarloResult.
 
 Scheduled via cron:
     0 2 1 * * cd /path/to/siren_web && python manage.py run_monte_carlo --all >> /var/log/monte_carlo.log 2>&1
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import django
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 from django.utils import timezone
+import io
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Options a scenario run reads, handed to --concurrency workers
+SCENARIO_OPTIONS = (
+    'iterations', 'profile', 'target_year', 'force', 'workers', 'seed',
+    'sampling', 'adaptive', 'tolerance', 'percentile_tolerance',
+    'sensitivity', 'sensitivity_samples', 'chronological',
+)
+
+# Shared input snapshot in a --concurrency worker (see init_scenario_worker)
+_worker_inputs = None
+
+
+def init_scenario_worker(inputs):
+    """Process pool initializer for --concurrency: set up Django and keep the shared inputs"""
+    global _worker_inputs
+    django.setup()
+    _worker_inputs = inputs
+
+
+def run_scenario_worker(scenario_id, position, options):
+    """
+    Process pool entry point for --concurrency: run one scenario in a worker
+    process, with its own database connection.
+
+    Returns:
+        (result dict or None if skipped, command output)
+    """
+    from siren_web.models import TargetScenario
+
+    output = io.StringIO()
+    try:
+        command = Command(stdout=output, stderr=output)
+        scenario = TargetScenario.objects.get(pk=scenario_id)
+        result = command.run_scenario(scenario, position, options, _worker_inputs)
+    finally:
+        connections.close_all()
+    return result, output.getvalue()
+
 
 class Command(BaseCommand):
     help = 'Run Monte Carlo simulation for renewable energy target scenarios'
@@ -68,6 +121,69 @@ class Command(BaseCommand):
             help='Target year for projections (default: 2040)'
         )
 
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Run iteration batches in parallel using N worker processes (default: 1)'
+        )
+        parser.add_argument(
+            '--sampling',
+            type=str,
+            default='random',
+            choices=['random', 'sobol', 'lhs', 'antithetic'],
+            help='How uncertainties are sampled: pseudo-random, scrambled Sobol, '
+                 'Latin hypercube or antithetic pairs (default: random)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed; a run is reproducible from its seed whatever the number of workers'
+        )
+
+        # Adaptive mode
+        parser.add_argument(
+            '--adaptive',
+            action='store_true',
+            help='Stop once the tolerances are met; --iterations becomes the maximum'
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.1,
+            help='Adaptive mode: 95%% CI half-width for P(75%%) and P(85%%), in percentage points (default: 0.1)'
+        )
+        parser.add_argument(
+            '--percentile-tolerance',
+            type=float,
+            default=0.1,
+            help='Adaptive mode: 95%% CI half-width for P10, median and P90, in percentage points (default: 0.1)'
+        )
+        parser.add_argument(
+            '--chronological',
+            action='store_true',
+            help='Dispatch each iteration hourly against a sampled supplyfactors weather year '
+                 '(curtailment and storage) instead of the annual estimate'
+        )
+        parser.add_argument(
+            '--sensitivity',
+            action='store_true',
+            help='Also compute Sobol sensitivity indices for the four uncertainties'
+        )
+        parser.add_argument(
+            '--sensitivity-samples',
+            type=int,
+            default=16384,
+            help='Sensitivity analysis: base samples N, costing 6N evaluations (default: 16384)'
+        )
+
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Run up to N scenarios at once in worker processes (default: 1)'
+        )
+
         # Options
         parser.add_argument(
             '--force',
@@ -77,7 +193,6 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         """Execute the command."""
-        from siren_web.models import TargetScenario, MonteCarloSimulation
         from powerplotui.services.monte_carlo_simulator import MonteCarloSimulator
 
         # Extract options
@@ -88,14 +203,36 @@ class Command(BaseCommand):
         iterations = options['iterations']
         profile = options['profile']
         target_year = options['target_year']
-        force = options.get('force', False)
+        workers = options['workers']
+        concurrency = options['concurrency']
+
+        if workers < 1:
+            raise CommandError('--workers must be at least 1')
+        if concurrency < 1:
+            raise CommandError('--concurrency must be at least 1')
+        if workers > 1 and concurrency > 1:
+            raise CommandError('Use either --workers (within a scenario) or --concurrency (across scenarios)')
+        adaptive = options.get('adaptive', False)
+        if adaptive and (options['tolerance'] <= 0 or options['percentile_tolerance'] <= 0):
+            raise CommandError('Tolerances must be positive')
+        if options['sensitivity'] and options['sensitivity_samples'] < 2:
+            raise CommandError('--sensitivity-samples must be at least 2')
 
         self.stdout.write(self.style.SUCCESS('=' * 70))
         self.stdout.write(self.style.SUCCESS('Monte Carlo Simulation for Renewable Energy Targets'))
         self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(f"Iterations: {iterations:,}")
+        if adaptive:
+            self.stdout.write(
+                f"Iterations: up to {iterations:,} (adaptive, tolerance "
+                f"{options['tolerance']} pp / percentiles {options['percentile_tolerance']} pp)"
+            )
+        else:
+            self.stdout.write(f"Iterations: {iterations:,}")
         self.stdout.write(f"Profile: {profile}")
         self.stdout.write(f"Target Year: {target_year}")
+        self.stdout.write(f"Workers: {workers}")
+        self.stdout.write(f"Sampling: {options['sampling']}")
+        self.stdout.write(f"Model: {'chronological hourly dispatch' if options['chronological'] else 'annual'}")
         self.stdout.write('')
 
         # Get scenarios to process
@@ -109,75 +246,28 @@ class Command(BaseCommand):
             self.stdout.write(f"  - {scenario.display_name}")
         self.stdout.write('')
 
-        # Process each scenario
-        results = []
-        for idx, scenario in enumerate(scenarios, 1):
-            self.stdout.write(self.style.HTTP_INFO(f"[{idx}/{len(scenarios)}] Processing: {scenario.display_name}"))
-
-            try:
-                # Check if recent simulation exists
-                if not force:
-                    recent_run = MonteCarloSimulation.objects.filter(
-                        target_scenario=scenario,
-                        status='completed'
-                    ).order_by('-run_date').first()
-
-                    if recent_run:
-                        days_ago = (timezone.now() - recent_run.run_date).days
-                        if days_ago < 30:  # Less than 30 days old
-                            self.stdout.write(self.style.WARNING(
-                                f"  Recent simulation exists ({days_ago} days ago). "
-                                f"Skipping. Use --force to override."
-                            ))
-                            continue
-
-                # Create simulation record
-                simulation = MonteCarloSimulation.objects.create(
-                    target_scenario=scenario,
-                    num_iterations=iterations,
-                    target_year=target_year,
-                    probability_profile=profile,
-                    status='pending',
-                    created_by='management_command'
-                )
-
-                self.stdout.write(f"  Created simulation record ID {simulation.simulation_id}")
-
-                # Run simulation
-                simulator = MonteCarloSimulator(
-                    target_scenario=scenario,
-                    num_iterations=iterations,
-                    probability_profile=profile,
-                    target_year=target_year
-                )
-
-                simulation = simulator.run_simulation(simulation)
-
-                # Report results
-                self.stdout.write(self.style.SUCCESS(f"  ✓ Completed in {simulation.execution_time_seconds:.1f}s"))
-                self.stdout.write(f"    Mean RE%: {simulation.mean_re_percentage:.2f}%")
-                self.stdout.write(f"    90% CI: [{simulation.p10_re_percentage:.2f}%, {simulation.p90_re_percentage:.2f}%]")
-                self.stdout.write(f"    P(75% target): {simulation.probability_75_percent:.1f}%")
-                self.stdout.write(f"    P(85% target): {simulation.probability_85_percent:.1f}%")
-
-                results.append({
-                    'scenario': scenario.display_name,
-                    'simulation_id': simulation.simulation_id,
-                    'status': 'success',
-                    'prob_85': simulation.probability_85_percent,
-                })
-
-            except Exception as e:
-                self.stderr.write(self.style.ERROR(f"  ✗ Failed: {str(e)}"))
-                logger.error(f"Monte Carlo failed for scenario {scenario.id}: {e}", exc_info=True)
-
-                results.append({
-                    'scenario': scenario.display_name,
-                    'status': 'failed',
-                    'error': str(e),
-                })
+        # The inputs do not depend on the scenario: load them once and share them
+        inputs = None
+        if len(scenarios) > 1:
+            self.stdout.write("Loading shared inputs...")
+            inputs = MonteCarloSimulator.load_shared_inputs(target_year, options['chronological'])
+            self.stdout.write(
+                f"  {len(inputs.pipeline_df)} pipeline facilities, "
+                f"base demand {inputs.base_demand_2040:,.0f} GWh"
+            )
+            if inputs.hourly_profiles:
+                self.stdout.write(f"  Weather years: {', '.join(map(str, inputs.hourly_profiles.years))}")
+            self.stdout.write('')
 
-            self.stdout.write('')  # Blank line between scenarios
+        scenario_options = {key: options.get(key) for key in SCENARIO_OPTIONS}
+        if concurrency > 1 and len(scenarios) > 1:
+            results = self.run_scenarios_parallel(scenarios, scenario_options, inputs, concurrency)
+        else:
+            results = []
+            for idx, scenario in enumerate(scenarios, 1):
+                result = self.run_scenario(scenario, f"[{idx}/{len(scenarios)}]", scenario_options, inputs)
+                if result:
+                    results.append(result)
 
         # Summary
         self.stdout.write(self.style.SUCCESS('=' * 70))
@@ -207,6 +297,173 @@ class Command(BaseCommand):
         self.stdout.write('')
         self.stdout.write(self.style.SUCCESS('Done!'))
 
+    def run_scenario(self, scenario, position, options, inputs=None):
+        """
+        Run and report the simulation for one scenario.
+
+        Args:
+            scenario: TargetScenario instance
+            position: str, progress label, e.g. '[2/5]'
+            options: dict of SCENARIO_OPTIONS values
+            inputs: SimulationInputs snapshot, or None to load from the database
+
+        Returns:
+            Result dict for the summary, or None if skipped
+        """
+        from siren_web.models import MonteCarloSimulation
+        from powerplotui.services.monte_carlo_simulator import MonteCarloSimulator
+        from powerplotui.services.monte_carlo_statistics import ConvergenceMonitor
+
+        adaptive = options.get('adaptive', False)
+        self.stdout.write(self.style.HTTP_INFO(f"{position} Processing: {scenario.display_name}"))
+
+        try:
+            # Check if recent simulation exists
+            if not options.get('force'):
+                recent_run = MonteCarloSimulation.objects.filter(
+                    target_scenario=scenario,
+                    status='completed'
+                ).order_by('-run_date').first()
+
+                if recent_run:
+                    days_ago = (timezone.now() - recent_run.run_date).days
+                    if days_ago < 30:  # Less than 30 days old
+                        self.stdout.write(self.style.WARNING(
+                            f"  Recent simulation exists ({days_ago} days ago). "
+                            f"Skipping. Use --force to override."
+                        ))
+                        return None
+
+            # Create simulation record
+            simulation = MonteCarloSimulation.objects.create(
+                target_scenario=scenario,
+                num_iterations=options['iterations'],
+                target_year=options['target_year'],
+                probability_profile=options['profile'],
+                status='pending',
+                created_by='management_command'
+            )
+
+            self.stdout.write(f"  Created simulation record ID {simulation.simulation_id}")
+
+            # Run simulation
+            simulator = MonteCarloSimulator(
+                target_scenario=scenario,
+                num_iterations=options['iterations'],
+                probability_profile=options['profile'],
+                target_year=options['target_year'],
+                seed=options.get('seed'),
+                workers=options['workers'],
+                sampling=options['sampling'],
+                convergence=ConvergenceMonitor(
+                    probability_tolerance=options['tolerance'],
+                    percentile_tolerance=options['percentile_tolerance'],
+                ) if adaptive else None,
+                inputs=inputs,
+                chronological=options.get('chronological', False)
+            )
+
+            simulation = simulator.run_simulation(simulation)
+
+            # Report results
+            self.stdout.write(self.style.SUCCESS(f"  ✓ Completed in {simulation.execution_time_seconds:.1f}s"))
+            self.stdout.write(f"    Seed: {simulator.seed}")
+            if adaptive:
+                self.stdout.write(
+                    f"    Iterations used: {simulation.iterations_completed:,} "
+                    f"({'converged' if simulation.converged else 'tolerances not met'})"
+                )
+                self.stdout.write(
+                    f"    Precision: ±{simulation.achieved_precision['probability_85_percent']:.3f} pp on P(85%)"
+                )
+            self.stdout.write(f"    Mean RE%: {simulation.mean_re_percentage:.2f}%")
+            self.stdout.write(f"    90% CI: [{simulation.p10_re_percentage:.2f}%, {simulation.p90_re_percentage:.2f}%]")
+            self.stdout.write(f"    P(75% target): {simulation.probability_75_percent:.1f}%")
+            self.stdout.write(f"    P(85% target): {simulation.probability_85_percent:.1f}%")
+
+            if options.get('sensitivity'):
+                self._run_sensitivity(simulator, simulation, options)
+
+            result = {
+                'scenario': scenario.display_name,
+                'simulation_id': simulation.simulation_id,
+                'status': 'success',
+                'prob_85': simulation.probability_85_percent,
+            }
+
+        except Exception as e:
+            self.stderr.write(self.style.ERROR(f"  ✗ Failed: {str(e)}"))
+            logger.error(f"Monte Carlo failed for scenario {scenario.id}: {e}", exc_info=True)
+
+            result = {
+                'scenario': scenario.display_name,
+                'status': 'failed',
+                'error': str(e),
+            }
+
+        self.stdout.write('')  # Blank line between scenarios
+        return result
+
+    def _run_sensitivity(self, simulator, simulation, options):
+        """Sobol sensitivity analysis of a completed simulation, stored with its results"""
+        from powerplotui.services.sensitivity_analyzer import SobolSensitivityAnalyzer
+
+        analyzer = SobolSensitivityAnalyzer(
+            simulator,
+            base_samples=options['sensitivity_samples'],
+            seed=options.get('seed'),
+            workers=options['workers']
+        )
+        sensitivity = analyzer.run()
+        analyzer.store(simulation, sensitivity)
+
+        self.stdout.write(
+            f"    Sensitivity ({sensitivity['model_evaluations']:,} evaluations, "
+            f"{sensitivity['execution_time_seconds']:.1f}s), total indices for P(85%):"
+        )
+        for group, indices in sensitivity['indices']['probability_85_percent'].items():
+            if indices['total'] is None:
+                self.stdout.write(f"      {group}: - (P(85%) does not vary)")
+                continue
+            low, high = indices['total_ci']
+            self.stdout.write(f"      {group}: {indices['total']:.3f} [{low:.3f}, {high:.3f}]")
+
+    def run_scenarios_parallel(self, scenarios, options, inputs, concurrency):
+        """
+        Run scenarios in a process pool, each worker holding the shared inputs.
+
+        Each scenario's output is written as it completes; results are
+        returned in scenario order.
+        """
+        self.stdout.write(f"Running {len(scenarios)} scenarios, {concurrency} at a time")
+        self.stdout.write('')
+
+        # Workers must not share the parent's connection
+        connections.close_all()
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=concurrency, initializer=init_scenario_worker,
+                                 initargs=(inputs,)) as executor:
+            futures = {
+                executor.submit(run_scenario_worker, scenario.pk,
+                                f"[{idx}/{len(scenarios)}]", options): idx
+                for idx, scenario in enumerate(scenarios, 1)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                scenario = scenarios[idx - 1]
+                try:
+                    result, output = future.result()
+                except Exception as e:
+                    self.stderr.write(self.style.ERROR(f"  ✗ {scenario.display_name} failed: {e}"))
+                    result = {'scenario': scenario.display_name, 'status': 'failed', 'error': str(e)}
+                    output = ''
+                self.stdout.write(output, ending='')
+                if result:
+                    results[idx] = result
+
+        return [results[idx] for idx in sorted(results)]
+
     def _get_scenarios(self, scenario_id, scenario_type, year, run_all):
         """
         Get list of scenarios to process based on arguments.
@@ -4,24 +4,63 @@ Django management command to update renewable energy dashboard data
 Can be run via cron job: python manage.py update_ret_dashboard
 """
 
-from django.core.management.base import BaseCommand
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 from django.utils import timezone
-from django.db.models import Sum, F, Avg, Max, Min, StdDev, Count, Q, Case, When, Value, DecimalField
-from datetime import datetime, timedelta
+from django.db.models import Sum, Avg, Max, Min, StdDev, Count, Q
+from datetime import datetime, timedelta, timezone as dt_timezone
 from calendar import monthrange
+from array import array
+import io
 import logging
+import time
+import numpy as np
 
 from siren_web.models import (
-    MonthlyREPerformance, DailyPeakRE,
-    NewCapacityCommissioned, FacilityScada, facilities,
+    MonthlyREPerformance, DailyPeakRE, DailyREPartial,
+    NewCapacityCommissioned, facilities,
     DPVGeneration, WholesalePrice
 )
+from powerplotui.services.scada_storage import get_scada_values
 
 logger = logging.getLogger(__name__)
 
 # Price spike threshold ($/MWh)
 PRICE_SPIKE_THRESHOLD = 300.0
 
+# Fuel types counted as renewable for operational RE% (plus category Storage)
+RE_FUEL_TYPES = ('WIND', 'SOLAR', 'BIOMASS', 'HYDRO')
+
+# SCADA quantities are DECIMAL(12,6); sums are done in integer micro-MW
+MICRO_UNITS = 10 ** 6
+
+# Half-hourly intervals in a complete day; a DailyREPartial with fewer SCADA
+# intervals, DPV records or prices was stored before its data was complete
+FULL_DAY_INTERVALS = 48
+
+
+def rebuild_month_worker(year, month, force, incremental):
+    """
+    Process pool entry point for --workers: update one month in a worker process.
+
+    Each worker opens its own database connection. New capacity is left to the
+    ordered pass in the parent process.
+
+    Returns:
+        (year, month, elapsed seconds, command output)
+    """
+    output = io.StringIO()
+    started = time.time()
+    try:
+        Command(stdout=output, stderr=output).update_month(
+            year, month, force, incremental, update_capacity=False
+        )
+    finally:
+        connections.close_all()
+    return year, month, time.time() - started, output.getvalue()
+
 
 class Command(BaseCommand):
     help = 'Update renewable energy dashboard data from SCADA'
@@ -47,6 +86,18 @@ class Command(BaseCommand):
             action='store_true',
             help='Update all months year-to-date',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='With --ytd, rebuild months in parallel using N worker processes',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Re-derive the month from stored daily partials, recomputing only '
+                 'new days and the latest stored day (with --force, rebuild all days)',
+        )
 
     def handle(self, *args, **options):
         """Main command handler"""
@@ -56,7 +107,7 @@ class Command(BaseCommand):
             year = options['year']
             month = options['month']
             self.stdout.write(f"Updating specific period: {month}/{year}")
-            self.update_month(year, month, options['force'])
+            self.update_month(year, month, options['force'], options['incremental'])
             
         elif options['ytd']:
             # Update all months in current year
@@ -64,8 +115,15 @@ class Command(BaseCommand):
             current_month = timezone.now().month
             self.stdout.write(f"Updating YTD for {year}")
             
-            for month in range(1, current_month + 1):
-                self.update_month(year, month, options['force'])
+            months = [(year, month) for month in range(1, current_month + 1)]
+            if options['workers'] > 1:
+                self.update_months_parallel(
+                    months, options['workers'], options['force'], options['incremental']
+                )
+            else:
+                for year, month in months:
+                    self.update_month(year, month, options['force'], options['incremental'])
+            self.report_ytd(year)
                 
         else:
             # Default: update last complete month
@@ -81,19 +139,115 @@ class Command(BaseCommand):
             month = target_date.month
             
             self.stdout.write(f"Updating last complete month: {month}/{year}")
-            self.update_month(year, month, options['force'])
-        
+            self.update_month(year, month, options['force'], options['incremental'])
+
+        self.refresh_capacity_factors()
         self.stdout.write(self.style.SUCCESS('Successfully updated RE dashboard data'))
 
-    def update_month(self, year, month, force=False):
-        """Update data for a specific month"""
+    def update_months_parallel(self, months, workers, force=False, incremental=False):
+        """
+        Update several months in a process pool, then run the ordered pass for
+        NewCapacityCommissioned in the parent process.
+
+        Month records are independent of each other, so they can be rebuilt in
+        any order; anything depending on prior months runs afterwards.
+        """
+        if workers < 1:
+            raise CommandError('--workers must be at least 1')
+
+        self.stdout.write(f"  Rebuilding {len(months)} months with {workers} workers")
+
+        # Workers must not share the parent's connection
+        connections.close_all()
+
+        started = time.time()
+        timings = {}
+        outputs = {}
+        failures = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            futures = {
+                executor.submit(rebuild_month_worker, year, month, force, incremental): (year, month)
+                for year, month in months
+            }
+            for future in as_completed(futures):
+                year, month = futures[future]
+                try:
+                    _, _, elapsed, output = future.result()
+                except Exception as e:
+                    failures[(year, month)] = e
+                    self.stdout.write(self.style.ERROR(f"  {month}/{year} failed: {e}"))
+                    continue
+                timings[(year, month)] = elapsed
+                outputs[(year, month)] = output
+                self.stdout.write(f"  Finished {month}/{year} in {elapsed:.1f}s")
+        wall_time = time.time() - started
+
+        # Month output in calendar order, then the ordered pass
+        for year, month in months:
+            if (year, month) in outputs:
+                self.stdout.write(outputs[(year, month)], ending='')
+
+        for year, month in months:
+            if (year, month) not in failures:
+                self.update_new_capacity(year, month)
+
+        self.stdout.write("  Per-month timings:")
+        for year, month in months:
+            if (year, month) in timings:
+                self.stdout.write(f"    {year}-{month:02d}: {timings[(year, month)]:.1f}s")
+            else:
+                self.stdout.write(f"    {year}-{month:02d}: failed")
+        self.stdout.write(
+            f"  Total {sum(timings.values()):.1f}s of month work in {wall_time:.1f}s elapsed"
+        )
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} month(s) failed: "
+                + ', '.join(f"{m}/{y}" for y, m in sorted(failures))
+            )
+
+    def refresh_capacity_factors(self):
+        """
+        Refresh the cached capacity factor distributions once the months are stored.
+
+        Done here rather than on each MonthlyREPerformance save because months
+        are written by worker processes; the refresh is skipped when the data
+        version is unchanged and failures are only logged.
+        """
+        from powerplotui.services.capacity_factor_analyzer import CapacityFactorAnalyzer
+
+        if CapacityFactorAnalyzer().refresh_cache():
+            self.stdout.write("  Refreshed capacity factor distributions")
+
+    def report_ytd(self, year):
+        """Write the YTD summary once all months of the year are updated"""
+        latest = MonthlyREPerformance.objects.filter(year=year).order_by('-month').first()
+        if not latest:
+            return
+        summary = latest.calculate_ytd_summary()
+        if summary:
+            self.stdout.write(
+                f"  YTD to {latest.month}/{year}: "
+                f"RE% {summary['re_percentage_underlying']:.1f}% underlying, "
+                f"{summary['re_percentage_operational']:.1f}% operational"
+            )
+
+    def update_month(self, year, month, force=False, incremental=False, update_capacity=True):
+        """Update data for a specific month.
+
+        In incremental mode the month is re-derived from DailyREPartial rows, so
+        only days without a partial (and the latest stored day, which may have
+        been incomplete) are read from SCADA. The existing record is always
+        overwritten; force rebuilds every day's partial.
+        """
         
         # Check if data already exists
         existing = MonthlyREPerformance.objects.filter(
             year=year, month=month
         ).first()
         
-        if existing and not force:
+        if existing and not (force or incremental):
             self.stdout.write(
                 self.style.WARNING(
                     f"  Data for {month}/{year} already exists. Use --force to overwrite."
@@ -108,13 +262,15 @@ class Command(BaseCommand):
         start_datetime = timezone.make_aware(datetime(year, month, 1, 0, 0, 0))
         end_datetime = timezone.make_aware(datetime(year, month, last_day, 23, 59, 59))
         
-        # Query SCADA data for the month
-        scada_data = FacilityScada.objects.filter(
-            dispatch_interval__gte=start_datetime,
-            dispatch_interval__lte=end_datetime
-        ).select_related('facility', 'facility__idtechnologies')
+        if incremental:
+            # Combine per-day partials, computing only the days that need it
+            partials = self.update_daily_partials(year, month, rebuild=force)
+            scada_data = self.merge_partial_scada(partials)
+        else:
+            # Extract the month's SCADA once and summarise it in a single pass
+            scada_data = self.summarise_scada(start_datetime, end_datetime)
         
-        if not scada_data.exists():
+        if not scada_data['record_count']:
             self.stdout.write(
                 self.style.ERROR(
                     f"  No SCADA data found for {month}/{year}"
@@ -122,13 +278,16 @@ class Command(BaseCommand):
             )
             return
         
-        self.stdout.write(f"  Found {scada_data.count()} SCADA records")
+        self.stdout.write(f"  Found {scada_data['record_count']} SCADA records")
         
         # Calculate generation by fuel type
         generation_data = self.calculate_generation(scada_data)
         
         # Get rooftop solar from DPVGeneration
-        rooftop_solar = self.get_rooftop_solar(year, month, start_datetime, end_datetime)
+        if incremental:
+            rooftop_solar = self.merge_partial_rooftop_solar(year, month, partials)
+        else:
+            rooftop_solar = self.get_rooftop_solar(year, month, start_datetime, end_datetime)
         generation_data['solar_rooftop'] = rooftop_solar
         self.stdout.write(f"  Rooftop solar: {rooftop_solar:.1f} GWh")
         
@@ -166,7 +325,10 @@ class Command(BaseCommand):
             peak_inst_dt = half_hourly_peak.get('datetime')
 
         # Get wholesale price statistics
-        wholesale_data = self.calculate_wholesale_prices(year, month, start_datetime, end_datetime)
+        if incremental:
+            wholesale_data = self.merge_partial_wholesale_prices(year, month, partials)
+        else:
+            wholesale_data = self.calculate_wholesale_prices(year, month, start_datetime, end_datetime)
 
         # Calculate underlying demand (operational + rooftop)
         underlying_demand = operational_demand + rooftop_solar
@@ -228,7 +390,8 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(msg))
         
         # Update new capacity commissioned
-        self.update_new_capacity(year, month)
+        if update_capacity:
+            self.update_new_capacity(year, month)
 
     def calculate_wholesale_prices(self, year, month, start_datetime, end_datetime):
         """
@@ -305,7 +468,11 @@ class Command(BaseCommand):
             if min_record:
                 result['min_datetime'] = min_record.trading_interval
         
-        # Log summary
+        self.log_wholesale_prices(result)
+        return result
+
+    def log_wholesale_prices(self, result):
+        """Write the wholesale price summary for a month"""
         self.stdout.write(
             f"  Wholesale prices: "
             f"Min ${result['min_price']:.2f}, "
@@ -318,9 +485,315 @@ class Command(BaseCommand):
                 f"{result['negative_count']} negative intervals, "
                 f"{result['spike_count']} spike intervals (>${PRICE_SPIKE_THRESHOLD})"
             )
-        
+
+    def update_daily_partials(self, year, month, rebuild=False):
+        """
+        Bring the month's DailyREPartial rows up to date.
+
+        Days up to today without a partial are computed, as are the latest
+        stored day and any stored day whose SCADA, DPV or price data was
+        incomplete when it was computed (e.g. a failed fetch since backfilled).
+        With rebuild, every day is recomputed.
+
+        Returns:
+            list of DailyREPartial for the month, in date order
+        """
+        _, last_day = monthrange(year, month)
+        start_date = datetime(year, month, 1).date()
+        end_date = min(datetime(year, month, last_day).date(), timezone.now().date())
+
+        stored = {
+            partial.trading_date: partial
+            for partial in DailyREPartial.objects.filter(
+                trading_date__gte=start_date,
+                trading_date__lte=datetime(year, month, last_day).date()
+            )
+        }
+
+        if rebuild or not stored:
+            recompute_from = start_date
+        else:
+            recompute_from = max(stored)
+
+        trading_date = start_date
+        computed = 0
+        while trading_date <= end_date:
+            if (trading_date >= recompute_from or trading_date not in stored
+                    or not self.is_complete_partial(stored[trading_date])):
+                stored[trading_date] = self.calculate_daily_partial(trading_date)
+                computed += 1
+            trading_date += timedelta(days=1)
+
+        self.stdout.write(
+            f"  Daily partials: {computed} computed, {len(stored) - computed} reused"
+        )
+        return [stored[day] for day in sorted(stored)]
+
+    @staticmethod
+    def is_complete_partial(partial):
+        """True if the partial was computed from a full day of SCADA, DPV and price data"""
+        return (
+            len(partial.interval_totals) >= FULL_DAY_INTERVALS
+            and partial.dpv_record_count >= FULL_DAY_INTERVALS
+            and partial.price_count >= FULL_DAY_INTERVALS
+        )
+
+    def calculate_daily_partial(self, trading_date):
+        """Compute and store the DailyREPartial for one day"""
+        start_datetime = timezone.make_aware(datetime.combine(trading_date, datetime.min.time()))
+        end_datetime = start_datetime + timedelta(days=1) - timedelta(seconds=1)
+
+        scada_data = self.summarise_scada(start_datetime, end_datetime)
+
+        dpv = DPVGeneration.objects.filter(
+            trading_interval__gte=start_datetime,
+            trading_interval__lte=end_datetime
+        ).aggregate(total=Sum('estimated_generation'), records=Count('id'))
+
+        # Welford running mean / M2 over the day's prices, in interval order
+        price_stats = {
+            'price_count': 0, 'price_mean': None, 'price_m2': None,
+            'price_max': None, 'price_max_datetime': None,
+            'price_min': None, 'price_min_datetime': None,
+            'price_negative_count': 0, 'price_spike_count': 0,
+        }
+        mean = m2 = 0.0
+        count = 0
+        for trading_interval, price in WholesalePrice.objects.filter(
+            trading_interval__gte=start_datetime,
+            trading_interval__lte=end_datetime
+        ).order_by('trading_interval').values_list('trading_interval', 'wholesale_price'):
+            count += 1
+            delta = price - mean
+            mean += delta / count
+            m2 += delta * (price - mean)
+            if price_stats['price_max'] is None or price > price_stats['price_max']:
+                price_stats['price_max'] = price
+                price_stats['price_max_datetime'] = trading_interval
+            if price_stats['price_min'] is None or price < price_stats['price_min']:
+                price_stats['price_min'] = price
+                price_stats['price_min_datetime'] = trading_interval
+            if price < 0:
+                price_stats['price_negative_count'] += 1
+            if price > PRICE_SPIKE_THRESHOLD:
+                price_stats['price_spike_count'] += 1
+        if count:
+            price_stats.update(price_count=count, price_mean=mean, price_m2=m2)
+
+        partial, _ = DailyREPartial.objects.update_or_create(
+            trading_date=trading_date,
+            defaults={
+                'scada_record_count': scada_data['record_count'],
+                'facility_totals': {
+                    str(facility_id): list(totals)
+                    for facility_id, totals in scada_data['facility_totals'].items()
+                },
+                'interval_totals': [
+                    [timestamp, generation, re_generation]
+                    for timestamp, generation, re_generation in zip(
+                        scada_data['intervals'].tolist(),
+                        scada_data['interval_generation'].tolist(),
+                        scada_data['interval_re_generation'].tolist(),
+                    )
+                ],
+                'dpv_generation': dpv['total'] or 0,
+                'dpv_record_count': dpv['records'],
+                **price_stats,
+            }
+        )
+        return partial
+
+    def merge_partial_scada(self, partials):
+        """Combine daily partials into the same summary summarise_scada() returns"""
+        facility_totals = {}
+        interval_rows = []
+        record_count = 0
+        for partial in partials:
+            record_count += partial.scada_record_count
+            for facility_id, totals in partial.facility_totals.items():
+                current = facility_totals.setdefault(int(facility_id), [0, 0, 0])
+                for i, value in enumerate(totals):
+                    current[i] += value
+            interval_rows.extend(partial.interval_totals)
+
+        interval_rows.sort()
+        columns = np.array(interval_rows, dtype=np.int64).reshape(-1, 3)
+        return {
+            'record_count': record_count,
+            'facility_totals': {
+                facility_id: tuple(totals) for facility_id, totals in facility_totals.items()
+            },
+            'intervals': columns[:, 0],
+            'interval_generation': columns[:, 1],
+            'interval_re_generation': columns[:, 2],
+        }
+
+    def merge_partial_rooftop_solar(self, year, month, partials):
+        """Rooftop solar (GWh) for the month from daily partials"""
+        if not any(partial.dpv_record_count for partial in partials):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"  No DPV data found for {month}/{year}"
+                )
+            )
+            return 0
+
+        total_mw = sum(partial.dpv_generation for partial in partials)
+        # (MW * 0.5 hours) / 1000 = GWh, as in get_rooftop_solar
+        return float(total_mw) * 0.5 / 1000.0 if total_mw else 0
+
+    def merge_partial_wholesale_prices(self, year, month, partials):
+        """
+        Wholesale price statistics for the month from daily partials.
+
+        Daily means and M2 are combined with the parallel variance formula;
+        std_dev is the population standard deviation, as StdDev() gives.
+        """
+        result = {
+            'max_price': None,
+            'max_datetime': None,
+            'min_price': None,
+            'min_datetime': None,
+            'avg_price': None,
+            'std_dev': None,
+            'negative_count': None,
+            'spike_count': None,
+        }
+
+        count = 0
+        mean = m2 = 0.0
+        negative_count = spike_count = 0
+        for partial in partials:
+            if not partial.price_count:
+                continue
+            total = count + partial.price_count
+            delta = partial.price_mean - mean
+            mean += delta * partial.price_count / total
+            m2 += partial.price_m2 + delta * delta * count * partial.price_count / total
+            count = total
+            negative_count += partial.price_negative_count
+            spike_count += partial.price_spike_count
+
+            if result['max_price'] is None or partial.price_max > result['max_price']:
+                result['max_price'] = partial.price_max
+                result['max_datetime'] = partial.price_max_datetime
+            if result['min_price'] is None or partial.price_min < result['min_price']:
+                result['min_price'] = partial.price_min
+                result['min_datetime'] = partial.price_min_datetime
+
+        if not count:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"  No wholesale price data found for {month}/{year}"
+                )
+            )
+            return result
+
+        self.stdout.write(f"  Found {count} wholesale price records")
+        result['avg_price'] = mean
+        result['std_dev'] = (m2 / count) ** 0.5
+        result['negative_count'] = negative_count
+        result['spike_count'] = spike_count
+
+        self.log_wholesale_prices(result)
         return result
 
+    def get_facility_lookup(self):
+        """Facility id -> technology and emissions attributes, loaded once per run"""
+        if getattr(self, '_facility_lookup', None) is None:
+            self._facility_lookup = {
+                facility_id: {
+                    'fuel_type': fuel_type,
+                    'technology_name': technology_name,
+                    'category': category,
+                    'emission_intensity': emission_intensity,
+                    'technology_emissions': technology_emissions,
+                    # RE sources: fuel_type in WIND/SOLAR/BIOMASS/HYDRO, or category=Storage (BESS)
+                    'is_re': (
+                        (fuel_type or '').upper() in RE_FUEL_TYPES
+                        or (category or '').lower() == 'storage'
+                    ),
+                }
+                for (facility_id, emission_intensity, fuel_type, technology_name,
+                     category, technology_emissions) in facilities.objects.values_list(
+                    'idfacilities', 'emission_intensity',
+                    'idtechnologies__fuel_type', 'idtechnologies__technology_name',
+                    'idtechnologies__category', 'idtechnologies__emissions',
+                )
+            }
+        return self._facility_lookup
+
+    def summarise_scada(self, start_datetime, end_datetime):
+        """Extract a period's SCADA into arrays and aggregate it in one pass.
+
+        Quantities are held as integer micro-MW so sums are exact, matching
+        DECIMAL sums done in the database. Archived months are read from the
+        SCADA archive.
+
+        Returns dict with:
+            - record_count: number of half-hourly records
+            - facility_totals: facility_id -> (positive, negative, net) micro-MW sums
+            - intervals: sorted dispatch intervals (epoch seconds)
+            - interval_generation: positive micro-MW per interval (all facilities)
+            - interval_re_generation: positive micro-MW per interval (RE facilities)
+        """
+        lookup = self.get_facility_lookup()
+
+        # end_datetime is the last second of the period (inclusive)
+        interval_col, facility_col, quantity_col = array('q'), array('q'), array('q')
+        for dispatch_interval, facility_id, quantity in get_scada_values(
+            start_datetime, end_datetime + timedelta(seconds=1)
+        ):
+            interval_col.append(int(dispatch_interval.timestamp()))
+            facility_col.append(facility_id)
+            quantity_col.append(int(quantity.scaleb(6)))
+
+        intervals = np.frombuffer(interval_col, dtype=np.int64)
+        facility_ids = np.frombuffer(facility_col, dtype=np.int64)
+        quantities = np.frombuffer(quantity_col, dtype=np.int64)
+
+        positive = np.where(quantities > 0, quantities, 0)
+        negative = np.where(quantities < 0, quantities, 0)
+
+        # Per facility sums
+        unique_facilities, facility_index = np.unique(facility_ids, return_inverse=True)
+        facility_sums = np.zeros((3, len(unique_facilities)), dtype=np.int64)
+        np.add.at(facility_sums[0], facility_index, positive)
+        np.add.at(facility_sums[1], facility_index, negative)
+        np.add.at(facility_sums[2], facility_index, quantities)
+
+        # Per interval sums
+        is_re = np.array(
+            [lookup.get(int(f), {}).get('is_re', False) for f in unique_facilities],
+            dtype=bool
+        )
+        unique_intervals, interval_index = np.unique(intervals, return_inverse=True)
+        interval_generation = np.zeros(len(unique_intervals), dtype=np.int64)
+        interval_re_generation = np.zeros(len(unique_intervals), dtype=np.int64)
+        np.add.at(interval_generation, interval_index, positive)
+        re_rows = is_re[facility_index]
+        np.add.at(interval_re_generation, interval_index[re_rows], positive[re_rows])
+
+        return {
+            'record_count': len(quantities),
+            'facility_totals': {
+                int(f): (int(pos), int(neg), int(net))
+                for f, pos, neg, net in zip(unique_facilities, *facility_sums)
+            },
+            'intervals': unique_intervals,
+            'interval_generation': interval_generation,
+            'interval_re_generation': interval_re_generation,
+        }
+
+    @staticmethod
+    def _micro_to_mw(value):
+        """Convert an exact micro-MW sum to MW"""
+        return int(value) / MICRO_UNITS
+
+    @staticmethod
+    def _interval_datetime(timestamp):
+        return datetime.fromtimestamp(int(timestamp), tz=dt_timezone.utc)
+
     def calculate_generation(self, scada_data):
         """Calculate generation totals by technology fuel type from SCADA data.
 
@@ -342,43 +815,26 @@ class Command(BaseCommand):
             'hydro_charge': 0,
         }
 
-        group_fields = [
-            'facility__idtechnologies__fuel_type',
-            'facility__idtechnologies__technology_name',
-            'facility__idtechnologies__category',
-        ]
-
-        # Aggregate POSITIVE quantities (generation / discharge) by fuel type
-        facility_discharge = scada_data.values(*group_fields).annotate(
-            total_mw=Sum(
-                Case(
-                    When(quantity__gt=0, then=F('quantity')),
-                    default=Value(0),
-                    output_field=DecimalField()
-                )
-            )
-        )
-
-        # Aggregate NEGATIVE quantities (charging / pumping) by fuel type
-        facility_charge = scada_data.values(*group_fields).annotate(
-            total_mw=Sum(
-                Case(
-                    When(quantity__lt=0, then=F('quantity')),
-                    default=Value(0),
-                    output_field=DecimalField()
-                )
-            )
-        )
+        # Sum POSITIVE (generation / discharge) and NEGATIVE (charging / pumping)
+        # quantities by technology
+        lookup = self.get_facility_lookup()
+        technology_totals = {}
+        for facility_id, (positive, negative, _) in scada_data['facility_totals'].items():
+            info = lookup.get(facility_id, {})
+            key = (info.get('fuel_type'), info.get('technology_name'), info.get('category'))
+            totals = technology_totals.setdefault(key, [0, 0])
+            totals[0] += positive
+            totals[1] += negative
 
         def _is_storage(fuel_type, category, tech_name):
             return category == 'STORAGE' or 'BATTERY' in tech_name.upper()
 
         # Process positive values (generation / discharge)
-        for item in facility_discharge:
-            fuel_type = (item.get('facility__idtechnologies__fuel_type') or '').upper()
-            tech_name = item.get('facility__idtechnologies__technology_name') or ''
-            category = (item.get('facility__idtechnologies__category') or '').upper()
-            total_mw = float(item['total_mw'] or 0)
+        for (fuel_type, tech_name, category), (positive, _) in technology_totals.items():
+            fuel_type = (fuel_type or '').upper()
+            tech_name = tech_name or ''
+            category = (category or '').upper()
+            total_mw = self._micro_to_mw(positive)
 
             # Convert from MW (half-hourly) to GWh: MW * 0.5h / 1000
             gen_gwh = total_mw * 0.5 / 1000.0
@@ -399,11 +855,11 @@ class Command(BaseCommand):
                 generation['storage_discharge'] += gen_gwh
 
         # Process negative values (charging / pumping)
-        for item in facility_charge:
-            fuel_type = (item.get('facility__idtechnologies__fuel_type') or '').upper()
-            tech_name = item.get('facility__idtechnologies__technology_name') or ''
-            category = (item.get('facility__idtechnologies__category') or '').upper()
-            total_mw = float(item['total_mw'] or 0)
+        for (fuel_type, tech_name, category), (_, negative) in technology_totals.items():
+            fuel_type = (fuel_type or '').upper()
+            tech_name = tech_name or ''
+            category = (category or '').upper()
+            total_mw = self._micro_to_mw(negative)
 
             # Convert negative MW to positive GWh charge value
             charge_gwh = abs(total_mw) * 0.5 / 1000.0
@@ -477,24 +933,19 @@ class Command(BaseCommand):
         total_emissions_kg = 0
         total_generation_kwh = 0
 
-        # Aggregate by facility, fetching both facility and technology intensities
-        facility_totals = scada_data.values(
-            'facility__emission_intensity',
-            'facility__idtechnologies__emissions'
-        ).annotate(
-            total_mw=Sum('quantity'),
-            facility_id=F('facility')
-        )
+        # Per facility totals, with both facility and technology intensities
+        lookup = self.get_facility_lookup()
 
-        for item in facility_totals:
-            total_mw = float(item['total_mw'] or 0)
+        for facility_id, (_, _, net) in scada_data['facility_totals'].items():
+            total_mw = self._micro_to_mw(net)
 
             # Convert MW (half-hourly) to kWh: MW * 0.5h * 1000
             generation_kwh = total_mw * 0.5 * 1000
 
             if generation_kwh > 0:
-                facility_intensity = item.get('facility__emission_intensity')
-                tech_emissions = item.get('facility__idtechnologies__emissions')
+                info = lookup.get(facility_id, {})
+                facility_intensity = info.get('emission_intensity')
+                tech_emissions = info.get('technology_emissions')
 
                 if facility_intensity is not None:
                     # t CO2-e/MWh == kg CO2-e/kWh; use value directly
@@ -523,24 +974,12 @@ class Command(BaseCommand):
 
     def get_peak_minimum(self, scada_data):
         """Get peak and minimum operational demand (positive generation only, excludes charging)"""
-        from django.db.models import Case, When, Value, DecimalField
-
-        # Aggregate by dispatch_interval to get total demand per half-hour interval
-        # Only count positive values (generation) to exclude storage charging
-        hourly_demand = scada_data.values('dispatch_interval').annotate(
-            total_demand=Sum(
-                Case(
-                    When(
-                        quantity__gt=0,
-                        then=F('quantity')
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField()
-                )
-            )
-        ).order_by('dispatch_interval')
-        
-        if not hourly_demand:
+
+        # Total demand per half-hour interval, counting only positive values
+        # (generation) to exclude storage charging
+        interval_demand = scada_data['interval_generation']
+
+        if not len(interval_demand):
             return {
                 'peak_mw': None,
                 'peak_datetime': None,
@@ -548,19 +987,38 @@ class Command(BaseCommand):
                 'min_datetime': None,
             }
         
-        # Find max and min
-        peak = max(hourly_demand, key=lambda x: x['total_demand'])
-        minimum = min(hourly_demand, key=lambda x: x['total_demand'])
+        # Find max and min (first occurrence in interval order)
+        peak = int(np.argmax(interval_demand))
+        minimum = int(np.argmin(interval_demand))
 
         # total_demand is sum of facility MW (power) for each interval.
         # Already in MW - no conversion needed.
         return {
-            'peak_mw': float(peak['total_demand']),
-            'peak_datetime': peak['dispatch_interval'],
-            'min_mw': float(minimum['total_demand']),
-            'min_datetime': minimum['dispatch_interval'],
+            'peak_mw': self._micro_to_mw(interval_demand[peak]),
+            'peak_datetime': self._interval_datetime(scada_data['intervals'][peak]),
+            'min_mw': self._micro_to_mw(interval_demand[minimum]),
+            'min_datetime': self._interval_datetime(scada_data['intervals'][minimum]),
         }
 
+    def _interval_re_data(self, scada_data):
+        """Per-interval RE and total (positive) generation, for intervals with generation"""
+        interval_data = []
+        for timestamp, re_gen, total_gen in zip(
+            scada_data['intervals'].tolist(),
+            scada_data['interval_re_generation'].tolist(),
+            scada_data['interval_generation'].tolist(),
+        ):
+            re_gen = self._micro_to_mw(re_gen)
+            total_gen = self._micro_to_mw(total_gen)
+            if total_gen > 0:
+                interval_data.append({
+                    'timestamp': timestamp,
+                    're_gen': re_gen,
+                    'total_gen': total_gen,
+                    're_percentage': (re_gen / total_gen) * 100,
+                })
+        return interval_data
+
     def calculate_best_re_hour(self, scada_data):
         """
         Calculate the interval with highest RE percentage based on operational demand.
@@ -569,58 +1027,12 @@ class Command(BaseCommand):
                           / operational demand
         Excludes rooftop solar (DPV) as that's not part of operational/grid demand.
         """
-        from django.db.models import Case, When, Value, DecimalField
-
         best_re = {
             'percentage': None,
             'datetime': None
         }
 
-        # RE sources: fuel_type in WIND/SOLAR/BIOMASS/HYDRO, or category=Storage (BESS)
-        re_condition = (
-            Q(facility__idtechnologies__fuel_type__in=['WIND', 'SOLAR', 'BIOMASS', 'HYDRO']) |
-            Q(facility__idtechnologies__category__iexact='storage')
-        )
-
-        # Use conditional aggregation to calculate RE vs total for each interval
-        hourly_stats = scada_data.values('dispatch_interval').annotate(
-            # Sum of renewable generation (positive only)
-            re_generation=Sum(
-                Case(
-                    When(
-                        re_condition,
-                        quantity__gt=0,
-                        then=F('quantity')
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField()
-                )
-            ),
-            # Sum of all generation (operational demand) - positive values only to exclude charging
-            total_generation=Sum(
-                Case(
-                    When(
-                        quantity__gt=0,
-                        then=F('quantity')
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField()
-                )
-            )
-        ).order_by('dispatch_interval')
-
-        # Collect per-interval RE data
-        interval_data = []
-        for interval in hourly_stats:
-            re_gen = float(interval['re_generation'] or 0)
-            total_gen = float(interval['total_generation'] or 0)
-            if total_gen > 0:
-                interval_data.append({
-                    'datetime': interval['dispatch_interval'],
-                    're_gen': re_gen,
-                    'total_gen': total_gen,
-                    're_percentage': (re_gen / total_gen) * 100,
-                })
+        interval_data = self._interval_re_data(scada_data)
 
         # Best Renewable Hour - average RE% over pairs of consecutive
         # half-hourly intervals (i.e. full clock hours)
@@ -630,17 +1042,15 @@ class Command(BaseCommand):
             curr = interval_data[i]
             nxt = interval_data[i + 1]
             # Check they are consecutive (30 min apart)
-            if hasattr(curr['datetime'], 'timestamp'):
-                delta = (nxt['datetime'] - curr['datetime']).total_seconds()
-                if delta != 1800:
-                    continue
+            if nxt['timestamp'] - curr['timestamp'] != 1800:
+                continue
             hourly_re = curr['re_gen'] + nxt['re_gen']
             hourly_total = curr['total_gen'] + nxt['total_gen']
             if hourly_total > 0:
                 hourly_pct = (hourly_re / hourly_total) * 100
                 if hourly_pct > max_hourly:
                     max_hourly = hourly_pct
-                    best_hour_datetime = curr['datetime']
+                    best_hour_datetime = self._interval_datetime(curr['timestamp'])
 
         if best_hour_datetime:
             best_re['percentage'] = max_hourly
@@ -655,44 +1065,12 @@ class Command(BaseCommand):
         Used as fallback when DailyPeakRE (5-minute) data is unavailable.
         Always >= best_re_hour (which averages over paired half-hours).
         """
-        re_condition = (
-            Q(facility__idtechnologies__fuel_type__in=['WIND', 'SOLAR', 'BIOMASS', 'HYDRO']) |
-            Q(facility__idtechnologies__category__iexact='storage')
-        )
-
-        interval_stats = scada_data.values('dispatch_interval').annotate(
-            re_generation=Sum(
-                Case(
-                    When(
-                        re_condition,
-                        quantity__gt=0,
-                        then=F('quantity'),
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField(),
-                )
-            ),
-            total_generation=Sum(
-                Case(
-                    When(
-                        quantity__gt=0,
-                        then=F('quantity'),
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField(),
-                )
-            ),
-        )
-
         best = {'percentage': None, 'datetime': None}
-        for interval in interval_stats:
-            re_gen = float(interval['re_generation'] or 0)
-            total_gen = float(interval['total_generation'] or 0)
-            if total_gen > 0:
-                pct = (re_gen / total_gen) * 100
-                if best['percentage'] is None or pct > best['percentage']:
-                    best['percentage'] = pct
-                    best['datetime'] = interval['dispatch_interval']
+        for interval in self._interval_re_data(scada_data):
+            pct = interval['re_percentage']
+            if best['percentage'] is None or pct > best['percentage']:
+                best['percentage'] = pct
+                best['datetime'] = self._interval_datetime(interval['timestamp'])
 
         if best['percentage'] is not None:
             self.stdout.write(
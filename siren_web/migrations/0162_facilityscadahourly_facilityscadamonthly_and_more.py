@@ -0,0 +1,73 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0161_remove_monthlyreperformance_emissions_intensity_kg_mwh_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FacilityScadaHourly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour_start', models.DateTimeField(db_index=True)),
+                ('quantity', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('generation', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('consumption', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('interval_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('facility', models.ForeignKey(db_column='idfacilities', on_delete=django.db.models.deletion.CASCADE, related_name='scada_hourly', to='siren_web.facilities')),
+            ],
+            options={
+                'db_table': 'facility_scada_hourly',
+                'ordering': ['-hour_start', 'facility'],
+                'indexes': [models.Index(fields=['facility', 'hour_start'], name='facility_sc_idfacil_82057a_idx')],
+                'unique_together': {('hour_start', 'facility')},
+            },
+        ),
+        migrations.CreateModel(
+            name='FacilityScadaMonthly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('hour', models.PositiveSmallIntegerField(help_text='Hour of day (0-23)')),
+                ('minute', models.PositiveSmallIntegerField(help_text='Minute of the half-hourly interval (0 or 30)')),
+                ('quantity', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('generation', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('consumption', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('interval_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('facility', models.ForeignKey(db_column='idfacilities', on_delete=django.db.models.deletion.CASCADE, related_name='scada_monthly', to='siren_web.facilities')),
+            ],
+            options={
+                'db_table': 'facility_scada_monthly',
+                'ordering': ['-year', '-month', 'facility', 'hour', 'minute'],
+                'indexes': [models.Index(fields=['year', 'month'], name='facility_sc_year_894b8e_idx')],
+                'unique_together': {('year', 'month', 'facility', 'hour', 'minute')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TechnologyScadaDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(db_index=True)),
+                ('quantity', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('generation', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('consumption', models.DecimalField(decimal_places=6, default=0, max_digits=16)),
+                ('interval_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('technology', models.ForeignKey(db_column='idtechnologies', on_delete=django.db.models.deletion.CASCADE, related_name='scada_daily', to='siren_web.technologies')),
+            ],
+            options={
+                'db_table': 'technology_scada_daily',
+                'ordering': ['-day', 'technology'],
+                'unique_together': {('day', 'technology')},
+            },
+        ),
+    ]
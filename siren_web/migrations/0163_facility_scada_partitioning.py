@@ -0,0 +1,84 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:30
+
+from datetime import date
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Monthly partitions created ahead of the current month; afterwards
+# manage_scada_partitions keeps splitting new months off p_future.
+MONTHS_AHEAD = 3
+
+
+def _next_month(year, month):
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def partition_facility_scada(apps, schema_editor):
+    """
+    Convert facility_scada to monthly RANGE partitions on dispatch_interval.
+
+    MySQL requires the partitioning column in every unique key, so the primary
+    key becomes (id, dispatch_interval); the (dispatch_interval, idfacilities)
+    unique key already qualifies. Partitions run from the earliest month with
+    data to MONTHS_AHEAD months past today, plus a catch-all p_future.
+    This rebuilds the table, so run it during a quiet period.
+    """
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(dispatch_interval) FROM facility_scada")
+        first = cursor.fetchone()[0]
+
+    today = date.today()
+    year, month = (first.year, first.month) if first else (today.year, today.month)
+    last = (today.year, today.month)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(*last)
+
+    definitions = []
+    while (year, month) <= last:
+        ny, nm = _next_month(year, month)
+        definitions.append(
+            f"PARTITION p{year}{month:02d} VALUES LESS THAN (TO_DAYS('{ny:04d}-{nm:02d}-01'))"
+        )
+        year, month = ny, nm
+    definitions.append("PARTITION p_future VALUES LESS THAN MAXVALUE")
+
+    schema_editor.execute(
+        "ALTER TABLE facility_scada DROP PRIMARY KEY, ADD PRIMARY KEY (id, dispatch_interval)"
+    )
+    schema_editor.execute(
+        "ALTER TABLE facility_scada PARTITION BY RANGE (TO_DAYS(dispatch_interval)) "
+        f"({', '.join(definitions)})"
+    )
+
+
+def unpartition_facility_scada(apps, schema_editor):
+    """Remove partitioning and restore the single-column primary key"""
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    schema_editor.execute("ALTER TABLE facility_scada REMOVE PARTITIONING")
+    schema_editor.execute(
+        "ALTER TABLE facility_scada DROP PRIMARY KEY, ADD PRIMARY KEY (id)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0162_facilityscadahourly_facilityscadamonthly_and_more'),
+    ]
+
+    operations = [
+        # Partitioned InnoDB tables cannot have foreign keys
+        migrations.AlterField(
+            model_name='facilityscada',
+            name='facility',
+            field=models.ForeignKey(db_column='idfacilities', db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='scada_records', to='siren_web.facilities'),
+        ),
+        migrations.RunPython(partition_facility_scada, unpartition_facility_scada),
+    ]
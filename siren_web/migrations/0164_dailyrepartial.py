@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0163_facility_scada_partitioning'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyREPartial',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trading_date', models.DateField(db_index=True, unique=True)),
+                ('scada_record_count', models.PositiveIntegerField(default=0)),
+                ('facility_totals', models.JSONField(default=dict, help_text='facility_id -> [generation, consumption, net] SCADA sums in micro-MW')),
+                ('interval_totals', models.JSONField(default=list, help_text='[timestamp, generation, RE generation] per dispatch interval in micro-MW')),
+                ('dpv_generation', models.DecimalField(decimal_places=4, default=0, help_text='Sum of half-hourly estimated DPV generation (MW)', max_digits=14)),
+                ('dpv_record_count', models.PositiveIntegerField(default=0)),
+                ('price_count', models.PositiveIntegerField(default=0)),
+                ('price_mean', models.FloatField(blank=True, null=True)),
+                ('price_m2', models.FloatField(blank=True, help_text='Sum of squared deviations from the mean wholesale price', null=True)),
+                ('price_max', models.FloatField(blank=True, null=True)),
+                ('price_max_datetime', models.DateTimeField(blank=True, null=True)),
+                ('price_min', models.FloatField(blank=True, null=True)),
+                ('price_min_datetime', models.DateTimeField(blank=True, null=True)),
+                ('price_negative_count', models.PositiveIntegerField(default=0)),
+                ('price_spike_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'daily_re_partial',
+                'ordering': ['-trading_date'],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0164_dailyrepartial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlotSurface',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('surface', models.CharField(choices=[('wem_price', 'WEM price by trading interval'), ('swis_demand', 'SWIS demand by hour of day')], max_length=20)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('series', models.JSONField(default=dict, help_text='Aggregate name -> list of values, one per column')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'plot_surface',
+                'ordering': ['surface', 'year', 'month'],
+                'unique_together': {('surface', 'year', 'month')},
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 03:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0165_plotsurface'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='montecarlosimulation',
+            name='achieved_precision',
+            field=models.JSONField(blank=True, help_text='Confidence interval half-widths (pp): {probability_85_percent: X, median_re_percentage: Y, ...}', null=True),
+        ),
+        migrations.AddField(
+            model_name='montecarlosimulation',
+            name='converged',
+            field=models.BooleanField(help_text='Adaptive runs: whether the tolerances were met (null if not adaptive)', null=True),
+        ),
+        migrations.AddField(
+            model_name='montecarlosimulation',
+            name='iterations_completed',
+            field=models.IntegerField(help_text='Iterations run (fewer than num_iterations if stopped early)', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 03:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0166_montecarlosimulation_achieved_precision_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='montecarloresult',
+            name='variance_contribution',
+            field=models.JSONField(blank=True, help_text='Sobol sensitivity analysis: {indices: {output: {factor: {first_order, total, ...}}}, ...}', null=True),
+        ),
+    ]
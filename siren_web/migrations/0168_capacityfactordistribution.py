@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-19 03:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('siren_web', '0167_alter_montecarloresult_variance_contribution'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CapacityFactorDistribution',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('technology', models.CharField(max_length=20)),
+                ('start_year', models.PositiveSmallIntegerField()),
+                ('end_year', models.PositiveSmallIntegerField()),
+                ('data_version', models.CharField(max_length=40)),
+                ('cf_mean', models.FloatField()),
+                ('cf_std', models.FloatField()),
+                ('cf_min', models.FloatField()),
+                ('cf_max', models.FloatField()),
+                ('n_months', models.IntegerField(help_text='Months of data behind the distribution (0 = default assumptions)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'capacity_factor_distributions',
+                'indexes': [models.Index(fields=['start_year', 'end_year', 'data_version'], name='capacity_fa_start_y_e376ba_idx')],
+                'unique_together': {('technology', 'start_year', 'end_year', 'data_version')},
+            },
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.7 on 2026-10-19 04:10
+
+from django.db import migrations
+
+
+def _next_month(year, month):
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+HOURLY_SQL = """
+    INSERT INTO facility_scada_hourly
+        (hour_start, idfacilities, quantity, generation, consumption,
+         interval_count, updated_at)
+    SELECT DATE_FORMAT(dispatch_interval, '%%Y-%%m-%%d %%H:00:00'), idfacilities,
+           SUM(quantity), SUM(GREATEST(quantity, 0)), SUM(LEAST(quantity, 0)),
+           COUNT(*), NOW()
+    FROM facility_scada
+    WHERE dispatch_interval >= %s AND dispatch_interval < %s
+    GROUP BY 1, 2
+"""
+
+DAILY_SQL = """
+    INSERT INTO technology_scada_daily
+        (day, idtechnologies, quantity, generation, consumption,
+         interval_count, updated_at)
+    SELECT DATE(s.dispatch_interval), f.idtechnologies,
+           SUM(s.quantity), SUM(GREATEST(s.quantity, 0)), SUM(LEAST(s.quantity, 0)),
+           COUNT(*), NOW()
+    FROM facility_scada s
+    JOIN facilities f ON f.idfacilities = s.idfacilities
+    WHERE s.dispatch_interval >= %s AND s.dispatch_interval < %s
+      AND f.idtechnologies IS NOT NULL
+    GROUP BY 1, 2
+"""
+
+MONTHLY_SQL = """
+    INSERT INTO facility_scada_monthly
+        (year, month, hour, minute, idfacilities, quantity, generation,
+         consumption, interval_count, updated_at)
+    SELECT YEAR(dispatch_interval), MONTH(dispatch_interval),
+           HOUR(dispatch_interval), MINUTE(dispatch_interval), idfacilities,
+           SUM(quantity), SUM(GREATEST(quantity, 0)), SUM(LEAST(quantity, 0)),
+           COUNT(*), NOW()
+    FROM facility_scada
+    WHERE dispatch_interval >= %s AND dispatch_interval < %s
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def rebuild_scada_rollups(apps, schema_editor):
+    """
+    Rebuild the SCADA rollups for every month held in facility_scada.
+
+    The rollup tables (0162) are only kept up to date by ingest from the
+    moment they exist, so a month ingested partly before that point would
+    otherwise return partial totals. Each month is recomputed with the same
+    buckets as ScadaRollupService.apply_changes, one month at a time. Months
+    already archived and dropped from facility_scada keep their rollups (see
+    rebuild_scada_rollups).
+    """
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT YEAR(dispatch_interval), MONTH(dispatch_interval) "
+            "FROM facility_scada ORDER BY 1, 2"
+        )
+        months = cursor.fetchall()
+
+    for year, month in months:
+        start = f"{year:04d}-{month:02d}-01"
+        ny, nm = _next_month(year, month)
+        end = f"{ny:04d}-{nm:02d}-01"
+
+        schema_editor.execute(
+            "DELETE FROM facility_scada_hourly WHERE hour_start >= %s AND hour_start < %s",
+            [start, end]
+        )
+        schema_editor.execute(
+            "DELETE FROM technology_scada_daily WHERE day >= %s AND day < %s",
+            [start, end]
+        )
+        schema_editor.execute(
+            "DELETE FROM facility_scada_monthly WHERE year = %s AND month = %s",
+            [year, month]
+        )
+        schema_editor.execute(HOURLY_SQL, [start, end])
+        schema_editor.execute(DAILY_SQL, [start, end])
+        schema_editor.execute(MONTHLY_SQL, [start, end])
+
+
+class Migration(migrations.Migration):
+
+    # Each month commits on its own rather than in one long transaction
+    atomic = False
+
+    dependencies = [
+        ('siren_web', '0168_capacityfactordistribution'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_scada_rollups, migrations.RunPython.noop),
+    ]
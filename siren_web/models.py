@@ -1917,12 +1917,19 @@ class DPVGeneration(models.Model):
         return f"DPV {self.trading_date} #{self.interval_number}: {self.estimated_generation}MW"
 
 class FacilityScada(models.Model):
-    """Store AEMO facility SCADA data with normalized facility reference"""
+    """
+    Store AEMO facility SCADA data with normalized facility reference.
+
+    The table is RANGE partitioned by month on dispatch_interval (migration 0163,
+    maintained by manage_scada_partitions). Partitioned InnoDB tables cannot
+    hold foreign keys, so the facility reference has no DB constraint.
+    """
     dispatch_interval = models.DateTimeField(db_index=True)
     facility = models.ForeignKey(
         'facilities',
         on_delete=models.CASCADE,        db_column='idfacilities',
-        related_name='scada_records'
+        related_name='scada_records',
+        db_constraint=False
     )
     quantity = models.DecimalField(max_digits=12, decimal_places=6)  # MW
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1965,6 +1972,179 @@ class DailyPeakRE(models.Model):
     def __str__(self):
         return f"Peak RE {self.trading_date}: {self.peak_re_percentage:.1f}%"
 
+class DailyREPartial(models.Model):
+    """
+    Per-day partial aggregates from which MonthlyREPerformance is re-derived
+    when update_ret_dashboard runs in --incremental mode.
+
+    SCADA sums are integer micro-MW so they add exactly across days, and the
+    day's per-interval totals are kept so peak/minimum demand and best RE
+    hour/interval can be re-derived for the month (including hours spanning
+    midnight). Price statistics are stored as count/mean/M2 so the monthly
+    mean and standard deviation can be combined from daily values.
+    """
+    trading_date = models.DateField(unique=True, db_index=True)
+    scada_record_count = models.PositiveIntegerField(default=0)
+    facility_totals = models.JSONField(
+        default=dict,
+        help_text="facility_id -> [generation, consumption, net] SCADA sums in micro-MW"
+    )
+    interval_totals = models.JSONField(
+        default=list,
+        help_text="[timestamp, generation, RE generation] per dispatch interval in micro-MW"
+    )
+    dpv_generation = models.DecimalField(
+        max_digits=14, decimal_places=4, default=0,
+        help_text="Sum of half-hourly estimated DPV generation (MW)"
+    )
+    dpv_record_count = models.PositiveIntegerField(default=0)
+    price_count = models.PositiveIntegerField(default=0)
+    price_mean = models.FloatField(null=True, blank=True)
+    price_m2 = models.FloatField(
+        null=True, blank=True,
+        help_text="Sum of squared deviations from the mean wholesale price"
+    )
+    price_max = models.FloatField(null=True, blank=True)
+    price_max_datetime = models.DateTimeField(null=True, blank=True)
+    price_min = models.FloatField(null=True, blank=True)
+    price_min_datetime = models.DateTimeField(null=True, blank=True)
+    price_negative_count = models.PositiveIntegerField(default=0)
+    price_spike_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'daily_re_partial'
+        ordering = ['-trading_date']
+
+    def __str__(self):
+        return f"RE partial {self.trading_date}: {self.scada_record_count} SCADA records"
+
+class FacilityScadaHourly(models.Model):
+    """
+    Hourly SCADA rollup per facility, maintained incrementally at ingest.
+
+    quantity is the sum of the half-hourly values in the hour (MWh for the hour),
+    with generation/consumption holding the positive and negative parts.
+    Hours are bucketed in UTC to match the dispatch_interval__year filters used
+    by the read paths.
+    """
+    hour_start = models.DateTimeField(db_index=True)
+    facility = models.ForeignKey(
+        'facilities',
+        on_delete=models.CASCADE,
+        db_column='idfacilities',
+        related_name='scada_hourly'
+    )
+    quantity = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    generation = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    consumption = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    interval_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'facility_scada_hourly'
+        unique_together = ['hour_start', 'facility']
+        indexes = [
+            models.Index(fields=['facility', 'hour_start']),
+        ]
+        ordering = ['-hour_start', 'facility']
+
+    def __str__(self):
+        return f"Facility {self.facility_id} @ {self.hour_start}: {self.quantity}MWh"
+
+class TechnologyScadaDaily(models.Model):
+    """
+    Daily SCADA rollup per technology (and so per fuel type), maintained at ingest.
+
+    Facilities without a technology are not rolled up. Days are UTC dates.
+    """
+    day = models.DateField(db_index=True)
+    technology = models.ForeignKey(
+        'Technologies',
+        on_delete=models.CASCADE,
+        db_column='idtechnologies',
+        related_name='scada_daily'
+    )
+    quantity = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    generation = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    consumption = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    interval_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'technology_scada_daily'
+        unique_together = ['day', 'technology']
+        ordering = ['-day', 'technology']
+
+    def __str__(self):
+        return f"Technology {self.technology_id} on {self.day}: {self.quantity}"
+
+class FacilityScadaMonthly(models.Model):
+    """
+    Monthly SCADA rollup per facility, maintained incrementally at ingest.
+
+    Each month is split by the (UTC) time of day of the half-hourly interval so
+    diurnal averages can be derived as quantity / interval_count; monthly
+    facility totals are the sum across the time-of-day rows.
+    """
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    hour = models.PositiveSmallIntegerField(help_text="Hour of day (0-23)")
+    minute = models.PositiveSmallIntegerField(help_text="Minute of the half-hourly interval (0 or 30)")
+    facility = models.ForeignKey(
+        'facilities',
+        on_delete=models.CASCADE,
+        db_column='idfacilities',
+        related_name='scada_monthly'
+    )
+    quantity = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    generation = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    consumption = models.DecimalField(max_digits=16, decimal_places=6, default=0)
+    interval_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'facility_scada_monthly'
+        unique_together = ['year', 'month', 'facility', 'hour', 'minute']
+        indexes = [
+            models.Index(fields=['year', 'month']),
+        ]
+        ordering = ['-year', '-month', 'facility', 'hour', 'minute']
+
+    def __str__(self):
+        return f"Facility {self.facility_id} {self.year}-{self.month:02d} {self.hour:02d}:{self.minute:02d}: {self.quantity}"
+
+class PlotSurface(models.Model):
+    """
+    Precomputed monthly aggregates behind the 3D surface charts (plot3D_views).
+
+    One row per surface per month. series maps each aggregate name to a list
+    with one value per column (trading interval or hour of day). Rows are
+    rebuilt by powerplotui/services/plot_surfaces.py after ingestion, or with
+    ``python manage.py rebuild_plot_surfaces``.
+    """
+    SURFACE_CHOICES = [
+        ('wem_price', 'WEM price by trading interval'),
+        ('swis_demand', 'SWIS demand by hour of day'),
+    ]
+
+    surface = models.CharField(max_length=20, choices=SURFACE_CHOICES)
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    series = models.JSONField(
+        default=dict,
+        help_text="Aggregate name -> list of values, one per column"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'plot_surface'
+        unique_together = ['surface', 'year', 'month']
+        ordering = ['surface', 'year', 'month']
+
+    def __str__(self):
+        return f"{self.surface} {self.year}-{self.month:02d}"
+
 class TurbinePowerCurves(models.Model):
     idturbinepowercurves = models.AutoField(db_column='idturbinepowercurves', primary_key=True)
     idwindturbines = models.ForeignKey(WindTurbines, on_delete=models.CASCADE, related_name='power_curves', db_column='idwindturbines')
@@ -4060,6 +4240,21 @@ class MonteCarloSimulation(models.Model):
         help_text="Probability of achieving 85% RE target"
     )
 
+    # Adaptive runs: iterations actually used and precision reached
+    iterations_completed = models.IntegerField(
+        null=True,
+        help_text="Iterations run (fewer than num_iterations if stopped early)"
+    )
+    converged = models.BooleanField(
+        null=True,
+        help_text="Adaptive runs: whether the tolerances were met (null if not adaptive)"
+    )
+    achieved_precision = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Confidence interval half-widths (pp): {probability_85_percent: X, median_re_percentage: Y, ...}"
+    )
+
     # Execution metadata
     execution_time_seconds = models.FloatField(
         null=True,
@@ -4203,7 +4398,7 @@ class MonteCarloResult(models.Model):
     variance_contribution = models.JSONField(
         null=True,
         blank=True,
-        help_text="Variance contribution by factor: {commissioning: 0.4, cf: 0.3, demand: 0.2, delay: 0.1}"
+        help_text="Sobol sensitivity analysis: {indices: {output: {factor: {first_order, total, ...}}}, ...}"
     )
 
     # Raw iteration results (sample for debugging - store first 1000)
@@ -4220,6 +4415,41 @@ class MonteCarloResult(models.Model):
         return f"Results for {self.simulation}"
 
 
+class CapacityFactorDistribution(models.Model):
+    """
+    Cached capacity factor distributions used by the Monte Carlo simulator.
+
+    One row per technology for an analysis period and data version (a token
+    of the MonthlyREPerformance months and commissioned capacity the
+    distribution was calculated from). Rows are maintained by
+    CapacityFactorAnalyzer (powerplotui/services/capacity_factor_analyzer.py)
+    after ingestion, or rebuilt with ``python manage.py rebuild_capacity_factors``.
+    """
+    technology = models.CharField(max_length=20)
+    start_year = models.PositiveSmallIntegerField()
+    end_year = models.PositiveSmallIntegerField()
+    data_version = models.CharField(max_length=40)
+
+    cf_mean = models.FloatField()
+    cf_std = models.FloatField()
+    cf_min = models.FloatField()
+    cf_max = models.FloatField()
+    n_months = models.IntegerField(
+        help_text="Months of data behind the distribution (0 = default assumptions)"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'capacity_factor_distributions'
+        unique_together = ['technology', 'start_year', 'end_year', 'data_version']
+        indexes = [
+            models.Index(fields=['start_year', 'end_year', 'data_version']),
+        ]
+
+    def __str__(self):
+        return f"{self.technology} CF {self.start_year}-{self.end_year}: {self.cf_mean:.3f}"
+
+
 # =============================================================================
 # SWIS Risk Analysis Models
 # =============================================================================
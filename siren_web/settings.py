@@ -252,7 +252,11 @@ CRISPY_RENDERER_CLASS = "crispy_bootstrap5.renderers.AccordionJsRenderer"
 # Powermap settings
 WEATHER_DATA_DIR = BASE_DIR / 'siren_web' / 'siren_files' / 'SWIS' / 'siren_data' / 'weather_files'
 POWER_CURVES_DIR = BASE_DIR / 'siren_web' / 'siren_files' / 'siren_data' / 'plant_data'
+# Worker processes for the SAM simulations in generate power
+SAM_WORKERS = min(os.cpu_count() or 1, 8)
 MEDIA_ROOT = BASE_DIR / 'media'
+# Powerplot settings
+SCADA_ARCHIVE_DIR = BASE_DIR / 'siren_web' / 'siren_files' / 'scada_archive'
 if 'fetch_historical_scada' in sys.argv:
     DATABASES['default']['OPTIONS'] = {
         'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",